@@ -27,6 +27,7 @@ from bencode3 import bdecode, BencodeError, bencode
 import sickrage
 from sickrage.core.websession import WebSession
 from sickrage.search_providers import SearchProviderType
+from sickrage.search_providers.content_cache import content_cache
 
 _clients = {
     'utorrent': 'uTorrentAPI',
@@ -185,6 +186,11 @@ class TorrentClient(GenericClient):
                 sickrage.app.log.warning('Torrent without content')
                 raise Exception('Torrent without content')
 
+            # the info hash computed when the provider verified the torrent
+            result.hash = content_cache.info_hash(result.url)
+            if result.hash:
+                return result
+
             try:
                 torrent_bdecode = bdecode(result.content)
             except BencodeError:
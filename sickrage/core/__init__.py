@@ -49,6 +49,7 @@ import sickrage
 from sickrage.core.announcements import Announcements
 from sickrage.core.api import API
 from sickrage.core.auth import AuthServer
+from sickrage.core.caches.provider_times import provider_times
 from sickrage.core.common import Quality, Qualities, EpisodeStatus
 from sickrage.core.config import Config
 from sickrage.core.config.helpers import change_gui_lang
@@ -59,6 +60,7 @@ from sickrage.core.enums import MultiEpNaming, DefaultHomePage, NzbMethod, Torre
 from sickrage.core.helpers import generate_secret, make_dir, restore_app_data, get_disk_space_usage, get_free_space, launch_browser, torrent_webui_url, \
     encryption, md5_file_hash, flatten
 from sickrage.core.logger import Logger
+from sickrage.core.nameparser import name_parser_pool
 from sickrage.core.nameparser.validator import check_force_season_folders
 from sickrage.core.processors import auto_postprocessor
 from sickrage.core.processors.auto_postprocessor import AutoPostProcessor
@@ -446,6 +448,17 @@ class Core(object):
             id=self.rsscache_updater.name
         )
 
+        # add provider cache times flush job
+        self.scheduler.add_job(
+            provider_times.task,
+            IntervalTrigger(
+                seconds=provider_times.interval,
+                timezone='utc'
+            ),
+            name=provider_times.name,
+            id=provider_times.name
+        )
+
         # add daily search job
         self.scheduler.add_job(
             self.daily_searcher.task,
@@ -482,6 +495,18 @@ class Core(object):
             id=self.backlog_searcher.name
         )
 
+        # add backlog search step job, queues the backlog cycle within the request budget
+        self.scheduler.add_job(
+            self.backlog_searcher.step,
+            IntervalTrigger(
+                minutes=self.backlog_searcher.step_interval,
+                start_date=datetime.datetime.now() + datetime.timedelta(minutes=35),
+                timezone='utc'
+            ),
+            name=self.backlog_searcher.name + '-STEP',
+            id=self.backlog_searcher.name + '-STEP'
+        )
+
         # add auto-postprocessing job
         self.scheduler.add_job(
             self.auto_postprocessor.task,
@@ -653,11 +678,17 @@ class Core(object):
             self.show_queue.shutdown()
             self.postprocessor_queue.shutdown()
 
+            # stop name parser worker processes
+            name_parser_pool.shutdown()
+
             # log out of ADBA
             if self.adba_connection:
                 self.log.debug("Shutting down ANIDB connection")
                 self.adba_connection.stop()
 
+            # save search provider cache times
+            provider_times.flush()
+
             # save shows
             self.log.info('Saving all shows to the database')
             for show in self.shows.values():
@@ -0,0 +1,125 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import hashlib
+import threading
+
+import sickrage
+from sickrage.core.databases.cache import CacheDB
+
+
+class FileMetaQualityCache(object):
+    """
+    Persistent cache of qualities detected from media file metadata.
+
+    Entries are keyed by path and stored with the size, mtime and inode of the file, a lookup only hits when all of
+    them still match so metadata is read again as soon as the file changes.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.errors = 0
+
+    @staticmethod
+    def _path_hash(path):
+        return hashlib.sha1(path.encode('utf-8', 'surrogateescape')).hexdigest()
+
+    def get(self, path, stat_result):
+        """
+        Looks up the cached quality of a file
+
+        :param path: full path of the media file
+        :param stat_result: os.stat result of the media file
+        :return: cached quality value or None if the file is not cached or changed since it was cached
+        """
+        try:
+            session = sickrage.app.cache_db.session()
+            entry = session.query(CacheDB.FileMetaQuality).filter_by(path_hash=self._path_hash(path)).one_or_none()
+        except Exception as e:
+            sickrage.app.log.debug('Unable to read file meta quality cache for {}: {}'.format(path, e))
+            with self.lock:
+                self.errors += 1
+            return None
+
+        with self.lock:
+            if not entry:
+                self.misses += 1
+                return None
+
+            if (entry.size, entry.mtime, entry.inode) != (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino):
+                self.stale += 1
+                return None
+
+            self.hits += 1
+
+        return entry.quality
+
+    def put(self, path, stat_result, quality):
+        """
+        Stores the quality detected for a file
+
+        :param path: full path of the media file
+        :param stat_result: os.stat result of the media file taken before its metadata was read
+        :param quality: detected quality
+        """
+        try:
+            session = sickrage.app.cache_db.session()
+            session.merge(CacheDB.FileMetaQuality(**{
+                'path_hash': self._path_hash(path),
+                'path': path,
+                'size': stat_result.st_size,
+                'mtime': stat_result.st_mtime_ns,
+                'inode': stat_result.st_ino,
+                'quality': int(quality)
+            }))
+            session.commit()
+        except Exception as e:
+            sickrage.app.log.debug('Unable to update file meta quality cache for {}: {}'.format(path, e))
+            with self.lock:
+                self.errors += 1
+
+    def clear(self):
+        """
+        Deletes all cached qualities and resets the counters
+        """
+        session = sickrage.app.cache_db.session()
+        session.query(CacheDB.FileMetaQuality).delete()
+        session.commit()
+
+        with self.lock:
+            self.hits = self.misses = self.stale = self.errors = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'errors': self.errors
+            }
+
+
+file_meta_quality_cache = FileMetaQualityCache()
@@ -0,0 +1,123 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import threading
+import time
+
+import sickrage
+from sickrage.core.databases.cache import CacheDB
+
+
+class ProviderTimes(object):
+    """
+    In memory copy of the last update and last search times of the search provider caches.
+
+    All times are read from the cache database once, changes are kept in memory and written back in one transaction
+    by flush, which runs on every change once the flush interval passed and from the scheduler so a crash loses at
+    most one interval of changes.
+    """
+
+    tables = (CacheDB.LastUpdate, CacheDB.LastSearch)
+
+    def __init__(self, interval=60):
+        self.name = "PROVIDER-TIMES"
+        self.lock = threading.RLock()
+        self.interval = interval
+        self.db = None
+        self.times = {}
+        self.dirty = set()
+        self.last_flush = time.monotonic()
+
+    def task(self, force=False):
+        self.flush()
+
+    def _load(self):
+        # times are reloaded when the cache database was replaced
+        if self.db is sickrage.app.cache_db:
+            return
+
+        session = sickrage.app.cache_db.session()
+
+        self.times = dict((table, dict((x.provider, int(x.time)) for x in session.query(table))) for table in self.tables)
+        self.dirty = set()
+        self.db = sickrage.app.cache_db
+
+    def get(self, table, provider_id):
+        """
+        Gets a provider time
+
+        :param table: CacheDB.LastUpdate or CacheDB.LastSearch
+        :param provider_id: id of the search provider
+        :return: unix timestamp, 0 if the provider has none yet
+        """
+        with self.lock:
+            self._load()
+            return self.times[table].get(provider_id, 0)
+
+    def set(self, table, provider_id, timestamp):
+        """
+        Sets a provider time, the change is written to the database by the next flush
+
+        :param table: CacheDB.LastUpdate or CacheDB.LastSearch
+        :param provider_id: id of the search provider
+        :param timestamp: unix timestamp
+        """
+        with self.lock:
+            self._load()
+            self.times[table][provider_id] = int(timestamp)
+            self.dirty.add((table, provider_id))
+
+            if time.monotonic() - self.last_flush >= self.interval:
+                self.flush()
+
+    def flush(self):
+        """
+        Writes all changed provider times to the database in one transaction
+        """
+        with self.lock:
+            self.last_flush = time.monotonic()
+
+            if not self.dirty or self.db is not sickrage.app.cache_db:
+                return
+
+            session = sickrage.app.cache_db.session()
+
+            try:
+                for table in self.tables:
+                    providers = [provider_id for dirty_table, provider_id in self.dirty if dirty_table is table]
+                    if not providers:
+                        continue
+
+                    existing = set(x.provider for x in session.query(table.provider).filter(table.provider.in_(providers)))
+
+                    session.bulk_update_mappings(table, [{'provider': x, 'time': self.times[table][x]} for x in providers if x in existing])
+                    session.bulk_insert_mappings(table, [{'provider': x, 'time': self.times[table][x]} for x in providers if x not in existing])
+
+                session.commit()
+                self.dirty.clear()
+            except Exception as e:
+                session.rollback()
+                sickrage.app.log.debug('Unable to save search provider cache times: {}'.format(e))
+
+
+provider_times = ProviderTimes()
@@ -0,0 +1,150 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+import threading
+import time
+from collections import OrderedDict
+
+import sickrage
+from sickrage.core.databases.cache import CacheDB
+
+
+class SeenItems(object):
+    """
+    Per search provider set of the RSS items that were already processed, keyed by a hash of the item GUID or url.
+
+    Each provider keeps a bounded LRU in memory which is loaded from the cache database the first time the provider
+    is used, new items are written back in one transaction per update. Items that were added to the provider cache
+    are forgotten again when that cache is cleared, items are also forgotten after the ttl so releases rejected
+    before their show was added get parsed again.
+    """
+
+    def __init__(self, capacity=5000, ttl=86400):
+        self.lock = threading.RLock()
+        self.capacity = capacity
+        self.ttl = ttl
+        self.db = None
+        self.items = {}
+        self.cleared = set()
+
+    def _load(self, provider_id):
+        # items are reloaded when the cache database was replaced
+        if self.db is not sickrage.app.cache_db:
+            self.items = {}
+            self.db = sickrage.app.cache_db
+
+        if provider_id in self.items:
+            return self.items[provider_id]
+
+        session = sickrage.app.cache_db.session()
+
+        # the provider cache was cleared before its items were loaded
+        if provider_id in self.cleared:
+            session.query(CacheDB.SeenItem).filter_by(provider=provider_id, cached=True).delete()
+            session.commit()
+            self.cleared.discard(provider_id)
+
+        rows = session.query(CacheDB.SeenItem).filter_by(provider=provider_id).order_by(CacheDB.SeenItem.time.desc()).limit(self.capacity)
+
+        self.items[provider_id] = OrderedDict((x.item_hash, (bool(x.cached), x.time)) for x in reversed(rows.all()))
+        return self.items[provider_id]
+
+    def filter(self, provider_id, item_hashes):
+        """
+        Gets the item hashes that were not seen yet
+
+        :param provider_id: id of the search provider
+        :param item_hashes: list of item hashes
+        :return: set of unseen item hashes
+        """
+        with self.lock:
+            items = self._load(provider_id)
+            min_time = int(time.time()) - self.ttl
+
+            unseen = set()
+            for item_hash in item_hashes:
+                if item_hash in items and items[item_hash][1] >= min_time:
+                    items.move_to_end(item_hash)
+                else:
+                    unseen.add(item_hash)
+
+            return unseen
+
+    def add(self, provider_id, item_hashes):
+        """
+        Marks items as seen and writes them to the database in one transaction
+
+        :param provider_id: id of the search provider
+        :param item_hashes: dict of item hash to whether the item was added to the provider cache
+        """
+        if not item_hashes:
+            return
+
+        with self.lock:
+            items = self._load(provider_id)
+            now = int(time.time())
+
+            for item_hash, cached in item_hashes.items():
+                items[item_hash] = (cached, now)
+                items.move_to_end(item_hash)
+
+            while len(items) > self.capacity:
+                items.popitem(last=False)
+
+            session = sickrage.app.cache_db.session()
+
+            try:
+                session.query(CacheDB.SeenItem).filter(CacheDB.SeenItem.provider == provider_id,
+                                                       CacheDB.SeenItem.item_hash.in_(list(item_hashes.keys()))).delete(synchronize_session=False)
+                session.query(CacheDB.SeenItem).filter(CacheDB.SeenItem.provider == provider_id,
+                                                       CacheDB.SeenItem.time < now - self.ttl).delete(synchronize_session=False)
+                session.bulk_insert_mappings(CacheDB.SeenItem, [{'provider': provider_id, 'item_hash': item_hash, 'cached': cached, 'time': now}
+                                                                for item_hash, cached in item_hashes.items()])
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                sickrage.app.log.debug('Unable to save seen RSS items: {}'.format(e))
+
+    def forget_cached(self, provider_id):
+        """
+        Forgets the seen items that were added to the provider cache, called when that cache is cleared
+
+        :param provider_id: id of the search provider
+        """
+        with self.lock:
+            if self.db is not sickrage.app.cache_db or provider_id not in self.items:
+                # applied when the provider items are loaded
+                self.cleared.add(provider_id)
+                return
+
+            items = self.items[provider_id]
+            for item_hash in [item_hash for item_hash, (cached, seen) in items.items() if cached]:
+                del items[item_hash]
+
+            session = sickrage.app.cache_db.session()
+            session.query(CacheDB.SeenItem).filter_by(provider=provider_id, cached=True).delete()
+            session.commit()
+
+
+seen_items = SeenItems()
@@ -20,15 +20,21 @@
 # ##############################################################################
 
 
+import contextlib
 import datetime
+import functools
+import hashlib
 import threading
 import time
 
 import feedparser
-from sqlalchemy import orm
+import requests
+from sqlalchemy import or_
 from sqlalchemy.exc import IntegrityError
 
 import sickrage
+from sickrage.core.caches.provider_times import provider_times
+from sickrage.core.caches.seen_items import seen_items
 from sickrage.core.common import Quality, Qualities
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.enums import SeriesProviderID
@@ -46,12 +52,17 @@ class TVCache(object):
         self.providerID = self.provider.id
         self.min_time = kwargs.pop('min_time', 10)
         self.search_strings = kwargs.pop('search_strings', dict(RSS=['']))
+        self.updated_items = 0
+        self.skipped_items = 0
+        self.feed_metrics = {'requests': 0, 'not_modified': 0, 'unchanged': 0, 'bytes_saved': 0, 'parse_time_saved': 0.0}
+        self.poll = None
 
     def clear(self):
         session = sickrage.app.cache_db.session()
         if self.shouldClearCache():
             session.query(CacheDB.Provider).filter_by(provider=self.providerID).delete()
             session.commit()
+            seen_items.forget_cached(self.providerID)
 
     def _get_title_and_url(self, item):
         return self.provider._get_title_and_url(item)
@@ -76,17 +87,26 @@ class TVCache(object):
         # check if we should update
         if self.should_update() or force:
             try:
-                data = self._get_rss_data()
+                with self.conditional_requests() as poll:
+                    data = self._get_rss_data()
+
+                # no feed changed since the last update, the cache already holds their items
+                if poll['requests'] and poll['skipped'] == poll['requests']:
+                    self.last_update = datetime.datetime.today()
+                    sickrage.app.log.debug("RSS feed not modified, skipping update")
+                    return True
+
                 if not self._check_auth(data):
                     return False
 
-                # clear cache
-                self.clear()
+                # clear cache, unless feeds were skipped as not modified since their items are only left in the cache
+                if not poll['skipped']:
+                    self.clear()
 
                 # set updated
                 self.last_update = datetime.datetime.today()
 
-                [self._parseItem(item) for item in data['entries']]
+                self._parse_items(data['entries'])
 
                 sickrage.app.log.debug("Updated RSS cache")
             except AuthException as e:
@@ -98,17 +118,165 @@ class TVCache(object):
 
         return True
 
-    def get_rss_feed(self, url, params=None):
+    @contextlib.contextmanager
+    def conditional_requests(self):
+        """
+        Makes the GET requests of the provider session conditional while this thread polls the feeds of the provider,
+        the yielded dict counts the requests and the requests skipped as not modified or unchanged
+        """
+        self.poll = {'thread': threading.get_ident(), 'requests': 0, 'skipped': 0}
+        self.provider.session.conditional = self
+
+        try:
+            yield self.poll
+        finally:
+            self.provider.session.conditional = None
+            self.poll = None
+
+    def _polling(self):
+        poll = self.poll
+        return poll is not None and poll['thread'] == threading.get_ident()
+
+    def prepare_request(self, session, url, kwargs):
+        """
+        Adds the ETag/Last-Modified of the previous response to a GET request of the provider session, and a response
+        hook emptying the body of a not modified or unchanged response so the provider skips parsing it.  Requests of
+        other threads and logins are left alone.
+
+        :param session: provider session
+        :param url: url of the request
+        :param kwargs: keyword arguments of the request, updated in place
+        """
+        if not self._polling() or self.provider.logging_in:
+            return
+
+        url = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+        feed_state = self._get_feed_state(url, None)
+
+        kwargs['headers'] = dict(kwargs.get('headers') or {}, **self._feed_validators(feed_state))
+
+        # request hooks replace the session hooks
+        hooks = dict(kwargs.get('hooks') or {})
+        hooks['response'] = list(session.hooks['response']) + list(hooks.get('response') or []) + [functools.partial(self._check_feed_state, url, feed_state)]
+        kwargs['hooks'] = hooks
+
+    def _check_feed_state(self, url, feed_state, response, **kwargs):
+        # a response sent again by a hook, such as the login check, passes through the hooks twice
+        if getattr(response, 'feed_state_checked', False):
+            return
+        response.feed_state_checked = True
+
+        self._count_feed_request()
+
+        if feed_state and response.status_code == 304:
+            self._count_skipped_feed(feed_state, True)
+            return
+
+        if not response.ok:
+            return
+
+        content_hash = hashlib.sha1(response.content).hexdigest()
+
+        if feed_state and feed_state.content_hash == content_hash:
+            self._count_skipped_feed(feed_state, False)
+            self._set_feed_state(url, None, response, content_hash, feed_state.parse_time_us)
+            response._content = b''
+            return
+
+        self._set_feed_state(url, None, response, content_hash, None)
+
+    def _count_feed_request(self):
+        self.feed_metrics['requests'] += 1
+        if self._polling():
+            self.poll['requests'] += 1
+
+    def _count_skipped_feed(self, feed_state, not_modified):
+        if not_modified:
+            self.feed_metrics['not_modified'] += 1
+            self.feed_metrics['bytes_saved'] += feed_state.size or 0
+        else:
+            self.feed_metrics['unchanged'] += 1
+
+        self.feed_metrics['parse_time_saved'] += (feed_state.parse_time_us or 0) / 1e6
+
+        if self._polling():
+            self.poll['skipped'] += 1
+
+    @staticmethod
+    def _feed_validators(feed_state):
+        headers = {}
+        if feed_state and feed_state.etag:
+            headers['If-None-Match'] = feed_state.etag
+        if feed_state and feed_state.last_modified:
+            headers['If-Modified-Since'] = feed_state.last_modified
+        return headers
+
+    def get_rss_feed(self, url, params=None, conditional=False):
+        """
+        Fetches and parses a RSS feed
+
+        :param url: url of the feed
+        :param params: query parameters
+        :param conditional: request the feed with the ETag/Last-Modified of the previous poll, if the feed is not
+                            modified or its content is identical a FeedParserDict with not_modified set and no entries
+                            is returned without parsing it.  Feeds fetched while the cache is updated always are.
+        :return: FeedParserDict
+        """
         try:
             if self.provider.login():
-                resp = WebSession().get(url, timeout=30, params=params)
+                conditional = conditional or self._polling()
+                feed_state = self._get_feed_state(url, params) if conditional else None
+
+                resp = WebSession().get(url, timeout=30, params=params, headers=self._feed_validators(feed_state))
+                self._count_feed_request()
+
+                if feed_state and resp is not None and resp.status_code == 304:
+                    self._count_skipped_feed(feed_state, True)
+                    return feedparser.FeedParserDict(entries=[], not_modified=True)
+
                 if resp:
-                    return feedparser.parse(resp.text)
+                    content_hash = hashlib.sha1(resp.content).hexdigest()
+
+                    if feed_state and feed_state.content_hash == content_hash:
+                        self._count_skipped_feed(feed_state, False)
+                        self._set_feed_state(url, params, resp, content_hash, feed_state.parse_time_us)
+                        return feedparser.FeedParserDict(entries=[], not_modified=True)
+
+                    start = time.perf_counter()
+                    feed = feedparser.parse(resp.text)
+                    parse_time = time.perf_counter() - start
+
+                    if conditional:
+                        self._set_feed_state(url, params, resp, content_hash, int(parse_time * 1e6))
+
+                    return feed
         except Exception as e:
             sickrage.app.log.debug("RSS Error: {}".format(e))
 
         return feedparser.FeedParserDict()
 
+    @staticmethod
+    def _feed_url_hash(url, params):
+        return hashlib.sha1('{}?{}'.format(url, sorted((params or {}).items())).encode('utf-8')).hexdigest()
+
+    def _get_feed_state(self, url, params):
+        session = sickrage.app.cache_db.session()
+        return session.query(CacheDB.FeedState).filter_by(url_hash=self._feed_url_hash(url, params)).one_or_none()
+
+    def _set_feed_state(self, url, params, resp, content_hash, parse_time_us):
+        session = sickrage.app.cache_db.session()
+        session.merge(CacheDB.FeedState(**{
+            'url_hash': self._feed_url_hash(url, params),
+            'provider': self.providerID,
+            'url': url,
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'size': len(resp.content),
+            'parse_time_us': parse_time_us
+        }))
+        session.commit()
+
     def _translateTitle(self, title):
         return '' + title.replace(' ', '.')
 
@@ -116,77 +284,71 @@ class TVCache(object):
         return url.replace('&amp;', '&')
 
     def _parseItem(self, item):
+        entry = self._get_item_entry(item)
+        if entry:
+            self.add_cache_entry(*entry)
+
+    def _parse_items(self, items):
+        # skip the items that were already processed by a previous update before parsing them
+        item_hashes = [self._get_item_hash(item) for item in items]
+        unseen = seen_items.filter(self.providerID, set(filter(None, item_hashes))) if items else set()
+
+        new_items = [(item_hash, item) for item_hash, item in zip(item_hashes, items) if not item_hash or item_hash in unseen]
+        self.skipped_items = len(items) - len(new_items)
+
+        entries = [(item_hash, self._get_item_entry(item)) for item_hash, item in new_items]
+
+        self.updated_items = len([entry for item_hash, entry in entries if entry])
+
+        cached_urls = self.add_cache_entries([entry for item_hash, entry in entries if entry]) if self.updated_items else set()
+
+        # an item is seen once, if it is in the provider cache it is seen until that cache is cleared
+        seen_items.add(self.providerID, dict((item_hash, bool(entry and entry[1] in cached_urls)) for item_hash, entry in entries if item_hash))
+
+    def _get_item_hash(self, item):
+        key = item.get('id') or item.get('guid') or item.get('link')
+        if not key:
+            key = self._get_title_and_url(item)[1]
+
+        return hashlib.sha1(str(key).encode('utf-8')).hexdigest() if key else None
+
+    def _get_item_entry(self, item):
         title, url = self._get_title_and_url(item)
         seeders, leechers = self._get_result_stats(item)
         size = self._get_size(item)
 
         self.check_item(title, url)
 
-        if title and url:
-            self.add_cache_entry(self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size)
-        else:
+        if not title or not url:
             sickrage.app.log.debug(
                 "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
+            return None
+
+        return self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size
 
     @property
     def last_update(self):
-        session = sickrage.app.cache_db.session()
-
-        try:
-            dbData = session.query(CacheDB.LastUpdate).filter_by(provider=self.providerID).one()
-            lastTime = int(dbData.time)
-            if lastTime > int(time.mktime(datetime.datetime.today().timetuple())):
-                lastTime = 0
-        except orm.exc.NoResultFound:
+        lastTime = provider_times.get(CacheDB.LastUpdate, self.providerID)
+        if lastTime > int(time.mktime(datetime.datetime.today().timetuple())):
             lastTime = 0
 
         return datetime.datetime.fromtimestamp(lastTime)
 
     @last_update.setter
     def last_update(self, toDate):
-        session = sickrage.app.cache_db.session()
-
-        with self.lock:
-            try:
-                dbData = session.query(CacheDB.LastUpdate).filter_by(provider=self.providerID).one()
-                dbData.time = int(time.mktime(toDate.timetuple()))
-            except orm.exc.NoResultFound:
-                session.add(CacheDB.LastUpdate(**{
-                    'provider': self.providerID,
-                    'time': int(time.mktime(toDate.timetuple()))
-                }))
-            finally:
-                session.commit()
+        provider_times.set(CacheDB.LastUpdate, self.providerID, time.mktime(toDate.timetuple()))
 
     @property
     def last_search(self):
-        session = sickrage.app.cache_db.session()
-
-        try:
-            dbData = session.query(CacheDB.LastSearch).filter_by(provider=self.providerID).one()
-            lastTime = int(dbData.time)
-            if lastTime > int(time.mktime(datetime.datetime.today().timetuple())):
-                lastTime = 0
-        except orm.exc.NoResultFound:
+        lastTime = provider_times.get(CacheDB.LastSearch, self.providerID)
+        if lastTime > int(time.mktime(datetime.datetime.today().timetuple())):
             lastTime = 0
 
         return datetime.datetime.fromtimestamp(lastTime)
 
     @last_search.setter
     def last_search(self, toDate):
-        session = sickrage.app.cache_db.session()
-
-        with self.lock:
-            try:
-                dbData = session.query(CacheDB.LastSearch).filter_by(provider=self.providerID).one()
-                dbData.time = int(time.mktime(toDate.timetuple()))
-            except orm.exc.NoResultFound:
-                session.add(CacheDB.LastSearch(**{
-                    'provider': self.providerID,
-                    'time': int(time.mktime(toDate.timetuple()))
-                }))
-            finally:
-                session.commit()
+        provider_times.set(CacheDB.LastSearch, self.providerID, time.mktime(toDate.timetuple()))
 
     def should_update(self):
         # if we've updated recently then skip the update
@@ -200,7 +362,7 @@ class TVCache(object):
             return False
         return True
 
-    def add_cache_entry(self, name, url, seeders, leechers, size):
+    def add_cache_entry(self, name, url, seeders, leechers, size, parse_result=None):
         session = sickrage.app.cache_db.session()
 
         # check for existing entry in cache
@@ -208,79 +370,182 @@ class TVCache(object):
             return
 
         try:
-            # parse release name
-            parse_result = NameParser(validate_show=True).parse(name)
-            if parse_result.series_name and parse_result.quality != Qualities.UNKNOWN:
-                season = parse_result.season_number if parse_result.season_number else 1
-                episodes = parse_result.episode_numbers
-
-                if season and episodes:
-                    # store episodes as a seperated string
-                    episode_text = "|" + "|".join(map(str, episodes)) + "|"
-
-                    # get quality of release
-                    quality = parse_result.quality
-
-                    # get release group
-                    release_group = parse_result.release_group
-
-                    # get version
-                    version = parse_result.version
-
-                    dbData = {
-                        'provider': self.providerID,
-                        'name': name,
-                        'season': season,
-                        'episodes': episode_text,
-                        'series_id': parse_result.series_id,
-                        'series_provider_id': parse_result.series_provider_id.name,
-                        'url': url,
-                        'time': int(time.mktime(datetime.datetime.today().timetuple())),
-                        'quality': quality,
-                        'release_group': release_group,
-                        'version': version,
-                        'seeders': try_int(seeders),
-                        'leechers': try_int(leechers),
-                        'size': try_int(size, -1)
-                    }
-
-                    # add to internal database
-                    try:
-                        session.add(CacheDB.Provider(**dbData))
-                        session.commit()
-                        sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(name))
-                    except IntegrityError:
-                        pass
-
-                    # add to external provider cache database
-                    if sickrage.app.config.general.enable_sickrage_api:
-                        from sickrage.search_providers import SearchProviderType
-                        if not self.provider.private and self.provider.provider_type in [SearchProviderType.NZB, SearchProviderType.TORRENT]:
-                            try:
-                                sickrage.app.api.provider_cache.add(data=dbData)
-                            except Exception as e:
-                                pass
+            # parse release name, unless it was already parsed by NameParser.parse_many
+            if parse_result is None:
+                parse_result = NameParser(validate_show=True).parse(name)
+            elif isinstance(parse_result, Exception):
+                raise parse_result
         except (InvalidShowException, InvalidNameException):
+            return
+
+        dbData = self._get_cache_entry_data(name, url, seeders, leechers, size, parse_result)
+        if not dbData:
+            return
+
+        # add to internal database
+        try:
+            session.add(CacheDB.Provider(**dbData))
+            session.commit()
+            sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(name))
+        except IntegrityError:
             pass
 
+        self._add_external_cache_entry(dbData)
+
+    def add_cache_entries(self, entries, parse_results=None):
+        """
+        Adds a batch of (name, url, seeders, leechers, size) entries to the cache. Urls already in the cache are
+        looked up with one query, the remaining names are parsed in one batch and the new rows are written with one
+        bulk insert and a single commit.
+
+        :param entries: list of (name, url, seeders, leechers, size) tuples
+        :param parse_results: optional dict of name to ParseResult or parser exception, names are parsed if omitted
+        :return: set of the urls of the entries that are in the cache, either already or added by this call
+        """
+        session = sickrage.app.cache_db.session()
+
+        # check for existing entries in cache, chunked to stay below the database bound parameter limit
+        urls = list(set(url for name, url, seeders, leechers, size in entries))
+        cached_urls = set()
+        for i in range(0, len(urls), 500):
+            cached_urls.update(x.url for x in session.query(CacheDB.Provider.url).filter(CacheDB.Provider.url.in_(urls[i:i + 500])))
+
+        existing_urls = set(cached_urls)
+
+        new_entries = []
+        for name, url, seeders, leechers, size in entries:
+            if url in cached_urls:
+                continue
+            cached_urls.add(url)
+            new_entries.append((name, url, seeders, leechers, size))
+
+        if not new_entries:
+            return existing_urls
+
+        # parse all release names in one batch
+        if parse_results is None:
+            parse_results = NameParser(validate_show=True).parse_many([name for name, url, seeders, leechers, size in new_entries])
+
+        rows = []
+        for name, url, seeders, leechers, size in new_entries:
+            parse_result = parse_results[name]
+            if isinstance(parse_result, (InvalidShowException, InvalidNameException)):
+                continue
+            elif isinstance(parse_result, Exception):
+                raise parse_result
+
+            dbData = self._get_cache_entry_data(name, url, seeders, leechers, size, parse_result)
+            if dbData:
+                rows.append(dbData)
+
+        if not rows:
+            return existing_urls
+
+        # add to internal database
+        try:
+            session.bulk_insert_mappings(CacheDB.Provider, rows)
+            session.commit()
+        except IntegrityError:
+            # another update cached some of these urls in the meantime, add the rows one by one instead
+            for dbData in rows:
+                try:
+                    session.add(CacheDB.Provider(**dbData))
+                    session.commit()
+                except IntegrityError:
+                    pass
+
+        sickrage.app.log.debug("SEARCH RESULTS:[{}] ADDED TO {} CACHE!".format(len(rows), self.provider.name))
+
+        for dbData in rows:
+            self._add_external_cache_entry(dbData)
+
+        return existing_urls | set(dbData['url'] for dbData in rows)
+
+    def _get_cache_entry_data(self, name, url, seeders, leechers, size, parse_result):
+        if not parse_result.series_name or parse_result.quality == Qualities.UNKNOWN:
+            return None
+
+        season = parse_result.season_number if parse_result.season_number else 1
+        episodes = parse_result.episode_numbers
+        if not season or not episodes:
+            return None
+
+        return {
+            'provider': self.providerID,
+            'name': name,
+            'season': season,
+            'episodes': "|" + "|".join(map(str, episodes)) + "|",
+            'series_id': parse_result.series_id,
+            'series_provider_id': parse_result.series_provider_id.name,
+            'url': url,
+            'time': int(time.mktime(datetime.datetime.today().timetuple())),
+            'quality': parse_result.quality,
+            'release_group': parse_result.release_group,
+            'version': parse_result.version,
+            'seeders': try_int(seeders),
+            'leechers': try_int(leechers),
+            'size': try_int(size, -1)
+        }
+
+    def _add_external_cache_entry(self, dbData):
+        # add to external provider cache database
+        if sickrage.app.config.general.enable_sickrage_api:
+            from sickrage.search_providers import SearchProviderType
+            if not self.provider.private and self.provider.provider_type in [SearchProviderType.NZB, SearchProviderType.TORRENT]:
+                try:
+                    sickrage.app.api.provider_cache.add(data=dbData)
+                except Exception as e:
+                    pass
+
     def search_cache(self, series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False):
         cache_results = {}
         dbData = []
 
+        # datetime stamp this search so cache gets cleared
+        self.last_search = datetime.datetime.today()
+
+        # get series, if it's not one of our shows then there is nothing to search for
+        series = find_show(series_id, series_provider_id)
+        if not series:
+            return cache_results
+
+        # skip if provider is anime only and show is not anime
+        if self.provider.anime_only and not series.is_anime:
+            sickrage.app.log.debug("" + str(series.name) + " is not an anime, skiping")
+            return cache_results
+
+        # wanted episode/quality combinations of the season, resolved once per search
+        wanted = {}
+
+        def want_episode(result_episode, quality):
+            if (result_episode, quality) not in wanted:
+                wanted[(result_episode, quality)] = series.want_episode(season, result_episode, quality, manualSearch, downCurQuality)
+            return wanted[(result_episode, quality)]
+
+        any_qualities, best_qualities = Quality.split_quality(series.quality)
+        allowed_qualities = set(any_qualities + best_qualities)
+        wanted_qualities = [x for x in allowed_qualities if want_episode(episode, x)]
+
         # get data from external database
         if sickrage.app.config.general.enable_sickrage_api and not self.provider.private:
             resp = sickrage.app.api.provider_cache.get(self.providerID, series_id, season, episode)
             if resp and 'data' in resp:
-                dbData += resp['data']
+                dbData += [(x, False) for x in resp['data']]
 
-        # get data from internal database
+        # get data from internal database, these names were already parsed when they were added to the cache. only
+        # rows in an allowed quality are returned and single episode rows need to be in a wanted quality.
         session = sickrage.app.cache_db.session()
-        dbData += [x.as_dict() for x in
+        dbData += [(x.as_dict(), True) for x in
                    session.query(CacheDB.Provider).filter_by(provider=self.providerID,
                                                              series_id=series_id,
-                                                             season=season).filter(CacheDB.Provider.episodes.contains("|{}|".format(episode)))]
-
-        for curResult in dbData:
+                                                             series_provider_id=series_provider_id,
+                                                             season=season).filter(
+                       CacheDB.Provider.episodes.contains("|{}|".format(episode)),
+                       CacheDB.Provider.quality.in_([int(x) for x in allowed_qualities]),
+                       or_(CacheDB.Provider.quality.in_([int(x) for x in wanted_qualities]),
+                           CacheDB.Provider.episodes != "|{}|".format(episode)))]
+
+        for curResult, parsed in dbData:
             result = self.provider.get_result()
 
             result.series_id = int(curResult["series_id"])
@@ -290,18 +555,12 @@ class TVCache(object):
             if not isinstance(result.series_provider_id, SeriesProviderID):
                 result.series_provider_id = SeriesProviderID[curResult["series_provider_id"]]
 
-            # get series, if it's not one of our shows then ignore it
-            series = find_show(result.series_id, result.series_provider_id)
-            if not series or series.series_provider_id != series_provider_id:
+            # ignore results of other shows
+            if result.series_id != series.series_id or result.series_provider_id != series_provider_id:
                 continue
 
             # ignored/required words, and non-tv junk
-            if not show_names.filter_bad_releases(curResult["name"]):
-                continue
-
-            # skip if provider is anime only and show is not anime
-            if self.provider.anime_only and not series.is_anime:
-                sickrage.app.log.debug("" + str(series.name) + " is not an anime, skiping")
+            if not show_names.filter_bad_releases(curResult["name"], parse=not parsed):
                 continue
 
             # get season and ep data (ignoring multi-eps for now)
@@ -317,12 +576,7 @@ class TVCache(object):
             result.version = curResult["version"]
 
             # make sure we want the episode
-            wantEp = False
-            for result_episode in result.episodes:
-                if series.want_episode(result.season, result_episode, result.quality, manualSearch, downCurQuality):
-                    wantEp = True
-
-            if not wantEp:
+            if result.season != season or not any(want_episode(x, result.quality) for x in result.episodes):
                 sickrage.app.log.info("Skipping " + curResult["name"] + " because we don't want an episode that's " + result.quality.display_name)
                 continue
 
@@ -343,7 +597,4 @@ class TVCache(object):
             else:
                 cache_results[int(episode)] += [result]
 
-        # datetime stamp this search so cache gets cleared
-        self.last_search = datetime.datetime.today()
-
         return cache_results
@@ -21,12 +21,16 @@
 # CPU Presets for sleep timers
 import enum
 import operator
+import os
 import pathlib
 import re
+import stat
+from collections import OrderedDict
 from functools import reduce
 
 from aenum import IntEnum, extend_enum
 
+from sickrage.core.caches.file_meta_cache import file_meta_quality_cache
 from sickrage.core.helpers.metadata import get_file_metadata, get_resolution
 
 countryList = {'Australia': 'AU',
@@ -41,6 +45,72 @@ timeFormat = '%A %I:%M %p'
 MULTI_EP_RESULT = -1
 SEASON_RESULT = -2
 
+# Scene quality tokens as (group name, first characters, pattern, features), a token that can start
+# at the same position as a later token must be listed first and include that token's features
+SCENE_QUALITY_TOKENS = [
+    ('hr_ws_pdtv', 'h', r'hr.ws.pdtv.[xh].?26[45]', {'hr_ws_pdtv'}),
+    ('r480p', '4', r'480p', {'sd_source'}),
+    ('r720p', '7', r'720p', {'720p', '720p_1080i', 'hires'}),
+    ('r720i', '7', r'720i', {'hires'}),
+    ('r1080p_hdtv', '1', r'1080p.hdtv', {'1080p', '1080pi', '1080pi_hdtv', 'hires'}),
+    ('r1080i_hdtv', '1', r'1080i.hdtv', {'1080pi', '1080pi_hdtv', '720p_1080i', 'hires'}),
+    ('r1080p', '1', r'1080p', {'1080p', '1080pi', 'hires'}),
+    ('r1080i', '1', r'1080i', {'1080pi', '720p_1080i', 'hires'}),
+    ('r2160p', '2', r'2160p', {'2160p', 'hires'}),
+    ('r2160i', '2', r'2160i', {'hires'}),
+    ('r4320p', '4', r'4320p', {'4320p', 'hires'}),
+    ('r4320i', '4', r'4320i', {'hires'}),
+    ('web', 'w', r'\bweb\b|web.?dl|web(?:rip|mux|hd)', {'web', 'sd_source'}),
+    ('hdtv', 'h', r'hd.?tv', {'hdtv', 'sd_source'}),
+    ('sdtv', 'sphdt', r'[sph]d.?tv|dsr|tv(?:rip|mux)|satrip', {'sd_source'}),
+    ('h26x', 'h', r'h.?26[45]', {'h26x', 'x26x', 'sd_codec'}),
+    ('x26x', 'xh', r'[xh].?26[45]', {'x26x', 'sd_codec'}),
+    ('xvid', 'xd', r'xvid|divx', {'sd_codec'}),
+    ('hevc', 'h', r'hevc', {'hevc'}),
+    ('itunes', 'i', r'itunes', {'itunes'}),
+    ('mpeg2', 'm', r'mpeg-?2', {'mpeg2'}),
+    ('dvdrip', 'd', r'dvd(?:rip|mux)', {'dvd'}),
+    ('bdrip', 'b', r'b[rd](?:rip|mux)|blue?-?ray', {'dvd', 'bluray'}),
+    ('hddvd', 'h', r'hddvd', {'bluray'}),
+]
+
+SCENE_QUALITY_ANIME_TOKENS = [
+    ('dvd', 'd', r'dvd', {'dvd'}),
+    ('bluray', 'b', r'BD|blue?-?ray', {'bluray'}),
+    ('sd', '348x', r'360p|480p|848x480|XviD', {'sd'}),
+    ('hd', '179', r'720p|1280x720|960x720', {'hd'}),
+    ('full_hd', '1', r'1080p|1920x1080', {'full_hd'}),
+]
+
+# Scene quality decision tables as (quality name, [(required features, excluded features), ...]),
+# the first quality with a matching rule wins
+SCENE_QUALITY_RULES = [
+    ('SDTV', [({'sd_source', 'sd_codec'}, {'hires', 'hr_ws_pdtv'})]),
+    ('SDDVD', [({'dvd', 'sd_codec'}, {'hires', 'hr_ws_pdtv'})]),
+    ('HDTV', [({'720p', 'hdtv', 'x26x'}, set()), ({'720p', 'hevc', 'x26x'}, set()), ({'hr_ws_pdtv'}, {'1080pi'})]),
+    ('RAWHDTV', [({'720p_1080i', 'hdtv', 'mpeg2'}, set()), ({'1080pi_hdtv', 'h26x'}, set())]),
+    ('FULLHDTV', [({'1080p', 'hdtv', 'x26x'}, set()), ({'1080p', 'hevc', 'x26x'}, set())]),
+    ('HDWEBDL', [({'720p', 'web'}, set()), ({'720p', 'itunes', 'x26x'}, set())]),
+    ('FULLHDWEBDL', [({'1080p', 'web'}, set()), ({'1080p', 'itunes', 'x26x'}, set())]),
+    ('HDBLURAY', [({'720p', 'bluray', 'x26x'}, set())]),
+    ('FULLHDBLURAY', [({'1080p', 'bluray', 'x26x'}, set())]),
+    ('UHD_4K_TV', [({'2160p', 'hdtv', 'x26x'}, set())]),
+    ('UHD_8K_TV', [({'4320p', 'hdtv', 'x26x'}, set())]),
+    ('UHD_4K_WEBDL', [({'2160p', 'web'}, set()), ({'2160p', 'itunes', 'x26x'}, set())]),
+    ('UHD_8K_WEBDL', [({'4320p', 'web'}, set()), ({'4320p', 'itunes', 'x26x'}, set())]),
+    ('UHD_4K_BLURAY', [({'2160p', 'bluray', 'x26x'}, set())]),
+    ('UHD_8K_BLURAY', [({'4320p', 'bluray', 'x26x'}, set())]),
+]
+
+SCENE_QUALITY_ANIME_RULES = [
+    ('SDTV', [({'sd'}, {'bluray', 'dvd'})]),
+    ('SDDVD', [({'dvd'}, set())]),
+    ('HDTV', [({'hd'}, {'bluray', 'full_hd'})]),
+    ('FULLHDTV', [({'full_hd'}, {'bluray', 'hd'})]),
+    ('HDBLURAY', [({'bluray', 'hd'}, {'full_hd'})]),
+    ('FULLHDBLURAY', [({'bluray', 'full_hd'}, {'hd'})]),
+]
+
 
 class EpisodeStatus(IntEnum):
     UNKNOWN = -1  # SHOULD NEVER HAPPEN
@@ -142,6 +212,9 @@ class Overview(enum.Enum):
 
 
 class Quality(object):
+    _scene_quality_classifier = None
+    _scene_quality_anime_classifier = None
+
     @staticmethod
     def combine_qualities(anyQualities, bestQualities):
         any_quality = 0
@@ -204,77 +277,54 @@ class Quality(object):
 
         name = pathlib.Path(name).name
 
-        check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
-
         if anime:
-            dvd_options = check_name([r"dvd", r"dvdrip"], any)
-            blue_ray_options = check_name([r"BD", r"blue?-?ray"], any)
-            sd_options = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
-            hd_options = check_name([r"720p", r"1280x720", r"960x720"], any)
-            full_hd = check_name([r"1080p", r"1920x1080"], any)
-
-            if sd_options and not blue_ray_options and not dvd_options:
-                ret = Qualities.SDTV
-            elif dvd_options:
-                ret = Qualities.SDDVD
-            elif hd_options and not blue_ray_options and not full_hd:
-                ret = Qualities.HDTV
-            elif full_hd and not blue_ray_options and not hd_options:
-                ret = Qualities.FULLHDTV
-            elif hd_options and not blue_ray_options and not full_hd:
-                ret = Qualities.HDWEBDL
-            elif blue_ray_options and hd_options and not full_hd:
-                ret = Qualities.HDBLURAY
-            elif blue_ray_options and full_hd and not hd_options:
-                ret = Qualities.FULLHDBLURAY
+            regex, token_features, rules = Quality._scene_quality_anime_classifier
+        else:
+            regex, token_features, rules = Quality._scene_quality_classifier
 
+        # single pass over the name, restarting one character after each token start so
+        # overlapping tokens are found the same way as separate searches would find them
+        features = set()
+        match = regex.search(name)
+        while match:
+            features |= token_features[match.lastgroup]
+            match = regex.search(name, match.start() + 1)
+
+        if not features:
             return ret
 
-        if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"], all)
-                and not check_name([r"(720|1080|2160|4320)[pi]"], all)
-                and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Qualities.SDTV
-        elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
-              and not check_name([r"(720|1080|2160|4320)[pi]"], all)
-              and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Qualities.SDDVD
-        elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
-              or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
-            ret = Qualities.HDTV
-        elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
-              or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
-            ret = Qualities.RAWHDTV
-        elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
-            ret = Qualities.FULLHDTV
-        elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Qualities.HDWEBDL
-        elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Qualities.FULLHDWEBDL
-        elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Qualities.HDBLURAY
-        elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Qualities.FULLHDBLURAY
-        elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Qualities.UHD_4K_TV
-        elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Qualities.UHD_8K_TV
-        elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Qualities.UHD_4K_WEBDL
-        elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Qualities.UHD_8K_WEBDL
-        elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Qualities.UHD_4K_BLURAY
-        elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Qualities.UHD_8K_BLURAY
+        for quality, quality_rules in rules:
+            for required, excluded in quality_rules:
+                if required <= features and not excluded & features:
+                    return Qualities[quality]
 
         return ret
 
+    @staticmethod
+    def _compile_scene_quality_classifier(tokens, rules):
+        """
+        Compiles scene quality tokens into one regex, tokens are grouped by their first character
+        behind a lookahead so each position only tries the tokens that can start there
+        """
+
+        first_chars = OrderedDict()
+        for group, chars, pattern, features in tokens:
+            for char in chars:
+                first_chars.setdefault(char, []).append((group, pattern, features))
+
+        branches = []
+        token_features = {}
+        for char, char_tokens in first_chars.items():
+            patterns = []
+            for group, pattern, features in char_tokens:
+                patterns.append('(?P<{}_{}>{})'.format(group, char, pattern))
+                token_features['{}_{}'.format(group, char)] = frozenset(features)
+            branches.append('(?=[{}])(?:{})'.format(char, '|'.join(patterns)))
+
+        regex = re.compile('(?=[{}])(?:{})'.format(''.join(first_chars), '|'.join(branches)), re.I)
+        rules = [(quality, [(frozenset(required), frozenset(excluded)) for required, excluded in quality_rules]) for quality, quality_rules in rules]
+        return regex, token_features, rules
+
     @staticmethod
     def composite_status(status, quality):
         return EpisodeStatus(status + 100 * quality)
@@ -294,42 +344,70 @@ class Quality(object):
     @staticmethod
     def quality_from_file_meta(filename):
         """
-        Get quality from file metadata
+        Get quality from file metadata, results are cached until the file changes
 
         :param filename: Filename to analyse
         :return: Quality prefix
         """
 
+        try:
+            stat_result = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return Qualities.UNKNOWN
+
+        if not stat.S_ISREG(stat_result.st_mode):
+            return Qualities.UNKNOWN
+
+        quality = file_meta_quality_cache.get(filename, stat_result)
+        if quality is not None:
+            return Qualities(quality)
+
+        # a failed read is not cached, it is tried again next time
+        quality = Quality._read_quality_from_file_meta(filename)
+        if quality is None:
+            return Qualities.UNKNOWN
+
+        file_meta_quality_cache.put(filename, stat_result, quality)
+        return quality
+
+    @staticmethod
+    def _read_quality_from_file_meta(filename):
+        """
+        Reads the file metadata and gets the quality from it
+
+        :param filename: Filename to analyse
+        :return: Quality prefix, None if the metadata could not be read
+        """
+
         data = {}
         quality = Qualities.UNKNOWN
 
         try:
-            if pathlib.Path(filename).is_file():
-                meta = get_file_metadata(filename)
-
-                if meta.get('resolution_width') and meta.get('resolution_height'):
-                    data['resolution_width'] = meta.get('resolution_width')
-                    data['resolution_height'] = meta.get('resolution_height')
-                    data['aspect'] = round(float(meta.get('resolution_width')) / meta.get('resolution_height', 1), 2)
-                else:
-                    data.update(get_resolution(filename))
-
-                base_filename = pathlib.Path(filename).name
-                bluray = re.search(r"blue?-?ray|hddvd|b[rd](rip|mux)", base_filename, re.I) is not None
-                webdl = re.search(r"\bweb\b|web.?dl|web(rip|mux|hd)", base_filename, re.I) is not None
-
-                if 3240 < data['resolution_height']:
-                    quality = ((Qualities.UHD_8K_TV, Qualities.UHD_8K_BLURAY)[bluray], Qualities.UHD_8K_WEBDL)[webdl]
-                if 1620 < data['resolution_height'] <= 3240:
-                    quality = ((Qualities.UHD_4K_TV, Qualities.UHD_4K_BLURAY)[bluray], Qualities.UHD_4K_WEBDL)[webdl]
-                elif 800 < data['resolution_height'] <= 1620:
-                    quality = ((Qualities.FULLHDTV, Qualities.FULLHDBLURAY)[bluray], Qualities.FULLHDWEBDL)[webdl]
-                elif 680 < data['resolution_height'] < 800:
-                    quality = ((Qualities.HDTV, Qualities.HDBLURAY)[bluray], Qualities.HDWEBDL)[webdl]
-                elif data['resolution_height'] < 680:
-                    quality = (Qualities.SDTV, Qualities.SDDVD)[re.search(r'dvd|b[rd]rip|blue?-?ray', base_filename, re.I) is not None]
+            meta = get_file_metadata(filename)
+
+            if meta.get('resolution_width') and meta.get('resolution_height'):
+                data['resolution_width'] = meta.get('resolution_width')
+                data['resolution_height'] = meta.get('resolution_height')
+                data['aspect'] = round(float(meta.get('resolution_width')) / meta.get('resolution_height', 1), 2)
+            else:
+                data.update(get_resolution(filename))
+
+            base_filename = pathlib.Path(filename).name
+            bluray = re.search(r"blue?-?ray|hddvd|b[rd](rip|mux)", base_filename, re.I) is not None
+            webdl = re.search(r"\bweb\b|web.?dl|web(rip|mux|hd)", base_filename, re.I) is not None
+
+            if 3240 < data['resolution_height']:
+                quality = ((Qualities.UHD_8K_TV, Qualities.UHD_8K_BLURAY)[bluray], Qualities.UHD_8K_WEBDL)[webdl]
+            if 1620 < data['resolution_height'] <= 3240:
+                quality = ((Qualities.UHD_4K_TV, Qualities.UHD_4K_BLURAY)[bluray], Qualities.UHD_4K_WEBDL)[webdl]
+            elif 800 < data['resolution_height'] <= 1620:
+                quality = ((Qualities.FULLHDTV, Qualities.FULLHDBLURAY)[bluray], Qualities.FULLHDWEBDL)[webdl]
+            elif 680 < data['resolution_height'] < 800:
+                quality = ((Qualities.HDTV, Qualities.HDBLURAY)[bluray], Qualities.HDWEBDL)[webdl]
+            elif data['resolution_height'] < 680:
+                quality = (Qualities.SDTV, Qualities.SDDVD)[re.search(r'dvd|b[rd]rip|blue?-?ray', base_filename, re.I) is not None]
         except Exception:
-            pass
+            return None
 
         return quality
 
@@ -682,6 +760,10 @@ class Qualities(enum.IntFlag):
         return self.name in self._combined_strings
 
 
+# compile scene quality classifiers
+Quality._scene_quality_classifier = Quality._compile_scene_quality_classifier(SCENE_QUALITY_TOKENS, SCENE_QUALITY_RULES)
+Quality._scene_quality_anime_classifier = Quality._compile_scene_quality_classifier(SCENE_QUALITY_ANIME_TOKENS, SCENE_QUALITY_ANIME_RULES)
+
 # extend episode status enum class with composite statuses
 [extend_enum(EpisodeStatus, f"{status.name}_{q.name}", status + 100 * q)
  for status in list(EpisodeStatus).copy()
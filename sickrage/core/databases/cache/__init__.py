@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 
-from sqlalchemy import Column, Integer, Text, String, Boolean, MetaData, Enum
+from sqlalchemy import Column, Integer, Text, String, Boolean, MetaData, Enum, BigInteger, Index
 from sqlalchemy.ext.declarative import declarative_base
 
 from sickrage.core.databases import SRDatabase, SRDatabaseBase
@@ -86,6 +86,10 @@ class CacheDB(SRDatabase):
 
     class Provider(base):
         __tablename__ = 'providers'
+        __table_args__ = (
+            Index('idx_series_id_season_quality', 'series_id', 'season', 'quality'),
+            Index('idx_provider_time', 'provider', 'time'),
+        )
 
         id = Column(Integer, primary_key=True)
         provider = Column(Text)
@@ -121,3 +125,59 @@ class CacheDB(SRDatabase):
         id = Column(Integer, primary_key=True)
         hash = Column(String(255), unique=True, nullable=False)
         seen = Column(Boolean, default=False)
+
+    class FileMetaQuality(base):
+        __tablename__ = 'file_meta_quality'
+
+        path_hash = Column(String(40), primary_key=True)
+        path = Column(Text)
+        size = Column(BigInteger)
+        mtime = Column(BigInteger)
+        inode = Column(BigInteger)
+        quality = Column(Integer)
+
+    class FeedState(base):
+        __tablename__ = 'feed_state'
+
+        url_hash = Column(String(40), primary_key=True)
+        provider = Column(String(32))
+        url = Column(Text)
+        etag = Column(Text)
+        last_modified = Column(Text)
+        content_hash = Column(String(40))
+        size = Column(BigInteger)
+        parse_time_us = Column(BigInteger)
+
+    class SeenItem(base):
+        __tablename__ = 'seen_items'
+
+        provider = Column(String(32), primary_key=True)
+        item_hash = Column(String(40), primary_key=True)
+        cached = Column(Boolean, default=False)
+        time = Column(Integer)
+
+    class BacklogCursor(base):
+        __tablename__ = 'backlog_cursor'
+
+        series_id = Column(Integer, primary_key=True)
+        series_provider_id = Column(Enum(SeriesProviderID), primary_key=True)
+        season = Column(Integer, primary_key=True)
+        episode = Column(Integer, primary_key=True)
+        cycle = Column(Integer)
+        searched = Column(Integer, default=0)
+        requests = Column(Integer, default=0)
+
+    class ProviderSession(base):
+        __tablename__ = 'provider_session'
+
+        provider_id = Column(Text, primary_key=True)
+        cookies = Column(Text)
+        time = Column(Integer)
+
+    class NewznabCaps(base):
+        __tablename__ = 'newznab_caps'
+
+        provider_id = Column(Text, primary_key=True)
+        url = Column(Text)
+        caps = Column(Text)
+        time = Column(Integer)
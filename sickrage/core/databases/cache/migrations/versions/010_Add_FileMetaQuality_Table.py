@@ -0,0 +1,32 @@
+"""Initial migration
+
+Revision ID: 10
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '10'
+down_revision = '9'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'file_meta_quality'):
+        op.create_table(
+            'file_meta_quality',
+            sa.Column('path_hash', sa.String(40), primary_key=True),
+            sa.Column('path', sa.Text),
+            sa.Column('size', sa.BigInteger),
+            sa.Column('mtime', sa.BigInteger),
+            sa.Column('inode', sa.BigInteger),
+            sa.Column('quality', sa.Integer)
+        )
+
+
+def downgrade():
+    pass
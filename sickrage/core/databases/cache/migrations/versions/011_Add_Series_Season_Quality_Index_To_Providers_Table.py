@@ -0,0 +1,31 @@
+"""Initial migration
+
+Revision ID: 11
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '11'
+down_revision = '10'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    providers = sa.Table('providers', meta, autoload=True)
+
+    if 'idx_series_id_season_quality' not in [x.name for x in providers.indexes]:
+        op.create_index('idx_series_id_season_quality', 'providers', ['series_id', 'season', 'quality'])
+
+
+def downgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    providers = sa.Table('providers', meta, autoload=True)
+
+    if 'idx_series_id_season_quality' in [x.name for x in providers.indexes]:
+        op.drop_index('idx_series_id_season_quality', 'providers')
@@ -0,0 +1,34 @@
+"""Initial migration
+
+Revision ID: 12
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '12'
+down_revision = '11'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'feed_state'):
+        op.create_table(
+            'feed_state',
+            sa.Column('url_hash', sa.String(40), primary_key=True),
+            sa.Column('provider', sa.String(32)),
+            sa.Column('url', sa.Text),
+            sa.Column('etag', sa.Text),
+            sa.Column('last_modified', sa.Text),
+            sa.Column('content_hash', sa.String(40)),
+            sa.Column('size', sa.BigInteger),
+            sa.Column('parse_time_us', sa.BigInteger)
+        )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,30 @@
+"""Initial migration
+
+Revision ID: 13
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '13'
+down_revision = '12'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'seen_items'):
+        op.create_table(
+            'seen_items',
+            sa.Column('provider', sa.String(32), primary_key=True),
+            sa.Column('item_hash', sa.String(40), primary_key=True),
+            sa.Column('cached', sa.Boolean),
+            sa.Column('time', sa.Integer)
+        )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,35 @@
+"""Initial migration
+
+Revision ID: 14
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from sickrage.core.enums import SeriesProviderID
+
+# revision identifiers, used by Alembic.
+revision = '14'
+down_revision = '13'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'backlog_cursor'):
+        op.create_table(
+            'backlog_cursor',
+            sa.Column('series_id', sa.Integer, primary_key=True),
+            sa.Column('series_provider_id', sa.Enum(SeriesProviderID), primary_key=True),
+            sa.Column('season', sa.Integer, primary_key=True),
+            sa.Column('episode', sa.Integer, primary_key=True),
+            sa.Column('cycle', sa.Integer),
+            sa.Column('searched', sa.Integer),
+            sa.Column('requests', sa.Integer)
+        )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,31 @@
+"""Initial migration
+
+Revision ID: 15
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '15'
+down_revision = '14'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    providers = sa.Table('providers', meta, autoload=True)
+
+    if 'idx_provider_time' not in [x.name for x in providers.indexes]:
+        op.create_index('idx_provider_time', 'providers', ['provider', 'time'])
+
+
+def downgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    providers = sa.Table('providers', meta, autoload=True)
+
+    if 'idx_provider_time' in [x.name for x in providers.indexes]:
+        op.drop_index('idx_provider_time', 'providers')
@@ -0,0 +1,29 @@
+"""Initial migration
+
+Revision ID: 16
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '16'
+down_revision = '15'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'provider_session'):
+        op.create_table(
+            'provider_session',
+            sa.Column('provider_id', sa.Text, primary_key=True),
+            sa.Column('cookies', sa.Text),
+            sa.Column('time', sa.Integer)
+        )
+
+
+def downgrade():
+    pass
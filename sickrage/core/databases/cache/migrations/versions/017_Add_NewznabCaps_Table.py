@@ -0,0 +1,30 @@
+"""Initial migration
+
+Revision ID: 17
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '17'
+down_revision = '16'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'newznab_caps'):
+        op.create_table(
+            'newznab_caps',
+            sa.Column('provider_id', sa.Text, primary_key=True),
+            sa.Column('url', sa.Text),
+            sa.Column('caps', sa.Text),
+            sa.Column('time', sa.Integer)
+        )
+
+
+def downgrade():
+    pass
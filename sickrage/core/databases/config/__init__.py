@@ -261,6 +261,19 @@ class ConfigDB(SRDatabase):
         view_changelog = Column(Boolean, default=False)
         strip_special_file_bits = Column(Boolean, default=True)
         max_queue_workers = Column(Integer, default=5)
+        name_parser_workers = Column(Integer, default=1)
+        search_provider_workers = Column(Integer, default=5)
+        search_provider_timeout = Column(Integer, default=60)
+        search_deadline = Column(Integer, default=300)
+        rss_cache_workers = Column(Integer, default=3)
+        rss_cache_timeout = Column(Integer, default=120)
+        adaptive_provider_order = Column(Boolean, default=False)
+        provider_circuit_breaker = Column(Boolean, default=False)
+        html_parser = Column(Text, default='html5lib')
+        backlog_search_budget = Column(Integer, default=0)
+        propers_from_rss_cache = Column(Boolean, default=True)
+        search_history_size = Column(Integer, default=100)
+        search_history_age = Column(Integer, default=60)
 
     class GUI(base):
         __tablename__ = 'gui'
@@ -0,0 +1,26 @@
+"""Initial migration
+
+Revision ID: 3
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3'
+down_revision = '2'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'name_parser_workers'):
+        op.add_column('general', sa.Column('name_parser_workers', sa.Integer, server_default='1'))
+
+
+def downgrade():
+    pass
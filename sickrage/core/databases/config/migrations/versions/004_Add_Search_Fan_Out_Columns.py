@@ -0,0 +1,32 @@
+"""Initial migration
+
+Revision ID: 4
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4'
+down_revision = '3'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'search_provider_workers'):
+        op.add_column('general', sa.Column('search_provider_workers', sa.Integer, server_default='5'))
+
+    if not hasattr(general.c, 'search_provider_timeout'):
+        op.add_column('general', sa.Column('search_provider_timeout', sa.Integer, server_default='60'))
+
+    if not hasattr(general.c, 'search_deadline'):
+        op.add_column('general', sa.Column('search_deadline', sa.Integer, server_default='300'))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,29 @@
+"""Initial migration
+
+Revision ID: 5
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5'
+down_revision = '4'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'rss_cache_workers'):
+        op.add_column('general', sa.Column('rss_cache_workers', sa.Integer, server_default='3'))
+
+    if not hasattr(general.c, 'rss_cache_timeout'):
+        op.add_column('general', sa.Column('rss_cache_timeout', sa.Integer, server_default='120'))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,26 @@
+"""Initial migration
+
+Revision ID: 7
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '7'
+down_revision = '6'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'html_parser'):
+        op.add_column('general', sa.Column('html_parser', sa.Text, server_default='html5lib'))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,26 @@
+"""Initial migration
+
+Revision ID: 8
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8'
+down_revision = '7'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'backlog_search_budget'):
+        op.add_column('general', sa.Column('backlog_search_budget', sa.Integer, server_default='0'))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,26 @@
+"""Initial migration
+
+Revision ID: 9
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9'
+down_revision = '8'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'propers_from_rss_cache'):
+        op.add_column('general', sa.Column('propers_from_rss_cache', sa.Boolean, server_default='1'))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,29 @@
+"""Initial migration
+
+Revision ID: 10
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '10'
+down_revision = '9'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'search_history_size'):
+        op.add_column('general', sa.Column('search_history_size', sa.Integer, server_default='100'))
+
+    if not hasattr(general.c, 'search_history_age'):
+        op.add_column('general', sa.Column('search_history_age', sa.Integer, server_default='60'))
+
+
+def downgrade():
+    pass
@@ -1414,8 +1414,20 @@ def backup_versioned_file(old_file, version):
     return True
 
 
+HTML_PARSERS = ('html5lib', 'lxml', 'html.parser')
+
+
 @contextmanager
-def bs4_parser(markup, features="html5lib", *args, **kwargs):
+def bs4_parser(markup, features=None, *args, **kwargs):
+    """
+    Parses markup with BeautifulSoup, falls back to html.parser if the tree builder is not available
+
+    :param markup: html or xml to parse
+    :param features: tree builder, one of HTML_PARSERS or 'xml', defaults to the configured html parser
+    """
+    if not features:
+        features = sickrage.app.config.general.html_parser if sickrage.app.config else "html5lib"
+
     try:
         _soup = BeautifulSoup(markup, features=features, *args, **kwargs)
     except:
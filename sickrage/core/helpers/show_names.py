@@ -24,7 +24,7 @@ import datetime
 import fnmatch
 import os
 import re
-from functools import partial
+from functools import lru_cache, partial
 
 import sickrage
 from sickrage.core.common import EpisodeStatus, countryList
@@ -43,6 +43,28 @@ resultFilters = [
 if hasattr('General', 'ignored_subs_list') and sickrage.app.config.general.ignored_subs_list:
     resultFilters.append("(" + sickrage.app.config.general.ignored_subs_list.replace(",", "|") + ")sub(bed|ed|s)?")
 
+PROPER_TOKENS = ('proper', 'repack', 'real')
+
+PROPER_REGEX = re.compile(r'(^|[. _-])({})([. _-]|$)'.format('|'.join(PROPER_TOKENS)), re.I)
+
+# season/episode, season only, 1x02, air date or absolute number, whichever comes first
+EPISODE_MARKER_REGEX = re.compile(r'[. _-](s\d{1,4}(e\d{1,4})*|\d{1,2}x\d{1,4}|\d{4}[. _-]\d{2}[. _-]\d{2}|\d{1,4})(?=[. _-]|$)', re.I)
+
+
+@lru_cache(maxsize=256)
+def compile_words(words):
+    """
+    Compiles a tuple of words into one alternation regex that tells if a name contains any of the words, plus a
+    regex per word to tell which word it was. Results are cached per word list so the regexes are only rebuilt when
+    the configured or per-show words change.
+
+    :param words: tuple of stripped words
+    :return: tuple of (alternation regex, list of (regex, word))
+    """
+    any_word = re.compile(r'(^|[\W_])(%s)($|[\W_])' % '|'.join(re.escape(word) for word in words), re.I)
+    each_word = [(re.compile(r'(^|[\W_])%s($|[\W_])' % re.escape(word), re.I), word) for word in words]
+    return any_word, each_word
+
 
 def contains_at_least_one_word(name, words):
     """
@@ -60,13 +82,31 @@ def contains_at_least_one_word(name, words):
     """
     if isinstance(words, str):
         words = words.split(',')
-    items = [(re.compile('(^|[\W_])%s($|[\W_])' % re.escape(word.strip()), re.I), word.strip()) for word in words]
-    for regexp, word in items:
+    if not words:
+        return False
+
+    any_word, each_word = compile_words(tuple(word.strip() for word in words))
+    if not any_word.search(name):
+        return False
+
+    for regexp, word in each_word:
         if regexp.search(name):
             return word
     return False
 
 
+def is_proper(name):
+    """
+    Checks if a release name is a proper, only the part after the episode marker is searched for proper tokens so show
+    names such as The Real Housewives are not mistaken for a REAL proper
+
+    :param name: release name
+    :return: True if the name has a proper token after its episode marker
+    """
+    marker = EPISODE_MARKER_REGEX.search(name)
+    return marker is not None and PROPER_REGEX.search(name, marker.end()) is not None
+
+
 def filter_bad_releases(name, parse=True):
     """
     Filters out non-english and just all-around stupid releases by comparing them
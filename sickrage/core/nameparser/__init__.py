@@ -20,10 +20,12 @@
 # ##############################################################################
 
 
+import multiprocessing
 import os
 import re
 import time
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from threading import Lock
 
 from dateutil import parser
@@ -33,7 +35,7 @@ import sickrage
 from sickrage.core.common import Quality, Qualities
 from sickrage.core.databases.main import MainDB
 from sickrage.core.enums import SeriesProviderID
-from sickrage.core.helpers import remove_extension, strip_accents
+from sickrage.core.helpers import remove_extension, strip_accents, try_int
 from sickrage.core.nameparser import regexes
 from sickrage.core.scene_numbering import get_absolute_number_from_season_and_episode, get_series_provider_absolute_numbering, get_series_provider_numbering
 from sickrage.core.tv.show.helpers import find_show_by_name, find_show, find_show_by_scene_exception
@@ -52,11 +54,13 @@ class NameParser(object):
         self.validate_show = validate_show
 
         if self.show_obj and not self.show_obj.is_anime:
-            self._compile_regexes(self.NORMAL_REGEX)
+            self.regex_mode = self.NORMAL_REGEX
         elif self.show_obj and self.show_obj.is_anime:
-            self._compile_regexes(self.ANIME_REGEX)
+            self.regex_mode = self.ANIME_REGEX
         else:
-            self._compile_regexes(self.ALL_REGEX)
+            self.regex_mode = self.ALL_REGEX
+
+        self._compile_regexes(self.regex_mode)
 
     def get_show(self, name):
         if not name:
@@ -115,251 +119,159 @@ class NameParser(object):
         return series_name.strip()
 
     def _compile_regexes(self, regexMode):
-        if regexMode == self.ANIME_REGEX:
-            dbg_str = "ANIME"
-            uncompiled_regex = [regexes.anime_regexes]
-        elif regexMode == self.NORMAL_REGEX:
-            dbg_str = "NORMAL"
-            uncompiled_regex = [regexes.normal_regexes]
-        else:
-            dbg_str = "ALL"
-            uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
-
-        self.compiled_regexes = []
-        for regexItem in uncompiled_regex:
-            for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
-                try:
-                    cur_regex = re.compile(cur_pattern, re.VERBOSE | re.IGNORECASE)
-                except re.error as errormsg:
-                    sickrage.app.log.info(
-                        "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
-                            dbg_str, errormsg, cur_pattern))
-                else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+        self.compiled_regexes = get_compiled_regexes(regexMode)
 
     def _parse_string(self, name, skip_scene_detection=False):
         if not name:
             return
 
-        session = sickrage.app.main_db.session()
-
-        matches = []
-        best_result = None
-
-        for (cur_regex_num, cur_regex_name, cur_regex) in self.compiled_regexes:
-            match = cur_regex.match(name)
-
-            if not match:
-                continue
-
-            result = ParseResult(name)
-            result.which_regex = {cur_regex_name}
-            result.score = 0 - cur_regex_num
-
-            named_groups = match.groupdict().keys()
-
-            if 'series_name' in named_groups:
-                result.series_name = match.group('series_name')
-                if result.series_name:
-                    result.series_name = self.clean_series_name(result.series_name)
+        best_result = self._resolve_result(name, match_string(name, self.regex_mode), skip_scene_detection)
 
-            if 'season_num' in named_groups:
-                tmp_season = int(match.group('season_num'))
-                if cur_regex_name == 'bare' and tmp_season in (19, 20):
-                    continue
-                if cur_regex_name == 'fov' and tmp_season > 500:
-                    continue
-
-                result.season_number = tmp_season
-
-            if 'ep_num' in named_groups:
-                ep_num = self._convert_number(match.group('ep_num'))
-                if 'extra_ep_num' in named_groups and match.group('extra_ep_num'):
-                    tmp_episodes = list(range(ep_num, self._convert_number(match.group('extra_ep_num')) + 1))
-                    # if len(tmp_episodes) > 6:
-                    #     continue
-                else:
-                    tmp_episodes = [ep_num]
-
-                result.episode_numbers = tmp_episodes
+        # CPU sleep
+        time.sleep(0.02)
 
-            if 'ep_ab_num' in named_groups:
-                ep_ab_num = self._convert_number(match.group('ep_ab_num'))
+        return best_result
 
-                if 'extra_ab_ep_num' in named_groups and match.group('extra_ab_ep_num'):
-                    result.ab_episode_numbers = list(range(ep_ab_num, self._convert_number(match.group('extra_ab_ep_num')) + 1))
-                else:
-                    result.ab_episode_numbers = [ep_ab_num]
+    def _resolve_result(self, name, best_result, skip_scene_detection=False):
+        """
+        Resolves the show, quality and scene numbering of a regex match produced by match_string,
+        this part of parsing needs the database and show list so it always runs in the main process.
+        """
 
-            if 'air_date' in named_groups:
-                air_date = match.group('air_date')
-                try:
-                    result.air_date = parser.parse(air_date, fuzzy=True).date()
-                    result.score += cur_regex_num
-                except Exception:
-                    continue
-
-            if 'extra_info' in named_groups:
-                tmp_extra_info = match.group('extra_info')
-
-                # Show.S04.Special or Show.S05.Part.2.Extras is almost certainly not every episode in the season
-                if tmp_extra_info and cur_regex_name == 'season_only' and re.search(
-                        r'([. _-]|^)(special|extra)s?\w*([. _-]|$)', tmp_extra_info, re.I):
-                    continue
-                result.extra_info = tmp_extra_info
-
-            if 'release_group' in named_groups:
-                result.release_group = match.group('release_group')
-
-            if 'version' in named_groups:
-                # assigns version to anime file if detected using anime regex. Non-anime regex receives -1
-                version = match.group('version')
-                if version:
-                    result.version = version
-                else:
-                    result.version = 1
-            else:
-                result.version = -1
+        if not best_result:
+            return best_result
 
-            result.score += len([x for x in result.__dict__ if getattr(result, x, None) is not None])
-            matches.append(result)
+        session = sickrage.app.main_db.session()
 
-        if len(matches):
-            # pick best match with highest score based on placement
-            best_result = max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+        show_obj = None
+        best_result.series_id = self.show_obj.series_id if self.show_obj else 0
+        best_result.series_provider_id = self.show_obj.series_provider_id if self.show_obj else SeriesProviderID.THETVDB
+
+        if not self.naming_pattern:
+            # try and create a show object for this result
+            result = self.get_show(best_result.series_name)
+            if result and len(result) == 2:
+                best_result.series_id, best_result.series_provider_id = result
+
+            if best_result.series_id and best_result.series_provider_id:
+                show_obj = find_show(best_result.series_id, best_result.series_provider_id)
+
+        # if this is a naming pattern test or result doesn't have a show object then return best result
+        if not show_obj or self.naming_pattern:
+            return best_result
+
+        # get quality
+        best_result.quality = Quality.name_quality(name, show_obj.is_anime)
+
+        new_episode_numbers = []
+        new_season_numbers = []
+        new_absolute_numbers = []
+
+        # if we have an air-by-date show then get the real season/episode numbers
+        if best_result.is_air_by_date:
+            try:
+                dbData = session.query(MainDB.TVEpisode).filter_by(series_id=show_obj.series_id, series_provider_id=show_obj.series_provider_id,
+                                                                   airdate=best_result.air_date).one()
+                season_number = int(dbData.season)
+                episode_numbers = [int(dbData.episode)]
+            except (orm.exc.NoResultFound, orm.exc.MultipleResultsFound):
+                season_number = None
+                episode_numbers = []
+
+            if not season_number or not episode_numbers:
+                series_provider_language = show_obj.lang or sickrage.app.config.general.series_provider_default_language
+                series = show_obj.series_provider.search(show_obj.series_id, language=series_provider_language)
+                if series:
+                    ep_obj = series.aired_on(best_result.air_date)
+                    if not ep_obj:
+                        if best_result.in_showlist:
+                            sickrage.app.log.warning(f"Unable to find episode with date {best_result.air_date} for show {show_obj.name}, skipping")
+                        episode_numbers = []
+                    else:
+                        season_number = int(ep_obj[0]["airedseason"])
+                        episode_numbers = [int(ep_obj[0]["airedepisodenumber"])]
+
+            for epNo in episode_numbers:
+                s = season_number
+                e = epNo
+
+                if show_obj.scene and not skip_scene_detection:
+                    (s, e) = get_series_provider_numbering(show_obj.series_id,
+                                                           show_obj.series_provider_id,
+                                                           season_number,
+                                                           epNo)
+                if s != -1:
+                    new_season_numbers.append(s)
 
-            show_obj = None
-            best_result.series_id = self.show_obj.series_id if self.show_obj else 0
-            best_result.series_provider_id = self.show_obj.series_provider_id if self.show_obj else SeriesProviderID.THETVDB
+                if e != -1:
+                    new_episode_numbers.append(e)
+
+        elif show_obj.is_anime and best_result.ab_episode_numbers:
+            for epAbsNo in best_result.ab_episode_numbers:
+                a = epAbsNo
+
+                if show_obj.scene:
+                    scene_result = show_obj.get_scene_exception_by_name(best_result.series_name)
+                    if scene_result:
+                        a = get_series_provider_absolute_numbering(show_obj.series_id,
+                                                                   show_obj.series_provider_id, epAbsNo,
+                                                                   True, scene_result[1])
+
+                (s, e) = show_obj.get_all_episodes_from_absolute_number([a])
+
+                if a != -1:
+                    new_absolute_numbers.append(a)
+
+                new_season_numbers.append(s)
+                new_episode_numbers.extend(e)
+
+        elif best_result.season_number and best_result.episode_numbers:
+            for epNo in best_result.episode_numbers:
+                s = best_result.season_number
+                e = epNo
+
+                if show_obj.scene and not skip_scene_detection:
+                    (s, e) = get_series_provider_numbering(show_obj.series_id,
+                                                           show_obj.series_provider_id,
+                                                           best_result.season_number,
+                                                           epNo)
+                if show_obj.is_anime:
+                    a = get_absolute_number_from_season_and_episode(show_obj.series_id, show_obj.series_provider_id, s, e)
+                    if a not in [-1, None]:
+                        new_absolute_numbers.append(a)
 
-            if not self.naming_pattern:
-                # try and create a show object for this result
-                result = self.get_show(best_result.series_name)
-                if result and len(result) == 2:
-                    best_result.series_id, best_result.series_provider_id = result
+                if s != -1:
+                    new_season_numbers.append(s)
 
-                if best_result.series_id and best_result.series_provider_id:
-                    show_obj = find_show(best_result.series_id, best_result.series_provider_id)
+                if e != -1:
+                    new_episode_numbers.append(e)
 
-            # if this is a naming pattern test or result doesn't have a show object then return best result
-            if not show_obj or self.naming_pattern:
-                return best_result
+        # need to do a quick sanity check here.  It's possible that we now have episodes
+        # from more than one season (by tvdb numbering), and this is just too much
+        # for sickrage, so we'd need to flag it.
+        new_season_numbers = list(set(new_season_numbers))  # remove duplicates
+        if len(new_season_numbers) > 1:
+            raise InvalidNameException(
+                f"Scene numbering results episodes from seasons {new_season_numbers}, (i.e. more than one) and sickrage does not support this.  Sorry.")
 
-            # get quality
-            best_result.quality = Quality.name_quality(name, show_obj.is_anime)
+        # I guess it's possible that we'd have duplicate episodes too, so lets
+        # eliminate them
+        new_episode_numbers = list(set(new_episode_numbers))
+        new_episode_numbers.sort()
 
-            new_episode_numbers = []
-            new_season_numbers = []
-            new_absolute_numbers = []
+        # maybe even duplicate absolute numbers so why not do them as well
+        new_absolute_numbers = list(set(new_absolute_numbers))
+        new_absolute_numbers.sort()
 
-            # if we have an air-by-date show then get the real season/episode numbers
-            if best_result.is_air_by_date:
-                try:
-                    dbData = session.query(MainDB.TVEpisode).filter_by(series_id=show_obj.series_id, series_provider_id=show_obj.series_provider_id,
-                                                                       airdate=best_result.air_date).one()
-                    season_number = int(dbData.season)
-                    episode_numbers = [int(dbData.episode)]
-                except (orm.exc.NoResultFound, orm.exc.MultipleResultsFound):
-                    season_number = None
-                    episode_numbers = []
-
-                if not season_number or not episode_numbers:
-                    series_provider_language = show_obj.lang or sickrage.app.config.general.series_provider_default_language
-                    series = show_obj.series_provider.search(show_obj.series_id, language=series_provider_language)
-                    if series:
-                        ep_obj = series.aired_on(best_result.air_date)
-                        if not ep_obj:
-                            if best_result.in_showlist:
-                                sickrage.app.log.warning(f"Unable to find episode with date {best_result.air_date} for show {show_obj.name}, skipping")
-                            episode_numbers = []
-                        else:
-                            season_number = int(ep_obj[0]["airedseason"])
-                            episode_numbers = [int(ep_obj[0]["airedepisodenumber"])]
-
-                for epNo in episode_numbers:
-                    s = season_number
-                    e = epNo
-
-                    if show_obj.scene and not skip_scene_detection:
-                        (s, e) = get_series_provider_numbering(show_obj.series_id,
-                                                               show_obj.series_provider_id,
-                                                               season_number,
-                                                               epNo)
-                    if s != -1:
-                        new_season_numbers.append(s)
-
-                    if e != -1:
-                        new_episode_numbers.append(e)
-
-            elif show_obj.is_anime and best_result.ab_episode_numbers:
-                for epAbsNo in best_result.ab_episode_numbers:
-                    a = epAbsNo
-
-                    if show_obj.scene:
-                        scene_result = show_obj.get_scene_exception_by_name(best_result.series_name)
-                        if scene_result:
-                            a = get_series_provider_absolute_numbering(show_obj.series_id,
-                                                                       show_obj.series_provider_id, epAbsNo,
-                                                                       True, scene_result[1])
-
-                    (s, e) = show_obj.get_all_episodes_from_absolute_number([a])
-
-                    if a != -1:
-                        new_absolute_numbers.append(a)
+        if len(new_absolute_numbers):
+            best_result.ab_episode_numbers = new_absolute_numbers
 
-                    new_season_numbers.append(s)
-                    new_episode_numbers.extend(e)
-
-            elif best_result.season_number and best_result.episode_numbers:
-                for epNo in best_result.episode_numbers:
-                    s = best_result.season_number
-                    e = epNo
-
-                    if show_obj.scene and not skip_scene_detection:
-                        (s, e) = get_series_provider_numbering(show_obj.series_id,
-                                                               show_obj.series_provider_id,
-                                                               best_result.season_number,
-                                                               epNo)
-                    if show_obj.is_anime:
-                        a = get_absolute_number_from_season_and_episode(show_obj.series_id, show_obj.series_provider_id, s, e)
-                        if a not in [-1, None]:
-                            new_absolute_numbers.append(a)
-
-                    if s != -1:
-                        new_season_numbers.append(s)
-
-                    if e != -1:
-                        new_episode_numbers.append(e)
-
-            # need to do a quick sanity check here.  It's possible that we now have episodes
-            # from more than one season (by tvdb numbering), and this is just too much
-            # for sickrage, so we'd need to flag it.
-            new_season_numbers = list(set(new_season_numbers))  # remove duplicates
-            if len(new_season_numbers) > 1:
-                raise InvalidNameException(
-                    f"Scene numbering results episodes from seasons {new_season_numbers}, (i.e. more than one) and sickrage does not support this.  Sorry.")
-
-            # I guess it's possible that we'd have duplicate episodes too, so lets
-            # eliminate them
-            new_episode_numbers = list(set(new_episode_numbers))
-            new_episode_numbers.sort()
-
-            # maybe even duplicate absolute numbers so why not do them as well
-            new_absolute_numbers = list(set(new_absolute_numbers))
-            new_absolute_numbers.sort()
-
-            if len(new_absolute_numbers):
-                best_result.ab_episode_numbers = new_absolute_numbers
-
-            if len(new_season_numbers) and len(new_episode_numbers):
-                best_result.episode_numbers = new_episode_numbers
-                best_result.season_number = new_season_numbers[0]
-
-            if show_obj.scene and not skip_scene_detection:
-                sickrage.app.log.debug(f"Scene converted parsed result {best_result.original_name} into {best_result}")
+        if len(new_season_numbers) and len(new_episode_numbers):
+            best_result.episode_numbers = new_episode_numbers
+            best_result.season_number = new_season_numbers[0]
 
-        # CPU sleep
-        time.sleep(0.02)
+        if show_obj.scene and not skip_scene_detection:
+            sickrage.app.log.debug(f"Scene converted parsed result {best_result.original_name} into {best_result}")
 
         return best_result
 
@@ -429,24 +341,65 @@ class NameParser(object):
             return cached
 
         # break it into parts if there are any (dirname, file name, extension)
-        dir_name, file_name = os.path.split(name)
-
-        base_file_name = file_name
-        if self.file_name:
-            base_file_name = remove_extension(file_name)
-
-        # set up a result to use
-        final_result = ParseResult(name)
+        base_file_name, dir_name = split_name(name, self.file_name)
 
         # try parsing the file name
         file_name_result = self._parse_string(base_file_name, skip_scene_detection)
 
-        # use only the direct parent dir
-        dir_name = os.path.basename(dir_name)
-
         # parse the dirname for extra info if needed
         dir_name_result = self._parse_string(dir_name, skip_scene_detection)
 
+        return self._build_result(name, file_name_result, dir_name_result, cache_result)
+
+    def parse_many(self, names, cache_result=True, skip_scene_detection=False, workers=None):
+        """
+        Parses a batch of release names, the regex stage is spread over a process pool and the
+        show lookups, quality and scene numbering are resolved afterwards in this process.
+
+        :param names: iterable of release names or file paths
+        :param cache_result: add successful results to the name parser cache
+        :param skip_scene_detection: skip scene numbering conversion
+        :param workers: number of worker processes, defaults to the name_parser_workers setting
+        :return: dict of name to ParseResult, or to the InvalidNameException/InvalidShowException raised for it
+        """
+
+        if self.naming_pattern:
+            cache_result = False
+
+        if workers is None:
+            workers = sickrage.app.config.general.name_parser_workers
+
+        results = OrderedDict()
+
+        to_parse = []
+        for name in names:
+            if name in results:
+                continue
+
+            cached = name_parser_cache.get(name)
+            if cached:
+                results[name] = cached
+                continue
+
+            results[name] = None
+            to_parse.append(name)
+
+        matches = name_parser_pool.map(to_parse, self.file_name, self.regex_mode, workers)
+
+        for name, (file_name_match, dir_name_match) in zip(to_parse, matches):
+            try:
+                file_name_result = self._resolve_result(file_name_match.original_name, file_name_match, skip_scene_detection) if file_name_match else None
+                dir_name_result = self._resolve_result(dir_name_match.original_name, dir_name_match, skip_scene_detection) if dir_name_match else None
+                results[name] = self._build_result(name, file_name_result, dir_name_result, cache_result)
+            except (InvalidNameException, InvalidShowException) as e:
+                results[name] = e
+
+        return results
+
+    def _build_result(self, name, file_name_result, dir_name_result, cache_result=True):
+        # set up a result to use
+        final_result = ParseResult(name)
+
         # build the ParseResult object
         final_result.air_date = self._combine_results(file_name_result, dir_name_result, 'air_date')
 
@@ -604,6 +557,222 @@ class NameParserCache(object):
 
 name_parser_cache = NameParserCache()
 
+_compiled_regexes = {}
+_compiled_regexes_lock = Lock()
+
+
+def match_string(name, regex_mode=NameParser.ALL_REGEX):
+    """
+    Runs the release name regexes against a single string and returns the best scoring match as a
+    ParseResult without any show information, it has no database or app dependencies so it is safe
+    to call from the name parser worker processes.
+    """
+
+    if not name:
+        return
+
+    matches = []
+
+    for (cur_regex_num, cur_regex_name, cur_regex) in get_compiled_regexes(regex_mode):
+        match = cur_regex.match(name)
+
+        if not match:
+            continue
+
+        result = ParseResult(name)
+        result.which_regex = {cur_regex_name}
+        result.score = 0 - cur_regex_num
+
+        named_groups = match.groupdict().keys()
+
+        if 'series_name' in named_groups:
+            result.series_name = match.group('series_name')
+            if result.series_name:
+                result.series_name = NameParser.clean_series_name(result.series_name)
+
+        if 'season_num' in named_groups:
+            tmp_season = int(match.group('season_num'))
+            if cur_regex_name == 'bare' and tmp_season in (19, 20):
+                continue
+            if cur_regex_name == 'fov' and tmp_season > 500:
+                continue
+
+            result.season_number = tmp_season
+
+        if 'ep_num' in named_groups:
+            ep_num = NameParser._convert_number(match.group('ep_num'))
+            if 'extra_ep_num' in named_groups and match.group('extra_ep_num'):
+                tmp_episodes = list(range(ep_num, NameParser._convert_number(match.group('extra_ep_num')) + 1))
+                # if len(tmp_episodes) > 6:
+                #     continue
+            else:
+                tmp_episodes = [ep_num]
+
+            result.episode_numbers = tmp_episodes
+
+        if 'ep_ab_num' in named_groups:
+            ep_ab_num = NameParser._convert_number(match.group('ep_ab_num'))
+
+            if 'extra_ab_ep_num' in named_groups and match.group('extra_ab_ep_num'):
+                result.ab_episode_numbers = list(range(ep_ab_num, NameParser._convert_number(match.group('extra_ab_ep_num')) + 1))
+            else:
+                result.ab_episode_numbers = [ep_ab_num]
+
+        if 'air_date' in named_groups:
+            air_date = match.group('air_date')
+            try:
+                result.air_date = parser.parse(air_date, fuzzy=True).date()
+                result.score += cur_regex_num
+            except Exception:
+                continue
+
+        if 'extra_info' in named_groups:
+            tmp_extra_info = match.group('extra_info')
+
+            # Show.S04.Special or Show.S05.Part.2.Extras is almost certainly not every episode in the season
+            if tmp_extra_info and cur_regex_name == 'season_only' and re.search(
+                    r'([. _-]|^)(special|extra)s?\w*([. _-]|$)', tmp_extra_info, re.I):
+                continue
+            result.extra_info = tmp_extra_info
+
+        if 'release_group' in named_groups:
+            result.release_group = match.group('release_group')
+
+        if 'version' in named_groups:
+            # assigns version to anime file if detected using anime regex. Non-anime regex receives -1
+            version = match.group('version')
+            if version:
+                result.version = version
+            else:
+                result.version = 1
+        else:
+            result.version = -1
+
+        result.score += len([x for x in result.__dict__ if getattr(result, x, None) is not None])
+        matches.append(result)
+
+    if not matches:
+        return
+
+    # pick best match with highest score based on placement
+    return max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+
+
+def get_compiled_regexes(regex_mode):
+    """
+    Returns the compiled release name regexes for a regex mode, regexes are compiled once per
+    process and shared between name parser instances.
+    """
+
+    with _compiled_regexes_lock:
+        if regex_mode not in _compiled_regexes:
+            if regex_mode == NameParser.ANIME_REGEX:
+                dbg_str = "ANIME"
+                uncompiled_regex = [regexes.anime_regexes]
+            elif regex_mode == NameParser.NORMAL_REGEX:
+                dbg_str = "NORMAL"
+                uncompiled_regex = [regexes.normal_regexes]
+            else:
+                dbg_str = "ALL"
+                uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
+
+            compiled_regexes = []
+            for regexItem in uncompiled_regex:
+                for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
+                    try:
+                        cur_regex = re.compile(cur_pattern, re.VERBOSE | re.IGNORECASE)
+                    except re.error as errormsg:
+                        sickrage.app.log.info(
+                            "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
+                                dbg_str, errormsg, cur_pattern))
+                    else:
+                        compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+
+            _compiled_regexes[regex_mode] = compiled_regexes
+
+        return _compiled_regexes[regex_mode]
+
+
+def split_name(name, file_name=True):
+    """
+    Splits a release name or path into the base file name and the direct parent dir name
+    """
+
+    dir_name, base_file_name = os.path.split(name)
+
+    if file_name:
+        base_file_name = remove_extension(base_file_name)
+
+    # use only the direct parent dir
+    return base_file_name, os.path.basename(dir_name)
+
+
+def match_names(split_names, regex_mode=NameParser.ALL_REGEX):
+    """
+    Regex stage of NameParser.parse_many, takes (base file name, dir name) tuples from split_name
+    and returns a (file name match, dir name match) tuple for each
+    """
+
+    return [(match_string(base_file_name, regex_mode), match_string(dir_name, regex_mode)) for base_file_name, dir_name in split_names]
+
+
+class NameParserPool(object):
+    min_chunk_size = 25
+
+    def __init__(self):
+        self.lock = Lock()
+        self.executor = None
+        self.workers = 0
+
+    def map(self, names, file_name=True, regex_mode=NameParser.ALL_REGEX, workers=1):
+        """
+        Runs the regex stage for a batch of names, small batches or a single worker skip the
+        process pool as pickling the results would cost more than it saves.
+        """
+
+        # splitting needs the app config for video extensions so it stays in this process
+        names = [split_name(name, file_name) for name in names]
+
+        workers = max(1, try_int(workers, 1))
+        if workers == 1 or len(names) < workers * self.min_chunk_size:
+            return match_names(names, regex_mode)
+
+        chunk_size = max(self.min_chunk_size, len(names) // (workers * 4))
+        chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+
+        try:
+            results = []
+            for chunk_results in self.get_executor(workers).map(match_names, chunks, [regex_mode] * len(chunks)):
+                results.extend(chunk_results)
+            return results
+        except Exception as e:
+            sickrage.app.log.debug("Name parser pool failed, parsing names in-process: {!r}".format(e))
+            self.shutdown()
+            return match_names(names, regex_mode)
+
+    def get_executor(self, workers):
+        with self.lock:
+            if self.executor and self.workers != workers:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+
+            if not self.executor:
+                # forking the threaded app could hand a worker locks held by other threads, workers only run regexes
+                self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+                self.workers = workers
+
+            return self.executor
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+                self.workers = 0
+
+
+name_parser_pool = NameParserPool()
+
 
 class InvalidNameException(Exception):
     """The given release name is not valid"""
@@ -331,13 +331,9 @@ class ProcessResult(object):
             if current_directory != sickrage.app.config.general.tv_download_dir and found_files:
                 found_files.append(os.path.basename(current_directory))
 
-            for found_file in found_files:
-                try:
-                    NameParser().parse(found_file, cache_result=False)
-                except (InvalidNameException, InvalidShowException) as e:
-                    pass
-                else:
-                    return True
+            parse_results = NameParser().parse_many(found_files, cache_result=False)
+            if any(not isinstance(parse_result, (InvalidNameException, InvalidShowException)) for parse_result in parse_results.values()):
+                return True
 
         self.log("Folder {} : No processable items found in folder".format(process_path),
                  sickrage.app.log.DEBUG)
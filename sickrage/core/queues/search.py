@@ -20,11 +20,14 @@
 # ##############################################################################
 
 
+import threading
+import time
 import traceback
-from collections import deque
+from collections import OrderedDict, defaultdict
 from enum import Enum
 
 import sickrage
+from sickrage.core.enums import SeriesProviderID
 from sickrage.core.queues import Queue, Task, TaskPriority
 from sickrage.core.search import search_providers, snatch_episode
 from sickrage.core.tv.show.helpers import find_show
@@ -39,31 +42,120 @@ class SearchTaskActions(Enum):
     MANUAL_SEARCH = 'Manual Search'
 
 
+class SearchHistory(object):
+    """
+    Bounded history of search queue entries keyed by (series_id, season, episode), every change of an entry moves it
+    to the end and gives it the next cursor. Entries are dropped oldest first once there are more than size of them or
+    they are older than age minutes, both default to the search history settings.
+    """
+
+    def __init__(self, size=None, age=None):
+        self._size = size
+        self._age = age
+        self.cursor = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self._size or sickrage.app.config.general.search_history_size
+
+    @property
+    def age(self):
+        return self._age or sickrage.app.config.general.search_history_age
+
+    def _expire(self):
+        expire_time = time.time() - self.age * 60
+        while self.entries and (len(self.entries) > self.size or next(iter(self.entries.values()))['time'] < expire_time):
+            self.entries.popitem(last=False)
+
+    def add(self, series_id, season, episode, **kwargs):
+        with self.lock:
+            self.cursor += 1
+            self.entries.pop((series_id, season, episode), None)
+            self.entries[(series_id, season, episode)] = dict(series_id=series_id, season=season, episode=episode,
+                                                              cursor=self.cursor, time=time.time(), **kwargs)
+            self._expire()
+
+    def get(self, series_id, season, episode):
+        with self.lock:
+            self._expire()
+            return self.entries.get((series_id, season, episode))
+
+    def remove(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def since(self, cursor=0, series_id=None):
+        """
+        Returns the entries changed after cursor, oldest first, only walking the entries newer than the cursor
+        """
+        entries = []
+
+        with self.lock:
+            self._expire()
+            for entry in reversed(self.entries.values()):
+                if entry['cursor'] <= cursor:
+                    break
+                if series_id is None or entry['series_id'] == series_id:
+                    entries.insert(0, entry)
+
+        return entries
+
+    def __contains__(self, key):
+        return self.get(*key) is not None
+
+    def __len__(self):
+        with self.lock:
+            self._expire()
+            return len(self.entries)
+
+
 class SearchQueue(Queue):
     def __init__(self):
         Queue.__init__(self, "SEARCHQUEUE")
-        self.TASK_HISTORY = {}
-        self.SNATCH_HISTORY = deque(maxlen=100)
+        self.TASK_HISTORY = SearchHistory()
+        self.SNATCH_HISTORY = SearchHistory()
 
-    def is_in_queue(self, series_id, season, episode):
-        for task in self.tasks.copy().values():
-            if all([isinstance(task, BacklogSearchTask), task.series_id == series_id, task.season == season, task.episode == episode]):
-                return True
+        # secondary indexes of the tasks, kept in sync with self.tasks by put and remove_task
+        self.show_tasks = defaultdict(dict)
+        self.episode_tasks = defaultdict(dict)
+        self.type_tasks = defaultdict(dict)
 
-        return False
+    def _task_indexes(self, task):
+        return [(self.show_tasks, (task.series_id, task.series_provider_id)),
+                (self.episode_tasks, (task.series_id, task.season, task.episode)),
+                (self.type_tasks, type(task))]
 
-    def is_ep_in_queue(self, season, episode):
-        for task in self.tasks.copy().values():
-            if all([isinstance(task, (ManualSearchTask, FailedSearchTask)), task.season == season, task.episode == episode]):
-                return True
+    def _index_task(self, task):
+        for index, key in self._task_indexes(task):
+            index[key][task.id] = task
 
-        return False
+    def _unindex_task(self, task):
+        for index, key in self._task_indexes(task):
+            index.get(key, {}).pop(task.id, None)
+            if key in index and not index[key]:
+                del index[key]
 
-    def is_show_in_queue(self, series_id):
-        return any(self.get_all_tasks_from_queue_by_show(series_id))
+    def _get_tasks_by_type(self, *task_types):
+        return [task for task_type in task_types for task in self.type_tasks.get(task_type, {}).copy().values()]
+
+    def is_in_queue(self, series_id, season, episode):
+        return any(isinstance(task, BacklogSearchTask) for task in self.episode_tasks.get((series_id, season, episode), {}).copy().values())
 
-    def get_all_tasks_from_queue_by_show(self, series_id):
-        return [task for task in self.tasks.copy().values() if task.series_id == series_id]
+    def is_ep_in_queue(self, series_id, season, episode):
+        return any(isinstance(task, (ManualSearchTask, FailedSearchTask)) for task in
+                   self.episode_tasks.get((series_id, season, episode), {}).copy().values())
+
+    def is_show_in_queue(self, series_id, series_provider_id=None):
+        return any(self.get_all_tasks_from_queue_by_show(series_id, series_provider_id))
+
+    def get_all_tasks_from_queue_by_show(self, series_id, series_provider_id=None):
+        series_provider_ids = [series_provider_id] if series_provider_id else list(SeriesProviderID)
+        return [task for x in series_provider_ids for task in self.show_tasks.get((series_id, x), {}).copy().values()]
+
+    def get_all_tasks_from_queue_by_episode(self, series_id, season, episode):
+        return list(self.episode_tasks.get((series_id, season, episode), {}).copy().values())
 
     def pause_daily_searcher(self):
         sickrage.app.scheduler.pause_job(sickrage.app.daily_searcher.name)
@@ -84,27 +176,19 @@ class SearchQueue(Queue):
         return not sickrage.app.scheduler.get_job(sickrage.app.backlog_searcher.name).next_run_time
 
     def is_manual_search_in_progress(self):
-        return any(isinstance(task, (ManualSearchTask, FailedSearchTask)) for task in self.tasks.copy().values())
+        return bool(self.type_tasks.get(ManualSearchTask) or self.type_tasks.get(FailedSearchTask))
 
     def is_backlog_in_progress(self):
-        return any(isinstance(task, BacklogSearchTask) for task in self.tasks.copy().values())
+        return bool(self.type_tasks.get(BacklogSearchTask))
 
     def is_dailysearch_in_progress(self):
-        return any(isinstance(task, DailySearchTask) for task in self.tasks.copy().values())
+        return bool(self.type_tasks.get(DailySearchTask))
 
     def queue_length(self):
-        length = {'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0}
-        for task in self.tasks.copy().values():
-            if isinstance(task, DailySearchTask):
-                length['daily'] += 1
-            elif isinstance(task, BacklogSearchTask):
-                length['backlog'] += 1
-            elif isinstance(task, ManualSearchTask):
-                length['manual'] += 1
-            elif isinstance(task, FailedSearchTask):
-                length['failed'] += 1
-
-        return length
+        return {'backlog': len(self.type_tasks.get(BacklogSearchTask, {})),
+                'daily': len(self.type_tasks.get(DailySearchTask, {})),
+                'manual': len(self.type_tasks.get(ManualSearchTask, {})),
+                'failed': len(self.type_tasks.get(FailedSearchTask, {}))}
 
     def put(self, item, *args, **kwargs):
         if all([not sickrage.app.config.general.use_nzbs, not sickrage.app.config.general.use_torrents]):
@@ -114,17 +198,37 @@ class SearchQueue(Queue):
             sickrage.app.log.warning("Search Failed, No NZB/Torrent providers enabled")
             return
 
-        if isinstance(item, DailySearchTask):
-            # daily searches
-            super(SearchQueue, self).put(item)
-        elif isinstance(item, BacklogSearchTask) and not self.is_in_queue(item.series_id, item.season, item.episode):
-            # backlog searches
-            super(SearchQueue, self).put(item)
-        elif isinstance(item, (ManualSearchTask, FailedSearchTask)) and not self.is_ep_in_queue(item.season, item.episode):
-            # manual and failed searches
-            super(SearchQueue, self).put(item)
-        else:
-            sickrage.app.log.debug("Not adding item, it's already in the queue")
+        with self.lock:
+            if isinstance(item, DailySearchTask):
+                # daily searches
+                task_id = super(SearchQueue, self).put(item)
+            elif isinstance(item, BacklogSearchTask) and not self.is_in_queue(item.series_id, item.season, item.episode):
+                # backlog searches
+                task_id = super(SearchQueue, self).put(item)
+            elif isinstance(item, (ManualSearchTask, FailedSearchTask)) and not self.is_ep_in_queue(item.series_id, item.season, item.episode):
+                # manual and failed searches
+                task_id = super(SearchQueue, self).put(item)
+                self.TASK_HISTORY.add(item.series_id, item.season, item.episode, task_id=item.id, status='Queued')
+            else:
+                sickrage.app.log.debug("Not adding item, it's already in the queue")
+                return
+
+            self._index_task(item)
+
+            return task_id
+
+    def remove_task(self, task_id):
+        with self.lock:
+            task = self.tasks.get(task_id)
+            super(SearchQueue, self).remove_task(task_id)
+            if task:
+                self._unindex_task(task)
+
+    def shutdown(self):
+        super(SearchQueue, self).shutdown()
+        self.show_tasks.clear()
+        self.episode_tasks.clear()
+        self.type_tasks.clear()
 
 
 class DailySearchTask(Task):
@@ -166,7 +270,7 @@ class DailySearchTask(Task):
                               not in sickrage.app.search_queue.SNATCH_HISTORY for episode in search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.SNATCH_HISTORY.append((search_result.series_id, search_result.season, episode)) for episode in
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add(search_result.series_id, search_result.season, episode) for episode in
                      search_result.episodes]
 
                     sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
@@ -200,13 +304,11 @@ class ManualSearchTask(Task):
     def run(self):
         self.started = True
 
-        sickrage.app.search_queue.TASK_HISTORY[self.id] = {
-            'season': self.season,
-            'episode': self.episode
-        }
+        sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Searching')
 
         show_object = find_show(self.series_id, self.series_provider_id)
         if not show_object:
+            sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Finished')
             return
 
         episode_object = show_object.get_episode(self.season, self.episode)
@@ -227,7 +329,7 @@ class ManualSearchTask(Task):
                                              downCurQuality=self.downCurQuality)
 
             if search_result:
-                [sickrage.app.search_queue.SNATCH_HISTORY.append((search_result.series_id, search_result.season, episode)) for episode in
+                [sickrage.app.search_queue.SNATCH_HISTORY.add(search_result.series_id, search_result.season, episode) for episode in
                  search_result.episodes]
 
                 sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
@@ -247,6 +349,7 @@ class ManualSearchTask(Task):
         except Exception:
             sickrage.app.log.debug(traceback.format_exc())
         finally:
+            sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Finished')
             sickrage.app.log.info("Finished manual search for: [" + episode_object.pretty_name() + "]")
 
     def finish(self):
@@ -259,13 +362,14 @@ class ManualSearchTask(Task):
 
 
 class BacklogSearchTask(Task):
-    def __init__(self, series_id, series_provider_id, season, episode):
+    def __init__(self, series_id, series_provider_id, season, episode, plan=None):
         super(BacklogSearchTask, self).__init__(SearchTaskActions.BACKLOG_SEARCH.value, SearchTaskActions.BACKLOG_SEARCH)
         self.name = f'BACKLOG-{series_id}-{series_provider_id.display_name}'
         self.series_id = series_id
         self.series_provider_id = series_provider_id
         self.season = season
         self.episode = episode
+        self.plan = plan
         self.priority = TaskPriority.LOW
         self.started = False
         self.success = False
@@ -273,13 +377,15 @@ class BacklogSearchTask(Task):
     def run(self):
         self.started = True
 
-        show_object = find_show(self.series_id, self.series_provider_id)
-        if not show_object:
-            return
-
-        episode_object = show_object.get_episode(self.season, self.episode)
+        show_object = episode_object = None
 
         try:
+            show_object = find_show(self.series_id, self.series_provider_id)
+            if not show_object:
+                return
+
+            episode_object = show_object.get_episode(self.season, self.episode)
+
             sickrage.app.log.info("Starting backlog search for: [{}] S{:02d}E{:02d}".format(show_object.name, self.season, self.episode))
 
             WebSocketMessage('SEARCH_QUEUE_STATUS_UPDATED',
@@ -291,29 +397,51 @@ class BacklogSearchTask(Task):
                                              self.series_provider_id,
                                              self.season,
                                              self.episode,
-                                             manualSearch=False)
+                                             manualSearch=False,
+                                             plan=self.plan)
 
             if search_result:
                 snatch = all([(search_result.series_id, search_result.season, episode)
                               not in sickrage.app.search_queue.SNATCH_HISTORY for episode in search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.SNATCH_HISTORY.append((search_result.series_id, search_result.season, episode)) for episode in
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add(search_result.series_id, search_result.season, episode) for episode in
                      search_result.episodes]
 
                     sickrage.app.log.info("Downloading {} from {}".format(search_result.name, search_result.provider.name))
-                    snatch_episode(search_result)
+                    self.success = snatch_episode(search_result)
             else:
                 sickrage.app.log.info("Unable to find search results for: [{}] S{:02d}E{:02d}".format(show_object.name, self.season, self.episode))
         except Exception:
             sickrage.app.log.debug(traceback.format_exc())
         finally:
-            WebSocketMessage('SEARCH_QUEUE_STATUS_UPDATED',
-                             {'seriesSlug': show_object.slug,
-                              'episodeId': episode_object.episode_id,
-                              'searchQueueStatus': episode_object.search_queue_status}).push()
+            if episode_object is not None:
+                WebSocketMessage('SEARCH_QUEUE_STATUS_UPDATED',
+                                 {'seriesSlug': show_object.slug,
+                                  'episodeId': episode_object.episode_id,
+                                  'searchQueueStatus': episode_object.search_queue_status}).push()
+
+                sickrage.app.log.info("Finished backlog search for: [{}] S{:02d}E{:02d}".format(show_object.name, self.season, self.episode))
+
+            # the backlog cursor only lets go of a queued episode once its task says it was searched
+            self.set_searched()
+
+    def set_searched(self):
+        key = (self.series_id, self.series_provider_id, self.season, self.episode)
+
+        if self.plan:
+            self.plan.done(self.season, self.episode)
+
+            # an episode the search plan cap kept from a provider was not searched, it stays pending in the backlog
+            # cursor and is searched again with the next plan
+            if self.plan.is_deferred(self.season, self.episode) and not self.success:
+                if sickrage.app.backlog_searcher:
+                    sickrage.app.backlog_searcher.cursor.set_pending(key)
+                return
 
-            sickrage.app.log.info("Finished backlog search for: [{}] S{:02d}E{:02d}".format(show_object.name, self.season, self.episode))
+        # records the episode in the backlog cursor so a restarted backlog cycle does not search it again
+        if sickrage.app.backlog_searcher:
+            sickrage.app.backlog_searcher.cursor.set_searched(key, sickrage.app.backlog_searcher.request_cost())
 
 
 class FailedSearchTask(Task):
@@ -332,13 +460,11 @@ class FailedSearchTask(Task):
     def run(self):
         self.started = True
 
-        sickrage.app.search_queue.TASK_HISTORY[self.id] = {
-            'season': self.season,
-            'episode': self.episode
-        }
+        sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Searching')
 
         show_object = find_show(self.series_id, self.series_provider_id)
         if not show_object:
+            sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Finished')
             return
 
         episode_object = show_object.get_episode(self.season, self.episode)
@@ -374,7 +500,7 @@ class FailedSearchTask(Task):
                               search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.SNATCH_HISTORY.append((search_result.series_id, search_result.season, episode)) for episode in
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add(search_result.series_id, search_result.season, episode) for episode in
                      search_result.episodes]
 
                     sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
@@ -387,4 +513,5 @@ class FailedSearchTask(Task):
                               'episodeId': episode_object.episode_id,
                               'searchQueueStatus': episode_object.search_queue_status}).push()
 
+            sickrage.app.search_queue.TASK_HISTORY.add(self.series_id, self.season, self.episode, task_id=self.id, status='Finished')
             sickrage.app.log.info("Finished failed download search for: [" + show_object.name + "]")
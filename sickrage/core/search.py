@@ -16,11 +16,20 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+import contextlib
+import hashlib
 import itertools
 import re
 import threading
+import time
+from base64 import b16encode, b32decode
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from datetime import date, timedelta
 
+from bencode3 import bdecode, bencode
+from sqlalchemy import func
+
 import sickrage
 from sickrage.clients import get_client_instance
 from sickrage.clients.nzb.nzbget import NZBGet
@@ -30,9 +39,10 @@ from sickrage.core.common import (
     SEASON_RESULT,
     MULTI_EP_RESULT
 )
+from sickrage.core.databases.main import MainDB
 from sickrage.core.enums import NzbMethod, TorrentMethod
 from sickrage.core.exceptions import AuthException
-from sickrage.core.helpers import show_names
+from sickrage.core.helpers import show_names, try_int
 from sickrage.core.nzbSplitter import split_nzb_result
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.tv.show.history import (
@@ -46,6 +56,8 @@ from sickrage.search_providers import (
     TorrentProvider,
     TorrentRssProvider, SearchProviderType
 )
+from sickrage.search_providers.content_cache import content_cache
+from sickrage.search_providers.health import provider_health
 
 
 def snatch_episode(result, end_status=EpisodeStatus.SNATCHED):
@@ -70,7 +82,7 @@ def snatch_episode(result, end_status=EpisodeStatus.SNATCHED):
             if date.today() - show_object.get_episode(result.season, episode_number).airdate <= timedelta(days=7):
                 result.priority = 1
 
-    if re.search(r'(^|[. _-])(proper|repack)([. _-]|$)', result.name, re.I) is not None:
+    if show_names.is_proper(result.name):
         end_status = EpisodeStatus.SNATCHED_PROPER
 
     # get result content
@@ -110,6 +122,7 @@ def snatch_episode(result, end_status=EpisodeStatus.SNATCHED):
 
     FailedHistory.log_snatch(result)
     History.log_snatch(result)
+    provider_health.record_snatch(result.provider.id)
 
     sickrage.app.alerts.message(_('Episode snatched'), result.name)
 
@@ -307,7 +320,319 @@ def is_first_best_match(result):
     return False
 
 
-def search_providers(series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False):
+class SearchProviderFanOut(object):
+    """
+    Queries search providers concurrently on a bounded thread pool.
+
+    Results are handed back in provider order so the configured provider priority still decides which result wins.
+    A provider that runs longer than the per provider timeout, or past the overall deadline, is skipped. Closing the
+    generator returned by run, for example once an acceptable result was found, cancels the searches not started yet.
+    """
+
+    def __init__(self, workers=5, provider_timeout=60, deadline=300):
+        self.workers = max(1, workers)
+        self.provider_timeout = provider_timeout
+        self.deadline = deadline
+
+    def run(self, func, providers, cancelled=None):
+        """
+        Calls func for every provider and yields (provider, result) tuples in provider order
+
+        :param func: function called with a provider, runs on a worker thread
+        :param providers: list of providers to search
+        :param cancelled: optional function called with every provider whose search was cancelled before it started
+        :return: generator of (provider, result) tuples, result is None if the provider failed or timed out
+        """
+        if not providers:
+            return
+
+        deadline = time.monotonic() + self.deadline
+        started = {}
+
+        def job(index, provider):
+            started[index] = time.monotonic()
+            return func(provider)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.workers, len(providers)))
+        futures = [executor.submit(job, index, provider) for index, provider in enumerate(providers)]
+
+        try:
+            for index, provider in enumerate(providers):
+                yield provider, self._wait(futures[index], provider, lambda: started.get(index), deadline)
+        finally:
+            for index, future in enumerate(futures):
+                if future.cancel() and cancelled:
+                    cancelled(providers[index])
+            executor.shutdown(wait=False)
+
+    def _wait(self, future, provider, get_started, deadline):
+        while True:
+            now = time.monotonic()
+
+            # the provider timeout only starts counting once a worker picked the search up
+            started = get_started()
+            limit = deadline if started is None else min(deadline, started + self.provider_timeout)
+            if now >= limit and not future.done():
+                sickrage.app.log.warning("Timed out while searching " + provider.name + ", skipping")
+                return None
+
+            try:
+                return future.result(timeout=max(0, limit - now) if started is not None else min(limit - now, 1))
+            except TimeoutError:
+                continue
+            except Exception as e:
+                sickrage.app.log.error("Error while searching " + provider.name + ", skipping: {}".format(e))
+                return None
+
+
+class ResultDeduplicator(object):
+    """
+    Merges search results of the same release returned by several providers.
+
+    Results are the same release when they share an infohash, taken from their magnet link or their torrent content,
+    or when their normalized names match and their sizes are within one percent of each other.  Only the first result
+    of a release is kept for evaluation, later duplicates with more seeders replace it as the source of the release.
+    """
+
+    source_fields = ('provider', 'provider_type', 'url', 'seeders', 'leechers', 'content', 'hash', 'extraInfo')
+
+    def __init__(self):
+        self.releases = {}
+        self.hashes = {}
+        self.names = {}
+        self.result_releases = {}
+        self.total = 0
+        self.duplicates = 0
+
+    @property
+    def duplicate_rate(self):
+        return self.duplicates / self.total if self.total else 0
+
+    @staticmethod
+    def info_hash(result):
+        match = re.search(r'urn:btih:([\w]{32,40})', result.url or '')
+        if match:
+            info_hash = match.group(1).upper()
+            if len(info_hash) == 32:
+                info_hash = b16encode(b32decode(info_hash)).decode()
+            return info_hash
+
+        info_hash = content_cache.info_hash(result.url)
+        if info_hash:
+            return info_hash.upper()
+
+        if result.content:
+            try:
+                return hashlib.sha1(bencode(bdecode(result.content)['info'])).hexdigest().upper()
+            except Exception:
+                pass
+
+    @staticmethod
+    def normalize_name(name):
+        name = re.sub(r'(\s*\[[^\]]*\])+$|\.(mkv|mp4|avi|torrent|nzb)$', '', name.strip().lower())
+        return re.sub(r'[^a-z0-9]+', '.', name).strip('.')
+
+    @staticmethod
+    def same_size(size, other_size):
+        if not size or not other_size or size < 0 or other_size < 0:
+            return False
+        return abs(size - other_size) <= max(size, other_size) * 0.01
+
+    @staticmethod
+    def better_source(result, other):
+        return try_int(result.seeders, -1) > try_int(other.seeders, -1)
+
+    def _find(self, info_hash, name, size):
+        if info_hash and info_hash in self.hashes:
+            return self.hashes[info_hash]
+
+        for release_size, release in self.names.get(name, []):
+            if self.same_size(size, release_size):
+                return release
+
+    def filter(self, results):
+        """
+        Removes results of releases that were already seen
+
+        :param results: list of search results
+        :return: list of results of new releases
+        """
+        kept = []
+
+        for result in results:
+            self.total += 1
+
+            info_hash, name = self.info_hash(result), self.normalize_name(result.name)
+            release = self._find(info_hash, name, result.size)
+
+            if release is None:
+                release = len(self.releases)
+                self.releases[release] = result
+                kept.append(result)
+            else:
+                self.duplicates += 1
+
+                best = self.releases[release]
+                if self.better_source(result, best):
+                    self.releases[release] = result
+                    if best in kept:
+                        kept[kept.index(best)] = result
+
+            # remember every identity of the release so later duplicates match either one
+            if info_hash:
+                self.hashes.setdefault(info_hash, release)
+            self.names.setdefault(name, []).append((result.size, release))
+            self.result_releases[result] = release
+
+        return kept
+
+    def best_source(self, result):
+        """
+        Points a result at the source of its release with the most seeders seen so far, what the search made of the
+        result, like the episodes of a season pack, is kept
+
+        :param result: search result that was passed through filter
+        :return: the same result
+        """
+        best = self.releases.get(self.result_releases.get(result))
+        if best is not None and best is not result:
+            for field in self.source_fields:
+                setattr(result, field, getattr(best, field))
+        return result
+
+
+class SearchPlan(object):
+    """
+    Plans the provider searches for a batch of wanted episodes of a show.
+
+    Episodes are grouped by season, a season of which at least season_ratio of the aired episodes is wanted gets
+    searched with season queries instead of a query per episode.  The items returned for a search string are shared
+    by every search of the plan so each string is sent to a provider once, and no more than max_search_strings are
+    sent to a provider for the whole plan.  Episodes of which the cap kept every search string from a provider are
+    deferred, they were not searched and are left to the next plan.
+    """
+
+    def __init__(self, series_id, series_provider_id, episodes, season_ratio=0.5, max_search_strings=30):
+        self.lock = threading.Lock()
+        self.series_id = series_id
+        self.series_provider_id = series_provider_id
+        self.season_ratio = season_ratio
+        self.max_search_strings = max_search_strings
+        self.pending = set(episodes)
+        self.search_modes = {}
+        self.responses = {}
+        self.search_locks = defaultdict(threading.Lock)
+        self.requests = defaultdict(int)
+        self.unplanned_requests = defaultdict(int)
+        self.skipped_requests = defaultdict(int)
+        self.searched_episodes = set()
+        self.capped_episodes = set()
+
+        wanted = defaultdict(list)
+        for season, episode in episodes:
+            wanted[season].append(episode)
+
+        with sickrage.app.main_db.session() as session:
+            aired = dict(session.query(MainDB.TVEpisode.season, func.count(MainDB.TVEpisode.episode)).filter(
+                MainDB.TVEpisode.series_id == series_id,
+                MainDB.TVEpisode.series_provider_id == series_provider_id,
+                MainDB.TVEpisode.airdate > date.min,
+                MainDB.TVEpisode.airdate < date.today()
+            ).group_by(MainDB.TVEpisode.season).all())
+
+        for season, season_episodes in wanted.items():
+            if season > 0 and len(season_episodes) > 1 and len(season_episodes) >= self.season_ratio * aired.get(season, 0):
+                self.search_modes[season] = 'sponly'
+            else:
+                self.search_modes[season] = 'eponly'
+
+    @property
+    def requests_saved(self):
+        return sum(self.unplanned_requests.values()) - sum(self.requests.values())
+
+    def search_mode(self, season):
+        return self.search_modes.get(season, 'eponly')
+
+    def add_unplanned(self, provider, season, episode):
+        """
+        Counts the search strings the provider would have been sent for the episode without a plan
+        """
+        if provider.search_mode == 'sponly':
+            search_strings = provider._get_season_search_strings(self.series_id, self.series_provider_id, season, episode)
+        else:
+            search_strings = provider._get_episode_search_strings(self.series_id, self.series_provider_id, season, episode)
+
+        with self.lock:
+            self.unplanned_requests[provider.id] += sum(len(x) for search_string in search_strings for x in search_string.values())
+
+    def search(self, provider, search_strings, **kwargs):
+        """
+        Searches the provider for the search strings that were not sent yet by this plan
+
+        :param provider: search provider
+        :param search_strings: dict of search mode and list of search strings
+        :return: list of items
+        """
+        key = (provider.id, tuple((mode, tuple(strings)) for mode, strings in search_strings.items()))
+        episode_key = (provider.id, kwargs.get('season'), kwargs.get('episode'))
+
+        with self.lock:
+            search_lock = self.search_locks[key]
+
+        with search_lock:
+            if key in self.responses:
+                with self.lock:
+                    self.searched_episodes.add(episode_key)
+                return self.responses[key]
+
+            with self.lock:
+                allowed = self.max_search_strings - self.requests[provider.id]
+
+                planned_strings = {}
+                for mode, strings in search_strings.items():
+                    planned_strings[mode] = strings[:max(0, allowed)]
+                    allowed -= len(planned_strings[mode])
+                    self.skipped_requests[provider.id] += len(strings) - len(planned_strings[mode])
+
+                self.requests[provider.id] += sum(len(x) for x in planned_strings.values())
+
+                if any(planned_strings.values()):
+                    self.searched_episodes.add(episode_key)
+                else:
+                    self.capped_episodes.add(episode_key)
+
+            if not any(planned_strings.values()):
+                sickrage.app.log.debug("Skipping search of {}, the search plan sent {} search strings to it already".format(
+                    provider.name, self.max_search_strings))
+                return []
+
+            self.responses[key] = provider.search(planned_strings, **kwargs)
+            return self.responses[key]
+
+    def is_deferred(self, season, episode):
+        """
+        Checks if the cap kept every search string of the episode from at least one provider
+        """
+        with self.lock:
+            return any(x[1:] == (season, episode) for x in self.capped_episodes - self.searched_episodes)
+
+    def done(self, season, episode):
+        """
+        Marks the search of an episode of the plan as finished, the requests saved by the plan are logged once the
+        last episode is searched
+        """
+        with self.lock:
+            self.pending.discard((season, episode))
+            if self.pending:
+                return
+
+        show_object = find_show(self.series_id, self.series_provider_id)
+
+        sickrage.app.log.info("Search plan for {} sent {} provider requests, saving {} and skipping {}".format(
+            show_object.name if show_object else self.series_id, sum(self.requests.values()), self.requests_saved, sum(self.skipped_requests.values())))
+
+
+def search_providers(series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False, plan=None):
     """
     Walk providers for information on shows
 
@@ -315,6 +640,7 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
     :param episodes: Episode IDs we hope to find
     :param manualSearch: Boolean, is this a manual search?
     :param downCurQuality: Boolean, should we re-download currently available quality file
+    :param plan: SearchPlan shared by the searches of a batch of episodes
     :return: results for search
     """
 
@@ -324,6 +650,7 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
 
     final_results = []
 
+    providers = []
     for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.general.randomize_providers).items():
         # check if provider is enabled
         if not providerObj.is_enabled:
@@ -339,11 +666,32 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
             sickrage.app.log.debug("" + str(show_object.name) + " is not an anime, skiping")
             continue
 
+        providers.append(providerObj)
+
+    if sickrage.app.config.general.adaptive_provider_order:
+        providers = provider_health.order(providers)
+
+    # skip providers with an open circuit breaker, a manual search still asks every provider
+    if sickrage.app.config.general.provider_circuit_breaker and not manualSearch:
+        for providerObj in providers.copy():
+            if not provider_health.allow(providerObj.id):
+                sickrage.app.log.info("Skipping " + providerObj.name + ", its circuit breaker is open after too many failed searches")
+                providers.remove(providerObj)
+
+    def search_provider(providerObj):
         found_results = {}
+        search_failed = False
+        search_start = time.monotonic()
 
         search_count = 0
         search_mode = providerObj.search_mode
 
+        # the search plan picks the search mode for the season of the episode
+        if plan and not manualSearch:
+            search_mode = plan.search_mode(season)
+            if not cacheOnly:
+                plan.add_unplanned(providerObj, season, episode)
+
         # Always search for episode when manually searching when in sponly
         if search_mode == 'sponly' and manualSearch is True:
             search_mode = 'eponly'
@@ -367,15 +715,16 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
                                                                 search_mode,
                                                                 manualSearch,
                                                                 downCurQuality,
-                                                                cacheOnly)
+                                                                cacheOnly,
+                                                                plan)
             except AuthException as e:
                 sickrage.app.log.warning("Authentication error: {}".format(e))
+                search_failed = True
                 break
             except Exception as e:
                 sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
+                search_failed = True
                 break
-            finally:
-                threading.currentThread().setName(orig_thread_name)
 
             if len(found_results):
                 # make a list of all the results for this provider
@@ -394,175 +743,209 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
                 sickrage.app.log.debug("Fallback season pack search initiate")
                 search_mode = 'sponly'
 
-        # skip to next provider if we have no results to process
-        if not len(found_results):
-            continue
+        # searches finishing after the provider timeout were skipped and count as failed
+        search_latency = time.monotonic() - search_start
+        provider_health.record_search(providerObj.id,
+                                      not search_failed and search_latency <= sickrage.app.config.general.search_provider_timeout,
+                                      search_latency,
+                                      sum(len(x) for x in found_results.values()))
 
-        # remove duplicates
-        for cur_episode in found_results:
-            found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
+        return found_results
 
-        # pick the best season NZB
-        best_season_result = None
-        if SEASON_RESULT in found_results:
-            best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
+    deduplicator = ResultDeduplicator()
 
-        highest_quality_overall = 0
-        for cur_episode in found_results:
-            for cur_result in found_results[cur_episode]:
-                if cur_result.quality != Qualities.UNKNOWN and cur_result.quality > highest_quality_overall:
-                    highest_quality_overall = cur_result.quality
+    fan_out = SearchProviderFanOut(workers=sickrage.app.config.general.search_provider_workers,
+                                   provider_timeout=sickrage.app.config.general.search_provider_timeout,
+                                   deadline=sickrage.app.config.general.search_deadline)
 
-        sickrage.app.log.debug("The highest quality of any match is " + highest_quality_overall.display_name)
+    # a cancelled search never records its outcome, its half open probe is released for the next search instead
+    provider_results = fan_out.run(search_provider, providers, cancelled=lambda x: provider_health.release(x.id))
 
-        # see if every episode is wanted
-        if best_season_result:
-            # get the quality of the season nzb
-            season_qual = best_season_result.quality
-            sickrage.app.log.debug("The quality of the season " + best_season_result.provider.provider_type.display_name + " is " + season_qual.display_name)
+    with contextlib.closing(provider_results):
+        for providerObj, found_results in provider_results:
+            # skip to next provider if we have no results to process
+            if not found_results:
+                continue
 
-            all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
+            # remove duplicates
+            for cur_episode in found_results:
+                found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
 
-            sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
+            # remove releases already returned by previous providers, keeping the source with the most seeders
+            duplicates = deduplicator.duplicates
+            for cur_episode in found_results:
+                found_results[cur_episode] = deduplicator.filter(found_results[cur_episode])
+            final_results = [deduplicator.best_source(x) for x in final_results]
 
-            all_wanted = True
-            any_wanted = False
+            if deduplicator.duplicates > duplicates:
+                sickrage.app.log.debug("Merged {} duplicate results from {}, {:.0%} of all results were duplicates".format(
+                    deduplicator.duplicates - duplicates, providerObj.name, deduplicator.duplicate_rate))
 
-            for curEp in all_episodes:
-                if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
-                    all_wanted = False
-                else:
-                    any_wanted = True
-
-            # if we need every ep in the season and there's nothing better then just download this and be done
-            # with it (unless single episodes are preferred)
-            if all_wanted and best_season_result.quality == highest_quality_overall:
-                sickrage.app.log.info("Every ep in this season is needed, "
-                                      "downloading the whole " + best_season_result.provider.provider_type.display_name + " " + best_season_result.name)
+            found_results = dict((k, v) for k, v in found_results.items() if v)
+            if not found_results:
+                continue
 
-                best_season_result.episodes = all_episodes
+            # pick the best season NZB
+            best_season_result = None
+            if SEASON_RESULT in found_results:
+                best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
 
-                return best_season_result
-            elif not any_wanted:
-                sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
-            else:
-                if best_season_result.provider.provider_type == NZBProvider.provider_type:
-                    sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
-
-                    # if not, break it apart and add them as the lowest priority results
-                    individual_results = split_nzb_result(best_season_result)
-                    for curResult in individual_results:
-                        ep_num = -1
-                        if len(curResult.episodes) == 1:
-                            ep_num = curResult.episodes[0]
-                        elif len(curResult.episodes) > 1:
-                            ep_num = MULTI_EP_RESULT
-
-                        if ep_num in found_results:
-                            found_results[ep_num].append(curResult)
-                        else:
-                            found_results[ep_num] = [curResult]
+            highest_quality_overall = 0
+            for cur_episode in found_results:
+                for cur_result in found_results[cur_episode]:
+                    if cur_result.quality != Qualities.UNKNOWN and cur_result.quality > highest_quality_overall:
+                        highest_quality_overall = cur_result.quality
 
-                # If this is a torrent all we can do is leech the entire torrent, user will have to select which
-                # eps not do download in his torrent client
-                else:
-                    # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
-                    # for it.
-                    sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
-                                          "don't want to 'don't download' in your torrent client if desired!")
+            sickrage.app.log.debug("The highest quality of any match is " + highest_quality_overall.display_name)
 
-                    best_season_result.episodes = all_episodes
+            # see if every episode is wanted
+            if best_season_result:
+                # get the quality of the season nzb
+                season_qual = best_season_result.quality
+                sickrage.app.log.debug("The quality of the season " + best_season_result.provider.provider_type.display_name + " is " + season_qual.display_name)
 
-                    if MULTI_EP_RESULT in found_results:
-                        found_results[MULTI_EP_RESULT].append(best_season_result)
-                    else:
-                        found_results[MULTI_EP_RESULT] = [best_season_result]
-
-        # go through multi-ep results and see if we really want them or not, get rid of the rest
-        multi_results = {}
-        if MULTI_EP_RESULT in found_results:
-            for _multiResult in found_results[MULTI_EP_RESULT]:
-                sickrage.app.log.debug(
-                    "Seeing if we want to bother with multi-episode result " + _multiResult.name)
-
-                # Filter result by ignore/required/whitelist/blacklist/quality, etc
-                multi_result = pick_best_result(_multiResult)
-                if not multi_result:
-                    continue
+                all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
 
-                # see how many of the eps that this result covers aren't covered by single results
-                needed_eps = []
-                not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    # if we have results for the episode
-                    if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
-                        not_needed_eps.append(multi_result_episode)
-                    else:
-                        needed_eps.append(multi_result_episode)
+                sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
 
-                sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
-                if not needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
-                    continue
+                all_wanted = True
+                any_wanted = False
 
-                # check if these eps are already covered by another multi-result
-                multi_needed_eps = []
-                multi_not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    if multi_result_episode in multi_results:
-                        multi_not_needed_eps.append(multi_result_episode)
+                for curEp in all_episodes:
+                    if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
+                        all_wanted = False
                     else:
-                        multi_needed_eps.append(multi_result_episode)
+                        any_wanted = True
 
-                sickrage.app.log.debug(
-                    "Multi-ep check result is multiNeededEps: " + str(
-                        multi_needed_eps) + ", multiNotNeededEps: " + str(
-                        multi_not_needed_eps)
-                )
+                # if we need every ep in the season and there's nothing better then just download this and be done
+                # with it (unless single episodes are preferred)
+                if all_wanted and best_season_result.quality == highest_quality_overall:
+                    sickrage.app.log.info("Every ep in this season is needed, "
+                                          "downloading the whole " + best_season_result.provider.provider_type.display_name + " " + best_season_result.name)
 
-                if not multi_needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
-                    continue
+                    best_season_result.episodes = all_episodes
 
-                # don't bother with the single result if we're going to get it with a multi result
-                for multi_result_episode in multi_result.episodes:
-                    multi_results[multi_result_episode] = multi_result
+                    return best_season_result
+                elif not any_wanted:
+                    sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
+                else:
+                    if best_season_result.provider.provider_type == NZBProvider.provider_type:
+                        sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
+
+                        # if not, break it apart and add them as the lowest priority results
+                        individual_results = split_nzb_result(best_season_result)
+                        for curResult in individual_results:
+                            ep_num = -1
+                            if len(curResult.episodes) == 1:
+                                ep_num = curResult.episodes[0]
+                            elif len(curResult.episodes) > 1:
+                                ep_num = MULTI_EP_RESULT
+
+                            if ep_num in found_results:
+                                found_results[ep_num].append(curResult)
+                            else:
+                                found_results[ep_num] = [curResult]
+
+                    # If this is a torrent all we can do is leech the entire torrent, user will have to select which
+                    # eps not do download in his torrent client
+                    else:
+                        # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
+                        # for it.
+                        sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
+                                              "don't want to 'don't download' in your torrent client if desired!")
 
-                    if multi_result_episode in found_results:
-                        sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
-                            multi_result_episode) + ", removing the single-episode results from the list")
-                        del found_results[multi_result_episode]
+                        best_season_result.episodes = all_episodes
 
-        # of all the single ep results narrow it down to the best one
-        final_results += list(set(multi_results.values()))
-        for curEp, curResults in found_results.items():
-            if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
-                continue
+                        if MULTI_EP_RESULT in found_results:
+                            found_results[MULTI_EP_RESULT].append(best_season_result)
+                        else:
+                            found_results[MULTI_EP_RESULT] = [best_season_result]
+
+            # go through multi-ep results and see if we really want them or not, get rid of the rest
+            multi_results = {}
+            if MULTI_EP_RESULT in found_results:
+                for _multiResult in found_results[MULTI_EP_RESULT]:
+                    sickrage.app.log.debug(
+                        "Seeing if we want to bother with multi-episode result " + _multiResult.name)
+
+                    # Filter result by ignore/required/whitelist/blacklist/quality, etc
+                    multi_result = pick_best_result(_multiResult)
+                    if not multi_result:
+                        continue
+
+                    # see how many of the eps that this result covers aren't covered by single results
+                    needed_eps = []
+                    not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        # if we have results for the episode
+                        if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
+                            not_needed_eps.append(multi_result_episode)
+                        else:
+                            needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
+                    if not needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
+                        continue
+
+                    # check if these eps are already covered by another multi-result
+                    multi_needed_eps = []
+                    multi_not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        if multi_result_episode in multi_results:
+                            multi_not_needed_eps.append(multi_result_episode)
+                        else:
+                            multi_needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug(
+                        "Multi-ep check result is multiNeededEps: " + str(
+                            multi_needed_eps) + ", multiNotNeededEps: " + str(
+                            multi_not_needed_eps)
+                    )
+
+                    if not multi_needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
+                        continue
+
+                    # don't bother with the single result if we're going to get it with a multi result
+                    for multi_result_episode in multi_result.episodes:
+                        multi_results[multi_result_episode] = multi_result
+
+                        if multi_result_episode in found_results:
+                            sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
+                                multi_result_episode) + ", removing the single-episode results from the list")
+                            del found_results[multi_result_episode]
+
+            # of all the single ep results narrow it down to the best one
+            final_results += list(set(multi_results.values()))
+            for curEp, curResults in found_results.items():
+                if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
+                    continue
 
-            if not len(curResults) > 0:
-                continue
+                if not len(curResults) > 0:
+                    continue
 
-            # if all results were rejected move on to the next episode
-            best_result = pick_best_result(curResults)
-            if not best_result:
-                continue
+                # if all results were rejected move on to the next episode
+                best_result = pick_best_result(curResults)
+                if not best_result:
+                    continue
 
-            # add result
-            final_results.append(best_result)
+                # add result
+                final_results.append(best_result)
 
-        # narrow results by comparing quality
-        if len(final_results) > 1:
-            final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
+            # narrow results by comparing quality
+            if len(final_results) > 1:
+                final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
 
-        # narrow results by comparing seeders for torrent results
-        if len(final_results) > 1:
-            final_results = list(set(
-                [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.provider_type == NZBProvider.provider_type or a.seeders > b.seeders]))
+            # narrow results by comparing seeders for torrent results
+            if len(final_results) > 1:
+                final_results = list(set(
+                    [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.provider_type == NZBProvider.provider_type or a.seeders > b.seeders]))
 
-        # check that we got all the episodes we wanted first before doing a match and snatch
-        for result in final_results.copy():
-            if all([episode in result.episodes and is_final_result(result)]):
-                return result
+            # check that we got all the episodes we wanted first before doing a match and snatch
+            for result in final_results.copy():
+                if all([episode in result.episodes and is_final_result(result)]):
+                    return result
 
     if len(final_results) == 1:
         return next(iter(final_results))
@@ -16,3 +16,152 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+
+import datetime
+from functools import lru_cache
+
+from sqlalchemy import and_, or_
+
+import sickrage
+from sickrage.core.common import Quality, Qualities, EpisodeStatus
+from sickrage.core.databases.main import MainDB
+from sickrage.core.tv.show.helpers import find_show, get_show_list
+
+
+@lru_cache(maxsize=None)
+def get_wanted_statuses(show_quality, skip_downloaded):
+    """
+    Get the episode statuses that still need a search for a show with the given quality settings
+    :param show_quality: combined quality of the show
+    :param skip_downloaded: skip upgrading the quality of downloaded episodes
+    :return: list of episode statuses
+    """
+
+    any_qualities, best_qualities = Quality.split_quality(show_quality)
+
+    wanted = []
+    for status in EpisodeStatus:
+        cur_status, cur_quality = Quality.split_composite_status(status)
+
+        # if we need a better one then say yes
+        if cur_status not in (EpisodeStatus.WANTED, EpisodeStatus.DOWNLOADED, EpisodeStatus.SNATCHED, EpisodeStatus.SNATCHED_PROPER):
+            continue
+
+        if cur_status != EpisodeStatus.WANTED:
+            if best_qualities:
+                if cur_quality in best_qualities:
+                    continue
+                elif cur_quality != Qualities.UNKNOWN and cur_quality > max(best_qualities):
+                    continue
+            else:
+                if cur_quality in any_qualities:
+                    continue
+                elif cur_quality != Qualities.UNKNOWN and cur_quality > max(any_qualities):
+                    continue
+
+        # skip upgrading quality of downloaded episodes if enabled
+        if cur_status == EpisodeStatus.DOWNLOADED and skip_downloaded:
+            continue
+
+        wanted += [status]
+
+    return wanted
+
+
+def get_wanted_episodes(*criterion):
+    """
+    Get the episodes of all unpaused shows that need a search, in one query over the whole library
+    :param criterion: additional filters on MainDB.TVEpisode, i.e. an airdate range
+    :return: dict of (series_id, series_provider_id) to a list of wanted (season, episode) tuples
+    """
+
+    wanted = {}
+
+    # shows with the same quality settings want the same statuses
+    show_qualities = set((show.quality, bool(show.skip_downloaded)) for show in get_show_list() if not show.paused)
+    if not show_qualities:
+        return wanted
+
+    with sickrage.app.main_db.session() as session:
+        query = session.query(
+            MainDB.TVEpisode.series_id, MainDB.TVEpisode.series_provider_id, MainDB.TVEpisode.season, MainDB.TVEpisode.episode
+        ).join(
+            MainDB.TVShow, and_(MainDB.TVShow.series_id == MainDB.TVEpisode.series_id,
+                                MainDB.TVShow.series_provider_id == MainDB.TVEpisode.series_provider_id)
+        ).filter(
+            MainDB.TVShow.paused == False,
+            MainDB.TVEpisode.season > 0,
+            or_(*[and_(MainDB.TVShow.quality == show_quality,
+                       MainDB.TVShow.skip_downloaded == skip_downloaded,
+                       MainDB.TVEpisode.status.in_(get_wanted_statuses(show_quality, skip_downloaded)))
+                  for show_quality, skip_downloaded in show_qualities]),
+            *criterion
+        ).order_by(
+            MainDB.TVEpisode.series_id, MainDB.TVEpisode.season, MainDB.TVEpisode.episode
+        )
+
+        for x in query:
+            wanted.setdefault((x.series_id, x.series_provider_id), []).append((x.season, x.episode))
+
+    return wanted
+
+
+def set_new_episode_statuses():
+    """
+    Sets the unaired episodes of all unpaused shows that have aired to the default episode status of their show,
+    the candidates are read in one query and updated in one bulk update
+    :return: list of updated (show, season, episode, status) tuples
+    """
+
+    cur_date = datetime.date.today() + datetime.timedelta(days=1)
+    cur_time = datetime.datetime.now(sickrage.app.tz)
+
+    updated = []
+
+    with sickrage.app.main_db.session() as session:
+        query = session.query(
+            MainDB.TVEpisode.series_id, MainDB.TVEpisode.series_provider_id, MainDB.TVEpisode.episode_id, MainDB.TVEpisode.season,
+            MainDB.TVEpisode.episode, MainDB.TVEpisode.airdate
+        ).join(
+            MainDB.TVShow, and_(MainDB.TVShow.series_id == MainDB.TVEpisode.series_id,
+                                MainDB.TVShow.series_provider_id == MainDB.TVEpisode.series_provider_id)
+        ).filter(
+            MainDB.TVShow.paused == False,
+            MainDB.TVEpisode.status == EpisodeStatus.UNAIRED,
+            MainDB.TVEpisode.season != 0,
+            MainDB.TVEpisode.airdate > datetime.date.min,
+            MainDB.TVEpisode.airdate <= cur_date
+        )
+
+        for x in query.all():
+            show = find_show(x.series_id, x.series_provider_id)
+            if not show or not cur_date >= x.airdate + datetime.timedelta(days=show.search_delay):
+                continue
+
+            if show.airs and show.network:
+                # This is how you assure it is always converted to local time
+                air_time = sickrage.app.tz_updater.parse_date_time(x.airdate, show.airs, show.network).astimezone(sickrage.app.tz)
+
+                # filter out any episodes that haven't started airing yet,
+                # but set them to the default status while they are airing
+                # so they are snatched faster
+                if air_time > cur_time:
+                    continue
+
+            status = show.default_ep_status if x.season > 0 else EpisodeStatus.SKIPPED
+            updated += [(show, x.season, x.episode, status)]
+
+            # keep the episode objects that are already loaded in sync
+            episode_object = show._episodes.get(x.episode_id)
+            if episode_object:
+                episode_object.status = status
+
+        if updated:
+            session.bulk_update_mappings(MainDB.TVEpisode, [{'series_id': show.series_id,
+                                                             'series_provider_id': show.series_provider_id,
+                                                             'season': season,
+                                                             'episode': episode,
+                                                             'status': status} for show, season, episode, status in updated])
+            session.commit()
+
+    return updated
@@ -22,22 +22,167 @@
 
 import datetime
 import threading
+import time
+from collections import OrderedDict
 
 import sickrage
-from sickrage.core.common import Quality, Qualities, EpisodeStatus
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
 from sickrage.core.queues.search import BacklogSearchTask
+from sickrage.core.search import SearchPlan
+from sickrage.core.searchers import get_wanted_episodes
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 
 
+class BacklogCursor(object):
+    """
+    Persistent position of the backlog searcher in the current backlog cycle.
+
+    A cycle starts with every wanted episode and ends once all of them were searched, each searched episode is
+    written to the cache database together with the number of provider requests it cost, so a restarted searcher
+    resumes the cycle instead of searching those episodes again. Episodes that were queued but not searched yet are
+    only kept in memory and are queued again after a restart.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.db = None
+        self.cycle = None
+        self.pending = OrderedDict()
+        self.queued = {}
+        self.searched = 0
+        self.spent = 0
+
+    def _load(self):
+        # the cursor is reloaded when the cache database was replaced
+        if self.db is sickrage.app.cache_db:
+            return
+
+        self.db = sickrage.app.cache_db
+        self.cycle = None
+        self.pending.clear()
+        self.queued.clear()
+        self.searched = 0
+        self.spent = 0
+
+        session = sickrage.app.cache_db.session()
+        for x in session.query(CacheDB.BacklogCursor).order_by(CacheDB.BacklogCursor.series_id,
+                                                                CacheDB.BacklogCursor.season,
+                                                                CacheDB.BacklogCursor.episode):
+            self.cycle = x.cycle
+
+            if x.searched:
+                self.searched += 1
+                self.spent += x.requests or 0
+            else:
+                self.pending[(x.series_id, x.series_provider_id, x.season, x.episode)] = None
+
+    @property
+    def finished(self):
+        with self.lock:
+            self._load()
+            return not self.pending and not self.queued
+
+    def start(self, wanted):
+        """
+        Starts a new backlog cycle
+
+        :param wanted: dict of wanted episodes as returned by get_wanted_episodes
+        """
+        with self.lock:
+            self._load()
+
+            self.cycle = int(time.time())
+            self.pending.clear()
+            self.queued.clear()
+            self.searched = 0
+            self.spent = 0
+
+            session = sickrage.app.cache_db.session()
+            session.query(CacheDB.BacklogCursor).delete()
+
+            mappings = []
+            for (series_id, series_provider_id), episodes in sorted(wanted.items(), key=lambda x: x[0][0]):
+                for season, episode in episodes:
+                    self.pending[(series_id, series_provider_id, season, episode)] = None
+                    mappings.append({
+                        'series_id': series_id,
+                        'series_provider_id': series_provider_id,
+                        'season': season,
+                        'episode': episode,
+                        'cycle': self.cycle,
+                        'searched': 0,
+                        'requests': 0
+                    })
+
+            session.bulk_insert_mappings(CacheDB.BacklogCursor, mappings)
+            session.commit()
+
+    def next(self):
+        """
+        Gets the next pending episode of the cycle
+
+        :return: tuple of series id, series provider id, season and episode or None
+        """
+        with self.lock:
+            self._load()
+            return next(iter(self.pending), None)
+
+    def set_queued(self, key, requests):
+        with self.lock:
+            self._load()
+            if self.pending.pop(key, False) is None:
+                self.queued[key] = requests
+
+    def set_pending(self, key):
+        """
+        Moves an episode that could not be queued back to the end of the pending episodes
+        """
+        with self.lock:
+            self._load()
+            if self.queued.pop(key, None) is not None:
+                self.pending[key] = None
+
+    def set_searched(self, key, requests=0):
+        """
+        Records an episode of the cycle as searched
+
+        :param key: tuple of series id, series provider id, season and episode
+        :param requests: provider requests spent when the episode was not queued by the cursor
+        """
+        with self.lock:
+            self._load()
+
+            if key in self.queued:
+                requests = self.queued.pop(key)
+            elif self.pending.pop(key, False) is not None:
+                return
+
+            series_id, series_provider_id, season, episode = key
+
+            session = sickrage.app.cache_db.session()
+            session.query(CacheDB.BacklogCursor).filter_by(series_id=series_id, series_provider_id=series_provider_id,
+                                                           season=season, episode=episode).update({
+                'searched': int(time.time()),
+                'requests': requests
+            })
+            session.commit()
+
+            self.searched += 1
+            self.spent += requests
+
+
 class BacklogSearcher(object):
     def __init__(self, *args, **kwargs):
         self.name = "BACKLOG"
         self.lock = threading.Lock()
         self.cycleTime = 21 / 60 / 24
+        self.step_interval = 10
         self.running = False
         self.amPaused = False
         self.amWaiting = False
         self.forced = False
+        self.cursor = BacklogCursor()
 
     def task(self, force=False):
         if self.running and not force:
@@ -54,7 +199,11 @@ class BacklogSearcher(object):
 
             self.forced = force
 
-            self.search_backlog()
+            if force:
+                self.search_backlog()
+            else:
+                self.start_cycle()
+                self.step()
         finally:
             self.running = False
 
@@ -62,6 +211,147 @@ class BacklogSearcher(object):
         sickrage.app.log.debug("amWaiting: " + str(self.amWaiting) + ", running: " + str(self.running))
         return (not self.amWaiting) and self.running
 
+    @staticmethod
+    def request_cost():
+        # every enabled backlog provider is searched once per episode
+        return max(1, len([x for x in sickrage.app.search_providers.enabled().values() if x.enable_backlog]))
+
+    def start_cycle(self):
+        """
+        Starts a full backlog cycle unless the current cycle still has episodes left
+        """
+        if not self.cursor.finished:
+            sickrage.app.log.info("Resuming backlog search with {} episode(s) left".format(len(self.cursor.pending) + len(self.cursor.queued)))
+            return
+
+        sickrage.app.log.info('Running full backlog search on missed episodes for all shows')
+
+        self.cursor.start(get_wanted_episodes(MainDB.TVEpisode.airdate > datetime.date.min, MainDB.TVEpisode.airdate < datetime.date.today()))
+
+        for show in get_show_list():
+            if not show.paused:
+                self._set_last_backlog_search(show, datetime.datetime.now())
+                show.save()
+
+    def allowance(self):
+        """
+        Gets the number of provider requests that can still be spent on the current cycle, the budget is spread over
+        the backlog search frequency so each step only releases the requests of the time that passed.
+
+        :return: number of requests or None if the budget is unlimited
+        """
+        budget = sickrage.app.config.general.backlog_search_budget
+        if not budget or not self.cursor.cycle:
+            return None
+
+        window = sickrage.app.config.general.backlog_searcher_freq * 60
+        elapsed = time.time() - self.cursor.cycle + self.step_interval * 60
+
+        return int(budget * elapsed / window) - self.cursor.spent - sum(self.cursor.queued.values())
+
+    def step(self):
+        """
+        Queues the pending episodes of the current cycle that fit in the request budget
+        """
+        job = sickrage.app.scheduler.get_job(self.name) if sickrage.app.scheduler else None
+        if job and not job.next_run_time:
+            return
+
+        if self.cursor.finished or not sickrage.app.search_providers.enabled():
+            return
+
+        # episodes whose task left the search queue without searching them, for example removed by hand, are pending again
+        with self.cursor.lock:
+            orphaned = [x for x in self.cursor.queued if not sickrage.app.search_queue.is_in_queue(x[0], x[2], x[3])]
+
+        for key in orphaned:
+            self.cursor.set_pending(key)
+
+        cost = self.request_cost()
+        allowance = self.allowance()
+
+        queued = OrderedDict()
+        while allowance is None or allowance >= cost:
+            key = self.cursor.next()
+            if not key:
+                break
+
+            series_id, series_provider_id, season, episode = key
+
+            show_object = find_show(series_id, series_provider_id)
+            if not show_object or show_object.paused:
+                self.cursor.set_searched(key)
+                continue
+
+            if (series_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
+                sickrage.app.search_queue.SNATCH_HISTORY.remove((series_id, season, episode))
+
+            self.cursor.set_queued(key, cost)
+            queued.setdefault((series_id, series_provider_id), []).append((season, episode))
+
+            if allowance is not None:
+                allowance -= cost
+
+        # episodes the search queue did not take, for example because they already are in it, stay pending
+        for key in self.queue_searches(queued):
+            self.cursor.set_pending(key)
+
+    @staticmethod
+    def queue_searches(wanted):
+        """
+        Queues backlog searches of wanted episodes
+
+        :param wanted: dict of (season, episode) lists keyed by series id and series provider id
+        :return: list of (series id, series provider id, season, episode) tuples the search queue did not take
+        """
+        rejected = []
+
+        # the episodes of a show share a search plan so seasons with most episodes wanted are searched at once
+        for (series_id, series_provider_id), episodes in wanted.items():
+            plan = SearchPlan(series_id, series_provider_id, episodes)
+            for season, episode in episodes:
+                if not sickrage.app.search_queue.put(BacklogSearchTask(series_id, series_provider_id, season, episode, plan=plan)):
+                    rejected.append((series_id, series_provider_id, season, episode))
+
+        return rejected
+
+    def progress(self):
+        """
+        Gets the progress of the current backlog cycle
+
+        :return: dict with the cycle start, episode counts, spent requests and the estimated seconds left
+        """
+        with self.cursor.lock:
+            self.cursor._load()
+
+            pending = len(self.cursor.pending)
+            queued = len(self.cursor.queued)
+            searched = self.cursor.searched
+            spent = self.cursor.spent
+
+        budget = sickrage.app.config.general.backlog_search_budget
+        elapsed = time.time() - self.cursor.cycle if self.cursor.cycle else 0
+
+        eta = None
+        if not pending and not queued:
+            eta = 0
+        elif budget:
+            window = sickrage.app.config.general.backlog_searcher_freq * 60
+            eta = max(0, int((spent + (pending + queued) * self.request_cost()) * window / budget - elapsed))
+        elif searched:
+            eta = int(elapsed / searched * (pending + queued))
+
+        return {
+            'cycle': self.cursor.cycle,
+            'total': pending + queued + searched,
+            'searched': searched,
+            'queued': queued,
+            'pending': pending,
+            'budget': budget,
+            'spent': spent,
+            'eta': eta
+        }
+
     def search_backlog(self, series_id=None, series_provider_id=None):
         self.amPaused = False
 
@@ -75,65 +365,32 @@ class BacklogSearcher(object):
         else:
             sickrage.app.log.info('Running full backlog search on missed episodes for all shows')
 
+        criterion = [MainDB.TVEpisode.airdate > from_date, MainDB.TVEpisode.airdate < datetime.date.today()]
+        if series_id and series_provider_id:
+            criterion += [MainDB.TVEpisode.series_id == series_id, MainDB.TVEpisode.series_provider_id == series_provider_id]
+
+        wanted = get_wanted_episodes(*criterion)
+
         # go through non air-by-date shows and see if they need any episodes
         for curShow in show_list:
             if curShow.paused:
                 sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                 continue
 
-            wanted = self._get_wanted(curShow, from_date)
-            if not wanted:
+            if not wanted.get((curShow.series_id, curShow.series_provider_id)):
                 sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(curShow.name))
                 continue
 
-            for season, episode in wanted:
+            for season, episode in wanted[(curShow.series_id, curShow.series_provider_id)]:
                 if (curShow.series_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
                     sickrage.app.search_queue.SNATCH_HISTORY.remove((curShow.series_id, season, episode))
 
-                sickrage.app.search_queue.put(BacklogSearchTask(curShow.series_id, curShow.series_provider_id, season, episode))
+            self.queue_searches({(curShow.series_id, curShow.series_provider_id): wanted[(curShow.series_id, curShow.series_provider_id)]})
 
             if from_date == datetime.date.min and not series_id:
                 self._set_last_backlog_search(curShow, datetime.datetime.now())
                 curShow.save()
 
-    @staticmethod
-    def _get_wanted(show, from_date):
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-
-        sickrage.app.log.debug("Seeing if we need anything that's older then today for {}".format(show.name))
-
-        # check through the list of statuses to see if we want any
-        wanted = []
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not datetime.date.today() > episode_object.airdate > from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(episode_object.status)
-
-            # if we need a better one then say yes
-            if cur_status not in {EpisodeStatus.WANTED, EpisodeStatus.DOWNLOADED, EpisodeStatus.SNATCHED, EpisodeStatus.SNATCHED_PROPER}:
-                continue
-
-            if cur_status != EpisodeStatus.WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Qualities.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Qualities.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == EpisodeStatus.DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
-
     @staticmethod
     def _get_last_backlog_search(show):
         sickrage.app.log.debug("Retrieving the last check time from the DB")
@@ -22,8 +22,9 @@ import datetime
 import threading
 
 import sickrage
-from sickrage.core.common import Quality, Qualities, EpisodeStatus
+from sickrage.core.databases.main import MainDB
 from sickrage.core.queues.search import DailySearchTask
+from sickrage.core.searchers import get_wanted_episodes, set_new_episode_statuses
 from sickrage.core.tv.show.helpers import get_show_list
 
 
@@ -48,76 +49,28 @@ class DailySearcher(object):
             threading.currentThread().setName(self.name)
 
             # find new released episodes and update their statuses
+            for show, season, episode, status in set_new_episode_statuses():
+                sickrage.app.log.info('Setting status ({status}) for show airing today: {name} {special}'.format(
+                    name='{} S{:02d}E{:02d}'.format(show.name, season, episode),
+                    status=status.display_name,
+                    special='(specials are not supported)' if not season > 0 else '',
+                ))
+
+            wanted = get_wanted_episodes(MainDB.TVEpisode.airdate >= datetime.date.today())
+
             for curShow in get_show_list():
                 if curShow.paused:
                     sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                     continue
 
-                for tv_episode in curShow.new_episodes:
-                    tv_episode.status = tv_episode.show.default_ep_status if tv_episode.season > 0 else EpisodeStatus.SKIPPED
-                    tv_episode.save()
-                    sickrage.app.log.info('Setting status ({status}) for show airing today: {name} {special}'.format(
-                        name=tv_episode.pretty_name(),
-                        status=tv_episode.status.display_name,
-                        special='(specials are not supported)' if not tv_episode.season > 0 else '',
-                    ))
-
-                wanted = self._get_wanted(curShow, datetime.date.today())
-                if not wanted:
+                if not wanted.get((curShow.series_id, curShow.series_provider_id)):
                     sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(curShow.name))
                     continue
 
-                for season, episode in wanted:
+                for season, episode in wanted[(curShow.series_id, curShow.series_provider_id)]:
                     if (curShow.series_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
                         sickrage.app.search_queue.SNATCH_HISTORY.remove((curShow.series_id, season, episode))
 
                     sickrage.app.search_queue.put(DailySearchTask(curShow.series_id, curShow.series_provider_id, season, episode))
         finally:
             self.running = False
-
-    @staticmethod
-    def _get_wanted(show, from_date):
-        """
-        Get a list of episodes that we want to download
-        :param show: Show these episodes are from
-        :param fromDate: Search from a certain date
-        :return: list of wanted episodes
-        """
-
-        wanted = []
-
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-        all_qualities = list(set(any_qualities + best_qualities))
-
-        sickrage.app.log.debug("Seeing if we need anything for today from {}".format(show.name))
-
-        # check through the list of statuses to see if we want any
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not episode_object.airdate >= from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(episode_object.status)
-
-            # if we need a better one then say yes
-            if cur_status not in (EpisodeStatus.WANTED, EpisodeStatus.DOWNLOADED, EpisodeStatus.SNATCHED, EpisodeStatus.SNATCHED_PROPER):
-                continue
-
-            if cur_status != EpisodeStatus.WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Qualities.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Qualities.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == EpisodeStatus.DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
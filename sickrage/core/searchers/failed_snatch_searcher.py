@@ -21,12 +21,14 @@
 import datetime
 import threading
 
+from sqlalchemy import and_, exists, func
+from sqlalchemy.orm import aliased
+
 import sickrage
-from sickrage.core.common import Quality, EpisodeStatus
+from sickrage.core.common import EpisodeStatus
 from sickrage.core.databases.main import MainDB
 from sickrage.core.helpers import flatten
 from sickrage.core.queues.search import FailedSearchTask
-from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.tv.show.history import FailedHistory
 
 
@@ -35,6 +37,7 @@ class FailedSnatchSearcher(object):
         self.name = "FAILEDSNATCHSEARCHER"
         self.lock = threading.Lock()
         self.running = False
+        self.batch_size = 25
 
     def task(self, force=False):
         """
@@ -55,40 +58,58 @@ class FailedSnatchSearcher(object):
 
             sickrage.app.log.info("Searching for failed snatches")
 
-            failed_snatches = False
-
-            for snatched_episode_obj in [x for x in self.snatched_episodes() if (x.series_id, x.season, x.episode) not in self.downloaded_releases()]:
-                show_object = find_show(snatched_episode_obj.series_id, snatched_episode_obj.series_provider_id)
-                episode_object = show_object.get_episode(snatched_episode_obj.season, snatched_episode_obj.episode)
-                if episode_object.show.paused:
-                    continue
-
-                cur_status, cur_quality = Quality.split_composite_status(episode_object.status)
-                if cur_status not in {EpisodeStatus.SNATCHED, EpisodeStatus.SNATCHED_BEST, EpisodeStatus.SNATCHED_PROPER}:
-                    continue
-
-                sickrage.app.search_queue.put(FailedSearchTask(show_object.series_id,
-                                                               show_object.series_provider_id,
-                                                               episode_object.season,
-                                                               episode_object.episode,
-                                                               True))
-
-                failed_snatches = True
-
+            failed_snatches = self.failed_snatches()
             if not failed_snatches:
                 sickrage.app.log.info("No failed snatches found")
+                return
+
+            # retries are queued a batch per run, the oldest snatches first, so the search queue is not flooded
+            for series_id, series_provider_id, season, episode in failed_snatches[:self.batch_size]:
+                sickrage.app.search_queue.put(FailedSearchTask(series_id, series_provider_id, season, episode, True))
+
+            if len(failed_snatches) > self.batch_size:
+                sickrage.app.log.info("Queued {} of {} failed snatches for a retry, the rest is queued on the next run".format(
+                    self.batch_size, len(failed_snatches)))
         finally:
             self.running = False
 
-    def snatched_episodes(self):
-        session = sickrage.app.main_db.session()
-        return (x for x in
-                session.query(MainDB.History).filter(MainDB.History.action.in_(flatten(
-                    [EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST),
-                     EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER)]))) if
-                24 >= (datetime.datetime.now() - x.date).days >= sickrage.app.config.failed_snatches.age)
-
-    def downloaded_releases(self):
-        session = sickrage.app.main_db.session()
-        return ((x.series_id, x.season, x.episode) for x in
-                session.query(MainDB.History).filter(MainDB.History.action.in_(EpisodeStatus.composites(EpisodeStatus.DOWNLOADED))))
+    @staticmethod
+    def failed_snatches():
+        """
+        Gets the episodes that are still snatched a while after their snatch and were never downloaded, the downloaded
+        releases are excluded by an anti-join so this is a single query regardless of the history size.
+
+        :return: list of series id, series provider id, season and episode tuples ordered by the oldest snatch
+        """
+        now = datetime.datetime.now()
+
+        snatched = flatten([EpisodeStatus.composites(EpisodeStatus.SNATCHED),
+                            EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST),
+                            EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER)])
+
+        downloaded = aliased(MainDB.History)
+
+        with sickrage.app.main_db.session() as session:
+            return [tuple(x) for x in session.query(MainDB.History.series_id,
+                                                    MainDB.History.series_provider_id,
+                                                    MainDB.History.season,
+                                                    MainDB.History.episode).join(
+                MainDB.TVShow, and_(MainDB.TVShow.series_id == MainDB.History.series_id,
+                                    MainDB.TVShow.series_provider_id == MainDB.History.series_provider_id)).join(
+                MainDB.TVEpisode, and_(MainDB.TVEpisode.series_id == MainDB.History.series_id,
+                                       MainDB.TVEpisode.series_provider_id == MainDB.History.series_provider_id,
+                                       MainDB.TVEpisode.season == MainDB.History.season,
+                                       MainDB.TVEpisode.episode == MainDB.History.episode)).filter(
+                MainDB.History.action.in_(snatched),
+                MainDB.History.date <= now - datetime.timedelta(days=sickrage.app.config.failed_snatches.age),
+                MainDB.History.date > now - datetime.timedelta(days=25),
+                MainDB.TVShow.paused == False,
+                MainDB.TVEpisode.status.in_(snatched),
+                ~exists().where(and_(downloaded.series_id == MainDB.History.series_id,
+                                     downloaded.season == MainDB.History.season,
+                                     downloaded.episode == MainDB.History.episode,
+                                     downloaded.action.in_(EpisodeStatus.composites(EpisodeStatus.DOWNLOADED))))
+            ).group_by(MainDB.History.series_id,
+                       MainDB.History.series_provider_id,
+                       MainDB.History.season,
+                       MainDB.History.episode).order_by(func.min(MainDB.History.date))]
@@ -20,18 +20,19 @@
 
 import datetime
 import operator
-import re
 import threading
 import time
 import traceback
 
-from sqlalchemy import orm
+from sqlalchemy import orm, or_
 
 import sickrage
 from sickrage.core.common import Quality, EpisodeStatus
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import AuthException
 from sickrage.core.helpers import remove_non_release_groups, flatten
+from sickrage.core.helpers.show_names import PROPER_TOKENS, is_proper
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
 from sickrage.core.search import pick_best_result, snatch_episode
 from sickrage.core.tv.show.helpers import find_show, get_show_list
@@ -42,6 +43,7 @@ class ProperSearcher(object):
     def __init__(self, *args, **kwargs):
         self.name = "PROPERSEARCHER"
         self.running = False
+        self.requests_avoided = 0
 
     def task(self, force=False):
         """
@@ -83,22 +85,47 @@ class ProperSearcher(object):
 
         orig_thread_name = threading.currentThread().getName()
 
+        providers = []
+        for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.general.randomize_providers).items():
+            # check provider type and provider is enabled
+            if not sickrage.app.config.general.use_nzbs and providerObj.provider_type in [NZBProvider.provider_type, NewznabProvider.provider_type]:
+                continue
+            elif not sickrage.app.config.general.use_torrents and providerObj.provider_type in [TorrentProvider.provider_type, TorrentRssProvider.provider_type]:
+                continue
+            elif not providerObj.is_enabled:
+                continue
+
+            providers.append(providerObj)
+
+        wanted_shows = []
         for show in get_show_list():
             wanted = self._get_wanted(show, search_date)
             if not wanted:
                 sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(show.name))
                 continue
 
+            wanted_shows.append((show, wanted))
+
+        # providers with a RSS feed are not searched, their propers are taken from the RSS cache
+        rss_providers = []
+        if sickrage.app.config.general.propers_from_rss_cache:
+            rss_providers = [x for x in providers if self._has_rss_cache(x, search_date)]
+
+        if rss_providers and wanted_shows:
+            sickrage.app.log.info("Searching the RSS cache of " + ", ".join(x.name for x in rss_providers) + " for any new PROPER releases")
+
+            for x in self._get_cached_propers(rss_providers, wanted_shows, search_date):
+                name = self._generic_name(x.name)
+                if name not in propers:
+                    sickrage.app.log.debug("Found new proper in RSS cache: " + x.name)
+                    propers[name] = x
+
+        for show, wanted in wanted_shows:
             self._lastProperSearch = self._get_last_proper_search(show.series_id, show.series_provider_id)
 
             # for each provider get a list of the
-            for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.general.randomize_providers).items():
-                # check provider type and provider is enabled
-                if not sickrage.app.config.general.use_nzbs and providerObj.provider_type in [NZBProvider.provider_type, NewznabProvider.provider_type]:
-                    continue
-                elif not sickrage.app.config.general.use_torrents and providerObj.provider_type in [TorrentProvider.provider_type, TorrentRssProvider.provider_type]:
-                    continue
-                elif not providerObj.is_enabled:
+            for providerObj in providers:
+                if providerObj in rss_providers:
                     continue
 
                 threading.currentThread().setName(orig_thread_name + " :: [" + providerObj.name + "]")
@@ -108,7 +135,7 @@ class ProperSearcher(object):
                 try:
                     for season, episode in wanted:
                         for x in providerObj.find_propers(show.series_id, show.series_provider_id, season, episode):
-                            if not re.search(r'(^|[. _-])(proper|repack)([. _-]|$)', x.name, re.I):
+                            if not is_proper(x.name):
                                 sickrage.app.log.debug('Found a non-proper, we have caught and skipped it.')
                                 continue
 
@@ -129,6 +156,11 @@ class ProperSearcher(object):
 
             self._set_last_proper_search(show.series_id, show.series_provider_id, datetime.datetime.now())
 
+        # every proper string is a search request per wanted episode of each show
+        self.requests_avoided = sum(len(x.proper_strings) for x in rss_providers) * sum(len(wanted) for show, wanted in wanted_shows)
+        if self.requests_avoided:
+            sickrage.app.log.info("Avoided {} proper search requests by using the RSS cache".format(self.requests_avoided))
+
         # take the list of unique propers and get it sorted by
         sorted_propers = sorted(propers.values(), key=operator.attrgetter('date'), reverse=True)
         for curProper in sorted_propers:
@@ -211,6 +243,50 @@ class ProperSearcher(object):
 
         return final_propers
 
+    @staticmethod
+    def _has_rss_cache(provider, since):
+        if not sickrage.app.config.general.enable_rss_cache or not provider.cache.search_strings:
+            return False
+        return provider.cache.last_update >= since
+
+    @staticmethod
+    def _get_cached_propers(providers, wanted_shows, search_date):
+        """
+        Gets the propers of wanted episodes from the RSS cache of the providers with one query
+
+        :param providers: list of search providers
+        :param wanted_shows: list of shows and their wanted season/episode tuples
+        :param search_date: propers cached before this date are ignored
+        :return: list of proper search results
+        """
+        results = []
+
+        providers = dict((x.id, x) for x in providers)
+        wanted = set((show.series_id, show.series_provider_id, season, episode) for show, episodes in wanted_shows for season, episode in episodes)
+
+        session = sickrage.app.cache_db.session()
+        for x in session.query(CacheDB.Provider).filter(CacheDB.Provider.provider.in_(providers.keys()),
+                                                        CacheDB.Provider.time >= int(time.mktime(search_date.timetuple())),
+                                                        or_(*[CacheDB.Provider.name.ilike('%{}%'.format(token)) for token in PROPER_TOKENS])):
+            if not is_proper(x.name):
+                continue
+
+            episodes = [int(episode) for episode in x.episodes.strip('|').split('|') if episode]
+            if not any((x.series_id, x.series_provider_id, x.season, episode) in wanted for episode in episodes):
+                continue
+
+            result = providers[x.provider].get_result(x.season, episodes)
+            result.provider = providers[x.provider]
+            result.name = x.name
+            result.url = x.url
+            result.seeders = x.seeders
+            result.leechers = x.leechers
+            result.size = x.size
+            result.date = datetime.datetime.fromtimestamp(x.time)
+            results.append(result)
+
+        return results
+
     def _get_wanted(self, show, search_date):
         session = sickrage.app.main_db.session()
 
@@ -326,14 +326,16 @@ class TVEpisode(object):
             'backlog': ''
         }
 
-        for search_task in sickrage.app.search_queue.get_all_tasks_from_queue_by_show(self.series_id):
-            if search_task.season == self.season and search_task.episode == self.episode:
-                if search_task.action in [SearchTaskActions.MANUAL_SEARCH, SearchTaskActions.FAILED_SEARCH]:
-                    search_queue_status['manual'] = search_task.status.name
-                elif search_task.action == SearchTaskActions.DAILY_SEARCH:
-                    search_queue_status['daily'] = search_task.status.name
-                elif search_task.action == SearchTaskActions.BACKLOG_SEARCH:
-                    search_queue_status['backlog'] = search_task.status.name
+        for search_task in sickrage.app.search_queue.get_all_tasks_from_queue_by_episode(self.series_id, self.season, self.episode):
+            if search_task.series_provider_id != self.series_provider_id:
+                continue
+
+            if search_task.action in [SearchTaskActions.MANUAL_SEARCH, SearchTaskActions.FAILED_SEARCH]:
+                search_queue_status['manual'] = search_task.status.name
+            elif search_task.action == SearchTaskActions.DAILY_SEARCH:
+                search_queue_status['daily'] = search_task.status.name
+            elif search_task.action == SearchTaskActions.BACKLOG_SEARCH:
+                search_queue_status['backlog'] = search_task.status.name
 
         return search_queue_status
 
@@ -1,5 +1,6 @@
-import functools
+import datetime
 import threading
+import time
 
 import sickrage
 
@@ -10,6 +11,9 @@ class RSSCacheUpdater(object):
         self.name = "RSSCACHE-UPDATER"
         self.lock = threading.Lock()
         self.running = False
+        self.finished = threading.Event()
+        self.in_flight = set()
+        self.metrics = {}
 
     def task(self, force=False):
         if self.running or not sickrage.app.config.general.enable_rss_cache and not force:
@@ -18,9 +22,70 @@ class RSSCacheUpdater(object):
         try:
             self.running = True
 
-            for providerID, providerObj in sickrage.app.search_providers.sort().items():
-                if providerObj.is_enabled:
-                    threading.currentThread().setName('{}::{}'.format(self.name, providerObj.name.upper()))
-                    providerObj.cache.update(force)
+            workers = max(1, sickrage.app.config.general.rss_cache_workers)
+            timeout = max(1, sickrage.app.config.general.rss_cache_timeout)
+
+            queue = [providerObj for providerID, providerObj in sickrage.app.search_providers.sort().items() if providerObj.is_enabled]
+            active = {}
+
+            while queue or active:
+                while queue and len(active) < workers:
+                    providerObj = queue.pop(0)
+
+                    with self.lock:
+                        # a provider whose previous update still hangs is not started again
+                        if providerObj.id in self.in_flight:
+                            sickrage.app.log.debug("RSS cache update for {} is still running, skipping".format(providerObj.name))
+                            continue
+                        self.in_flight.add(providerObj.id)
+
+                    thread = threading.Thread(target=self.update_provider, args=(providerObj, force),
+                                              name='{}::{}'.format(self.name, providerObj.name.upper()), daemon=True)
+                    thread.start()
+                    active[providerObj.id] = (providerObj, thread, time.monotonic())
+
+                self.finished.wait(1)
+                self.finished.clear()
+
+                for providerID, (providerObj, thread, started) in list(active.items()):
+                    if not thread.is_alive():
+                        del active[providerID]
+                    elif time.monotonic() - started >= timeout:
+                        # stop waiting for it so the remaining providers get its worker slot
+                        sickrage.app.log.warning("RSS cache update for {} timed out after {}s".format(providerObj.name, timeout))
+                        self._set_metrics(providerObj, 'timeout', time.monotonic() - started)
+                        del active[providerID]
         finally:
             self.running = False
+
+    def update_provider(self, providerObj, force=False):
+        """
+        Updates the RSS cache of a single provider and records how long it took and how many items it returned
+        """
+        start = time.monotonic()
+        status = 'failed'
+
+        try:
+            providerObj.cache.updated_items = 0
+            providerObj.cache.skipped_items = 0
+            if providerObj.cache.update(force):
+                status = 'updated'
+        except Exception as e:
+            sickrage.app.log.debug("Error while updating RSS cache for {}: {}".format(providerObj.name, e))
+        finally:
+            with self.lock:
+                self.in_flight.discard(providerObj.id)
+
+            self._set_metrics(providerObj, status, time.monotonic() - start, providerObj.cache.updated_items)
+            self.finished.set()
+
+    def _set_metrics(self, providerObj, status, duration, items=0):
+        with self.lock:
+            self.metrics[providerObj.id] = {
+                'status': status,
+                'duration': round(duration, 3),
+                'items': items,
+                'skipped': providerObj.cache.skipped_items,
+                'feed': dict(providerObj.cache.feed_metrics),
+                'time': datetime.datetime.now()
+            }
@@ -39,11 +39,13 @@ from sickrage.core.webserver.handlers.announcements import AnnouncementsHandler,
 from sickrage.core.webserver.handlers.api import ApiSwaggerDotJsonHandler, ApiPingHandler
 from sickrage.core.webserver.handlers.api.v1 import ApiHandler
 from sickrage.core.webserver.handlers.api.v2 import ApiV2RetrieveSeriesMetadataHandler
+from sickrage.core.webserver.handlers.api.v2.backlog import ApiV2BacklogProgressHandler
 from sickrage.core.webserver.handlers.api.v2.config import ApiV2ConfigHandler
 from sickrage.core.webserver.handlers.api.v2.episode import ApiV2EpisodesRenameHandler, ApiV2EpisodesManualSearchHandler
 from sickrage.core.webserver.handlers.api.v2.file_browser import ApiV2FileBrowserHandler
 from sickrage.core.webserver.handlers.api.v2.postprocess import Apiv2PostProcessHandler
 from sickrage.core.webserver.handlers.api.v2.schedule import ApiV2ScheduleHandler
+from sickrage.core.webserver.handlers.api.v2.search_provider import ApiV2SearchProvidersHealthHandler
 from sickrage.core.webserver.handlers.api.v2.series import ApiV2SeriesHandler, ApiV2SeriesEpisodesHandler, ApiV2SeriesImagesHandler, ApiV2SeriesImdbInfoHandler, \
     ApiV2SeriesBlacklistHandler, ApiV2SeriesWhitelistHandler, ApiV2SeriesRefreshHandler, ApiV2SeriesUpdateHandler
 from sickrage.core.webserver.handlers.api.v2.series_provider import ApiV2SeriesProvidersHandler, ApiV2SeriesProvidersSearchHandler, \
@@ -216,11 +218,13 @@ class WebServer(threading.Thread):
         self.handlers['api_v2_handlers'] = [
             (fr'{self.api_v2_root}/ping', ApiPingHandler),
             (fr'{self.api_v2_root}/swagger.json', ApiSwaggerDotJsonHandler, {'api_handlers': 'api_v2_handlers', 'api_version': '2.0.0'}),
+            (fr'{self.api_v2_root}/backlog/progress', ApiV2BacklogProgressHandler),
             (fr'{self.api_v2_root}/config', ApiV2ConfigHandler),
             (fr'{self.api_v2_root}/file-browser', ApiV2FileBrowserHandler),
             (fr'{self.api_v2_root}/postprocess', Apiv2PostProcessHandler),
             (fr'{self.api_v2_root}/retrieve-series-metadata', ApiV2RetrieveSeriesMetadataHandler),
             (fr'{self.api_v2_root}/schedule', ApiV2ScheduleHandler),
+            (fr'{self.api_v2_root}/search-providers/health', ApiV2SearchProvidersHealthHandler),
             (fr'{self.api_v2_root}/series-providers', ApiV2SeriesProvidersHandler),
             (fr'{self.api_v2_root}/series-providers/([a-z]+)/search', ApiV2SeriesProvidersSearchHandler),
             (fr'{self.api_v2_root}/series-providers/([a-z]+)/languages', ApiV2SeriesProvidersLanguagesHandler),
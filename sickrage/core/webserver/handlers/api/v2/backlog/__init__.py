@@ -0,0 +1,57 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import sickrage
+from sickrage.core.webserver.handlers.api import APIBaseHandler
+
+
+class ApiV2BacklogProgressHandler(APIBaseHandler):
+    def get(self):
+        """Get backlog search progress"
+        ---
+        tags: [Backlog]
+        summary: Get backlog search progress
+        description: Get the episode counts, spent provider requests and estimated seconds left of the current backlog cycle
+        responses:
+          200:
+            description: Success payload
+          401:
+            description: Returned if your JWT token is missing or expired
+            content:
+              application/json:
+                schema:
+                  NotAuthorizedSchema
+        """
+
+        progress = sickrage.app.backlog_searcher.progress()
+
+        return self.write_json({
+            'cycleStart': progress['cycle'],
+            'total': progress['total'],
+            'searched': progress['searched'],
+            'queued': progress['queued'],
+            'pending': progress['pending'],
+            'budget': progress['budget'],
+            'spentRequests': progress['spent'],
+            'eta': progress['eta']
+        })
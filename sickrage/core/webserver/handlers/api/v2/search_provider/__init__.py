@@ -0,0 +1,67 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import sickrage
+from sickrage.core.webserver.handlers.api import APIBaseHandler
+from sickrage.search_providers.health import provider_health
+
+
+class ApiV2SearchProvidersHealthHandler(APIBaseHandler):
+    def get(self):
+        """Get search provider health scores"
+        ---
+        tags: [Search Providers]
+        summary: Get search provider health scores
+        description: Get the rolling success rate, latency percentiles, yield, score and circuit breaker state of every search provider
+        responses:
+          200:
+            description: Success payload
+          401:
+            description: Returned if your JWT token is missing or expired
+            content:
+              application/json:
+                schema:
+                  NotAuthorizedSchema
+        """
+
+        results = []
+        for provider_id, provider in sickrage.app.search_providers.sort().items():
+            stats = provider_health.stats(provider_id)
+
+            results.append({
+                'id': provider_id,
+                'name': provider.name,
+                'enabled': provider.is_enabled,
+                'state': stats['state'],
+                'score': provider_health.score(provider_id),
+                'searches': stats['searches'],
+                'successRate': stats['success_rate'],
+                'latencyP50': stats['latency_p50'],
+                'latencyP95': stats['latency_p95'],
+                'results': stats['results'],
+                'snatches': stats['snatches'],
+                'yield': stats['yield'],
+                'consecutiveFailures': stats['consecutive_failures'],
+                'loginsPerHour': stats['logins_per_hour']
+            })
+
+        return self.write_json(results)
@@ -28,7 +28,7 @@ from sickrage.core.common import Quality, Qualities, EpisodeStatus
 from sickrage.core.config.helpers import change_gui_lang, change_https_key, change_https_cert, change_updater_freq, change_show_update_hour, \
     change_version_notify
 from sickrage.core.enums import UITheme, DefaultHomePage, TimezoneDisplay, SearchFormat, SeriesProviderID, CpuPreset
-from sickrage.core.helpers import generate_api_key, checkbox_to_value, try_int
+from sickrage.core.helpers import generate_api_key, checkbox_to_value, try_int, HTML_PARSERS
 from sickrage.core.webserver import ConfigWebHandler
 from sickrage.core.webserver.handlers.base import BaseHandler
 
@@ -155,6 +155,8 @@ class SaveGeneralHandler(BaseHandler):
         enable_upnp = self.get_argument('enable_upnp', None)
         strip_special_file_bits = self.get_argument('strip_special_file_bits', None)
         max_queue_workers = self.get_argument('max_queue_workers', None)
+        name_parser_workers = self.get_argument('name_parser_workers', None)
+        html_parser = self.get_argument('html_parser', 'html5lib')
         web_root = self.get_argument('web_root', '')
         ip_whitelist_localhost_enabled = self.get_argument('ip_whitelist_localhost_enabled', None)
         ip_whitelist_enabled = self.get_argument('ip_whitelist_enabled', None)
@@ -274,6 +276,10 @@ class SaveGeneralHandler(BaseHandler):
 
         sickrage.app.config.general.max_queue_workers = try_int(max_queue_workers)
 
+        sickrage.app.config.general.name_parser_workers = max(1, try_int(name_parser_workers, 1))
+
+        sickrage.app.config.general.html_parser = html_parser if html_parser in HTML_PARSERS else 'html5lib'
+
         sickrage.app.config.save()
 
         if auth_method_changed:
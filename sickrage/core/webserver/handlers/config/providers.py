@@ -81,9 +81,10 @@ class GetNewznabCategoriesHandler(BaseHandler):
         name = self.get_argument('name')
         url = self.get_argument('url')
         key = self.get_argument('key')
+        refresh = bool(try_int(self.get_argument('refresh', '0')))
 
         temp_provider = NewznabProvider(name, url, key)
-        success, tv_categories, error = temp_provider.get_newznab_categories()
+        success, tv_categories, error = temp_provider.get_newznab_categories(refresh=refresh)
 
         return self.write(json_encode({'success': success, 'tv_categories': tv_categories, 'error': error}))
 
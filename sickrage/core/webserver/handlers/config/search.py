@@ -72,15 +72,24 @@ class SaveSearchHandler(BaseHandler):
         syno_dsm_path = self.get_argument('syno_dsm_path', None)
         nzbget_use_https = self.get_argument('nzbget_use_https', None)
         backlog_frequency = self.get_argument('backlog_frequency', None)
+        backlog_search_budget = self.get_argument('backlog_search_budget', None)
+        search_history_size = self.get_argument('search_history_size', None)
+        search_history_age = self.get_argument('search_history_age', None)
         dailysearch_frequency = self.get_argument('dailysearch_frequency', None)
         nzb_method = self.get_argument('nzb_method', None)
         torrent_method = self.get_argument('torrent_method', None)
         usenet_retention = self.get_argument('usenet_retention', None)
         download_propers = self.get_argument('download_propers', None)
         check_propers_interval = self.get_argument('check_propers_interval', None)
+        propers_from_rss_cache = self.get_argument('propers_from_rss_cache', None)
         allow_high_priority = self.get_argument('allow_high_priority', None)
         sab_forced = self.get_argument('sab_forced', None)
         randomize_providers = self.get_argument('randomize_providers', None)
+        adaptive_provider_order = self.get_argument('adaptive_provider_order', None)
+        provider_circuit_breaker = self.get_argument('provider_circuit_breaker', None)
+        search_provider_workers = self.get_argument('search_provider_workers', None)
+        search_provider_timeout = self.get_argument('search_provider_timeout', None)
+        search_deadline = self.get_argument('search_deadline', None)
         use_failed_snatcher = self.get_argument('use_failed_snatcher', None)
         failed_snatch_age = self.get_argument('failed_snatch_age', None)
         torrent_dir = self.get_argument('torrent_dir', None)
@@ -100,6 +109,8 @@ class SaveSearchHandler(BaseHandler):
         require_words = self.get_argument('require_words', None)
         ignored_subs_list = self.get_argument('ignored_subs_list', None)
         enable_rss_cache = self.get_argument('enable_rss_cache', None)
+        rss_cache_workers = self.get_argument('rss_cache_workers', None)
+        rss_cache_timeout = self.get_argument('rss_cache_timeout', None)
         torrent_file_to_magnet = self.get_argument('torrent_file_to_magnet', None)
         torrent_magnet_to_file = self.get_argument('torrent_magnet_to_file', None)
         download_unverified_magnet_link = self.get_argument('download_unverified_magnet_link', None)
@@ -126,12 +137,23 @@ class SaveSearchHandler(BaseHandler):
         sickrage.app.config.general.require_words = require_words if require_words else ""
         sickrage.app.config.general.ignored_subs_list = ignored_subs_list if ignored_subs_list else ""
         sickrage.app.config.general.randomize_providers = checkbox_to_value(randomize_providers)
+        sickrage.app.config.general.adaptive_provider_order = checkbox_to_value(adaptive_provider_order)
+        sickrage.app.config.general.provider_circuit_breaker = checkbox_to_value(provider_circuit_breaker)
+        sickrage.app.config.general.search_provider_workers = max(1, try_int(search_provider_workers, 5))
+        sickrage.app.config.general.search_provider_timeout = max(1, try_int(search_provider_timeout, 60))
+        sickrage.app.config.general.search_deadline = max(1, try_int(search_deadline, 300))
+        sickrage.app.config.general.backlog_search_budget = max(0, try_int(backlog_search_budget, 0))
+        sickrage.app.config.general.search_history_size = max(1, try_int(search_history_size, 100))
+        sickrage.app.config.general.search_history_age = max(1, try_int(search_history_age, 60))
         sickrage.app.config.general.enable_rss_cache = checkbox_to_value(enable_rss_cache)
+        sickrage.app.config.general.rss_cache_workers = max(1, try_int(rss_cache_workers, 3))
+        sickrage.app.config.general.rss_cache_timeout = max(1, try_int(rss_cache_timeout, 120))
         sickrage.app.config.general.torrent_file_to_magnet = checkbox_to_value(torrent_file_to_magnet)
         sickrage.app.config.general.torrent_magnet_to_file = checkbox_to_value(torrent_magnet_to_file)
         sickrage.app.config.general.download_unverified_magnet_link = checkbox_to_value(download_unverified_magnet_link)
         sickrage.app.config.general.download_propers = checkbox_to_value(download_propers)
         sickrage.app.config.general.proper_searcher_interval = CheckPropersInterval[check_propers_interval]
+        sickrage.app.config.general.propers_from_rss_cache = checkbox_to_value(propers_from_rss_cache)
         sickrage.app.config.general.allow_high_priority = checkbox_to_value(allow_high_priority)
         sickrage.app.config.sabnzbd.username = sab_username
         sickrage.app.config.sabnzbd.password = sab_password
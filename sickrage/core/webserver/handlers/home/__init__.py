@@ -43,10 +43,9 @@ from sickrage.core.exceptions import (
     EpisodeNotFoundException,
     MultipleEpisodesInDatabaseException
 )
-from sickrage.core.helpers import clean_url, clean_host, clean_hosts, get_disk_space_usage
+from sickrage.core.helpers import clean_url, clean_host, clean_hosts, get_disk_space_usage, try_int
 from sickrage.core.helpers.anidb import get_release_groups_for_anime
 from sickrage.core.helpers.srdatetime import SRDateTime
-from sickrage.core.queues import TaskStatus
 from sickrage.core.queues.search import FailedSearchTask, ManualSearchTask
 from sickrage.core.scene_numbering import (
     get_scene_numbering_for_show,
@@ -1325,25 +1324,16 @@ class GetManualSearchStatusHandler(BaseHandler):
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
+        cursor = try_int(self.get_argument('cursor', '0'))
 
         episodes = []
 
-        for task_id, task_items in sickrage.app.search_queue.TASK_HISTORY.copy().items():
-            search_task = sickrage.app.search_queue.fetch_task(task_id)
-            if not search_task:
-                # Finished Manual Searches
-                episodes += self.get_episodes(int(show), task_items['season'], task_items['episode'], 'Finished')
-                del sickrage.app.search_queue.TASK_HISTORY[task_id]
-
-            if isinstance(search_task, (ManualSearchTask, FailedSearchTask)):
-                if search_task.status == TaskStatus.QUEUED:
-                    # Queued Manual Searches
-                    episodes += self.get_episodes(int(show), task_items['season'], task_items['episode'], 'Queued')
-                elif search_task.status == TaskStatus.STARTED:
-                    # Running Manual Searches
-                    episodes += self.get_episodes(int(show), task_items['season'], task_items['episode'], 'Searching')
-
-        return self.write(json_encode({'episodes': episodes}))
+        # only the manual searches queued, started or finished since the cursor the client last got
+        latest_cursor = sickrage.app.search_queue.TASK_HISTORY.cursor
+        for entry in sickrage.app.search_queue.TASK_HISTORY.since(cursor, int(show)):
+            episodes += self.get_episodes(int(show), entry['season'], entry['episode'], entry['status'])
+
+        return self.write(json_encode({'episodes': episodes, 'cursor': latest_cursor}))
 
     def get_episodes(self, series_id, season, episode, search_status):
         results = []
@@ -130,7 +130,7 @@ var i=n(14),a=i.Buffer;function o(e,t){for(var n in e)t[n]=e[n]}function r(e,t,n
  * Copyright jQuery Foundation and other contributors
  * Released under the MIT license.
  * http://jquery.org/license
- */a=[n(1),n(2)],void 0===(o="function"==typeof(i=function(e){return e.fn.extend({uniqueId:(t=0,function(){return this.each((function(){this.id||(this.id="ui-id-"+ ++t)}))}),removeUniqueId:function(){return this.each((function(){/^ui-id-\d+$/.test(this.id)&&e(this).removeAttr("id")}))}});var t})?i.apply(t,a):i)||(e.exports=o)},function(e,t,n){(function(e){var i=void 0!==e&&e||"undefined"!=typeof self&&self||window,a=Function.prototype.apply;function o(e,t){this._id=e,this._clearFn=t}t.setTimeout=function(){return new o(a.call(setTimeout,i,arguments),clearTimeout)},t.setInterval=function(){return new o(a.call(setInterval,i,arguments),clearInterval)},t.clearTimeout=t.clearInterval=function(e){e&&e.close()},o.prototype.unref=o.prototype.ref=function(){},o.prototype.close=function(){this._clearFn.call(i,this._id)},t.enroll=function(e,t){clearTimeout(e._idleTimeoutId),e._idleTimeout=t},t.unenroll=function(e){clearTimeout(e._idleTimeoutId),e._idleTimeout=-1},t._unrefActive=t.active=function(e){clearTimeout(e._idleTimeoutId);var t=e._idleTimeout;t>=0&&(e._idleTimeoutId=setTimeout((function(){e._onTimeout&&e._onTimeout()}),t))},n(97),t.setImmediate="undefined"!=typeof self&&self.setImmediate||void 0!==e&&e.setImmediate||this&&this.setImmediate,t.clearImmediate="undefined"!=typeof self&&self.clearImmediate||void 0!==e&&e.clearImmediate||this&&this.clearImmediate}).call(this,n(8))},function(e,t){var n={}.toString;e.exports=Array.isArray||function(e){return"[object Array]"==n.call(e)}},function(e){e.exports=JSON.parse('[["a140","",62],["a180","",32],["a240","",62],["a280","",32],["a2ab","",5],["a2e3","€"],["a2ef",""],["a2fd",""],["a340","",62],["a380","",31,"　"],["a440","",62],["a480","",32],["a4f4","",10],["a540","",62],["a580","",32],["a5f7","",7],["a640","",62],["a680","",32],["a6b9","",7],["a6d9","",6],["a6ec",""],["a6f3",""],["a6f6","",8],["a740","",62],["a780","",32],["a7c2","",14],["a7f2","",12],["a896","",10],["a8bc","ḿ"],["a8bf","ǹ"],["a8c1",""],["a8ea","",20],["a958",""],["a95b",""],["a95d",""],["a989","〾⿰",11],["a997","",12],["a9f0","",14],["aaa1","",93],["aba1","",93],["aca1","",93],["ada1","",93],["aea1","",93],["afa1","",93],["d7fa","",4],["f8a1","",93],["f9a1","",93],["faa1","",93],["fba1","",93],["fca1","",93],["fda1","",93],["fe50","⺁⺄㑳㑇⺈⺋㖞㘚㘎⺌⺗㥮㤘㧏㧟㩳㧐㭎㱮㳠⺧⺪䁖䅟⺮䌷⺳⺶⺷䎱䎬⺻䏝䓖䙡䙌"],["fe80","䜣䜩䝼䞍⻊䥇䥺䥽䦂䦃䦅䦆䦟䦛䦷䦶䲣䲟䲠䲡䱷䲢䴓",6,"䶮",93],["8135f437",""]]')},function(e){e.exports=JSON.parse('[["0","\\u0000",127],["a140","　，、。．‧；：？！︰…‥﹐﹑﹒·﹔﹕﹖﹗｜–︱—︳╴︴﹏（）︵︶｛｝︷︸〔〕︹︺【】︻︼《》︽︾〈〉︿﹀「」﹁﹂『』﹃﹄﹙﹚"],["a1a1","﹛﹜﹝﹞‘’“”〝〞‵′＃＆＊※§〃○●△▲◎☆★◇◆□■▽▼㊣℅¯￣＿ˍ﹉﹊﹍﹎﹋﹌﹟﹠﹡＋－×÷±√＜＞＝≦≧≠∞≒≡﹢",4,"～∩∪⊥∠∟⊿㏒㏑∫∮∵∴♀♂⊕⊙↑↓←→↖↗↙↘∥∣／"],["a240","＼∕﹨＄￥〒￠￡％＠℃℉﹩﹪﹫㏕㎜㎝㎞㏎㎡㎎㎏㏄°兙兛兞兝兡兣嗧瓩糎▁",7,"▏▎▍▌▋▊▉┼┴┬┤├▔─│▕┌┐└┘╭"],["a2a1","╮╰╯═╞╪╡◢◣◥◤╱╲╳０",9,"Ⅰ",9,"〡",8,"十卄卅Ａ",25,"ａ",21],["a340","ｗｘｙｚΑ",16,"Σ",6,"α",16,"σ",6,"ㄅ",10],["a3a1","ㄐ",25,"˙ˉˊˇˋ"],["a3e1","€"],["a440","一乙丁七乃九了二人儿入八几刀刁力匕十卜又三下丈上丫丸凡久么也乞于亡兀刃勺千叉口土士夕大女子孑孓寸小尢尸山川工己已巳巾干廾弋弓才"],["a4a1","丑丐不中丰丹之尹予云井互五亢仁什仃仆仇仍今介仄元允內六兮公冗凶分切刈勻勾勿化匹午升卅卞厄友及反壬天夫太夭孔少尤尺屯巴幻廿弔引心戈戶手扎支文斗斤方日曰月木欠止歹毋比毛氏水火爪父爻片牙牛犬王丙"],["a540","世丕且丘主乍乏乎以付仔仕他仗代令仙仞充兄冉冊冬凹出凸刊加功包匆北匝仟半卉卡占卯卮去可古右召叮叩叨叼司叵叫另只史叱台句叭叻四囚外"],["a5a1","央失奴奶孕它尼巨巧左市布平幼弁弘弗必戊打扔扒扑斥旦朮本未末札正母民氐永汁汀氾犯玄玉瓜瓦甘生用甩田由甲申疋白皮皿目矛矢石示禾穴立丞丟乒乓乩亙交亦亥仿伉伙伊伕伍伐休伏仲件任仰仳份企伋光兇兆先全"],["a640","共再冰列刑划刎刖劣匈匡匠印危吉吏同吊吐吁吋各向名合吃后吆吒因回囝圳地在圭圬圯圩夙多夷夸妄奸妃好她如妁字存宇守宅安寺尖屹州帆并年"],["a6a1","式弛忙忖戎戌戍成扣扛托收早旨旬旭曲曳有朽朴朱朵次此死氖汝汗汙江池汐汕污汛汍汎灰牟牝百竹米糸缶羊羽老考而耒耳聿肉肋肌臣自至臼舌舛舟艮色艾虫血行衣西阡串亨位住佇佗佞伴佛何估佐佑伽伺伸佃佔似但佣"],["a740","作你伯低伶余佝佈佚兌克免兵冶冷別判利刪刨劫助努劬匣即卵吝吭吞吾否呎吧呆呃吳呈呂君吩告吹吻吸吮吵吶吠吼呀吱含吟听囪困囤囫坊坑址坍"],["a7a1","均坎圾坐坏圻壯夾妝妒妨妞妣妙妖妍妤妓妊妥孝孜孚孛完宋宏尬局屁尿尾岐岑岔岌巫希序庇床廷弄弟彤形彷役忘忌志忍忱快忸忪戒我抄抗抖技扶抉扭把扼找批扳抒扯折扮投抓抑抆改攻攸旱更束李杏材村杜杖杞杉杆杠"],["a840","杓杗步每求汞沙沁沈沉沅沛汪決沐汰沌汨沖沒汽沃汲汾汴沆汶沍沔沘沂灶灼災灸牢牡牠狄狂玖甬甫男甸皂盯矣私秀禿究系罕肖肓肝肘肛肚育良芒"],["a8a1","芋芍見角言谷豆豕貝赤走足身車辛辰迂迆迅迄巡邑邢邪邦那酉釆里防阮阱阪阬並乖乳事些亞享京佯依侍佳使佬供例來侃佰併侈佩佻侖佾侏侑佺兔兒兕兩具其典冽函刻券刷刺到刮制剁劾劻卒協卓卑卦卷卸卹取叔受味呵"],["a940","咖呸咕咀呻呷咄咒咆呼咐呱呶和咚呢周咋命咎固垃坷坪坩坡坦坤坼夜奉奇奈奄奔妾妻委妹妮姑姆姐姍始姓姊妯妳姒姅孟孤季宗定官宜宙宛尚屈居"],["a9a1","屆岷岡岸岩岫岱岳帘帚帖帕帛帑幸庚店府底庖延弦弧弩往征彿彼忝忠忽念忿怏怔怯怵怖怪怕怡性怩怫怛或戕房戾所承拉拌拄抿拂抹拒招披拓拔拋拈抨抽押拐拙拇拍抵拚抱拘拖拗拆抬拎放斧於旺昔易昌昆昂明昀昏昕昊"],["aa40","昇服朋杭枋枕東果杳杷枇枝林杯杰板枉松析杵枚枓杼杪杲欣武歧歿氓氛泣注泳沱泌泥河沽沾沼波沫法泓沸泄油況沮泗泅泱沿治泡泛泊沬泯泜泖泠"],["aaa1","炕炎炒炊炙爬爭爸版牧物狀狎狙狗狐玩玨玟玫玥甽疝疙疚的盂盲直知矽社祀祁秉秈空穹竺糾罔羌羋者肺肥肢肱股肫肩肴肪肯臥臾舍芳芝芙芭芽芟芹花芬芥芯芸芣芰芾芷虎虱初表軋迎返近邵邸邱邶采金長門阜陀阿阻附"],["ab40","陂隹雨青非亟亭亮信侵侯便俠俑俏保促侶俘俟俊俗侮俐俄係俚俎俞侷兗冒冑冠剎剃削前剌剋則勇勉勃勁匍南卻厚叛咬哀咨哎哉咸咦咳哇哂咽咪品"],["aba1","哄哈咯咫咱咻咩咧咿囿垂型垠垣垢城垮垓奕契奏奎奐姜姘姿姣姨娃姥姪姚姦威姻孩宣宦室客宥封屎屏屍屋峙峒巷帝帥帟幽庠度建弈弭彥很待徊律徇後徉怒思怠急怎怨恍恰恨恢恆恃恬恫恪恤扁拜挖按拼拭持拮拽指拱拷"],["ac40","拯括拾拴挑挂政故斫施既春昭映昧是星昨昱昤曷柿染柱柔某柬架枯柵柩柯柄柑枴柚查枸柏柞柳枰柙柢柝柒歪殃殆段毒毗氟泉洋洲洪流津洌洱洞洗"],["aca1","活洽派洶洛泵洹洧洸洩洮洵洎洫炫為炳炬炯炭炸炮炤爰牲牯牴狩狠狡玷珊玻玲珍珀玳甚甭畏界畎畋疫疤疥疢疣癸皆皇皈盈盆盃盅省盹相眉看盾盼眇矜砂研砌砍祆祉祈祇禹禺科秒秋穿突竿竽籽紂紅紀紉紇約紆缸美羿耄"],["ad40","耐耍耑耶胖胥胚胃胄背胡胛胎胞胤胝致舢苧范茅苣苛苦茄若茂茉苒苗英茁苜苔苑苞苓苟苯茆虐虹虻虺衍衫要觔計訂訃貞負赴赳趴軍軌述迦迢迪迥"],["ada1","迭迫迤迨郊郎郁郃酋酊重閂限陋陌降面革韋韭音頁風飛食首香乘亳倌倍倣俯倦倥俸倩倖倆值借倚倒們俺倀倔倨俱倡個候倘俳修倭倪俾倫倉兼冤冥冢凍凌准凋剖剜剔剛剝匪卿原厝叟哨唐唁唷哼哥哲唆哺唔哩哭員唉哮哪"],["ae40","哦唧唇哽唏圃圄埂埔埋埃堉夏套奘奚娑娘娜娟娛娓姬娠娣娩娥娌娉孫屘宰害家宴宮宵容宸射屑展屐峭峽峻峪峨峰島崁峴差席師庫庭座弱徒徑徐恙"],["aea1","恣恥恐恕恭恩息悄悟悚悍悔悌悅悖扇拳挈拿捎挾振捕捂捆捏捉挺捐挽挪挫挨捍捌效敉料旁旅時晉晏晃晒晌晅晁書朔朕朗校核案框桓根桂桔栩梳栗桌桑栽柴桐桀格桃株桅栓栘桁殊殉殷氣氧氨氦氤泰浪涕消涇浦浸海浙涓"],["af40","浬涉浮浚浴浩涌涊浹涅浥涔烊烘烤烙烈烏爹特狼狹狽狸狷玆班琉珮珠珪珞畔畝畜畚留疾病症疲疳疽疼疹痂疸皋皰益盍盎眩真眠眨矩砰砧砸砝破砷"],["afa1","砥砭砠砟砲祕祐祠祟祖神祝祗祚秤秣秧租秦秩秘窄窈站笆笑粉紡紗紋紊素索純紐紕級紜納紙紛缺罟羔翅翁耆耘耕耙耗耽耿胱脂胰脅胭胴脆胸胳脈能脊胼胯臭臬舀舐航舫舨般芻茫荒荔荊茸荐草茵茴荏茲茹茶茗荀茱茨荃"],["b040","虔蚊蚪蚓蚤蚩蚌蚣蚜衰衷袁袂衽衹記訐討訌訕訊託訓訖訏訑豈豺豹財貢起躬軒軔軏辱送逆迷退迺迴逃追逅迸邕郡郝郢酒配酌釘針釗釜釙閃院陣陡"],["b0a1","陛陝除陘陞隻飢馬骨高鬥鬲鬼乾偺偽停假偃偌做偉健偶偎偕偵側偷偏倏偯偭兜冕凰剪副勒務勘動匐匏匙匿區匾參曼商啪啦啄啞啡啃啊唱啖問啕唯啤唸售啜唬啣唳啁啗圈國圉域堅堊堆埠埤基堂堵執培夠奢娶婁婉婦婪婀"],["b140","娼婢婚婆婊孰寇寅寄寂宿密尉專將屠屜屝崇崆崎崛崖崢崑崩崔崙崤崧崗巢常帶帳帷康庸庶庵庾張強彗彬彩彫得徙從徘御徠徜恿患悉悠您惋悴惦悽"],["b1a1","情悻悵惜悼惘惕惆惟悸惚惇戚戛扈掠控捲掖探接捷捧掘措捱掩掉掃掛捫推掄授掙採掬排掏掀捻捩捨捺敝敖救教敗啟敏敘敕敔斜斛斬族旋旌旎晝晚晤晨晦晞曹勗望梁梯梢梓梵桿桶梱梧梗械梃棄梭梆梅梔條梨梟梡梂欲殺"],["b240","毫毬氫涎涼淳淙液淡淌淤添淺清淇淋涯淑涮淞淹涸混淵淅淒渚涵淚淫淘淪深淮淨淆淄涪淬涿淦烹焉焊烽烯爽牽犁猜猛猖猓猙率琅琊球理現琍瓠瓶"],["b2a1","瓷甜產略畦畢異疏痔痕疵痊痍皎盔盒盛眷眾眼眶眸眺硫硃硎祥票祭移窒窕笠笨笛第符笙笞笮粒粗粕絆絃統紮紹紼絀細紳組累終紲紱缽羞羚翌翎習耜聊聆脯脖脣脫脩脰脤舂舵舷舶船莎莞莘荸莢莖莽莫莒莊莓莉莠荷荻荼"],["b340","莆莧處彪蛇蛀蚶蛄蚵蛆蛋蚱蚯蛉術袞袈被袒袖袍袋覓規訪訝訣訥許設訟訛訢豉豚販責貫貨貪貧赧赦趾趺軛軟這逍通逗連速逝逐逕逞造透逢逖逛途"],["b3a1","部郭都酗野釵釦釣釧釭釩閉陪陵陳陸陰陴陶陷陬雀雪雩章竟頂頃魚鳥鹵鹿麥麻傢傍傅備傑傀傖傘傚最凱割剴創剩勞勝勛博厥啻喀喧啼喊喝喘喂喜喪喔喇喋喃喳單喟唾喲喚喻喬喱啾喉喫喙圍堯堪場堤堰報堡堝堠壹壺奠"],["b440","婷媚婿媒媛媧孳孱寒富寓寐尊尋就嵌嵐崴嵇巽幅帽幀幃幾廊廁廂廄弼彭復循徨惑惡悲悶惠愜愣惺愕惰惻惴慨惱愎惶愉愀愒戟扉掣掌描揀揩揉揆揍"],["b4a1","插揣提握揖揭揮捶援揪換摒揚揹敞敦敢散斑斐斯普晰晴晶景暑智晾晷曾替期朝棺棕棠棘棗椅棟棵森棧棹棒棲棣棋棍植椒椎棉棚楮棻款欺欽殘殖殼毯氮氯氬港游湔渡渲湧湊渠渥渣減湛湘渤湖湮渭渦湯渴湍渺測湃渝渾滋"],["b540","溉渙湎湣湄湲湩湟焙焚焦焰無然煮焜牌犄犀猶猥猴猩琺琪琳琢琥琵琶琴琯琛琦琨甥甦畫番痢痛痣痙痘痞痠登發皖皓皴盜睏短硝硬硯稍稈程稅稀窘"],["b5a1","窗窖童竣等策筆筐筒答筍筋筏筑粟粥絞結絨絕紫絮絲絡給絢絰絳善翔翕耋聒肅腕腔腋腑腎脹腆脾腌腓腴舒舜菩萃菸萍菠菅萋菁華菱菴著萊菰萌菌菽菲菊萸萎萄菜萇菔菟虛蛟蛙蛭蛔蛛蛤蛐蛞街裁裂袱覃視註詠評詞証詁"],["b640","詔詛詐詆訴診訶詖象貂貯貼貳貽賁費賀貴買貶貿貸越超趁跎距跋跚跑跌跛跆軻軸軼辜逮逵週逸進逶鄂郵鄉郾酣酥量鈔鈕鈣鈉鈞鈍鈐鈇鈑閔閏開閑"],["b6a1","間閒閎隊階隋陽隅隆隍陲隄雁雅雄集雇雯雲韌項順須飧飪飯飩飲飭馮馭黃黍黑亂傭債傲傳僅傾催傷傻傯僇剿剷剽募勦勤勢勣匯嗟嗨嗓嗦嗎嗜嗇嗑嗣嗤嗯嗚嗡嗅嗆嗥嗉園圓塞塑塘塗塚塔填塌塭塊塢塒塋奧嫁嫉嫌媾媽媼"],["b740","媳嫂媲嵩嵯幌幹廉廈弒彙徬微愚意慈感想愛惹愁愈慎慌慄慍愾愴愧愍愆愷戡戢搓搾搞搪搭搽搬搏搜搔損搶搖搗搆敬斟新暗暉暇暈暖暄暘暍會榔業"],["b7a1","楚楷楠楔極椰概楊楨楫楞楓楹榆楝楣楛歇歲毀殿毓毽溢溯滓溶滂源溝滇滅溥溘溼溺溫滑準溜滄滔溪溧溴煎煙煩煤煉照煜煬煦煌煥煞煆煨煖爺牒猷獅猿猾瑯瑚瑕瑟瑞瑁琿瑙瑛瑜當畸瘀痰瘁痲痱痺痿痴痳盞盟睛睫睦睞督"],["b840","睹睪睬睜睥睨睢矮碎碰碗碘碌碉硼碑碓硿祺祿禁萬禽稜稚稠稔稟稞窟窠筷節筠筮筧粱粳粵經絹綑綁綏絛置罩罪署義羨群聖聘肆肄腱腰腸腥腮腳腫"],["b8a1","腹腺腦舅艇蒂葷落萱葵葦葫葉葬葛萼萵葡董葩葭葆虞虜號蛹蜓蜈蜇蜀蛾蛻蜂蜃蜆蜊衙裟裔裙補裘裝裡裊裕裒覜解詫該詳試詩詰誇詼詣誠話誅詭詢詮詬詹詻訾詨豢貊貉賊資賈賄貲賃賂賅跡跟跨路跳跺跪跤跦躲較載軾輊"],["b940","辟農運遊道遂達逼違遐遇遏過遍遑逾遁鄒鄗酬酪酩釉鈷鉗鈸鈽鉀鈾鉛鉋鉤鉑鈴鉉鉍鉅鈹鈿鉚閘隘隔隕雍雋雉雊雷電雹零靖靴靶預頑頓頊頒頌飼飴"],["b9a1","飽飾馳馱馴髡鳩麂鼎鼓鼠僧僮僥僖僭僚僕像僑僱僎僩兢凳劃劂匱厭嗾嘀嘛嘗嗽嘔嘆嘉嘍嘎嗷嘖嘟嘈嘐嗶團圖塵塾境墓墊塹墅塽壽夥夢夤奪奩嫡嫦嫩嫗嫖嫘嫣孵寞寧寡寥實寨寢寤察對屢嶄嶇幛幣幕幗幔廓廖弊彆彰徹慇"],["ba40","愿態慷慢慣慟慚慘慵截撇摘摔撤摸摟摺摑摧搴摭摻敲斡旗旖暢暨暝榜榨榕槁榮槓構榛榷榻榫榴槐槍榭槌榦槃榣歉歌氳漳演滾漓滴漩漾漠漬漏漂漢"],["baa1","滿滯漆漱漸漲漣漕漫漯澈漪滬漁滲滌滷熔熙煽熊熄熒爾犒犖獄獐瑤瑣瑪瑰瑭甄疑瘧瘍瘋瘉瘓盡監瞄睽睿睡磁碟碧碳碩碣禎福禍種稱窪窩竭端管箕箋筵算箝箔箏箸箇箄粹粽精綻綰綜綽綾綠緊綴網綱綺綢綿綵綸維緒緇綬"],["bb40","罰翠翡翟聞聚肇腐膀膏膈膊腿膂臧臺與舔舞艋蓉蒿蓆蓄蒙蒞蒲蒜蓋蒸蓀蓓蒐蒼蓑蓊蜿蜜蜻蜢蜥蜴蜘蝕蜷蜩裳褂裴裹裸製裨褚裯誦誌語誣認誡誓誤"],["bba1","說誥誨誘誑誚誧豪貍貌賓賑賒赫趙趕跼輔輒輕輓辣遠遘遜遣遙遞遢遝遛鄙鄘鄞酵酸酷酴鉸銀銅銘銖鉻銓銜銨鉼銑閡閨閩閣閥閤隙障際雌雒需靼鞅韶頗領颯颱餃餅餌餉駁骯骰髦魁魂鳴鳶鳳麼鼻齊億儀僻僵價儂儈儉儅凜"],["bc40","劇劈劉劍劊勰厲嘮嘻嘹嘲嘿嘴嘩噓噎噗噴嘶嘯嘰墀墟增墳墜墮墩墦奭嬉嫻嬋嫵嬌嬈寮寬審寫層履嶝嶔幢幟幡廢廚廟廝廣廠彈影德徵慶慧慮慝慕憂"],["bca1","慼慰慫慾憧憐憫憎憬憚憤憔憮戮摩摯摹撞撲撈撐撰撥撓撕撩撒撮播撫撚撬撙撢撳敵敷數暮暫暴暱樣樟槨樁樞標槽模樓樊槳樂樅槭樑歐歎殤毅毆漿潼澄潑潦潔澆潭潛潸潮澎潺潰潤澗潘滕潯潠潟熟熬熱熨牖犛獎獗瑩璋璃"],["bd40","瑾璀畿瘠瘩瘟瘤瘦瘡瘢皚皺盤瞎瞇瞌瞑瞋磋磅確磊碾磕碼磐稿稼穀稽稷稻窯窮箭箱範箴篆篇篁箠篌糊締練緯緻緘緬緝編緣線緞緩綞緙緲緹罵罷羯"],["bda1","翩耦膛膜膝膠膚膘蔗蔽蔚蓮蔬蔭蔓蔑蔣蔡蔔蓬蔥蓿蔆螂蝴蝶蝠蝦蝸蝨蝙蝗蝌蝓衛衝褐複褒褓褕褊誼諒談諄誕請諸課諉諂調誰論諍誶誹諛豌豎豬賠賞賦賤賬賭賢賣賜質賡赭趟趣踫踐踝踢踏踩踟踡踞躺輝輛輟輩輦輪輜輞"],["be40","輥適遮遨遭遷鄰鄭鄧鄱醇醉醋醃鋅銻銷鋪銬鋤鋁銳銼鋒鋇鋰銲閭閱霄霆震霉靠鞍鞋鞏頡頫頜颳養餓餒餘駝駐駟駛駑駕駒駙骷髮髯鬧魅魄魷魯鴆鴉"],["bea1","鴃麩麾黎墨齒儒儘儔儐儕冀冪凝劑劓勳噙噫噹噩噤噸噪器噥噱噯噬噢噶壁墾壇壅奮嬝嬴學寰導彊憲憑憩憊懍憶憾懊懈戰擅擁擋撻撼據擄擇擂操撿擒擔撾整曆曉暹曄曇暸樽樸樺橙橫橘樹橄橢橡橋橇樵機橈歙歷氅濂澱澡"],["bf40","濃澤濁澧澳激澹澶澦澠澴熾燉燐燒燈燕熹燎燙燜燃燄獨璜璣璘璟璞瓢甌甍瘴瘸瘺盧盥瞠瞞瞟瞥磨磚磬磧禦積穎穆穌穋窺篙簑築篤篛篡篩篦糕糖縊"],["bfa1","縑縈縛縣縞縝縉縐罹羲翰翱翮耨膳膩膨臻興艘艙蕊蕙蕈蕨蕩蕃蕉蕭蕪蕞螃螟螞螢融衡褪褲褥褫褡親覦諦諺諫諱謀諜諧諮諾謁謂諷諭諳諶諼豫豭貓賴蹄踱踴蹂踹踵輻輯輸輳辨辦遵遴選遲遼遺鄴醒錠錶鋸錳錯錢鋼錫錄錚"],["c040","錐錦錡錕錮錙閻隧隨險雕霎霑霖霍霓霏靛靜靦鞘頰頸頻頷頭頹頤餐館餞餛餡餚駭駢駱骸骼髻髭鬨鮑鴕鴣鴦鴨鴒鴛默黔龍龜優償儡儲勵嚎嚀嚐嚅嚇"],["c0a1","嚏壕壓壑壎嬰嬪嬤孺尷屨嶼嶺嶽嶸幫彌徽應懂懇懦懋戲戴擎擊擘擠擰擦擬擱擢擭斂斃曙曖檀檔檄檢檜櫛檣橾檗檐檠歜殮毚氈濘濱濟濠濛濤濫濯澀濬濡濩濕濮濰燧營燮燦燥燭燬燴燠爵牆獰獲璩環璦璨癆療癌盪瞳瞪瞰瞬"],["c140","瞧瞭矯磷磺磴磯礁禧禪穗窿簇簍篾篷簌篠糠糜糞糢糟糙糝縮績繆縷縲繃縫總縱繅繁縴縹繈縵縿縯罄翳翼聱聲聰聯聳臆臃膺臂臀膿膽臉膾臨舉艱薪"],["c1a1","薄蕾薜薑薔薯薛薇薨薊虧蟀蟑螳蟒蟆螫螻螺蟈蟋褻褶襄褸褽覬謎謗謙講謊謠謝謄謐豁谿豳賺賽購賸賻趨蹉蹋蹈蹊轄輾轂轅輿避遽還邁邂邀鄹醣醞醜鍍鎂錨鍵鍊鍥鍋錘鍾鍬鍛鍰鍚鍔闊闋闌闈闆隱隸雖霜霞鞠韓顆颶餵騁"],["c240","駿鮮鮫鮪鮭鴻鴿麋黏點黜黝黛鼾齋叢嚕嚮壙壘嬸彝懣戳擴擲擾攆擺擻擷斷曜朦檳檬櫃檻檸櫂檮檯歟歸殯瀉瀋濾瀆濺瀑瀏燻燼燾燸獷獵璧璿甕癖癘"],["c2a1","癒瞽瞿瞻瞼礎禮穡穢穠竄竅簫簧簪簞簣簡糧織繕繞繚繡繒繙罈翹翻職聶臍臏舊藏薩藍藐藉薰薺薹薦蟯蟬蟲蟠覆覲觴謨謹謬謫豐贅蹙蹣蹦蹤蹟蹕軀轉轍邇邃邈醫醬釐鎔鎊鎖鎢鎳鎮鎬鎰鎘鎚鎗闔闖闐闕離雜雙雛雞霤鞣鞦"],["c340","鞭韹額顏題顎顓颺餾餿餽餮馥騎髁鬃鬆魏魎魍鯊鯉鯽鯈鯀鵑鵝鵠黠鼕鼬儳嚥壞壟壢寵龐廬懲懷懶懵攀攏曠曝櫥櫝櫚櫓瀛瀟瀨瀚瀝瀕瀘爆爍牘犢獸"],["c3a1","獺璽瓊瓣疇疆癟癡矇礙禱穫穩簾簿簸簽簷籀繫繭繹繩繪羅繳羶羹羸臘藩藝藪藕藤藥藷蟻蠅蠍蟹蟾襠襟襖襞譁譜識證譚譎譏譆譙贈贊蹼蹲躇蹶蹬蹺蹴轔轎辭邊邋醱醮鏡鏑鏟鏃鏈鏜鏝鏖鏢鏍鏘鏤鏗鏨關隴難霪霧靡韜韻類"],["c440","願顛颼饅饉騖騙鬍鯨鯧鯖鯛鶉鵡鵲鵪鵬麒麗麓麴勸嚨嚷嚶嚴嚼壤孀孃孽寶巉懸懺攘攔攙曦朧櫬瀾瀰瀲爐獻瓏癢癥礦礪礬礫竇競籌籃籍糯糰辮繽繼"],["c4a1","纂罌耀臚艦藻藹蘑藺蘆蘋蘇蘊蠔蠕襤覺觸議譬警譯譟譫贏贍躉躁躅躂醴釋鐘鐃鏽闡霰飄饒饑馨騫騰騷騵鰓鰍鹹麵黨鼯齟齣齡儷儸囁囀囂夔屬巍懼懾攝攜斕曩櫻欄櫺殲灌爛犧瓖瓔癩矓籐纏續羼蘗蘭蘚蠣蠢蠡蠟襪襬覽譴"],["c540","護譽贓躊躍躋轟辯醺鐮鐳鐵鐺鐸鐲鐫闢霸霹露響顧顥饗驅驃驀騾髏魔魑鰭鰥鶯鶴鷂鶸麝黯鼙齜齦齧儼儻囈囊囉孿巔巒彎懿攤權歡灑灘玀瓤疊癮癬"],["c5a1","禳籠籟聾聽臟襲襯觼讀贖贗躑躓轡酈鑄鑑鑒霽霾韃韁顫饕驕驍髒鬚鱉鰱鰾鰻鷓鷗鼴齬齪龔囌巖戀攣攫攪曬欐瓚竊籤籣籥纓纖纔臢蘸蘿蠱變邐邏鑣鑠鑤靨顯饜驚驛驗髓體髑鱔鱗鱖鷥麟黴囑壩攬灞癱癲矗罐羈蠶蠹衢讓讒"],["c640","讖艷贛釀鑪靂靈靄韆顰驟鬢魘鱟鷹鷺鹼鹽鼇齷齲廳欖灣籬籮蠻觀躡釁鑲鑰顱饞髖鬣黌灤矚讚鑷韉驢驥纜讜躪釅鑽鑾鑼鱷鱸黷豔鑿鸚爨驪鬱鸛鸞籲"],["c940","乂乜凵匚厂万丌乇亍囗兀屮彳丏冇与丮亓仂仉仈冘勼卬厹圠夃夬尐巿旡殳毌气爿丱丼仨仜仩仡仝仚刌匜卌圢圣夗夯宁宄尒尻屴屳帄庀庂忉戉扐氕"],["c9a1","氶汃氿氻犮犰玊禸肊阞伎优伬仵伔仱伀价伈伝伂伅伢伓伄仴伒冱刓刉刐劦匢匟卍厊吇囡囟圮圪圴夼妀奼妅奻奾奷奿孖尕尥屼屺屻屾巟幵庄异弚彴忕忔忏扜扞扤扡扦扢扙扠扚扥旯旮朾朹朸朻机朿朼朳氘汆汒汜汏汊汔汋"],["ca40","汌灱牞犴犵玎甪癿穵网艸艼芀艽艿虍襾邙邗邘邛邔阢阤阠阣佖伻佢佉体佤伾佧佒佟佁佘伭伳伿佡冏冹刜刞刡劭劮匉卣卲厎厏吰吷吪呔呅吙吜吥吘"],["caa1","吽呏呁吨吤呇囮囧囥坁坅坌坉坋坒夆奀妦妘妠妗妎妢妐妏妧妡宎宒尨尪岍岏岈岋岉岒岊岆岓岕巠帊帎庋庉庌庈庍弅弝彸彶忒忑忐忭忨忮忳忡忤忣忺忯忷忻怀忴戺抃抌抎抏抔抇扱扻扺扰抁抈扷扽扲扴攷旰旴旳旲旵杅杇"],["cb40","杙杕杌杈杝杍杚杋毐氙氚汸汧汫沄沋沏汱汯汩沚汭沇沕沜汦汳汥汻沎灴灺牣犿犽狃狆狁犺狅玕玗玓玔玒町甹疔疕皁礽耴肕肙肐肒肜芐芏芅芎芑芓"],["cba1","芊芃芄豸迉辿邟邡邥邞邧邠阰阨阯阭丳侘佼侅佽侀侇佶佴侉侄佷佌侗佪侚佹侁佸侐侜侔侞侒侂侕佫佮冞冼冾刵刲刳剆刱劼匊匋匼厒厔咇呿咁咑咂咈呫呺呾呥呬呴呦咍呯呡呠咘呣呧呤囷囹坯坲坭坫坱坰坶垀坵坻坳坴坢"],["cc40","坨坽夌奅妵妺姏姎妲姌姁妶妼姃姖妱妽姀姈妴姇孢孥宓宕屄屇岮岤岠岵岯岨岬岟岣岭岢岪岧岝岥岶岰岦帗帔帙弨弢弣弤彔徂彾彽忞忥怭怦怙怲怋"],["cca1","怴怊怗怳怚怞怬怢怍怐怮怓怑怌怉怜戔戽抭抴拑抾抪抶拊抮抳抯抻抩抰抸攽斨斻昉旼昄昒昈旻昃昋昍昅旽昑昐曶朊枅杬枎枒杶杻枘枆构杴枍枌杺枟枑枙枃杽极杸杹枔欥殀歾毞氝沓泬泫泮泙沶泔沭泧沷泐泂沺泃泆泭泲"],["cd40","泒泝沴沊沝沀泞泀洰泍泇沰泹泏泩泑炔炘炅炓炆炄炑炖炂炚炃牪狖狋狘狉狜狒狔狚狌狑玤玡玭玦玢玠玬玝瓝瓨甿畀甾疌疘皯盳盱盰盵矸矼矹矻矺"],["cda1","矷祂礿秅穸穻竻籵糽耵肏肮肣肸肵肭舠芠苀芫芚芘芛芵芧芮芼芞芺芴芨芡芩苂芤苃芶芢虰虯虭虮豖迒迋迓迍迖迕迗邲邴邯邳邰阹阽阼阺陃俍俅俓侲俉俋俁俔俜俙侻侳俛俇俖侺俀侹俬剄剉勀勂匽卼厗厖厙厘咺咡咭咥哏"],["ce40","哃茍咷咮哖咶哅哆咠呰咼咢咾呲哞咰垵垞垟垤垌垗垝垛垔垘垏垙垥垚垕壴复奓姡姞姮娀姱姝姺姽姼姶姤姲姷姛姩姳姵姠姾姴姭宨屌峐峘峌峗峋峛"],["cea1","峞峚峉峇峊峖峓峔峏峈峆峎峟峸巹帡帢帣帠帤庰庤庢庛庣庥弇弮彖徆怷怹恔恲恞恅恓恇恉恛恌恀恂恟怤恄恘恦恮扂扃拏挍挋拵挎挃拫拹挏挌拸拶挀挓挔拺挕拻拰敁敃斪斿昶昡昲昵昜昦昢昳昫昺昝昴昹昮朏朐柁柲柈枺"],["cf40","柜枻柸柘柀枷柅柫柤柟枵柍枳柷柶柮柣柂枹柎柧柰枲柼柆柭柌枮柦柛柺柉柊柃柪柋欨殂殄殶毖毘毠氠氡洨洴洭洟洼洿洒洊泚洳洄洙洺洚洑洀洝浂"],["cfa1","洁洘洷洃洏浀洇洠洬洈洢洉洐炷炟炾炱炰炡炴炵炩牁牉牊牬牰牳牮狊狤狨狫狟狪狦狣玅珌珂珈珅玹玶玵玴珫玿珇玾珃珆玸珋瓬瓮甮畇畈疧疪癹盄眈眃眄眅眊盷盻盺矧矨砆砑砒砅砐砏砎砉砃砓祊祌祋祅祄秕种秏秖秎窀"],["d040","穾竑笀笁籺籸籹籿粀粁紃紈紁罘羑羍羾耇耎耏耔耷胘胇胠胑胈胂胐胅胣胙胜胊胕胉胏胗胦胍臿舡芔苙苾苹茇苨茀苕茺苫苖苴苬苡苲苵茌苻苶苰苪"],["d0a1","苤苠苺苳苭虷虴虼虳衁衎衧衪衩觓訄訇赲迣迡迮迠郱邽邿郕郅邾郇郋郈釔釓陔陏陑陓陊陎倞倅倇倓倢倰倛俵俴倳倷倬俶俷倗倜倠倧倵倯倱倎党冔冓凊凄凅凈凎剡剚剒剞剟剕剢勍匎厞唦哢唗唒哧哳哤唚哿唄唈哫唑唅哱"],["d140","唊哻哷哸哠唎唃唋圁圂埌堲埕埒垺埆垽垼垸垶垿埇埐垹埁夎奊娙娖娭娮娕娏娗娊娞娳孬宧宭宬尃屖屔峬峿峮峱峷崀峹帩帨庨庮庪庬弳弰彧恝恚恧"],["d1a1","恁悢悈悀悒悁悝悃悕悛悗悇悜悎戙扆拲挐捖挬捄捅挶捃揤挹捋捊挼挩捁挴捘捔捙挭捇挳捚捑挸捗捀捈敊敆旆旃旄旂晊晟晇晑朒朓栟栚桉栲栳栻桋桏栖栱栜栵栫栭栯桎桄栴栝栒栔栦栨栮桍栺栥栠欬欯欭欱欴歭肂殈毦毤"],["d240","毨毣毢毧氥浺浣浤浶洍浡涒浘浢浭浯涑涍淯浿涆浞浧浠涗浰浼浟涂涘洯浨涋浾涀涄洖涃浻浽浵涐烜烓烑烝烋缹烢烗烒烞烠烔烍烅烆烇烚烎烡牂牸"],["d2a1","牷牶猀狺狴狾狶狳狻猁珓珙珥珖玼珧珣珩珜珒珛珔珝珚珗珘珨瓞瓟瓴瓵甡畛畟疰痁疻痄痀疿疶疺皊盉眝眛眐眓眒眣眑眕眙眚眢眧砣砬砢砵砯砨砮砫砡砩砳砪砱祔祛祏祜祓祒祑秫秬秠秮秭秪秜秞秝窆窉窅窋窌窊窇竘笐"],["d340","笄笓笅笏笈笊笎笉笒粄粑粊粌粈粍粅紞紝紑紎紘紖紓紟紒紏紌罜罡罞罠罝罛羖羒翃翂翀耖耾耹胺胲胹胵脁胻脀舁舯舥茳茭荄茙荑茥荖茿荁茦茜茢"],["d3a1","荂荎茛茪茈茼荍茖茤茠茷茯茩荇荅荌荓茞茬荋茧荈虓虒蚢蚨蚖蚍蚑蚞蚇蚗蚆蚋蚚蚅蚥蚙蚡蚧蚕蚘蚎蚝蚐蚔衃衄衭衵衶衲袀衱衿衯袃衾衴衼訒豇豗豻貤貣赶赸趵趷趶軑軓迾迵适迿迻逄迼迶郖郠郙郚郣郟郥郘郛郗郜郤酐"],["d440","酎酏釕釢釚陜陟隼飣髟鬯乿偰偪偡偞偠偓偋偝偲偈偍偁偛偊偢倕偅偟偩偫偣偤偆偀偮偳偗偑凐剫剭剬剮勖勓匭厜啵啶唼啍啐唴唪啑啢唶唵唰啒啅"],["d4a1","唌唲啥啎唹啈唭唻啀啋圊圇埻堔埢埶埜埴堀埭埽堈埸堋埳埏堇埮埣埲埥埬埡堎埼堐埧堁堌埱埩埰堍堄奜婠婘婕婧婞娸娵婭婐婟婥婬婓婤婗婃婝婒婄婛婈媎娾婍娹婌婰婩婇婑婖婂婜孲孮寁寀屙崞崋崝崚崠崌崨崍崦崥崏"],["d540","崰崒崣崟崮帾帴庱庴庹庲庳弶弸徛徖徟悊悐悆悾悰悺惓惔惏惤惙惝惈悱惛悷惊悿惃惍惀挲捥掊掂捽掽掞掭掝掗掫掎捯掇掐据掯捵掜捭掮捼掤挻掟"],["d5a1","捸掅掁掑掍捰敓旍晥晡晛晙晜晢朘桹梇梐梜桭桮梮梫楖桯梣梬梩桵桴梲梏桷梒桼桫桲梪梀桱桾梛梖梋梠梉梤桸桻梑梌梊桽欶欳欷欸殑殏殍殎殌氪淀涫涴涳湴涬淩淢涷淶淔渀淈淠淟淖涾淥淜淝淛淴淊涽淭淰涺淕淂淏淉"],["d640","淐淲淓淽淗淍淣涻烺焍烷焗烴焌烰焄烳焐烼烿焆焓焀烸烶焋焂焎牾牻牼牿猝猗猇猑猘猊猈狿猏猞玈珶珸珵琄琁珽琇琀珺珼珿琌琋珴琈畤畣痎痒痏"],["d6a1","痋痌痑痐皏皉盓眹眯眭眱眲眴眳眽眥眻眵硈硒硉硍硊硌砦硅硐祤祧祩祪祣祫祡离秺秸秶秷窏窔窐笵筇笴笥笰笢笤笳笘笪笝笱笫笭笯笲笸笚笣粔粘粖粣紵紽紸紶紺絅紬紩絁絇紾紿絊紻紨罣羕羜羝羛翊翋翍翐翑翇翏翉耟"],["d740","耞耛聇聃聈脘脥脙脛脭脟脬脞脡脕脧脝脢舑舸舳舺舴舲艴莐莣莨莍荺荳莤荴莏莁莕莙荵莔莩荽莃莌莝莛莪莋荾莥莯莈莗莰荿莦莇莮荶莚虙虖蚿蚷"],["d7a1","蛂蛁蛅蚺蚰蛈蚹蚳蚸蛌蚴蚻蚼蛃蚽蚾衒袉袕袨袢袪袚袑袡袟袘袧袙袛袗袤袬袌袓袎覂觖觙觕訰訧訬訞谹谻豜豝豽貥赽赻赹趼跂趹趿跁軘軞軝軜軗軠軡逤逋逑逜逌逡郯郪郰郴郲郳郔郫郬郩酖酘酚酓酕釬釴釱釳釸釤釹釪"],["d840","釫釷釨釮镺閆閈陼陭陫陱陯隿靪頄飥馗傛傕傔傞傋傣傃傌傎傝偨傜傒傂傇兟凔匒匑厤厧喑喨喥喭啷噅喢喓喈喏喵喁喣喒喤啽喌喦啿喕喡喎圌堩堷"],["d8a1","堙堞堧堣堨埵塈堥堜堛堳堿堶堮堹堸堭堬堻奡媯媔媟婺媢媞婸媦婼媥媬媕媮娷媄媊媗媃媋媩婻婽媌媜媏媓媝寪寍寋寔寑寊寎尌尰崷嵃嵫嵁嵋崿崵嵑嵎嵕崳崺嵒崽崱嵙嵂崹嵉崸崼崲崶嵀嵅幄幁彘徦徥徫惉悹惌惢惎惄愔"],["d940","惲愊愖愅惵愓惸惼惾惁愃愘愝愐惿愄愋扊掔掱掰揎揥揨揯揃撝揳揊揠揶揕揲揵摡揟掾揝揜揄揘揓揂揇揌揋揈揰揗揙攲敧敪敤敜敨敥斌斝斞斮旐旒"],["d9a1","晼晬晻暀晱晹晪晲朁椌棓椄棜椪棬棪棱椏棖棷棫棤棶椓椐棳棡椇棌椈楰梴椑棯棆椔棸棐棽棼棨椋椊椗棎棈棝棞棦棴棑椆棔棩椕椥棇欹欻欿欼殔殗殙殕殽毰毲毳氰淼湆湇渟湉溈渼渽湅湢渫渿湁湝湳渜渳湋湀湑渻渃渮湞"],["da40","湨湜湡渱渨湠湱湫渹渢渰湓湥渧湸湤湷湕湹湒湦渵渶湚焠焞焯烻焮焱焣焥焢焲焟焨焺焛牋牚犈犉犆犅犋猒猋猰猢猱猳猧猲猭猦猣猵猌琮琬琰琫琖"],["daa1","琚琡琭琱琤琣琝琩琠琲瓻甯畯畬痧痚痡痦痝痟痤痗皕皒盚睆睇睄睍睅睊睎睋睌矞矬硠硤硥硜硭硱硪确硰硩硨硞硢祴祳祲祰稂稊稃稌稄窙竦竤筊笻筄筈筌筎筀筘筅粢粞粨粡絘絯絣絓絖絧絪絏絭絜絫絒絔絩絑絟絎缾缿罥"],["db40","罦羢羠羡翗聑聏聐胾胔腃腊腒腏腇脽腍脺臦臮臷臸臹舄舼舽舿艵茻菏菹萣菀菨萒菧菤菼菶萐菆菈菫菣莿萁菝菥菘菿菡菋菎菖菵菉萉萏菞萑萆菂菳"],["dba1","菕菺菇菑菪萓菃菬菮菄菻菗菢萛菛菾蛘蛢蛦蛓蛣蛚蛪蛝蛫蛜蛬蛩蛗蛨蛑衈衖衕袺裗袹袸裀袾袶袼袷袽袲褁裉覕覘覗觝觚觛詎詍訹詙詀詗詘詄詅詒詈詑詊詌詏豟貁貀貺貾貰貹貵趄趀趉跘跓跍跇跖跜跏跕跙跈跗跅軯軷軺"],["dc40","軹軦軮軥軵軧軨軶軫軱軬軴軩逭逴逯鄆鄬鄄郿郼鄈郹郻鄁鄀鄇鄅鄃酡酤酟酢酠鈁鈊鈥鈃鈚鈦鈏鈌鈀鈒釿釽鈆鈄鈧鈂鈜鈤鈙鈗鈅鈖镻閍閌閐隇陾隈"],["dca1","隉隃隀雂雈雃雱雰靬靰靮頇颩飫鳦黹亃亄亶傽傿僆傮僄僊傴僈僂傰僁傺傱僋僉傶傸凗剺剸剻剼嗃嗛嗌嗐嗋嗊嗝嗀嗔嗄嗩喿嗒喍嗏嗕嗢嗖嗈嗲嗍嗙嗂圔塓塨塤塏塍塉塯塕塎塝塙塥塛堽塣塱壼嫇嫄嫋媺媸媱媵媰媿嫈媻嫆"],["dd40","媷嫀嫊媴媶嫍媹媐寖寘寙尟尳嵱嵣嵊嵥嵲嵬嵞嵨嵧嵢巰幏幎幊幍幋廅廌廆廋廇彀徯徭惷慉慊愫慅愶愲愮慆愯慏愩慀戠酨戣戥戤揅揱揫搐搒搉搠搤"],["dda1","搳摃搟搕搘搹搷搢搣搌搦搰搨摁搵搯搊搚摀搥搧搋揧搛搮搡搎敯斒旓暆暌暕暐暋暊暙暔晸朠楦楟椸楎楢楱椿楅楪椹楂楗楙楺楈楉椵楬椳椽楥棰楸椴楩楀楯楄楶楘楁楴楌椻楋椷楜楏楑椲楒椯楻椼歆歅歃歂歈歁殛嗀毻毼"],["de40","毹毷毸溛滖滈溏滀溟溓溔溠溱溹滆滒溽滁溞滉溷溰滍溦滏溲溾滃滜滘溙溒溎溍溤溡溿溳滐滊溗溮溣煇煔煒煣煠煁煝煢煲煸煪煡煂煘煃煋煰煟煐煓"],["dea1","煄煍煚牏犍犌犑犐犎猼獂猻猺獀獊獉瑄瑊瑋瑒瑑瑗瑀瑏瑐瑎瑂瑆瑍瑔瓡瓿瓾瓽甝畹畷榃痯瘏瘃痷痾痼痹痸瘐痻痶痭痵痽皙皵盝睕睟睠睒睖睚睩睧睔睙睭矠碇碚碔碏碄碕碅碆碡碃硹碙碀碖硻祼禂祽祹稑稘稙稒稗稕稢稓"],["df40","稛稐窣窢窞竫筦筤筭筴筩筲筥筳筱筰筡筸筶筣粲粴粯綈綆綀綍絿綅絺綎絻綃絼綌綔綄絽綒罭罫罧罨罬羦羥羧翛翜耡腤腠腷腜腩腛腢腲朡腞腶腧腯"],["dfa1","腄腡舝艉艄艀艂艅蓱萿葖葶葹蒏蒍葥葑葀蒆葧萰葍葽葚葙葴葳葝蔇葞萷萺萴葺葃葸萲葅萩菙葋萯葂萭葟葰萹葎葌葒葯蓅蒎萻葇萶萳葨葾葄萫葠葔葮葐蜋蜄蛷蜌蛺蛖蛵蝍蛸蜎蜉蜁蛶蜍蜅裖裋裍裎裞裛裚裌裐覅覛觟觥觤"],["e040","觡觠觢觜触詶誆詿詡訿詷誂誄詵誃誁詴詺谼豋豊豥豤豦貆貄貅賌赨赩趑趌趎趏趍趓趔趐趒跰跠跬跱跮跐跩跣跢跧跲跫跴輆軿輁輀輅輇輈輂輋遒逿"],["e0a1","遄遉逽鄐鄍鄏鄑鄖鄔鄋鄎酮酯鉈鉒鈰鈺鉦鈳鉥鉞銃鈮鉊鉆鉭鉬鉏鉠鉧鉯鈶鉡鉰鈱鉔鉣鉐鉲鉎鉓鉌鉖鈲閟閜閞閛隒隓隑隗雎雺雽雸雵靳靷靸靲頏頍頎颬飶飹馯馲馰馵骭骫魛鳪鳭鳧麀黽僦僔僗僨僳僛僪僝僤僓僬僰僯僣僠"],["e140","凘劀劁勩勫匰厬嘧嘕嘌嘒嗼嘏嘜嘁嘓嘂嗺嘝嘄嗿嗹墉塼墐墘墆墁塿塴墋塺墇墑墎塶墂墈塻墔墏壾奫嫜嫮嫥嫕嫪嫚嫭嫫嫳嫢嫠嫛嫬嫞嫝嫙嫨嫟孷寠"],["e1a1","寣屣嶂嶀嵽嶆嵺嶁嵷嶊嶉嶈嵾嵼嶍嵹嵿幘幙幓廘廑廗廎廜廕廙廒廔彄彃彯徶愬愨慁慞慱慳慒慓慲慬憀慴慔慺慛慥愻慪慡慖戩戧戫搫摍摛摝摴摶摲摳摽摵摦撦摎撂摞摜摋摓摠摐摿搿摬摫摙摥摷敳斠暡暠暟朅朄朢榱榶槉"],["e240","榠槎榖榰榬榼榑榙榎榧榍榩榾榯榿槄榽榤槔榹槊榚槏榳榓榪榡榞槙榗榐槂榵榥槆歊歍歋殞殟殠毃毄毾滎滵滱漃漥滸漷滻漮漉潎漙漚漧漘漻漒滭漊"],["e2a1","漶潳滹滮漭潀漰漼漵滫漇漎潃漅滽滶漹漜滼漺漟漍漞漈漡熇熐熉熀熅熂熏煻熆熁熗牄牓犗犕犓獃獍獑獌瑢瑳瑱瑵瑲瑧瑮甀甂甃畽疐瘖瘈瘌瘕瘑瘊瘔皸瞁睼瞅瞂睮瞀睯睾瞃碲碪碴碭碨硾碫碞碥碠碬碢碤禘禊禋禖禕禔禓"],["e340","禗禈禒禐稫穊稰稯稨稦窨窫窬竮箈箜箊箑箐箖箍箌箛箎箅箘劄箙箤箂粻粿粼粺綧綷緂綣綪緁緀緅綝緎緄緆緋緌綯綹綖綼綟綦綮綩綡緉罳翢翣翥翞"],["e3a1","耤聝聜膉膆膃膇膍膌膋舕蒗蒤蒡蒟蒺蓎蓂蒬蒮蒫蒹蒴蓁蓍蒪蒚蒱蓐蒝蒧蒻蒢蒔蓇蓌蒛蒩蒯蒨蓖蒘蒶蓏蒠蓗蓔蓒蓛蒰蒑虡蜳蜣蜨蝫蝀蜮蜞蜡蜙蜛蝃蜬蝁蜾蝆蜠蜲蜪蜭蜼蜒蜺蜱蜵蝂蜦蜧蜸蜤蜚蜰蜑裷裧裱裲裺裾裮裼裶裻"],["e440","裰裬裫覝覡覟覞觩觫觨誫誙誋誒誏誖谽豨豩賕賏賗趖踉踂跿踍跽踊踃踇踆踅跾踀踄輐輑輎輍鄣鄜鄠鄢鄟鄝鄚鄤鄡鄛酺酲酹酳銥銤鉶銛鉺銠銔銪銍"],["e4a1","銦銚銫鉹銗鉿銣鋮銎銂銕銢鉽銈銡銊銆銌銙銧鉾銇銩銝銋鈭隞隡雿靘靽靺靾鞃鞀鞂靻鞄鞁靿韎韍頖颭颮餂餀餇馝馜駃馹馻馺駂馽駇骱髣髧鬾鬿魠魡魟鳱鳲鳵麧僿儃儰僸儆儇僶僾儋儌僽儊劋劌勱勯噈噂噌嘵噁噊噉噆噘"],["e540","噚噀嘳嘽嘬嘾嘸嘪嘺圚墫墝墱墠墣墯墬墥墡壿嫿嫴嫽嫷嫶嬃嫸嬂嫹嬁嬇嬅嬏屧嶙嶗嶟嶒嶢嶓嶕嶠嶜嶡嶚嶞幩幝幠幜緳廛廞廡彉徲憋憃慹憱憰憢憉"],["e5a1","憛憓憯憭憟憒憪憡憍慦憳戭摮摰撖撠撅撗撜撏撋撊撌撣撟摨撱撘敶敺敹敻斲斳暵暰暩暲暷暪暯樀樆樗槥槸樕槱槤樠槿槬槢樛樝槾樧槲槮樔槷槧橀樈槦槻樍槼槫樉樄樘樥樏槶樦樇槴樖歑殥殣殢殦氁氀毿氂潁漦潾澇濆澒"],["e640","澍澉澌潢潏澅潚澖潶潬澂潕潲潒潐潗澔澓潝漀潡潫潽潧澐潓澋潩潿澕潣潷潪潻熲熯熛熰熠熚熩熵熝熥熞熤熡熪熜熧熳犘犚獘獒獞獟獠獝獛獡獚獙"],["e6a1","獢璇璉璊璆璁瑽璅璈瑼瑹甈甇畾瘥瘞瘙瘝瘜瘣瘚瘨瘛皜皝皞皛瞍瞏瞉瞈磍碻磏磌磑磎磔磈磃磄磉禚禡禠禜禢禛歶稹窲窴窳箷篋箾箬篎箯箹篊箵糅糈糌糋緷緛緪緧緗緡縃緺緦緶緱緰緮緟罶羬羰羭翭翫翪翬翦翨聤聧膣膟"],["e740","膞膕膢膙膗舖艏艓艒艐艎艑蔤蔻蔏蔀蔩蔎蔉蔍蔟蔊蔧蔜蓻蔫蓺蔈蔌蓴蔪蓲蔕蓷蓫蓳蓼蔒蓪蓩蔖蓾蔨蔝蔮蔂蓽蔞蓶蔱蔦蓧蓨蓰蓯蓹蔘蔠蔰蔋蔙蔯虢"],["e7a1","蝖蝣蝤蝷蟡蝳蝘蝔蝛蝒蝡蝚蝑蝞蝭蝪蝐蝎蝟蝝蝯蝬蝺蝮蝜蝥蝏蝻蝵蝢蝧蝩衚褅褌褔褋褗褘褙褆褖褑褎褉覢覤覣觭觰觬諏諆誸諓諑諔諕誻諗誾諀諅諘諃誺誽諙谾豍貏賥賟賙賨賚賝賧趠趜趡趛踠踣踥踤踮踕踛踖踑踙踦踧"],["e840","踔踒踘踓踜踗踚輬輤輘輚輠輣輖輗遳遰遯遧遫鄯鄫鄩鄪鄲鄦鄮醅醆醊醁醂醄醀鋐鋃鋄鋀鋙銶鋏鋱鋟鋘鋩鋗鋝鋌鋯鋂鋨鋊鋈鋎鋦鋍鋕鋉鋠鋞鋧鋑鋓"],["e8a1","銵鋡鋆銴镼閬閫閮閰隤隢雓霅霈霂靚鞊鞎鞈韐韏頞頝頦頩頨頠頛頧颲餈飺餑餔餖餗餕駜駍駏駓駔駎駉駖駘駋駗駌骳髬髫髳髲髱魆魃魧魴魱魦魶魵魰魨魤魬鳼鳺鳽鳿鳷鴇鴀鳹鳻鴈鴅鴄麃黓鼏鼐儜儓儗儚儑凞匴叡噰噠噮"],["e940","噳噦噣噭噲噞噷圜圛壈墽壉墿墺壂墼壆嬗嬙嬛嬡嬔嬓嬐嬖嬨嬚嬠嬞寯嶬嶱嶩嶧嶵嶰嶮嶪嶨嶲嶭嶯嶴幧幨幦幯廩廧廦廨廥彋徼憝憨憖懅憴懆懁懌憺"],["e9a1","憿憸憌擗擖擐擏擉撽撉擃擛擳擙攳敿敼斢曈暾曀曊曋曏暽暻暺曌朣樴橦橉橧樲橨樾橝橭橶橛橑樨橚樻樿橁橪橤橐橏橔橯橩橠樼橞橖橕橍橎橆歕歔歖殧殪殫毈毇氄氃氆澭濋澣濇澼濎濈潞濄澽澞濊澨瀄澥澮澺澬澪濏澿澸"],["ea40","澢濉澫濍澯澲澰燅燂熿熸燖燀燁燋燔燊燇燏熽燘熼燆燚燛犝犞獩獦獧獬獥獫獪瑿璚璠璔璒璕璡甋疀瘯瘭瘱瘽瘳瘼瘵瘲瘰皻盦瞚瞝瞡瞜瞛瞢瞣瞕瞙"],["eaa1","瞗磝磩磥磪磞磣磛磡磢磭磟磠禤穄穈穇窶窸窵窱窷篞篣篧篝篕篥篚篨篹篔篪篢篜篫篘篟糒糔糗糐糑縒縡縗縌縟縠縓縎縜縕縚縢縋縏縖縍縔縥縤罃罻罼罺羱翯耪耩聬膱膦膮膹膵膫膰膬膴膲膷膧臲艕艖艗蕖蕅蕫蕍蕓蕡蕘"],["eb40","蕀蕆蕤蕁蕢蕄蕑蕇蕣蔾蕛蕱蕎蕮蕵蕕蕧蕠薌蕦蕝蕔蕥蕬虣虥虤螛螏螗螓螒螈螁螖螘蝹螇螣螅螐螑螝螄螔螜螚螉褞褦褰褭褮褧褱褢褩褣褯褬褟觱諠"],["eba1","諢諲諴諵諝謔諤諟諰諈諞諡諨諿諯諻貑貒貐賵賮賱賰賳赬赮趥趧踳踾踸蹀蹅踶踼踽蹁踰踿躽輶輮輵輲輹輷輴遶遹遻邆郺鄳鄵鄶醓醐醑醍醏錧錞錈錟錆錏鍺錸錼錛錣錒錁鍆錭錎錍鋋錝鋺錥錓鋹鋷錴錂錤鋿錩錹錵錪錔錌"],["ec40","錋鋾錉錀鋻錖閼闍閾閹閺閶閿閵閽隩雔霋霒霐鞙鞗鞔韰韸頵頯頲餤餟餧餩馞駮駬駥駤駰駣駪駩駧骹骿骴骻髶髺髹髷鬳鮀鮅鮇魼魾魻鮂鮓鮒鮐魺鮕"],["eca1","魽鮈鴥鴗鴠鴞鴔鴩鴝鴘鴢鴐鴙鴟麈麆麇麮麭黕黖黺鼒鼽儦儥儢儤儠儩勴嚓嚌嚍嚆嚄嚃噾嚂噿嚁壖壔壏壒嬭嬥嬲嬣嬬嬧嬦嬯嬮孻寱寲嶷幬幪徾徻懃憵憼懧懠懥懤懨懞擯擩擣擫擤擨斁斀斶旚曒檍檖檁檥檉檟檛檡檞檇檓檎"],["ed40","檕檃檨檤檑橿檦檚檅檌檒歛殭氉濌澩濴濔濣濜濭濧濦濞濲濝濢濨燡燱燨燲燤燰燢獳獮獯璗璲璫璐璪璭璱璥璯甐甑甒甏疄癃癈癉癇皤盩瞵瞫瞲瞷瞶"],["eda1","瞴瞱瞨矰磳磽礂磻磼磲礅磹磾礄禫禨穜穛穖穘穔穚窾竀竁簅簏篲簀篿篻簎篴簋篳簂簉簃簁篸篽簆篰篱簐簊糨縭縼繂縳顈縸縪繉繀繇縩繌縰縻縶繄縺罅罿罾罽翴翲耬膻臄臌臊臅臇膼臩艛艚艜薃薀薏薧薕薠薋薣蕻薤薚薞"],["ee40","蕷蕼薉薡蕺蕸蕗薎薖薆薍薙薝薁薢薂薈薅蕹蕶薘薐薟虨螾螪螭蟅螰螬螹螵螼螮蟉蟃蟂蟌螷螯蟄蟊螴螶螿螸螽蟞螲褵褳褼褾襁襒褷襂覭覯覮觲觳謞"],["eea1","謘謖謑謅謋謢謏謒謕謇謍謈謆謜謓謚豏豰豲豱豯貕貔賹赯蹎蹍蹓蹐蹌蹇轃轀邅遾鄸醚醢醛醙醟醡醝醠鎡鎃鎯鍤鍖鍇鍼鍘鍜鍶鍉鍐鍑鍠鍭鎏鍌鍪鍹鍗鍕鍒鍏鍱鍷鍻鍡鍞鍣鍧鎀鍎鍙闇闀闉闃闅閷隮隰隬霠霟霘霝霙鞚鞡鞜"],["ef40","鞞鞝韕韔韱顁顄顊顉顅顃餥餫餬餪餳餲餯餭餱餰馘馣馡騂駺駴駷駹駸駶駻駽駾駼騃骾髾髽鬁髼魈鮚鮨鮞鮛鮦鮡鮥鮤鮆鮢鮠鮯鴳鵁鵧鴶鴮鴯鴱鴸鴰"],["efa1","鵅鵂鵃鴾鴷鵀鴽翵鴭麊麉麍麰黈黚黻黿鼤鼣鼢齔龠儱儭儮嚘嚜嚗嚚嚝嚙奰嬼屩屪巀幭幮懘懟懭懮懱懪懰懫懖懩擿攄擽擸攁攃擼斔旛曚曛曘櫅檹檽櫡櫆檺檶檷櫇檴檭歞毉氋瀇瀌瀍瀁瀅瀔瀎濿瀀濻瀦濼濷瀊爁燿燹爃燽獶"],["f040","璸瓀璵瓁璾璶璻瓂甔甓癜癤癙癐癓癗癚皦皽盬矂瞺磿礌礓礔礉礐礒礑禭禬穟簜簩簙簠簟簭簝簦簨簢簥簰繜繐繖繣繘繢繟繑繠繗繓羵羳翷翸聵臑臒"],["f0a1","臐艟艞薴藆藀藃藂薳薵薽藇藄薿藋藎藈藅薱薶藒蘤薸薷薾虩蟧蟦蟢蟛蟫蟪蟥蟟蟳蟤蟔蟜蟓蟭蟘蟣螤蟗蟙蠁蟴蟨蟝襓襋襏襌襆襐襑襉謪謧謣謳謰謵譇謯謼謾謱謥謷謦謶謮謤謻謽謺豂豵貙貘貗賾贄贂贀蹜蹢蹠蹗蹖蹞蹥蹧"],["f140","蹛蹚蹡蹝蹩蹔轆轇轈轋鄨鄺鄻鄾醨醥醧醯醪鎵鎌鎒鎷鎛鎝鎉鎧鎎鎪鎞鎦鎕鎈鎙鎟鎍鎱鎑鎲鎤鎨鎴鎣鎥闒闓闑隳雗雚巂雟雘雝霣霢霥鞬鞮鞨鞫鞤鞪"],["f1a1","鞢鞥韗韙韖韘韺顐顑顒颸饁餼餺騏騋騉騍騄騑騊騅騇騆髀髜鬈鬄鬅鬩鬵魊魌魋鯇鯆鯃鮿鯁鮵鮸鯓鮶鯄鮹鮽鵜鵓鵏鵊鵛鵋鵙鵖鵌鵗鵒鵔鵟鵘鵚麎麌黟鼁鼀鼖鼥鼫鼪鼩鼨齌齕儴儵劖勷厴嚫嚭嚦嚧嚪嚬壚壝壛夒嬽嬾嬿巃幰"],["f240","徿懻攇攐攍攉攌攎斄旞旝曞櫧櫠櫌櫑櫙櫋櫟櫜櫐櫫櫏櫍櫞歠殰氌瀙瀧瀠瀖瀫瀡瀢瀣瀩瀗瀤瀜瀪爌爊爇爂爅犥犦犤犣犡瓋瓅璷瓃甖癠矉矊矄矱礝礛"],["f2a1","礡礜礗礞禰穧穨簳簼簹簬簻糬糪繶繵繸繰繷繯繺繲繴繨罋罊羃羆羷翽翾聸臗臕艤艡艣藫藱藭藙藡藨藚藗藬藲藸藘藟藣藜藑藰藦藯藞藢蠀蟺蠃蟶蟷蠉蠌蠋蠆蟼蠈蟿蠊蠂襢襚襛襗襡襜襘襝襙覈覷覶觶譐譈譊譀譓譖譔譋譕"],["f340","譑譂譒譗豃豷豶貚贆贇贉趬趪趭趫蹭蹸蹳蹪蹯蹻軂轒轑轏轐轓辴酀鄿醰醭鏞鏇鏏鏂鏚鏐鏹鏬鏌鏙鎩鏦鏊鏔鏮鏣鏕鏄鏎鏀鏒鏧镽闚闛雡霩霫霬霨霦"],["f3a1","鞳鞷鞶韝韞韟顜顙顝顗颿颽颻颾饈饇饃馦馧騚騕騥騝騤騛騢騠騧騣騞騜騔髂鬋鬊鬎鬌鬷鯪鯫鯠鯞鯤鯦鯢鯰鯔鯗鯬鯜鯙鯥鯕鯡鯚鵷鶁鶊鶄鶈鵱鶀鵸鶆鶋鶌鵽鵫鵴鵵鵰鵩鶅鵳鵻鶂鵯鵹鵿鶇鵨麔麑黀黼鼭齀齁齍齖齗齘匷嚲"],["f440","嚵嚳壣孅巆巇廮廯忀忁懹攗攖攕攓旟曨曣曤櫳櫰櫪櫨櫹櫱櫮櫯瀼瀵瀯瀷瀴瀱灂瀸瀿瀺瀹灀瀻瀳灁爓爔犨獽獼璺皫皪皾盭矌矎矏矍矲礥礣礧礨礤礩"],["f4a1","禲穮穬穭竷籉籈籊籇籅糮繻繾纁纀羺翿聹臛臙舋艨艩蘢藿蘁藾蘛蘀藶蘄蘉蘅蘌藽蠙蠐蠑蠗蠓蠖襣襦覹觷譠譪譝譨譣譥譧譭趮躆躈躄轙轖轗轕轘轚邍酃酁醷醵醲醳鐋鐓鏻鐠鐏鐔鏾鐕鐐鐨鐙鐍鏵鐀鏷鐇鐎鐖鐒鏺鐉鏸鐊鏿"],["f540","鏼鐌鏶鐑鐆闞闠闟霮霯鞹鞻韽韾顠顢顣顟飁飂饐饎饙饌饋饓騲騴騱騬騪騶騩騮騸騭髇髊髆鬐鬒鬑鰋鰈鯷鰅鰒鯸鱀鰇鰎鰆鰗鰔鰉鶟鶙鶤鶝鶒鶘鶐鶛"],["f5a1","鶠鶔鶜鶪鶗鶡鶚鶢鶨鶞鶣鶿鶩鶖鶦鶧麙麛麚黥黤黧黦鼰鼮齛齠齞齝齙龑儺儹劘劗囃嚽嚾孈孇巋巏廱懽攛欂櫼欃櫸欀灃灄灊灈灉灅灆爝爚爙獾甗癪矐礭礱礯籔籓糲纊纇纈纋纆纍罍羻耰臝蘘蘪蘦蘟蘣蘜蘙蘧蘮蘡蘠蘩蘞蘥"],["f640","蠩蠝蠛蠠蠤蠜蠫衊襭襩襮襫觺譹譸譅譺譻贐贔趯躎躌轞轛轝酆酄酅醹鐿鐻鐶鐩鐽鐼鐰鐹鐪鐷鐬鑀鐱闥闤闣霵霺鞿韡顤飉飆飀饘饖騹騽驆驄驂驁騺"],["f6a1","騿髍鬕鬗鬘鬖鬺魒鰫鰝鰜鰬鰣鰨鰩鰤鰡鶷鶶鶼鷁鷇鷊鷏鶾鷅鷃鶻鶵鷎鶹鶺鶬鷈鶱鶭鷌鶳鷍鶲鹺麜黫黮黭鼛鼘鼚鼱齎齥齤龒亹囆囅囋奱孋孌巕巑廲攡攠攦攢欋欈欉氍灕灖灗灒爞爟犩獿瓘瓕瓙瓗癭皭礵禴穰穱籗籜籙籛籚"],["f740","糴糱纑罏羇臞艫蘴蘵蘳蘬蘲蘶蠬蠨蠦蠪蠥襱覿覾觻譾讄讂讆讅譿贕躕躔躚躒躐躖躗轠轢酇鑌鑐鑊鑋鑏鑇鑅鑈鑉鑆霿韣顪顩飋饔饛驎驓驔驌驏驈驊"],["f7a1","驉驒驐髐鬙鬫鬻魖魕鱆鱈鰿鱄鰹鰳鱁鰼鰷鰴鰲鰽鰶鷛鷒鷞鷚鷋鷐鷜鷑鷟鷩鷙鷘鷖鷵鷕鷝麶黰鼵鼳鼲齂齫龕龢儽劙壨壧奲孍巘蠯彏戁戃戄攩攥斖曫欑欒欏毊灛灚爢玂玁玃癰矔籧籦纕艬蘺虀蘹蘼蘱蘻蘾蠰蠲蠮蠳襶襴襳觾"],["f840","讌讎讋讈豅贙躘轤轣醼鑢鑕鑝鑗鑞韄韅頀驖驙鬞鬟鬠鱒鱘鱐鱊鱍鱋鱕鱙鱌鱎鷻鷷鷯鷣鷫鷸鷤鷶鷡鷮鷦鷲鷰鷢鷬鷴鷳鷨鷭黂黐黲黳鼆鼜鼸鼷鼶齃齏"],["f8a1","齱齰齮齯囓囍孎屭攭曭曮欓灟灡灝灠爣瓛瓥矕礸禷禶籪纗羉艭虃蠸蠷蠵衋讔讕躞躟躠躝醾醽釂鑫鑨鑩雥靆靃靇韇韥驞髕魙鱣鱧鱦鱢鱞鱠鸂鷾鸇鸃鸆鸅鸀鸁鸉鷿鷽鸄麠鼞齆齴齵齶囔攮斸欘欙欗欚灢爦犪矘矙礹籩籫糶纚"],["f940","纘纛纙臠臡虆虇虈襹襺襼襻觿讘讙躥躤躣鑮鑭鑯鑱鑳靉顲饟鱨鱮鱭鸋鸍鸐鸏鸒鸑麡黵鼉齇齸齻齺齹圞灦籯蠼趲躦釃鑴鑸鑶鑵驠鱴鱳鱱鱵鸔鸓黶鼊"],["f9a1","龤灨灥糷虪蠾蠽蠿讞貜躩軉靋顳顴飌饡馫驤驦驧鬤鸕鸗齈戇欞爧虌躨钂钀钁驩驨鬮鸙爩虋讟钃鱹麷癵驫鱺鸝灩灪麤齾齉龘碁銹裏墻恒粧嫺╔╦╗╠╬╣╚╩╝╒╤╕╞╪╡╘╧╛╓╥╖╟╫╢╙╨╜║═╭╮╰╯▓"]]')},function(e,t,n){"use strict";(function(t,i){var a=n(25);e.exports=y;var o,r=n(45);y.ReadableState=v;n(32).EventEmitter;var s=function(e,t){return e.listeners(t).length},l=n(49),c=n(33).Buffer,d=t.Uint8Array||function(){};var u=Object.create(n(19));u.inherits=n(20);var h=n(120),f=void 0;f=h&&h.debuglog?h.debuglog("stream"):function(){};var p,m=n(121),g=n(50);u.inherits(y,l);var b=["error","close","destroy","pause","resume"];function v(e,t){e=e||{};var i=t instanceof(o=o||n(15));this.objectMode=!!e.objectMode,i&&(this.objectMode=this.objectMode||!!e.readableObjectMode);var a=e.highWaterMark,r=e.readableHighWaterMark,s=this.objectMode?16:16384;this.highWaterMark=a||0===a?a:i&&(r||0===r)?r:s,this.highWaterMark=Math.floor(this.highWaterMark),this.buffer=new m,this.length=0,this.pipes=null,this.pipesCount=0,this.flowing=null,this.ended=!1,this.endEmitted=!1,this.reading=!1,this.sync=!0,this.needReadable=!1,this.emittedReadable=!1,this.readableListening=!1,this.resumeScheduled=!1,this.destroyed=!1,this.defaultEncoding=e.defaultEncoding||"utf8",this.awaitDrain=0,this.readingMore=!1,this.decoder=null,this.encoding=null,e.encoding&&(p||(p=n(29).StringDecoder),this.decoder=new p(e.encoding),this.encoding=e.encoding)}function y(e){if(o=o||n(15),!(this instanceof y))return new y(e);this._readableState=new v(e,this),this.readable=!0,e&&("function"==typeof e.read&&(this._read=e.read),"function"==typeof e.destroy&&(this._destroy=e.destroy)),l.call(this)}function _(e,t,n,i,a){var o,r=e._readableState;null===t?(r.reading=!1,function(e,t){if(t.ended)return;if(t.decoder){var n=t.decoder.end();n&&n.length&&(t.buffer.push(n),t.length+=t.objectMode?1:n.length)}t.ended=!0,S(e)}(e,r)):(a||(o=function(e,t){var n;i=t,c.isBuffer(i)||i instanceof d||"string"==typeof t||void 0===t||e.objectMode||(n=new TypeError("Invalid non-string/buffer chunk"));var i;return n}(r,t)),o?e.emit("error",o):r.objectMode||t&&t.length>0?("string"==typeof t||r.objectMode||Object.getPrototypeOf(t)===c.prototype||(t=function(e){return c.from(e)}(t)),i?r.endEmitted?e.emit("error",new Error("stream.unshift() after end event")):w(e,r,t,!0):r.ended?e.emit("error",new Error("stream.push() after EOF")):(r.reading=!1,r.decoder&&!n?(t=r.decoder.write(t),r.objectMode||0!==t.length?w(e,r,t,!1):C(e,r)):w(e,r,t,!1))):i||(r.reading=!1));return function(e){return!e.ended&&(e.needReadable||e.length<e.highWaterMark||0===e.length)}(r)}function w(e,t,n,i){t.flowing&&0===t.length&&!t.sync?(e.emit("data",n),e.read(0)):(t.length+=t.objectMode?1:n.length,i?t.buffer.unshift(n):t.buffer.push(n),t.needReadable&&S(e)),C(e,t)}Object.defineProperty(y.prototype,"destroyed",{get:function(){return void 0!==this._readableState&&this._readableState.destroyed},set:function(e){this._readableState&&(this._readableState.destroyed=e)}}),y.prototype.destroy=g.destroy,y.prototype._undestroy=g.undestroy,y.prototype._destroy=function(e,t){this.push(null),t(e)},y.prototype.push=function(e,t){var n,i=this._readableState;return i.objectMode?n=!0:"string"==typeof e&&((t=t||i.defaultEncoding)!==i.encoding&&(e=c.from(e,t),t=""),n=!0),_(this,e,t,!1,n)},y.prototype.unshift=function(e){return _(this,e,null,!0,!1)},y.prototype.isPaused=function(){return!1===this._readableState.flowing},y.prototype.setEncoding=function(e){return p||(p=n(29).StringDecoder),this._readableState.decoder=new p(e),this._readableState.encoding=e,this};function k(e,t){return e<=0||0===t.length&&t.ended?0:t.objectMode?1:e!=e?t.flowing&&t.length?t.buffer.head.data.length:t.length:(e>t.highWaterMark&&(t.highWaterMark=function(e){return e>=8388608?e=8388608:(e--,e|=e>>>1,e|=e>>>2,e|=e>>>4,e|=e>>>8,e|=e>>>16,e++),e}(e)),e<=t.length?e:t.ended?t.length:(t.needReadable=!0,0))}function S(e){var t=e._readableState;t.needReadable=!1,t.emittedReadable||(f("emitReadable",t.flowing),t.emittedReadable=!0,t.sync?a.nextTick(A,e):A(e))}function A(e){f("emit readable"),e.emit("readable"),I(e)}function C(e,t){t.readingMore||(t.readingMore=!0,a.nextTick(x,e,t))}function x(e,t){for(var n=t.length;!t.reading&&!t.flowing&&!t.ended&&t.length<t.highWaterMark&&(f("maybeReadMore read 0"),e.read(0),n!==t.length);)n=t.length;t.readingMore=!1}function T(e){f("readable nexttick read 0"),e.read(0)}function E(e,t){t.reading||(f("resume read 0"),e.read(0)),t.resumeScheduled=!1,t.awaitDrain=0,e.emit("resume"),I(e),t.flowing&&!t.reading&&e.read(0)}function I(e){var t=e._readableState;for(f("flow",t.flowing);t.flowing&&null!==e.read(););}function M(e,t){return 0===t.length?null:(t.objectMode?n=t.buffer.shift():!e||e>=t.length?(n=t.decoder?t.buffer.join(""):1===t.buffer.length?t.buffer.head.data:t.buffer.concat(t.length),t.buffer.clear()):n=function(e,t,n){var i;e<t.head.data.length?(i=t.head.data.slice(0,e),t.head.data=t.head.data.slice(e)):i=e===t.head.data.length?t.shift():n?function(e,t){var n=t.head,i=1,a=n.data;e-=a.length;for(;n=n.next;){var o=n.data,r=e>o.length?o.length:e;if(r===o.length?a+=o:a+=o.slice(0,e),0===(e-=r)){r===o.length?(++i,n.next?t.head=n.next:t.head=t.tail=null):(t.head=n,n.data=o.slice(r));break}++i}return t.length-=i,a}(e,t):function(e,t){var n=c.allocUnsafe(e),i=t.head,a=1;i.data.copy(n),e-=i.data.length;for(;i=i.next;){var o=i.data,r=e>o.length?o.length:e;if(o.copy(n,n.length-e,0,r),0===(e-=r)){r===o.length?(++a,i.next?t.head=i.next:t.head=t.tail=null):(t.head=i,i.data=o.slice(r));break}++a}return t.length-=a,n}(e,t);return i}(e,t.buffer,t.decoder),n);var n}function O(e){var t=e._readableState;if(t.length>0)throw new Error('"endReadable()" called on non-empty stream');t.endEmitted||(t.ended=!0,a.nextTick(P,t,e))}function P(e,t){e.endEmitted||0!==e.length||(e.endEmitted=!0,t.readable=!1,t.emit("end"))}function D(e,t){for(var n=0,i=e.length;n<i;n++)if(e[n]===t)return n;return-1}y.prototype.read=function(e){f("read",e),e=parseInt(e,10);var t=this._readableState,n=e;if(0!==e&&(t.emittedReadable=!1),0===e&&t.needReadable&&(t.length>=t.highWaterMark||t.ended))return f("read: emitReadable",t.length,t.ended),0===t.length&&t.ended?O(this):S(this),null;if(0===(e=k(e,t))&&t.ended)return 0===t.length&&O(this),null;var i,a=t.needReadable;return f("need readable",a),(0===t.length||t.length-e<t.highWaterMark)&&f("length less than watermark",a=!0),t.ended||t.reading?f("reading or ended",a=!1):a&&(f("do read"),t.reading=!0,t.sync=!0,0===t.length&&(t.needReadable=!0),this._read(t.highWaterMark),t.sync=!1,t.reading||(e=k(n,t))),null===(i=e>0?M(e,t):null)?(t.needReadable=!0,e=0):t.length-=e,0===t.length&&(t.ended||(t.needReadable=!0),n!==e&&t.ended&&O(this)),null!==i&&this.emit("data",i),i},y.prototype._read=function(e){this.emit("error",new Error("_read() is not implemented"))},y.prototype.pipe=function(e,t){var n=this,o=this._readableState;switch(o.pipesCount){case 0:o.pipes=e;break;case 1:o.pipes=[o.pipes,e];break;default:o.pipes.push(e)}o.pipesCount+=1,f("pipe count=%d opts=%j",o.pipesCount,t);var l=(!t||!1!==t.end)&&e!==i.stdout&&e!==i.stderr?d:y;function c(t,i){f("onunpipe"),t===n&&i&&!1===i.hasUnpiped&&(i.hasUnpiped=!0,f("cleanup"),e.removeListener("close",b),e.removeListener("finish",v),e.removeListener("drain",u),e.removeListener("error",g),e.removeListener("unpipe",c),n.removeListener("end",d),n.removeListener("end",y),n.removeListener("data",m),h=!0,!o.awaitDrain||e._writableState&&!e._writableState.needDrain||u())}function d(){f("onend"),e.end()}o.endEmitted?a.nextTick(l):n.once("end",l),e.on("unpipe",c);var u=function(e){return function(){var t=e._readableState;f("pipeOnDrain",t.awaitDrain),t.awaitDrain&&t.awaitDrain--,0===t.awaitDrain&&s(e,"data")&&(t.flowing=!0,I(e))}}(n);e.on("drain",u);var h=!1;var p=!1;function m(t){f("ondata"),p=!1,!1!==e.write(t)||p||((1===o.pipesCount&&o.pipes===e||o.pipesCount>1&&-1!==D(o.pipes,e))&&!h&&(f("false write response, pause",n._readableState.awaitDrain),n._readableState.awaitDrain++,p=!0),n.pause())}function g(t){f("onerror",t),y(),e.removeListener("error",g),0===s(e,"error")&&e.emit("error",t)}function b(){e.removeListener("finish",v),y()}function v(){f("onfinish"),e.removeListener("close",b),y()}function y(){f("unpipe"),n.unpipe(e)}return n.on("data",m),function(e,t,n){if("function"==typeof e.prependListener)return e.prependListener(t,n);e._events&&e._events[t]?r(e._events[t])?e._events[t].unshift(n):e._events[t]=[n,e._events[t]]:e.on(t,n)}(e,"error",g),e.once("close",b),e.once("finish",v),e.emit("pipe",n),o.flowing||(f("pipe resume"),n.resume()),e},y.prototype.unpipe=function(e){var t=this._readableState,n={hasUnpiped:!1};if(0===t.pipesCount)return this;if(1===t.pipesCount)return e&&e!==t.pipes||(e||(e=t.pipes),t.pipes=null,t.pipesCount=0,t.flowing=!1,e&&e.emit("unpipe",this,n)),this;if(!e){var i=t.pipes,a=t.pipesCount;t.pipes=null,t.pipesCount=0,t.flowing=!1;for(var o=0;o<a;o++)i[o].emit("unpipe",this,n);return this}var r=D(t.pipes,e);return-1===r||(t.pipes.splice(r,1),t.pipesCount-=1,1===t.pipesCount&&(t.pipes=t.pipes[0]),e.emit("unpipe",this,n)),this},y.prototype.on=function(e,t){var n=l.prototype.on.call(this,e,t);if("data"===e)!1!==this._readableState.flowing&&this.resume();else if("readable"===e){var i=this._readableState;i.endEmitted||i.readableListening||(i.readableListening=i.needReadable=!0,i.emittedReadable=!1,i.reading?i.length&&S(this):a.nextTick(T,this))}return n},y.prototype.addListener=y.prototype.on,y.prototype.resume=function(){var e=this._readableState;return e.flowing||(f("resume"),e.flowing=!0,function(e,t){t.resumeScheduled||(t.resumeScheduled=!0,a.nextTick(E,e,t))}(this,e)),this},y.prototype.pause=function(){return f("call pause flowing=%j",this._readableState.flowing),!1!==this._readableState.flowing&&(f("pause"),this._readableState.flowing=!1,this.emit("pause")),this},y.prototype.wrap=function(e){var t=this,n=this._readableState,i=!1;for(var a in e.on("end",(function(){if(f("wrapped end"),n.decoder&&!n.ended){var e=n.decoder.end();e&&e.length&&t.push(e)}t.push(null)})),e.on("data",(function(a){(f("wrapped data"),n.decoder&&(a=n.decoder.write(a)),n.objectMode&&null==a)||(n.objectMode||a&&a.length)&&(t.push(a)||(i=!0,e.pause()))})),e)void 0===this[a]&&"function"==typeof e[a]&&(this[a]=function(t){return function(){return e[t].apply(e,arguments)}}(a));for(var o=0;o<b.length;o++)e.on(b[o],this.emit.bind(this,b[o]));return this._read=function(t){f("wrapped _read",t),i&&(i=!1,e.resume())},this},Object.defineProperty(y.prototype,"readableHighWaterMark",{enumerable:!1,get:function(){return this._readableState.highWaterMark}}),y._fromList=M}).call(this,n(8),n(12))},function(e,t,n){e.exports=n(32).EventEmitter},function(e,t,n){"use strict";var i=n(25);function a(e,t){e.emit("error",t)}e.exports={destroy:function(e,t){var n=this,o=this._readableState&&this._readableState.destroyed,r=this._writableState&&this._writableState.destroyed;return o||r?(t?t(e):!e||this._writableState&&this._writableState.errorEmitted||i.nextTick(a,this,e),this):(this._readableState&&(this._readableState.destroyed=!0),this._writableState&&(this._writableState.destroyed=!0),this._destroy(e||null,(function(e){!t&&e?(i.nextTick(a,n,e),n._writableState&&(n._writableState.errorEmitted=!0)):t&&t(e)})),this)},undestroy:function(){this._readableState&&(this._readableState.destroyed=!1,this._readableState.reading=!1,this._readableState.ended=!1,this._readableState.endEmitted=!1),this._writableState&&(this._writableState.destroyed=!1,this._writableState.ended=!1,this._writableState.ending=!1,this._writableState.finished=!1,this._writableState.errorEmitted=!1)}}},function(e,t,n){"use strict";(function(t,i,a){var o=n(25);function r(e){var t=this;this.next=null,this.entry=null,this.finish=function(){!function(e,t,n){var i=e.entry;e.entry=null;for(;i;){var a=i.callback;t.pendingcb--,a(n),i=i.next}t.corkedRequestsFree?t.corkedRequestsFree.next=e:t.corkedRequestsFree=e}(t,e)}}e.exports=v;var s,l=!t.browser&&["v0.10","v0.9."].indexOf(t.version.slice(0,5))>-1?i:o.nextTick;v.WritableState=b;var c=Object.create(n(19));c.inherits=n(20);var d={deprecate:n(123)},u=n(49),h=n(33).Buffer,f=a.Uint8Array||function(){};var p,m=n(50);function g(){}function b(e,t){s=s||n(15),e=e||{};var i=t instanceof s;this.objectMode=!!e.objectMode,i&&(this.objectMode=this.objectMode||!!e.writableObjectMode);var a=e.highWaterMark,c=e.writableHighWaterMark,d=this.objectMode?16:16384;this.highWaterMark=a||0===a?a:i&&(c||0===c)?c:d,this.highWaterMark=Math.floor(this.highWaterMark),this.finalCalled=!1,this.needDrain=!1,this.ending=!1,this.ended=!1,this.finished=!1,this.destroyed=!1;var u=!1===e.decodeStrings;this.decodeStrings=!u,this.defaultEncoding=e.defaultEncoding||"utf8",this.length=0,this.writing=!1,this.corked=0,this.sync=!0,this.bufferProcessing=!1,this.onwrite=function(e){!function(e,t){var n=e._writableState,i=n.sync,a=n.writecb;if(function(e){e.writing=!1,e.writecb=null,e.length-=e.writelen,e.writelen=0}(n),t)!function(e,t,n,i,a){--t.pendingcb,n?(o.nextTick(a,i),o.nextTick(A,e,t),e._writableState.errorEmitted=!0,e.emit("error",i)):(a(i),e._writableState.errorEmitted=!0,e.emit("error",i),A(e,t))}(e,n,i,t,a);else{var r=k(n);r||n.corked||n.bufferProcessing||!n.bufferedRequest||w(e,n),i?l(_,e,n,r,a):_(e,n,r,a)}}(t,e)},this.writecb=null,this.writelen=0,this.bufferedRequest=null,this.lastBufferedRequest=null,this.pendingcb=0,this.prefinished=!1,this.errorEmitted=!1,this.bufferedRequestCount=0,this.corkedRequestsFree=new r(this)}function v(e){if(s=s||n(15),!(p.call(v,this)||this instanceof s))return new v(e);this._writableState=new b(e,this),this.writable=!0,e&&("function"==typeof e.write&&(this._write=e.write),"function"==typeof e.writev&&(this._writev=e.writev),"function"==typeof e.destroy&&(this._destroy=e.destroy),"function"==typeof e.final&&(this._final=e.final)),u.call(this)}function y(e,t,n,i,a,o,r){t.writelen=i,t.writecb=r,t.writing=!0,t.sync=!0,n?e._writev(a,t.onwrite):e._write(a,o,t.onwrite),t.sync=!1}function _(e,t,n,i){n||function(e,t){0===t.length&&t.needDrain&&(t.needDrain=!1,e.emit("drain"))}(e,t),t.pendingcb--,i(),A(e,t)}function w(e,t){t.bufferProcessing=!0;var n=t.bufferedRequest;if(e._writev&&n&&n.next){var i=t.bufferedRequestCount,a=new Array(i),o=t.corkedRequestsFree;o.entry=n;for(var s=0,l=!0;n;)a[s]=n,n.isBuf||(l=!1),n=n.next,s+=1;a.allBuffers=l,y(e,t,!0,t.length,a,"",o.finish),t.pendingcb++,t.lastBufferedRequest=null,o.next?(t.corkedRequestsFree=o.next,o.next=null):t.corkedRequestsFree=new r(t),t.bufferedRequestCount=0}else{for(;n;){var c=n.chunk,d=n.encoding,u=n.callback;if(y(e,t,!1,t.objectMode?1:c.length,c,d,u),n=n.next,t.bufferedRequestCount--,t.writing)break}null===n&&(t.lastBufferedRequest=null)}t.bufferedRequest=n,t.bufferProcessing=!1}function k(e){return e.ending&&0===e.length&&null===e.bufferedRequest&&!e.finished&&!e.writing}function S(e,t){e._final((function(n){t.pendingcb--,n&&e.emit("error",n),t.prefinished=!0,e.emit("prefinish"),A(e,t)}))}function A(e,t){var n=k(t);return n&&(!function(e,t){t.prefinished||t.finalCalled||("function"==typeof e._final?(t.pendingcb++,t.finalCalled=!0,o.nextTick(S,e,t)):(t.prefinished=!0,e.emit("prefinish")))}(e,t),0===t.pendingcb&&(t.finished=!0,e.emit("finish"))),n}c.inherits(v,u),b.prototype.getBuffer=function(){for(var e=this.bufferedRequest,t=[];e;)t.push(e),e=e.next;return t},function(){try{Object.defineProperty(b.prototype,"buffer",{get:d.deprecate((function(){return this.getBuffer()}),"_writableState.buffer is deprecated. Use _writableState.getBuffer instead.","DEP0003")})}catch(e){}}(),"function"==typeof Symbol&&Symbol.hasInstance&&"function"==typeof Function.prototype[Symbol.hasInstance]?(p=Function.prototype[Symbol.hasInstance],Object.defineProperty(v,Symbol.hasInstance,{value:function(e){return!!p.call(this,e)||this===v&&(e&&e._writableState instanceof b)}})):p=function(e){return e instanceof this},v.prototype.pipe=function(){this.emit("error",new Error("Cannot pipe, not readable"))},v.prototype.write=function(e,t,n){var i,a=this._writableState,r=!1,s=!a.objectMode&&(i=e,h.isBuffer(i)||i instanceof f);return s&&!h.isBuffer(e)&&(e=function(e){return h.from(e)}(e)),"function"==typeof t&&(n=t,t=null),s?t="buffer":t||(t=a.defaultEncoding),"function"!=typeof n&&(n=g),a.ended?function(e,t){var n=new Error("write after end");e.emit("error",n),o.nextTick(t,n)}(this,n):(s||function(e,t,n,i){var a=!0,r=!1;return null===n?r=new TypeError("May not write null values to stream"):"string"==typeof n||void 0===n||t.objectMode||(r=new TypeError("Invalid non-string/buffer chunk")),r&&(e.emit("error",r),o.nextTick(i,r),a=!1),a}(this,a,e,n))&&(a.pendingcb++,r=function(e,t,n,i,a,o){if(!n){var r=function(e,t,n){e.objectMode||!1===e.decodeStrings||"string"!=typeof t||(t=h.from(t,n));return t}(t,i,a);i!==r&&(n=!0,a="buffer",i=r)}var s=t.objectMode?1:i.length;t.length+=s;var l=t.length<t.highWaterMark;l||(t.needDrain=!0);if(t.writing||t.corked){var c=t.lastBufferedRequest;t.lastBufferedRequest={chunk:i,encoding:a,isBuf:n,callback:o,next:null},c?c.next=t.lastBufferedRequest:t.bufferedRequest=t.lastBufferedRequest,t.bufferedRequestCount+=1}else y(e,t,!1,s,i,a,o);return l}(this,a,s,e,t,n)),r},v.prototype.cork=function(){this._writableState.corked++},v.prototype.uncork=function(){var e=this._writableState;e.corked&&(e.corked--,e.writing||e.corked||e.finished||e.bufferProcessing||!e.bufferedRequest||w(this,e))},v.prototype.setDefaultEncoding=function(e){if("string"==typeof e&&(e=e.toLowerCase()),!(["hex","utf8","utf-8","ascii","binary","base64","ucs2","ucs-2","utf16le","utf-16le","raw"].indexOf((e+"").toLowerCase())>-1))throw new TypeError("Unknown encoding: "+e);return this._writableState.defaultEncoding=e,this},Object.defineProperty(v.prototype,"writableHighWaterMark",{enumerable:!1,get:function(){return this._writableState.highWaterMark}}),v.prototype._write=function(e,t,n){n(new Error("_write() is not implemented"))},v.prototype._writev=null,v.prototype.end=function(e,t,n){var i=this._writableState;"function"==typeof e?(n=e,e=null,t=null):"function"==typeof t&&(n=t,t=null),null!=e&&this.write(e,t),i.corked&&(i.corked=1,this.uncork()),i.ending||i.finished||function(e,t,n){t.ending=!0,A(e,t),n&&(t.finished?o.nextTick(n):e.once("finish",n));t.ended=!0,e.writable=!1}(this,i,n)},Object.defineProperty(v.prototype,"destroyed",{get:function(){return void 0!==this._writableState&&this._writableState.destroyed},set:function(e){this._writableState&&(this._writableState.destroyed=e)}}),v.prototype.destroy=m.destroy,v.prototype._undestroy=m.undestroy,v.prototype._destroy=function(e,t){this.end(),t(e)}}).call(this,n(12),n(44).setImmediate,n(8))},function(e,t,n){"use strict";e.exports=r;var i=n(15),a=Object.create(n(19));function o(e,t){var n=this._transformState;n.transforming=!1;var i=n.writecb;if(!i)return this.emit("error",new Error("write callback called multiple times"));n.writechunk=null,n.writecb=null,null!=t&&this.push(t),i(e);var a=this._readableState;a.reading=!1,(a.needReadable||a.length<a.highWaterMark)&&this._read(a.highWaterMark)}function r(e){if(!(this instanceof r))return new r(e);i.call(this,e),this._transformState={afterTransform:o.bind(this),needTransform:!1,transforming:!1,writecb:null,writechunk:null,writeencoding:null},this._readableState.needReadable=!0,this._readableState.sync=!1,e&&("function"==typeof e.transform&&(this._transform=e.transform),"function"==typeof e.flush&&(this._flush=e.flush)),this.on("prefinish",s)}function s(){var e=this;"function"==typeof this._flush?this._flush((function(t,n){l(e,t,n)})):l(this,null,null)}function l(e,t,n){if(t)return e.emit("error",t);if(null!=n&&e.push(n),e._writableState.length)throw new Error("Calling transform done when ws.length != 0");if(e._transformState.transforming)throw new Error("Calling transform done when still transforming");return e.push(null)}a.inherits=n(20),a.inherits(r,i),r.prototype.push=function(e,t){return this._transformState.needTransform=!1,i.prototype.push.call(this,e,t)},r.prototype._transform=function(e,t,n){throw new Error("_transform() is not implemented")},r.prototype._write=function(e,t,n){var i=this._transformState;if(i.writecb=n,i.writechunk=e,i.writeencoding=t,!i.transforming){var a=this._readableState;(i.needTransform||a.needReadable||a.length<a.highWaterMark)&&this._read(a.highWaterMark)}},r.prototype._read=function(e){var t=this._transformState;null!==t.writechunk&&t.writecb&&!t.transforming?(t.transforming=!0,this._transform(t.writechunk,t.writeencoding,t.afterTransform)):t.needTransform=!0},r.prototype._destroy=function(e,t){var n=this;i.prototype._destroy.call(this,e,(function(e){t(e),n.emit("close")}))}},function(e,t,n){var i,a;!function(o,r){i=[n(54)],void 0===(a=function(e){return function(e,t){"use strict";var n={extend:function(e,t){for(var n in t)e[n]=t[n];return e},modulo:function(e,t){return(e%t+t)%t}},i=Array.prototype.slice;n.makeArray=function(e){return Array.isArray(e)?e:null==e?[]:"object"==typeof e&&"number"==typeof e.length?i.call(e):[e]},n.removeFrom=function(e,t){var n=e.indexOf(t);-1!=n&&e.splice(n,1)},n.getParent=function(e,n){for(;e.parentNode&&e!=document.body;)if(e=e.parentNode,t(e,n))return e},n.getQueryElement=function(e){return"string"==typeof e?document.querySelector(e):e},n.handleEvent=function(e){var t="on"+e.type;this[t]&&this[t](e)},n.filterFindElements=function(e,i){e=n.makeArray(e);var a=[];return e.forEach((function(e){if(e instanceof HTMLElement)if(i){t(e,i)&&a.push(e);for(var n=e.querySelectorAll(i),o=0;o<n.length;o++)a.push(n[o])}else a.push(e)})),a},n.debounceMethod=function(e,t,n){n=n||100;var i=e.prototype[t],a=t+"Timeout";e.prototype[t]=function(){var e=this[a];clearTimeout(e);var t=arguments,o=this;this[a]=setTimeout((function(){i.apply(o,t),delete o[a]}),n)}},n.docReady=function(e){var t=document.readyState;"complete"==t||"interactive"==t?setTimeout(e):document.addEventListener("DOMContentLoaded",e)},n.toDashed=function(e){return e.replace(/(.)([A-Z])/g,(function(e,t,n){return t+"-"+n})).toLowerCase()};var a=e.console;return n.htmlInit=function(t,i){n.docReady((function(){var o=n.toDashed(i),r="data-"+o,s=document.querySelectorAll("["+r+"]"),l=document.querySelectorAll(".js-"+o),c=n.makeArray(s).concat(n.makeArray(l)),d=r+"-options",u=e.jQuery;c.forEach((function(e){var n,o=e.getAttribute(r)||e.getAttribute(d);try{n=o&&JSON.parse(o)}catch(t){return void(a&&a.error("Error parsing "+r+" on "+e.className+": "+t))}var s=new t(e,n);u&&u.data(e,i,s)}))}))},n}(o,e)}.apply(t,i))||(e.exports=a)}(window)},function(e,t,n){var i,a;!function(o,r){"use strict";void 0===(a="function"==typeof(i=r)?i.call(t,n,t,e):i)||(e.exports=a)}(window,(function(){"use strict";var e=function(){var e=window.Element.prototype;if(e.matches)return"matches";if(e.matchesSelector)return"matchesSelector";for(var t=["webkit","moz","ms","o"],n=0;n<t.length;n++){var i=t[n]+"MatchesSelector";if(e[i])return i}}();return function(t,n){return t[e](n)}}))},function(e,t,n){"use strict";n.d(t,"a",(function(){return i}));var i=function(){function e(){this._hasWeakSet="function"==typeof WeakSet,this._inner=this._hasWeakSet?new WeakSet:[]}return e.prototype.memoize=function(e){if(this._hasWeakSet)return!!this._inner.has(e)||(this._inner.add(e),!1);for(var t=0;t<this._inner.length;t++){if(this._inner[t]===e)return!0}return this._inner.push(e),!1},e.prototype.unmemoize=function(e){if(this._hasWeakSet)this._inner.delete(e);else for(var t=0;t<this._inner.length;t++)if(this._inner[t]===e){this._inner.splice(t,1);break}},e}()},function(e,t,n){n(57),e.exports=n(58)},function(e,t,n){(function(e){("undefined"!=typeof window?window:void 0!==e?e:"undefined"!=typeof self?self:{}).SENTRY_RELEASE={id:"10.0.8"}}).call(this,n(8))},function(e,t,n){"use strict";n(59),n(60),n(61),n(62),n(63),n(64),n(65),n(66)},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){"use strict";(function(e){var t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};n(67),n(69),n(70),n(71),n(72),n(73),n(74),n(75),n(35),n(76),n(77),n(78),n(88),n(90),n(91),n(92);var i=n(93),a=n(95),o=h(n(131)),r=h(n(5)),s=h(n(132)),l=h(n(133)),c=h(n(140)),d=h(n(141)),u=h(n(142));function h(e){return e&&e.__esModule?e:{default:e}}(function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(t[n]=e[n]);return t.default=e,t})(n(145)).init({dsn:"https://d4bf4ed225c946c8972c7238ad07d124@sentry.sickrage.ca/2",release:"10.0.8",beforeSend:function(e,t){return e.exception&&e.exception.values[0].stacktrace.frames.forEach((function(e){e.filename=e.filename.substring(e.filename.lastIndexOf("/"))})),e}}),(0,s.default)("isotope",l.default,e),(0,s.default)("imagesLoaded",c.default,e);var f=function(e){return(0,i.gettext)(e)};e(document).ready((function(e){var n={ws_notifications:function(){var t="https:"===window.location.protocol?"wss:":"ws:";new WebSocket(t+"//"+window.location.hostname+":"+window.location.port+n.srWebRoot+"/ws/ui").onmessage=function(t){var i=e.parseJSON(t.data);switch(i.type){case"NOTIFICATION":n.notify(i.data.type,i.data.title,i.data.body);break;case"redirect":window.location.href=i.data.url}}},text_viewer:function(){var t=e("p.text-viewer");t.each((function(){var t=e(this).text();t.length<500||e(this).html(t.slice(0,500)+'<span>... </span><a href="#" class="read-more"> Read More</a><span style="display:none;">'+t.slice(500,t.length)+' <a href="#" class="read-less"> Read Less </a></span>')})),e("a.read-more",t).click((function(t){t.preventDefault(),e(this).hide().prev().hide(),e(this).next().show()})),e("a.read-less",t).click((function(t){t.preventDefault(),e(this).parent().hide().prev().show().prev().show()}))},notify:function(e,t,i){r.default.modules.Desktop.permission(),new r.default({stack:{dir1:"up",dir2:"left",firstpos1:25,firstpos2:25},icons:"fontawesome5",styling:"bootstrap4",addclass:"stack-bottomright",delay:5e3,hide:!0,history:!1,shadow:!1,width:"340px",target:document.body,data:{modules:{Desktop:{desktop:!0,icon:n.srWebRoot+"/images/logo-badge.png"}},type:e,title:t,text:i.replace(/<br[\s/]*(?:\s[^>]*)?>/gi,"\n").replace(/<[/]?b(?:\s[^>]*)?>/gi,"*").replace(/<i(?:\s[^>]*)?>/gi,"[").replace(/<[/]i>/gi,"]").replace(/<(?:[/]?ul|\/li)(?:\s[^>]*)?>/gi,"").replace(/<li(?:\s[^>]*)?>/gi,"\n* ")}})},isMeta:function(t,n){return new RegExp(n.length>1?n.join("|"):n).test(e('meta[data-var="'+t+'"]').data("content"))},getMeta:function(t){return e('meta[data-var="'+t+'"]').data("content")},metaToBool:function(t){var n=e('meta[data-var="'+t+'"]').data("content");return void 0===n?n:!("false"===(n=isNaN(n)?n.toLowerCase():n.toString())||"none"===n||"0"===n)},popupWindow:function(e,t,n,i){var a=(screen.width-n)/2,o=(screen.height-i)/4;return window.open(e,t,"toolbar=no, location=no, directories=no, status=no, menubar=no, scrollbars=no, resizable=no, copyhistory=no, width="+n+", height="+i+", top="+o+", left="+a)},showHideRows:function(t,n){e("tr."+t).each((function(){n?e(this).show():e(this).hide()}))},updateUrlParameter:function(e,t,n){var i=e.indexOf("#"),a=-1===i?"":e.substr(i);e=-1===i?e:e.substr(0,i);var o=new RegExp("([?&])"+t+"=.*?(&|$)","i"),r=-1!==e.indexOf("?")?"&":"?";return n?e=e.match(o)?e.replace(o,"$1"+t+"="+n+"$2"):e+r+t+"="+n:("?"===(e=e.replace(new RegExp("([?&]?)"+t+"=[^&]*","i"),"")).slice(-1)&&(e=e.slice(0,-1)),-1===e.indexOf("?")&&(e=e.replace(/&/,"?"))),e+a},quicksearch:function(){e.widget("custom.catcomplete",e.ui.autocomplete,{_create:function(){this._super(),this.widget().menu("option","items","> :not(.ui-autocomplete-category)")},_renderMenu:function(t,n){var i=this,a="";e.each(n,(function(e,n){var o;n.category!=a&&(t.append("<li class='ui-autocomplete-category text-warning p-1'><strong class='text-uppercase'>"+n.category+"</strong></li>"),a=n.category),o=i._renderItemData(t,n),n.category&&o.attr("aria-label",n.category+" : "+n.name)}))},_renderItem:function(t,i){var a=e('<li class="bg-transparent m-1">'),o=e("<img>"),r=e("<a>");return a.attr("data-value",i.name),o.attr({src:i.img,alt:i.name,class:"img-fluid w-100"}),"shows"===i.category?(i.series_id?r.attr({href:n.srWebRoot+"/home/displayShow?show="+i.series_id,class:"btn btn-dark btn-block d-inline-block text-left"}):r.attr({href:n.srWebRoot+"/home/addShows/newShow?search_string="+i.name,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(r),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="show-name" class="text-white text-truncate"></strong></div><div class="row"><strong id="show-seasons" class="text-secondary"></strong></div></div></div>')),a.find("#show-img").append(o),i.series_id?a.find("#show-name").append(i.name):a.find("#show-name").append("Add new show: "+i.name),a.find("#show-seasons").append(i.seasons+" seasons")):(r.attr({href:n.srWebRoot+"/home/displayShow?show="+i.series_id+"#S"+i.season+"E"+i.episode,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(r),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="ep-name" class="text-white"></strong></div><div class="row"><strong id="show-name" class="text-secondary text-truncate"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#ep-name").append(i.name),a.find("#show-name").append(i.showname)),a.appendTo(t)}}),e("#quicksearch").catcomplete({delay:1e3,minLength:1,source:function(t,i){e.ajax({url:n.srWebRoot+"/quicksearch.json",dataType:"json",type:"POST",data:{term:t.term},success:function(e){i(e)}})},focus:function(t,n){return e("#quicksearch").val(n.item.name),!1},open:function(){e(".quicksearch-input-container").append('<button type="button" class="quicksearch-input-btn"><i class="fas fa-1x fa-times-circle text-white m-2" aria-hidden="true"></i></button>'),e("ul.ui-menu").width(e(this).innerWidth()),e("ul.ui-menu").css("border","none"),e("ul.ui-menu").css("outline","none"),e("ul.ui-menu").addClass("bg-dark shadow rounded"),e(".quicksearch-input-btn").click((function(){e("#quicksearch").catcomplete("close").val(""),e(this).remove()}))}})},updateProfileBadge:function(){var t=0;e.getJSON(n.srWebRoot+"/logs/errorCount",(function(n){n.count?(t+=n.count,e("#numErrors").text(n.count),e("#numErrors").parent().removeClass("d-none")):e("#numErrors").parent().addClass("d-none"),t?e("#profile-badge").text(t):e("#profile-badge").text("")})),e.getJSON(n.srWebRoot+"/logs/warningCount",(function(n){n.count?(t+=n.count,e("#numWarnings").text(n.count),e("#numWarnings").parent().removeClass("d-none")):e("#numWarnings").parent().addClass("d-none"),t?e("#profile-badge").text(t):e("#profile-badge").text("")})),e.getJSON(n.srWebRoot+"/announcements/announcementCount",(function(n){n.count?(t+=n.count,e("#numAnnouncements").text(n.count)):e("#numAnnouncements").text(""),t?e("#profile-badge").text(t):e("#profile-badge").text("")}))},common:{init:function(){n.srPID=n.getMeta("srPID"),n.srWebRoot=n.getMeta("srWebRoot"),n.srDefaultPage=n.getMeta("srDefaultPage"),n.loadingHTML='<i class="fas fa-spinner fa-spin fa-fw"></i>',n.anonURL=n.getMeta("anonURL"),n.ws_notifications(),n.updateProfileBadge(),e.get(n.srWebRoot+"/messages.po",(function(e){e&&((0,i.addLocale)(n.getMeta("srLocale"),a.po.parse(e)),(0,i.useLocale)(n.getMeta("srLocale")))})),n.quicksearch(),e(window).scroll((function(){e(this).scrollTop()>50?e("#back-to-top").fadeIn():e("#back-to-top").fadeOut()})),e("#back-to-top").click((function(){return e("body,html").animate({scrollTop:0},800),!1})),e('[title!=""]').tooltipster();for(var t=document.getElementsByTagName("img"),r=0;r<t.length;r++)t[r].getAttribute("data-src")&&t[r].setAttribute("src",t[r].getAttribute("data-src"));(navigator.maxTouchPoints||0)<2&&e(".dropdown-toggle").on("click",(function(){"true"===e(this).attr("aria-expanded")&&(window.location.href=e(this).attr("href"))})),n.metaToBool("sickrage.FUZZY_DATING")&&(e.timeago.settings.allowFuture=!0,e.timeago.settings.strings={prefixAgo:null,prefixFromNow:"In ",suffixAgo:"ago",suffixFromNow:"",seconds:"less than a minute",minute:"about a minute",minutes:"%d minutes",hour:"an hour",hours:"%d hours",day:"a day",days:"%d days",month:"a month",months:"%d months",year:"a year",years:"%d years",wordSeparator:" ",numbers:[]},e("[datetime]").timeago()),e.tablesorter.addParser({id:"loadingNames",is:function(){return!1},format:function(e){return 0===e.indexOf("Loading...")?e.replace("Loading...","000"):n.metaToBool("sickrage.SORT_ARTICLE")?e||"":(e||"").replace(/^(The|A|An)\s/i,"")},type:"text"}),e.tablesorter.addParser({id:"quality",is:function(){return!1},format:function(e){return e.replace("hd1080p",5).replace("hd720p",4).replace("hd",3).replace("sd",2).replace("any",1).replace("best",0).replace("custom",7)},type:"numeric"}),e.tablesorter.addParser({id:"realISODate",is:function(){return!1},format:function(e){return new Date(e).getTime()},type:"numeric"}),e.tablesorter.addParser({id:"cDate",is:function(){return!1},format:function(e){return e},type:"numeric"}),e.tablesorter.addParser({id:"eps",is:function(){return!1},format:function(e){var t=e.match(/^(.*)/);if(null===t||"?"===t[1])return-10;var i=t[1].split(" / ");if(-1!==i[0].indexOf("+")){var a=i[0].split("+");i[0]=a[0]}if(i[0]=parseInt(i[0]),i[1]=parseInt(i[1]),0===i[0])return i[1];var o=parseInt(n.getMeta("max_download_count")*i[0]/i[1]),r=Math.round(i[0]/i[1]*100)/1e3;return o>0&&(o+=i[0]),o+r},type:"numeric"}),o.default.defaults={theme:"dark",type:"blue",typeAnimated:!0,confirm:function(){location.href=this.$target.attr("href")}},e("a.shutdown").confirm({theme:"dark",title:f("Shutdown"),content:f("Are you sure you want to shutdown SiCKRAGE ?")}),e("a.restart").confirm({theme:"dark",title:f("Restart"),content:f("Are you sure you want to restart SiCKRAGE ?")}),e("a.submiterrors").confirm({theme:"dark",title:f("Submit Errors"),content:f("Are you sure you want to submit these errors ?")+'<br><br><span class="text-danger">'+f("Make sure SiCKRAGE is updated and trigger")+"<br>"+f("this error with debug enabled before submitting")+"</span>"}),e("#removeW").click((function(){e("#white option:selected").remove().appendTo("#pool")})),e("#addW").click((function(){e("#pool option:selected").remove().appendTo("#white")})),e("#addB").click((function(){e("#pool option:selected").remove().appendTo("#black")})),e("#removeP").click((function(){e("#pool option:selected").remove()})),e("#removeB").click((function(){e("#black option:selected").remove().appendTo("#pool")})),e("#addToWhite").click((function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#white"),e("#addToPoolText").val("")}})),e("#addToBlack").click((function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#black"),e("#addToPoolText").val("")}})),e("input:checkbox.enabler").each((function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).show():e("#content_"+e(this).attr("id")).hide()})),e("input:checkbox.enabler").on("click",(function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).fadeIn("fast","linear"):e("#content_"+e(this).attr("id")).fadeOut("fast","linear")})),e(".modal").on("shown.bs.modal",(function(){e("body").addClass("modal-open"),e("body").removeAttr("style")})),n.browser.init(),n.quality_chooser.init(),e("#changelog").on("click",(function(t){t.preventDefault(),e("#changelogModal").find(".modal-body").load(n.srWebRoot+"/changelog"),e("#changelogModal").modal()})),n.text_viewer()}},ajax_search:{searchStatusUrl:"/home/getManualSearchStatus",failedDownload:!1,qualityDownload:!1,selectedEpisode:"",manualSearches:[],init:function(){n.ajax_search.searchStatusUrl=n.srWebRoot+n.ajax_search.searchStatusUrl,n.ajax_search.ajaxEpSearch({colorRow:!0}),n.ajax_search.checkManualSearches(),n.ajax_search.ajaxEpSubtitlesSearch()},enableLink:function(e){e.on("click.disabled",!1),e.prop("enableClick","1"),e.fadeTo("fast",1)},disableLink:function(e){e.off("click.disabled"),e.prop("enableClick","0"),e.fadeTo("fast",.5)},updateImages:function(t){e.each(t.episodes,(function(t,i){var a="",o=e("a[id="+i.show+"x"+i.season+"x"+i.episode+"]"),r=o.children("i"),s=o.parent();if(o){var l="";"searching"===i.searchstatus.toLowerCase()?(r.prop("class","fas fa-spinner fa-spin fa-fw"),r.prop("title",f("Searching")),r.prop("alt",f("Searching")),n.ajax_search.disableLink(o),a=i.searchstatus):"queued"===i.searchstatus.toLowerCase()?(r.prop("class","fas fa-clock"),r.prop("title",f("Queued")),r.prop("alt",f("Queued")),n.ajax_search.disableLink(o),a=i.searchstatus):"finished"===i.searchstatus.toLowerCase()&&(r.prop("class","fas fa-search"),r.prop("title",f("Search")),r.prop("alt",f("Search")),"N/A"!==i.quality&&r.parent().prop("class","epRetry"),n.ajax_search.enableLink(o),l=/(\w+)\s\((.+?)\)/,a=i.status.replace(l,'$1 <span class="badge text-white '+i.quality+'">$2</span>'),s.closest("tr").prop("class",i.overview+" season-"+i.season+" seasonstyle font-weight-bold text-dark")),s.siblings(".col-status").html(a)}var c=e("a[id=forceUpdate-"+i.show+"x"+i.season+"x"+i.episode+"]"),d=c.children("i");c&&("searching"===i.searchstatus.toLowerCase()?(d.prop("title",f("Searching")),d.prop("alt",f("Searching")),d.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(c)):"queued"===i.searchstatus.toLowerCase()?(d.prop("title",f("Queued")),d.prop("alt",f("Queued")),d.prop("class","fas fa-clock")):"finished"===i.searchstatus.toLowerCase()&&(d.prop("title",f("Search")),d.prop("alt",f("Search")),d.prop("class","fas fa-search"),"snatched"===i.overview.toLowerCase()?c.closest("tr").remove():n.ajax_search.enableLink(c)))}))},manualSearch:function(t){var i,a,o,r=n.ajax_search.selectedEpisode.parent(),s=n.ajax_search.selectedEpisode,l=n.ajax_search.selectedEpisode.children("i");l.prop("title",f("loading")),l.prop("class",t.loadingIcon);var c=n.ajax_search.selectedEpisode.prop("href");return!1===n.ajax_search.failedDownload&&(c=c.replace("retryEpisode","searchEpisode")),c=c+"&downCurQuality="+(n.ajax_search.qualityDownload?"1":"0"),e.getJSON(c,(function(e){if("failure"===e.result.toLowerCase())i=t.noIcon,a="failed";else{i=t.loadingIcon,a="success",t.colorRow&&r.parent().removeClass("skipped wanted qual good unaired").addClass("snatched");o=e.result.replace(/(\w+)\s\((.+?)\)/,'$1 <span class="badge text-white '+e.quality+'">$2</span>'),r.siblings(".col-status").html(o),n.ajax_search.disableLink(s)}l.prop("title",a),l.prop("height",t.size),l.prop("class",i)})),!1},checkManualSearches:function(){var t=e("#series_id").val();if(void 0!==t){var i=5e3;e.ajax({url:n.ajax_search.searchStatusUrl+"?show="+t,success:function(e){i=e.episodes?5e3:15e3,n.ajax_search.updateImages(e)},error:function(){i=3e4},type:"GET",dataType:"json",complete:function(){setTimeout(n.ajax_search.checkManualSearches,i)},timeout:15e3})}},ajaxEpSearch:function(t){t=e.extend({},{size:16,colorRow:!1,loadingIcon:"fas fa-spinner fa-spin fa-fw",queuedIcon:"fas fa-clock",noIcon:"fas fa-times",yesIcon:"fas fa-check"},t),e(".epRetry").click((function(t){if(t.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e("#manualSearchModalFailed").modal()})),e(".epSearch").click((function(i){if(i.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e(this).parent().parent().children(".col-status").children(".quality").length?e("#manualSearchModalQuality").modal():n.ajax_search.manualSearch(t)})),e("#manualSearchModalFailed .btn").click((function(){n.ajax_search.failedDownload=this.classList.contains("btn-success")})),e("#manualSearchModalQuality .btn").click((function(){n.ajax_search.qualityDownload=this.classList.contains("btn-success"),n.ajax_search.manualSearch(t)}))},ajaxEpSubtitlesSearch:function(){e(".epSubtitlesSearch").click((function(){var t=e(this).parent().siblings(".col-subtitles"),n=e(this);return n.empty(),n.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),(function(i){if("failure"!==i.result.toLowerCase()&&"no subtitles downloaded"!==i.result.toLowerCase()){var a=i.subtitles.split(",");t.empty(),e.each(a,(function(n,i){""!==i&&"und"!==i&&(a.length,t.append(e("<i/>").attr({class:"sickrage-flags sickrage-flags-"+i})))})),n.remove()}else n.remove()})),!1}))},ajaxEpMergeSubtitles:function(){e(".epMergeSubtitles").click((function(){var t=e(this);return t.empty(),t.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),(function(){t.remove()})),!1}))}},browser:{defaults:{title:f("Choose Directory"),url:"/browser/",autocompleteURL:"/browser/complete",includeFiles:0,fileTypes:[],showBrowseButton:!0},fileBrowserDialog:null,currentBrowserPath:null,currentRequest:null,init:function(){n.browser.defaults.url=n.srWebRoot+n.browser.defaults.url,n.browser.defaults.autocomplete=n.srWebRoot+n.browser.defaults.autocompleteURL,e.fn.fileBrowser=n.browser.fileBrowser,e.fn.nFileBrowser=n.browser.nFileBrowser},browse:function(t,i,a,o){n.browser.currentBrowserPath!==t&&(n.browser.currentBrowserPath=t,n.browser.currentRequest&&n.browser.currentRequest.abort(),n.browser.currentRequest=e.getJSON(i,{path:t,includeFiles:a,fileTypes:o.join(",")},(function(t){n.browser.fileBrowserDialog.find(".modal-body").empty();var r,s=t[0],l=0,c=null;t=e.grep(t,(function(){return 0!=l++})),e('<input class="form-control mb-1">').val(s.currentPath).on("keypress",(function(e){13===e.which&&n.browser.browse(e.target.value,i,a,o)})).appendTo(n.browser.fileBrowserDialog.find(".modal-body")).fileBrowser({showBrowseButton:!1}).on("autocompleteselect",(function(e,t){n.browser.browse(t.item.value,i,a,o)})),r=e('<div class="list-group">').appendTo(n.browser.fileBrowserDialog.find(".modal-body")),e.each(t,(function(t,s){if(s.isFile&&o&&(!s.isAllowed||-1!==o.indexOf("images")&&!s.isImage))return!0;c=e('<a href="javascript:void(0)">').on("click",(function(){s.isFile?(n.browser.currentBrowserPath=s.path,n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click()):n.browser.browse(s.path,i,a,o)})).text(s.name),s.isImage?c.prepend('<span class="fas fa-file-image ml-1 mr-1"></span>'):s.isFile?c.prepend('<span class="fas fa-file ml-1 mr-1"></span>'):c.prepend('<span class="fas fa-folder ml-1 mr-1"></span>').on("mouseenter",(function(){e("span",this).addClass("fa-folder-open")})).on("mouseleave",(function(){e("span",this).removeClass("fa-folder-open")})),c.appendTo(r)})),e("a",r).wrap('<div class="list-group-item list-group-item-action list-group-item-dark p-0">')})))},nFileBrowser:function(t,i){i=e.extend({},n.browser.defaults,i),n.browser.fileBrowserDialog?n.browser.fileBrowserDialog.find(".modal-title").text(i.title):(n.browser.fileBrowserDialog=e("#fileBrowserDialog").modal(),n.browser.fileBrowserDialog.find(".modal-body").addClass("ui-front"),n.browser.fileBrowserDialog.find(".modal-title").text(i.title),n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click((function(){t(n.browser.currentBrowserPath,i),n.browser.fileBrowserDialog.modal("hide")})));var a="";return i.initialDir&&(a=i.initialDir),n.browser.browse(a,i.url,i.includeFiles,i.fileTypes),n.browser.fileBrowserDialog.modal(),!1},fileBrowser:function(t){if((t=e.extend({},n.browser.defaults,t)).field=e(this),t.field.autocomplete&&t.autocompleteURL){var i="";t.field.autocomplete({position:{my:"top",at:"bottom",collision:"flipfit"},source:function(n,a){i=e.ui.autocomplete.escapeRegex(n.term,t.includeFiles),e.ajax({url:t.autocompleteURL,data:n,dataType:"json",success:function(t){var n=new RegExp("^"+i,"i"),o=e.grep(t,(function(e){return n.test(e)}));a(o)}})},open:function(){e(".ui-autocomplete li.ui-menu-item a").removeClass("ui-corner-all")}}).data("ui-autocomplete")._renderItem=function(t,n){var a=n.label,o=new RegExp("(?![^&;]+;)(?!<[^<>]*)("+i+")(?![^<>]*>)(?![^&;]+;)","gi");return a=a.replace(o,(function(e){return"<b>"+e+"</b>"})),e("<li></li>").data("ui-autocomplete-item",n).append("<a class='text-nowrap'>"+a+"</a>").appendTo(t)}}var a,o,r=!1;try{r=!!localStorage.getItem}catch(e){r=null}return r&&t.key&&(a=localStorage["fileBrowser-"+t.key]),t.key&&0===t.field.val().length&&a&&t.field.val(a),o=function(e,t){t.field.val(e),r&&t.key&&(localStorage["fileBrowser-"+t.key]=e)},t.field.addClass("fileBrowserField"),t.showBrowseButton&&t.field.after(e('<div class="input-group-append"><span class="input-group-text"><a href="#" class="fileBrowser fas fa-search""></a></span></div>').on("click",(function(){var n=t.field.val()||t.key&&a||"",i=e.extend({},t,{initialDir:n});return e(this).nFileBrowser(o,i),!1}))),t.field}},root_dirs:{init:function(){for(var t=["assert","clear","count","debug","dir","dirxml","error","exception","group","groupCollapsed","groupEnd","info","log","markTimeline","profile","profileEnd","table","time","timeEnd","timeStamp","trace","warn"],i=t.length,a=window.console=window.console||{};i--;){var o=t[i];a[o]||(a[o]=function(){})}e("#addRootDir").click((function(){e(this).nFileBrowser(n.root_dirs.addRootDir)})),e("#editRootDir").click((function(){e(this).nFileBrowser(n.root_dirs.editRootDir,{initialDir:e("#rootDirs option:selected").val()})})),e("#deleteRootDir").click((function(){if(e("#rootDirs option:selected").length){var t=e("#rootDirs option:selected"),i=t.attr("id")===e("#whichDefaultRootDir").val(),o=e("#rootDirs option:selected").attr("id").substr(3);if(t.remove(),n.root_dirs.syncOptionIDs(),i)a.log("new default when deleting"),e("#whichDefaultRootDir").val(""),e("#rootDirs option").length&&n.root_dirs.setDefault(e("#rootDirs option").attr("id"));else if(e("#whichDefaultRootDir").val().length){var r=e("#whichDefaultRootDir").val().substr(3);r>o&&e("#whichDefaultRootDir").val("rd-"+(r-1))}}n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})})),e("#defaultRootDir").click((function(){e("#rootDirs option:selected").length&&n.root_dirs.setDefault(e("#rootDirs option:selected").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})})),e("#rootDirs").click((function(){n.root_dirs.refreshRootDirs()})),n.root_dirs.syncOptionIDs(),n.root_dirs.setDefault(e("#whichDefaultRootDir").val(),!0),n.root_dirs.refreshRootDirs()},addRootDir:function(t){if(t.length){var i=!1;return e("#whichDefaultRootDir").val().length||(i=!0),e("#rootDirs").append('<option value="'+t+'">'+t+"</option>"),n.root_dirs.syncOptionIDs(),i&&n.root_dirs.setDefault(e("#rootDirs option").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}),!1}},editRootDir:function(t){t.length&&(e("#rootDirs option:selected").length&&(e("#rootDirs option:selected").attr("id")===e("#whichDefaultRootDir").val()?e("#rootDirs option:selected").text("*"+t):e("#rootDirs option:selected").text(t),e("#rootDirs option:selected").val(t)),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}))},setDefault:function(t,n){if((void 0===t||t.length)&&(e("#whichDefaultRootDir").val()!==t||!0===n)){if("*"!==e("#"+t).text().charAt(0)&&e("#"+t).text("*"+e("#"+t).text()),e("#whichDefaultRootDir").val()&&!0!==n){var i=e("#"+e("#whichDefaultRootDir").val());i.text(i.text().substring(1))}e("#whichDefaultRootDir").val(t)}},syncOptionIDs:function(){var t=0;e("#rootDirs option").each((function(){e(this).attr("id","rd-"+t++)}))},refreshRootDirs:function(){if(e("#rootDirs").length){var t="true";n.root_dirs.syncOptionIDs(),!e("#rootDirs option:selected").length&&e("#whichDefaultRootDir").val().length&&e("#"+e("#whichDefaultRootDir").val()).prop("selected",!0),e("#rootDirs option:selected").length&&(t=""),e("#deleteRootDir").prop("disabled",t),e("#defaultRootDir").prop("disabled",t),e("#editRootDir").prop("disabled",t);var i="";e("#whichDefaultRootDir").val().length>=4&&(i=e("#whichDefaultRootDir").val().substr(3)),e("#rootDirs option").each((function(){i.length&&(i+="|"+e(this).val())})),e("#rootDirText").val(i),e("#rootDirText").change()}}},quality_chooser:{init:function(){e("#qualityPreset").change((function(){n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())})),n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())},setFromPresets:function(t){if(0===parseInt(t))return e("#qualityPreset_label").hide(),void e("#customQuality").show();e("#customQuality").hide(),e("#qualityPreset_label").show(),e("#anyQualities option").each((function(){(t&e(this).val())>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)})),e("#bestQualities option").each((function(){(t&e(this).val()<<16)>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)}))}},root:{init:function(){},schedule:function(){if(n.ajax_search.init(),e.backstretch(n.srWebRoot+"/images/backdrops/schedule.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),n.isMeta("sickrage.COMING_EPS_LAYOUT",["LIST"])){var t={DATE:0,SHOW:2,NETWORK:5},i=n.getMeta("sickrage.COMING_EPS_SORT"),a=i in t?[[t[i],0]]:[[0,0]];e("#showListTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["stickyHeaders","filter","columnSelector","saveSort"],sortList:a,textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},7:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"loadingNames"},7:{sorter:"quality"},8:{sorter:!1},9:{sorter:!1}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_saveFilters:!0,columnSelector_mediaquery:!1}:{filter_columnFilters:!1,columnSelector_mediaquery:!1}})}n.isMeta("sickrage.COMING_EPS_LAYOUT",["BANNER","POSTER"])&&(e(".ep_summary").hide(),e(".ep_summaryTrigger").click((function(){e(this).next(".ep_summary").slideToggle("normal",(function(){e(this).prev(".ep_summaryTrigger").attr("class",(function(t,n){return e(this).next(".ep_summary").is(":visible")?n.replace("fa-plus-square","fa-minus-square"):n.replace("fa-minus-square","fa-plus-square")}))}))}))),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e.tablesorter.columnSelector.attachTo(e("#showListTable"),"#popover-target")}))},history:function(){e.backstretch(n.srWebRoot+"/images/backdrops/history.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#historyTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["filter"],sortList:[[0,1]],textExtraction:n.isMeta("sickrage.HISTORY_LAYOUT",["DETAILED"])?{0:function(t){return e(t).find("time").attr("datetime")},4:function(t){return e(t).find("span").text().toLowerCase()}}:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("span").text().toLowerCase()},2:function(t){return e(t).attr("data-provider").toLowerCase()},5:function(t){return e(t).attr("data-quality").toLowerCase()}},headers:n.isMeta("sickrage.HISTORY_LAYOUT",["DETAILED"])?{0:{sorter:"realISODate"},4:{sorter:"data-quality"}}:{0:{sorter:"realISODate"},4:{sorter:!1},5:{sorter:"data-quality"}}}),e("#history_limit").on("change",(function(){window.location.href=n.srWebRoot+"/history/?limit="+e(this).val()})),e("a.clearhistory").confirm({theme:"dark",title:f("Clear History"),content:f("Are you sure you want to clear all download history ?")}),e("a.trimhistory").confirm({theme:"dark",title:f("Trim History"),content:f("Are you sure you want to trim all download history older than 30 days ?")})},api_builder:function(){e("[data-action=api-call]").on("click",(function(){var t=e("[data-command="+e(this).data("command-name")+"]"),n=e("#option-profile").is(":checked"),i=e(this).data("target"),a=e(this).data("time"),o=e("#"+e(this).data("base-url")).text(),r=e(this).data("url");e.each(t,(function(t,n){var i=e(n).attr("name"),a=e(n).val();void 0!==i&&void 0!==a&&i!==a&&a&&(e.isArray(a)&&(a=a.join("|")),o+="&"+i+"="+a)})),n&&(o+="&profile=1");var s=(new Date).getTime();e.get(o,(function(t,n,l){var c=(new Date).getTime()-s,d=e("#option-jsonp").is(":checked"),u=l.getResponseHeader("content-type")||"",h=e(i);if(e(a).text(c+"ms"),e(r).text(o+(d?"&jsonp=foo":"")),"image/"===u.slice(0,6))h.html(e("<img/>").attr("src",o));else{var f=JSON.stringify(t,null,4);d?h.text("foo("+f+");"):h.text(f)}h.parents(".result-wrapper").removeClass("d-none")}))})),e("[data-action=clear-result]").on("click",(function(){e(e(this).data("target")).html("").parents(".result-wrapper").addClass("d-none")})),e("[data-action=update-episodes]").on("change",(function(){var t=e(this).data("command"),i=e("[data-command="+t+"][name=episode]"),a=e(this).val(),o=e("[data-command="+t+"][name=series_id]").val(),r=e.parseJSON(window.atob(n.getMeta("episodes")));if(void 0!==i)for(var s in i.removeClass("d-none"),i.find("option:gt(0)").remove(),r[o][a])Object.prototype.hasOwnProperty.call(r[o][a],s)&&i.append(e("<option>",{value:s,label:"Episode "+s}))})),e("[data-action=update-seasons]").on("change",(function(){var t=e(this).data("command"),i=e("[data-command="+t+"][name=season]"),a=e(this).val(),o=e.parseJSON(window.atob(n.getMeta("episodes")));if(void 0!==i)for(var r in i.removeClass("d-none"),i.find("option:gt(0)").remove(),o[a])Object.prototype.hasOwnProperty.call(o[a],r)&&i.append(e("<option>",{value:r,label:0===r?"Specials":"Season "+r}))}))},announcements:function(){e(".mark-seen").on("click",(function(){var t=e(this);e.post(n.srWebRoot+"/announcements/mark-seen",{ahash:e(this).closest(".announcement")[0].id},(function(){n.updateProfileBadge(),t.hide()}))}))}},home:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/home.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},index:function(){var t=new IntersectionObserver((function(t,i){t.forEach((function(t){t.isIntersecting&&e.getJSON(n.srWebRoot+"/home/showProgress",{"show-id":e(t.target).data("show-id")},(function(n){var a=n.progressbar_percent,o=100===a?100:a>80?80:a>60?60:a>40?40:20;e(t.target).append('<div class="progressbarText" title="'+n.progress_tip+'">'+n.progress_text+"</div>"),e(t.target).css({width:a+"%"}),e(t.target).addClass("progress-"+o),i.unobserve(t.target)}))}))}));function i(t){var n,i,a;t<125?a=3:t<175?(n=9,i=.6,a=4):(n=11,i=1,a=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():(e(".show-details").show(),e(".show-dlstats, .show-quality").css("fontSize",n),e(".show-network-image").css("transform","scale("+i+")")),e(".show-container").css({width:t,borderRadius:a})}document.querySelectorAll("div.progress-bar").forEach((function(e){t.observe(e)})),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.posterSize||188,change:function(t,n){window.localStorage&&localStorage.setItem("posterSize",n.value),i(n.value),e(".show-grid").isotope("layout")}}),e("#showListTableShows:has(tbody tr), #showListTableAnime:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[7,1],[2,0]],textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span:first").text()},6:function(t){return e(t).data("show-size")},7:function(t){return e(t).find("span").text().toLowerCase()}},widgets:["saveSort","stickyHeaders","filter","columnSelector"],headers:n.metaToBool("sickrage.FILTER_ROW")?{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"},7:{filter:"parsed"}}:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_functions:{5:function(e,t,n){var i=!1,a=Math.floor(t%1*1e3);if(""===n)i=!0;else{var o=n.match(/(<|<=|>=|>)\s(\d+)/i);o&&("<"===o[1]?a<parseInt(o[2])&&(i=!0):"<="===o[1]?a<=parseInt(o[2])&&(i=!0):">="===o[1]?a>=parseInt(o[2])&&(i=!0):">"===o[1]&&a>parseInt(o[2])&&(i=!0)),(o=n.match(/(\d+)\s(-|to)\s(\d+)/i))&&("-"!==o[2]&&"to"!==o[2]||a>=parseInt(o[1])&&a<=parseInt(o[3])&&(i=!0)),(o=n.match(/(=)?\s?(\d+)\s?(=)?/i))&&("="!==o[1]&&"="!==o[3]||parseInt(o[2])===a&&(i=!0)),!isNaN(parseFloat(n))&&isFinite(n)&&parseInt(n)===a&&(i=!0)}return i}},columnSelector_mediaquery:!1}:{filter_columnFilters:!1},sortStable:!0,sortAppend:[[2,0]]}),e(".show-grid").imagesLoaded((function(){i(parseInt(localStorage.posterSize||188)),e(".show-grid").removeClass("d-none"),e(".show-grid").isotope({itemSelector:".show-container",sortBy:n.getMeta("sickrage.POSTER_SORT_BY"),sortAscending:n.getMeta("sickrage.POSTER_SORT_BY"),layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{NAME:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^((?:The|A|An)\s)/i,"")).toLowerCase()}}});var t=null;e(".show-container").on("mouseenter",(function(){var n=e(this);"none"===n.find(".show-details").css("display")&&(t=setTimeout((function(){t=null,e("#posterPopup").remove();var i=n.clone().attr({id:"posterPopup"}),a=n.offset().left,o=n.offset().top;i.css({position:"absolute",margin:0,top:o,left:a,zIndex:9999}),i.find(".show-details").show(),i.on("mouseleave",(function(){e(this).remove()})),i.appendTo("body");var r=o+n.height()/2-219,s=a+n.width()/2-125,l=e(window).scrollTop(),c=e(window).scrollLeft(),d=l+e(window).innerHeight(),u=c+e(window).innerWidth();r<l+5&&(r=l+5),s<c+5&&(s=c+5),r+438+5>d&&(r=d-438-5),s+250+5>u&&(s=u-250-5),i.animate({top:r,left:s,width:250,height:438})}),300))})).on("mouseleave",(function(){null!==t&&clearTimeout(t)}))})),e("#postersort").on("change",(function(){var t=e(this).val();e(".show-grid").isotope({sortBy:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))})),e("#postersortdirection").on("change",(function(){var t="true"===e(this).val();e(".show-grid").isotope({sortAscending:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))})),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e.tablesorter.columnSelector.attachTo(e("#showListTableShows"),"#popover-target"),e("#showListTableAnime").length&&n.metaToBool("sickrage.ANIME_SPLIT_HOME")&&e.tablesorter.columnSelector.attachTo(e("#showListTableAnime"),"#popover-target")}))},display_show:{init:function(){n.home.display_show.imdbRating(),n.metaToBool("sickrage.FANART_BACKGROUND")&&(e.backstretch(n.srWebRoot+"/images/"+e("#series_id").attr("value")+".fanart.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")),e("#showTable, #animeTable").tablesorter({theme:"bootstrap",widgets:["saveSort","columnSelector"],widgetOptions:{columnSelector_saveColumns:!0,columnSelector_layout:'<br><label><input type="checkbox">{name}</label>',columnSelector_mediaquery:!1,columnSelector_cssChecked:"checked"}}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e(".displayShowTable").each((function(t,n){e.tablesorter.columnSelector.attachTo(n,"#popover-target")}))})),e("#seasonJump").on("change",(function(){var t=e("#seasonJump option:selected").val();if(t&&"jump"!==t){var n=e("#seasonJump option:selected").data("season");e("html,body").animate({scrollTop:e('[name ="'+t.substring(1)+'"]').offset().top-50},"slow"),e("#collapseSeason-"+n).collapse("show"),location.hash=t}e(this).val("jump")})),e("#prevShow").on("click",(function(){e("#pickShow option:selected").prev().prop("selected","selected"),e("#pickShow").change()})),e("#nextShow").on("click",(function(){e("#pickShow option:selected").next().prop("selected","selected"),e("#pickShow").change()})),e("#changeStatus").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/manage/setEpisodeStatus?show="+e("#series_id").attr("value")+"&eps="+t.join("|")+"&status="+e("#statusSelect").val()})),e("#deleteEpisode").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/deleteEpisode?show="+e("#series_id").attr("value")+"&eps="+t.join("|")})),e(".seasonCheck").on("click",(function(){var t=this,n=e(this).attr("id");e("#collapseSeason-"+n).collapse("show"),e(".epCheck:visible").each((function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)}))}));var t=null;e(".epCheck").on("click",(function(n){if(t&&n.shiftKey){var i=this,a=0;e(".epCheck").each((function(){switch(a){case 2:return!1;case 1:e(this).prop("checked",t.checked)}e(this)!==i&&e(this)!==t||a++}))}else t=this})),e(".seriesCheck").on("click",(function(){e(".epCheck:visible").each((function(){e(this).prop("checked",!0)})),e(".seasonCheck:visible").each((function(){e(this).prop("checked",!0)}))})),e(".clearAll").on("click",(function(){e(".epCheck:visible").each((function(){e(this).prop("checked",!1)})),e(".seasonCheck:visible").each((function(){e(this).prop("checked",!1)}))})),e("#pickShow").on("change",(function(){var t=e(this).val();0!==t&&(window.location.href=n.srWebRoot+"/home/displayShow?show="+t)})),e("#checkboxControls input").change((function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)})),e("#checkboxControls input").each((function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each((function(){t?e(this).show():e(this).hide()}))})),e("tr.seasonheader").each((function(){var t=0,n=e(this).attr("id");e("tr."+n+" :visible").each((function(){t++})),0===t?(e(this).hide(),e("#"+n+"-cols").hide()):(e(this).show(),e("#"+n+"-cols").show())})),e(".sceneSeasonXEpisode").on("change",(function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-season"),i=e(this).attr("data-for-episode"),a=e(this).val().match(/^(\d+)x(\d+)$/i),o=null,r=null;a&&(o=a[1],r=a[2]),n.home.display_show.setEpisodeSceneNumbering(t,i,o,r)})),e(".sceneAbsolute").on("change",(function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-absolute"),i=e(this).val().match(/^(\d{1,3})$/i),a=null;i&&(a=i[1]),n.home.display_show.setAbsoluteSceneNumbering(t,a)})),n.ajax_search.init(),e("a.removeshow").confirm({theme:"dark",title:f("Remove Show"),content:f("Are you sure you want to remove")+'<span class="footerhighlight">'+e("#showtitle").data("showname")+"</span>"+f(" from the database?")+'<br><br><input type="checkbox" id="deleteFiles" name="deleteFiles"/>&nbsp;<label for="deleteFiles" class="text-danger">'+f("Check to delete files as well. IRREVERSIBLE")+"</label>",buttons:{confirm:function(){var e=this.$content.find("#deleteFiles").prop("checked");location.href=this.$target.attr("href")+(e?"&full=1":"")},cancel:{action:function(){}}}})},imdbRating:function(){for(var t=e("#imdbstars"),n=t.data("imdb-rating"),i=e("<i>").addClass("fas fa-star text-warning"),a=0;a<n;a++)t.append(i.clone())},setEpisodeSceneNumbering:function(t,i,a,o){var r=e("#series_id").val(),s=e("#series_provider_id").val();""===a&&(a=null),""===o&&(o=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{series_id:r,series_provider_id:s,forSeason:t,forEpisode:i,sceneSeason:a,sceneEpisode:o},(function(n){null===n.sceneSeason||null===n.sceneEpisode?e("#sceneSeasonXEpisode_"+r+"_"+t+"_"+i).val(""):e("#sceneSeasonXEpisode_"+r+"_"+t+"_"+i).val(n.sceneSeason+"x"+n.sceneEpisode),n.success?null===n.sceneSeason||null===n.sceneEpisode?alert(f("Scene numbering cleared for season "+t+" episode "+i)):alert(f("Scene numbering set for season "+t+" episode "+i)):n.errorMessage?alert(n.errorMessage):alert(f("Update failed."))}))},setAbsoluteSceneNumbering:function(t,i){var a=e("#series_id").val(),o=e("#series_provider_id").val();""===i&&(i=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:a,series_provider_id:o,forAbsolute:t,sceneAbsolute:i},(function(n){null===n.sceneAbsolute?e("#sceneAbsolute_"+a+"_"+t).val(""):e("#sceneAbsolute_"+a+"_"+t).val(n.sceneAbsolute),n.success?null===n.sceneAbsolute?alert(f("Scene absolute numbering cleared for absolute "+t)):alert(f("Scene absolute numbering set for absolute "+t)):n.errorMessage?alert(n.errorMessage):alert(f("Update failed."))}))}},edit_show:{init:function(){var t=[];e("#location").fileBrowser({title:f("Select Show Location")}),e("#submit").click((function(){var t=[];e("#exceptions_list option").each((function(){t.push(e(this).val())})),e("#exceptions_list").val(t),n.metaToBool("show.is_anime")&&n.home.generate_bwlist()})),e("#addSceneName").click((function(){var n=e("#SceneName").val(),i=e("<option>");if(t=[],e("#exceptions_list option").each((function(){t.push(e(this).val())})),e("#SceneName").val(""),!(e.inArray(n,t)>-1||""===n))return e("#SceneException").show(),i.attr("value",n),i.html(n),i.appendTo("#exceptions_list")})),e("#removeSceneName").click((function(){e("#exceptions_list option:selected").remove(),n.home.edit_show.toggleSceneException()})),n.home.edit_show.toggleSceneException()},toggleSceneException:function(){var t=[];e("#exceptions_list option").each((function(){t.push(e(this).val())})),""===t?e("#SceneException").hide():e("#SceneException").show()}},add_shows:function(){e.backstretch(n.srWebRoot+"/images/backdrops/addshows.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},add_existing_shows:{init:function(){n.home.add_show_options(),n.root_dirs.init(),e("#tableDiv").on("click","#checkAll",(function(){e(".dirCheck").not(this).prop("checked",this.checked)})),e("#submitShowDirs").on("click",(function(){var t=!1,n=e("#addShowForm");if(e(".dirCheck").each((function(){if(!0===this.checked){var i=e(this).attr("id"),a=e(this).closest("tr").find("select").val();e("<input>",{type:"hidden",name:"shows_to_add",value:a+"|"+i}).appendTo(n),t=!0}})),!1===t)return!1;e("<input>",{type:"hidden",name:"promptForSettings",value:e("#promptForSettings").prop("checked")?"on":"off"}).appendTo(n),n.submit()}));var t="";e("#rootDirText").on("change",(function(){if(t===e("#rootDirText").val())return!1;t=e("#rootDirText").val(),e("#rootDirStaticList").html(""),e("#rootDirs option").each((function(t,n){e("#rootDirStaticList").append('<div class="list-group-item-dark mb-1"><div class="align-middle m-1"><label class="form-check-label" for="\' + $(w).val() + \'"><input type="checkbox" class="dir_check" id="'+e(n).val()+'" checked=checked><b>'+e(n).val()+"</b></label></div></div>")})),n.home.add_existing_shows.loadContent()})),e("#rootDirStaticList").on("click",".dir_check",n.home.add_existing_shows.loadContent),e("#tableDiv").on("click",".showManage",(function(t){t.preventDefault(),e("html,body").animate({scrollTop:0},1e3)})),e("#rootDirs option").attr("selected","selected").parent().focus(),e("#rootDirs option").click()},loadContent:function(){var t="";e(".dir_check").each((function(n,i){e(i).is(":checked")&&(t.length&&(t+="&"),t+="rootDir="+encodeURIComponent(e(i).attr("id")))})),e("#tableDiv").html("<span>"+n.loadingHTML+f("loading folders...")+"</span>"),e.get(n.srWebRoot+"/home/addShows/massAddTable/",t,(function(t){e("#tableDiv").html(t),e("#addRootDirTable").tablesorter({theme:"bootstrap",sortList:[[1,0]],headers:{0:{sorter:!1}}})}))}},postprocess:function(){e("#episodeDir").fileBrowser({title:f("Select Unprocessed Episode Folder"),key:"postprocessPath"})},trakt_shows:{init:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#showsort").val("original"),e("#showsortdirection").val("asc"),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.traktPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("traktPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded((function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})})),e("#showsort").on("change",(function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})})),e("#showsortdirection").on("change",(function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})})),e("#traktlist").on("change",(function(e){document.location.href=n.updateUrlParameter(document.location.href,"list",e.target.value)})),e("#limit").on("change",(function(e){document.location.href=n.updateUrlParameter(document.location.href,"limit",e.target.value)}))}},popular_shows:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.imdbPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("imdbPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded((function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})})),e("#showsort").on("change",(function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})})),e("#showsortdirection").on("change",(function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})}))},test_renaming:function(){e(".seriesCheck").on("click",(function(){var t=this;e(".seasonCheck:visible").each((function(){e(this).prop("checked",t.checked)})),e(".epCheck:visible").each((function(){e(this).prop("checked",t.checked)}))})),e(".seasonCheck").click((function(){var t=this,n=e(t).attr("id");e(".epCheck:visible").each((function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)}))})),e("input[type=submit]").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/doRename?show="+e("#series_id").attr("value")+"&eps="+t.join("|")}))},new_show:{init:function(){var t=e("div.setup-panel div a"),i=e(".setup-content"),a=e(".nextBtn"),o=document.getElementById("addShowForm");o&&o.addEventListener("submit",(function(e){!1===o.checkValidity()&&(e.preventDefault(),e.stopPropagation()),o.classList.add("was-validated")}),!1),i.hide(),n.root_dirs.init(),n.home.add_show_options(),n.quality_chooser.init(),e("input:hidden[name=whichSeries]").length&&(e("#addShowForm")[0].classList.add("was-validated"),n.home.update_bwlist(e("#providedSeriesName").val()),t.addClass("disabled"),t.removeClass("btn-success").addClass("btn-dark"),e("#fullShowPath").length?(e('div.setup-panel div a[href="#step-3"]').removeClass("btn-dark").addClass("btn-success"),i.hide(),e("#step-3").show()):(e('div.setup-panel div a[href="#step-2"]').removeClass("btn-dark").addClass("btn-success"),i.hide(),e("#step-2").show())),e("#nameToSearch").focus(),e("#searchName").click((function(){!0===e("#addShowForm")[0].checkValidity()&&(e("#addShowForm")[0].classList.add("was-validated"),e(".nextBtn").removeClass("disabled"))})),e("#addShowForm").submit((function(){n.home.generate_bwlist()})),t.click((function(n){n.preventDefault();var a=e(e(this).attr("href")),o=e(this);o.hasClass("disabled")||(t.removeClass("btn-success").addClass("btn-dark"),o.removeClass("btn-dark").addClass("btn-success"),i.hide(),a.show(),a.find("input:eq(0)").focus())})),a.click((function(){var t=e(this).closest(".setup-content").attr("id"),i=e('div.setup-panel div a[href="#'+t+'"]').parent().next().children("a"),a=!0,o="";"step-1"==t&&(e("input:radio[name=whichSeries]:checked").length?o=e("input:radio[name=whichSeries]:checked").val().split("|")[4]:e("input:hidden[name=whichSeries]").length&&e("input:hidden[name=whichSeries]").val().length&&(o=e("#providedSeriesName").val()),o.length?n.home.update_bwlist(o):a=!1),"step-2"==t&&(e("#rootDirs option").length||e("#fullShowPath").length||(e("#step-2-messages").empty().html('<div style="color: red;"><b>'+f("You must add a root TV show directory!")+"</b></div>"),a=!1)),a&&i.removeClass("disabled").trigger("click")})),e("#searchName").on("click",(function(){e("#searchName").prop("disabled",!0),n.home.new_show.searchSeriesProvider(),e("#searchName").prop("disabled",!1)})),e("#skipShowButton").on("click",(function(){e("#skipShow").val("1"),e("#addShowForm").submit()})),e("#nameToSearch").keypress((function(t){13===(t.keyCode?t.keyCode:t.which)&&(t.preventDefault(),e("#searchName").click())})),e("div.setup-panel div a.btn-success").trigger("click")},searchSeriesProvider:function(){if(e("#nameToSearch").val().length){var t="<b>"+e("#nameToSearch").val().trim()+"</b> on "+e("#providedSeriesProviderID option:selected").text()+"<br/>";e("#step-1-messages").empty().html('<i id="searchingAnim" class="fas fa-spinner fa-spin fa-fw"></i> searching for '+t),e.ajax({url:n.srWebRoot+"/home/addShows/searchSeriesProviderForShowName",data:{search_term:e("#nameToSearch").val().trim(),lang:e("#seriesProviderLanguage").val(),series_provider_id:e("#providedSeriesProviderID").val()},timeout:1e3*parseInt(e("#series_provider_timeout").val(),10),dataType:"json",error:function(){e("#step-1-messages").empty().html(f("search timed out, try increasing timeout for series provider"))},success:function(t){var i=!0,a='<legend class="legend">'+f("Search Results:")+"</legend>\n",o="";0===t.results.length?a+="<b>"+f("No results found, try a different search or language.")+"</b>":(e.each(t.results,(function(e,r){i&&"disabled"!==r[6]?(o=" checked",i=!1):o="";var s=r.join("|");if(a+='<input type="radio" class="pull-left" id="whichSeries" name="whichSeries" value="'+s.replace(/"/g,"")+'"'+o+" "+r[6]+" /> ",a+='<a href="'+n.anonURL+r[2]+r[3]+"&lid="+t.langid+'" onclick="window.open(this.href, \'_blank\'); return false;" ><b>'+r[4]+"</b></a>",null!==r[5]){var l=new Date(r[5]),c=new Date;a+=l>c?f(" (will debut on ")+r[5]+")":f(" (started on ")+r[5]+")"}null!==r[0]&&(a+=" ["+r[0]+"]"),"disabled"===r[6]&&(a+='<div class="d-inline text-danger font-weight-bold">'+f(" already exists in show library")+"</div>"),a+="<br/>"})),a+="</ul>"),a+="<br/>",e("#step-1-messages").html(a)}})}}},add_show_options:function(){e("#saveDefaultsButton").on("click",(function(){var t=[],i=[];e("#anyQualities option:selected").each((function(n,i){t.push(e(i).val())})),e("#bestQualities option:selected").each((function(t,n){i.push(e(n).val())})),e.get(n.srWebRoot+"/config/general/saveAddShowDefaults",{defaultStatus:e("#statusSelect").val(),qualityPreset:e("#qualityPreset").val(),anyQualities:t.join(","),bestQualities:i.join(","),defaultFlattenFolders:e("#flatten_folders").prop("checked"),subtitles:e("#subtitles").prop("checked"),anime:e("#anime").prop("checked"),search_format:e("#search_format").val(),defaultStatusAfter:e("#statusSelectAfter").val(),scene:e("#scene").prop("checked"),skip_downloaded:e("#skip_downloaded").prop("checked"),add_show_year:e("#add_show_year").prop("checked")}),e(this).attr("disabled",!0),n.notify("info",f("Saved Defaults"),f('Your "add show" defaults have been set to your current selections.'))})),e("#statusSelect, #qualityPreset, #flatten_folders, #anyQualities, #bestQualities, #subtitles, #search_format, #anime, #statusSelectAfter, #scene, #skip_downloaded, #add_show_year").change((function(){e("#saveDefaultsButton").attr("disabled",!1)}))},generate_bwlist:function(){var t=[];e("#white option").each((function(n,i){t[n]=e(i).val()})),e("#whitelist").val(t.join(",")),t=[],e("#black option").each((function(n,i){t[n]=e(i).val()})),e("#blacklist").val(t.join(","))},update_bwlist:function(t){e("#white").children().remove(),e("#black").children().remove(),e("#pool").children().remove(),e("#anime").prop("checked")?(e("#blackwhitelist").show(),t&&e.getJSON(n.srWebRoot+"/home/fetch_releasegroups",{show_name:t},(function(t){"success"===t.result&&e.each(t.groups,(function(t,n){var i=e("<option>");i.attr("value",n.name),i.html(n.name+" | "+n.rating+" | "+n.range),i.appendTo("#pool")}))}))):e("#blackwhitelist").hide()},server_status:{init:function(){e("#schedulerStatusTable").tablesorter({theme:"bootstrap",widgets:["saveSort"]}),e("#queueStatusTable").tablesorter({theme:"bootstrap",sortList:[[3,0],[4,0],[2,1]],widgets:["saveSort"]}),e(".forceSchedulerJob").click((function(t){t.preventDefault(),e.get(e(this).data("target"))}))}}},config:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/config.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500");var t=document.getElementById("configForm");t&&t.addEventListener("submit",(function(e){!1===t.checkValidity()&&(e.preventDefault(),e.stopPropagation()),t.classList.add("was-validated")}),!1),e("#configForm").ajaxForm({beforeSubmit:function(){e(".config_submitter .config_submitter_refresh").each((function(){e(this).attr("disabled","disabled"),e(this).after("<span>"+n.loadingHTML+f(" Saving...")+"</span>"),e(this).hide()}))},success:function(){setTimeout((function(){e(".config_submitter").each((function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show()})),e(".config_submitter_refresh").each((function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show(),window.location.reload()})),e("#email_show").trigger("notify")}),2e3)}}),e("#config-menus a").click((function(t){t.preventDefault(),e(this).tab("show")})),e("ul.nav-pills > li > a").on("shown.bs.tab",(function(t){window.location.hash=e(t.target).attr("href").substr(1)})),e('#config-menus a[href="'+window.location.hash+'"]').tab("show"),e("a.resetConfig").confirm({theme:"dark",title:f("Reset Config to Defaults"),content:f("Are you sure you want to reset config to defaults?")})},general:{is_account_linked:"",init:function(){n.root_dirs.init(),0===e("input[name='proxy_setting']").val().length&&(e("input[id='proxy_series_providers']").prop("checked",!1),e("label[for='proxy_series_providers']").hide()),e("input[name='proxy_setting']").on("input",(function(){0===e(this).val().length?(e("input[id='proxy_series_providers']").prop("checked",!1),e("label[for='proxy_series_providers']").hide()):e("label[for='proxy_series_providers']").show()})),e(".viewIf").on("click",(function(){e(this).prop("checked")?(e(".hide_if_"+e(this).attr("id")).css("display","none"),e(".show_if_"+e(this).attr("id")).fadeIn("fast","linear")):(e(".show_if_"+e(this).attr("id")).css("display","none"),e(".hide_if_"+e(this).attr("id")).fadeIn("fast","linear"))})),e(".datePresets").on("click",(function(){var t=e("#date_presets").val();e(this).prop("checked")&&"%x"===t?(t="%a, %b %d, %Y",e("#date_use_system_default").html("1")):e(this).prop("checked")||"1"!==e("#date_use_system_default").html()||(t="%x"),e("#date_presets").attr("name","date_preset_old"),e("#date_presets").attr("id","date_presets_old"),e("#date_presets_na").attr("name","date_preset"),e("#date_presets_na").attr("id","date_presets"),e("#date_presets_old").attr("name","date_preset_na"),e("#date_presets_old").attr("id","date_presets_na"),t&&e("#date_presets").val(t)})),e("#api_key").on("click",(function(){e("#api_key").select()})),e("#generate_new_apikey").on("click",(function(){e.get(n.srWebRoot+"/config/general/generateApiKey",(function(t){void 0===t.error?e("#api_key").val(t):alert(t.error)}))})),e("#syncRemote").click((function(){function t(){e.getJSON(n.srWebRoot+"/googleDrive/getProgress",(function(t){e("#current_info").html(t.current_info)})).error((function(){clearInterval(window.progressInterval),e("#current_info").html("Uh oh, something went wrong")}))}e.ajax({type:"GET",url:n.srWebRoot+"/googleDrive/syncRemote",beforeSend:function(){window.progressInterval=setInterval(t,100),e("#pleaseWaitDialog").modal()},success:function(){clearInterval(window.progressInterval),e("#pleaseWaitDialog").modal("hide")}})})),e("#pip3_path").length&&(e("#pip3_path").fileBrowser({title:f("Select path to pip3"),key:"pip3_path",includeFiles:1}),e("#verifyPipPath").click((function(){var t=e.trim(e("#pip3_path").val());if(!t)return e("#testPIP-result").html(f("Please fill out the necessary fields above.")),void e("#pip3_path").addClass("warning");e("#pip3_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testPIP-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done((function(t){e("#testPIP-result").html(t),e("#verifyPipPath").prop("disabled",!1)}))}))),e("#git_path").length&&(e("#git_path").fileBrowser({title:f("Select path to git"),key:"git_path",includeFiles:1}),e("#verifyGitPath").click((function(){var t=e.trim(e("#git_path").val());if(!t)return e("#testGIT-result").html(f("Please fill out the necessary fields above.")),void e("#git_path").addClass("warning");e("#git_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testGIT-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done((function(t){e("#testGIT-result").html(t),e("#verifyGitPath").prop("disabled",!1)}))}))),e("#installRequirements").on("click",(function(){window.location.href=n.srWebRoot+"/home/installRequirements"})),e("#branchCheckout").on("click",(function(){window.location.href=n.srWebRoot+"/home/branchCheckout?branch="+e("#branchVersion").val()})),e("#web_auth_method").change((function(){e(this).find("option:selected").each((function(){"local_auth"===e(this).val()?(e("#content_use_local_auth").show(),e("#web_username").prop("required",!0),e("#web_password").prop("required",!0)):(e("#content_use_local_auth").hide(),e("#web_username").prop("required",!1),e("#web_password").prop("required",!1))}))})).change(),e("#enable_sickrage_api").on("change",(function(){var t=e(this).prop("checked"),i=null;t?i=n.popupWindow(n.srWebRoot+"/account/link","Link SiCKRAGE Account",1200,650):e.get(n.srWebRoot+"/account/unlink");var a=setInterval((function(e){n.config.general.checkIsAccountLinked(),t&&"true"===n.config.general.is_account_linked?(e.close(),clearInterval(a)):t||"false"!==n.config.general.is_account_linked||clearInterval(a)}),1e3,i)}))},checkIsAccountLinked:function(){e.ajax({url:n.srWebRoot+"/account/is-linked",dataType:"json",success:function(t){"true"===t.linked?(e("#link_sickrage_account").addClass("d-none"),e("#unlink_sickrage_account").removeClass("d-none")):(e("#unlink_sickrage_account").addClass("d-none"),e("#link_sickrage_account").removeClass("d-none")),n.config.general.is_account_linked=t.linked}})}},subtitles:{init:function(){e.getJSON(n.srWebRoot+"/config/subtitles/wanted_languages",(function(e){new d.default({el:document.querySelector("#subtitles_languages"),remote:{url:n.srWebRoot+"/config/subtitles/get_code"},setItems:e,itemName:"subtitles_languages",newitemName:"subtitles_languages_new"})})),e("#subtitles_dir").fileBrowser({title:f("Select Subtitles Download Directory")}),e("#editAService").change((function(){n.config.subtitles.showHideServices()})),e(".service_enabler").on("click",(function(){n.config.subtitles.refreshServiceList()})),n.config.subtitles.showHideServices(),e("#service_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.subtitles.refreshServiceList()}}),e("#service_order_list").disableSelection()},showHideServices:function(){e(".serviceDiv").each((function(){var t=e(this).attr("id");e("#editAService :selected").val()+"Div"===t?e(this).show():e(this).hide()}))},addService:function(t,i,a,o,r,s){if(null===a.match("/$")&&(a+="/"),0===e("#service_order_list > #"+t).length&&!1!==s){var l='<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="service_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/newznab.gif" alt="'+i+'" width="16" height="16"></a> '+i+"</li>";e("#service_order_list").append(l),e("#service_order_list").sortable("refresh")}},deleteService:function(t){e("#service_order_list > #"+t).remove()},refreshServiceList:function(){var t=e("#service_order_list").sortable("toArray"),n=[];e.each(t,(function(t,i){var a=+e("#enable_"+i).prop("checked")?"1":"0";n.push(i+":"+a)})),e("#service_order").val(n.join(" "))}},search:{init:function(){e("#nzb_method").change(n.config.search.nzbMethodHandler),e("#torrent_method").change(n.config.search.torrentMethodHandler),n.config.search.nzbMethodHandler(),n.config.search.torrentMethodHandler(),e("#testSABnzbd").click((function(){e("#testSABnzbd_result").html(n.loadingHTML);var t=e("#sab_host").val(),i=e("#sab_username").val(),a=e("#sab_password").val(),o=e("#sab_apikey").val();e.get(n.srWebRoot+"/home/testSABnzbd",{host:t,username:i,password:a,apikey:o},(function(t){e("#testSABnzbd_result").html(t)}))})),e("#testSynologyDSM").click((function(){e("#testSynologyDSM_result").html(n.loadingHTML);var t=e("#nzb_method").val(),i=e("#syno_dsm_host").val(),a=e("#syno_dsm_username").val(),o=e("#syno_dsm_password").val();e.get(n.srWebRoot+"/home/testSynologyDSM",{nzb_method:t,host:i,username:a,password:o},(function(t){e("#testSynologyDSM_result").html(t)}))})),e("#use_torrents").click((function(){n.config.search.toggleTorrentTitle()})),e("#test_torrent").click((function(){e("#test_torrent_result").html(n.loadingHTML);var t=e("#torrent_method :selected").val(),i=e("#torrent_host").val(),a=e("#torrent_username").val(),o=e("#torrent_password").val();e.get(n.srWebRoot+"/home/testTorrent",{torrent_method:t,host:i,username:a,password:o},(function(t){e("#test_torrent_result").html(t)}))})),n.config.search.rtorrentScgi(),e("#torrent_host").change(n.config.search.rtorrentScgi),e("#nzb_dir").fileBrowser({title:f("Select .nzb blackhole/watch location")}),e("#torrent_dir").fileBrowser({title:f("Select .torrent blackhole/watch location")}),e("#torrent_path").fileBrowser({title:f("Select .torrent download location")})},toggleTorrentTitle:function(){e("#use_torrents").prop("checked")?e("#no_torrents").show():e("#no_torrents").hide()},nzbMethodHandler:function(){e("#blackhole_settings").hide(),e("#sabnzbd_settings").hide(),e("#nzbget_settings").hide(),e("#download_station_settings").hide(),e("#testSABnzbd").hide(),e("#testSABnzbd_result").hide(),e("#testSynologyDSM").hide(),e("#testSynologyDSM_result").hide(),e("#nzbget_host").prop("required",!1),e("#sab_host").prop("required",!1),e("#syno_dsm_host").prop("required",!1);var t=e("#nzb_method").val();"blackhole"!==t.toLowerCase()?"nzbget"===t.toLowerCase()?(e("#nzbget_settings").show(),e("#nzbget_host").prop("required",!0)):"sabnzbd"===t.toLowerCase()?(e("#sabnzbd_settings").show(),e("#testSABnzbd").show(),e("#testSABnzbd_result").show(),e("#sab_host").prop("required",!0)):"download_station"===t.toLowerCase()&&(e("#download_station_settings").show(),e("#testSynologyDSM").show(),e("#testSynologyDSM_result").show(),e("#syno_dsm_host").prop("required",!0)):(e("#blackhole_settings").show(),e("#nzbget_host").prop("required",!1),e("#sab_host").prop("required",!1),e("#syno_dsm_host").prop("required",!1))},torrentMethodHandler:function(){e("#options_torrent_clients").hide(),e("#options_torrent_blackhole").hide(),e("#torrent_host").prop("required",!1);var t=e("#torrent_method").val(),n="",i="#options_torrent_blackhole";"blackhole"!==t.toLowerCase()&&(e("#label_warning_deluge").hide(),e("#label_anime_warning_deluge").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_auth_type_option").hide(),e("#torrent_path_option").show(),e("#torrent_path_option").find(".fileBrowser").show(),e("#torrent_seed_time_option").hide(),e("#torrent_high_bandwidth_option").hide(),e("#torrent_label_option").show(),e("#torrent_label_anime_option").show(),e("#path_synology").hide(),e("#torrent_paused_option").show(),e("#torrent_rpc_url_option").hide(),"utorrent"===t.toLowerCase()?(n="uTorrent",e("#torrent_path_option").hide(),e("#torrent_seed_time_label").text(f("Minimum seeding time is")),e("#torrent_seed_time_option").show(),e("#torrent_host").attr("placeholder",f("URL to your uTorrent client (e.g. http://localhost:8000)")),e("#torrent_host").prop("required",!0)):"transmission"===t.toLowerCase()?(n="Transmission",e("#torrent_seed_time_label").text(f("Stop seeding when inactive for")),e("#torrent_seed_time_option").show(),e("#torrent_high_bandwidth_option").show(),e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_rpc_url_option").show(),e("#torrent_host").attr("placeholder",f("URL to your Transmission client (e.g. http://localhost:9091)")),e("#torrent_host").prop("required",!0)):"deluge"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").show(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_host").attr("placeholder",f("URL to your Deluge client (e.g. http://localhost:8112)")),e("#torrent_host").prop("required",!0)):"deluged"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").show(),e("#torrent_host").attr("placeholder",f("IP or Hostname of your Deluge Daemon (e.g. scgi://localhost:58846)")),e("#torrent_host").prop("required",!0)):"download_station"===t.toLowerCase()?(n="Synology DS",e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_path_option").find(".fileBrowser").hide(),e("#torrent_host").attr("placeholder",f("URL to your Synology DS client (e.g. http://localhost:5000)")),e("#torrent_host").prop("required",!0),e("#path_synology").show()):"rtorrent"===t.toLowerCase()?(n="rTorrent",e("#torrent_paused_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your rTorrent client (e.g. scgi://localhost:5000 or https://localhost/rutorrent/plugins/httprpc/action.php)")),e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").show(),e("#torrent_auth_type_option").show(),e("#torrent_host").prop("required",!0)):"qbittorrent"===t.toLowerCase()?(n="qbittorrent",e("#torrent_path_option").hide(),e("#label_warning_qbittorrent").show(),e("#label_anime_warning_qbittorrent").show(),e("#torrent_host").attr("placeholder",f("URL to your qbittorrent client (e.g. http://localhost:8080)")),e("#torrent_host").prop("required",!0)):"mlnet"===t.toLowerCase()?(n="mlnet",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your MLDonkey (e.g. http://localhost:4080)")),e("#torrent_host").prop("required",!0)):"putio"===t.toLowerCase()&&(n="putio",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your putio client (e.g. http://localhost:8080)")),e("#torrent_host").prop("required",!0)),e("#host_title").text(n+" host:port"),e("#username_title").text(n+" username"),e("#password_title").text(n+" password"),e("#torrent_client").text(n),e("#rpcurl_title").text(n+" RPC URL"),i="#options_torrent_clients"),e(i).show()},rtorrentScgi:function(){"rtorrent"===e("#torrent_method :selected").val().toLowerCase()&&("scgi://"===e("#torrent_host").val().substr(0,7)?(e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_password_option").hide(),e("#torrent_password").prop("value",""),e("#torrent_auth_type_option").hide(),e("#torrent_auth_type option[value=none]").attr("selected","selected")):(e("#torrent_username_option").show(),e("#torrent_password_option").show(),e("#torrent_auth_type_option").show()))}},postprocessing:{init:function(){e("#unpack").on("change",(function(){e(this).prop("checked")?n.config.postprocessing.israr_supported():e("#unpack").tooltipster("close")})),e("#name_presets").on("change",(function(){n.config.postprocessing.setup_naming()})),e("#name_abd_presets").on("change",(function(){n.config.postprocessing.setup_abd_naming()})),e("#naming_custom_abd").on("change",(function(){n.config.postprocessing.setup_abd_naming()})),e("#name_sports_presets").on("change",(function(){n.config.postprocessing.setup_sports_naming()})),e("#naming_custom_sports").on("change",(function(){n.config.postprocessing.setup_sports_naming()})),e("#name_anime_presets").on("change",(function(){n.config.postprocessing.setup_anime_naming()})),e("#naming_custom_anime").on("change",(function(){n.config.postprocessing.setup_anime_naming()})),e('input[name="naming_anime"]').on("click",(function(){n.config.postprocessing.setup_anime_naming()})),e("#naming_multi_ep").change(n.config.postprocessing.fill_examples),e("#naming_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_examples()}),500)})),e("#naming_anime_multi_ep").change(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_anime_examples()}),500)})),e("#naming_abd_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_abd_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_abd_examples()}),500)})),e("#naming_sports_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_sports_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_sports_examples()}),500)})),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_anime_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_anime_examples()}),500)})),e("#show_naming_key").on("click",(function(){e("#naming_key").toggleClass("d-none")})),e("#show_naming_abd_key").on("click",(function(){e("#naming_abd_key").toggleClass("d-none")})),e("#show_naming_sports_key").on("click",(function(){e("#naming_sports_key").toggleClass("d-none")})),e("#show_naming_anime_key").on("click",(function(){e("#naming_anime_key").toggleClass("d-none")})),e("#do_custom").on("click",(function(){e("#naming_pattern").val(e("#name_presets :selected").attr("id")),e("#naming_custom").show(),e("#naming_pattern").focus()})),n.config.postprocessing.setup_naming(),n.config.postprocessing.setup_abd_naming(),n.config.postprocessing.setup_sports_naming(),n.config.postprocessing.setup_anime_naming(),e("#metadataType").on("change keyup",(function(){n.config.postprocessing.showHideMetadata()})),n.config.postprocessing.showHideMetadata(),e(".metadata_checkbox").on("click",(function(){n.config.postprocessing.refreshMetadataConfig(!1)})),n.config.postprocessing.refreshMetadataConfig(!0),e("img[title]").tooltipster({position:{viewport:e(window),at:"bottom center",my:"top right"}}),e("i[title]").tooltipster({position:{viewport:e(window),at:"top center",my:"bottom center"}}),e(".custom-pattern,#unpack").tooltipster("content",f("validating...")),e("#tv_download_dir").fileBrowser({title:f("Select TV Download Directory")}),e("#unpack_dir").fileBrowser({title:f("Select UNPACK Directory")})},typewatch:function(){var e=0;return function(t,n){clearTimeout(e),e=setTimeout(t,n)}},israr_supported:function(){e.get(n.srWebRoot+"/config/postProcessing/isRarSupported",(function(t){"supported"!==t&&(e("#unpack").tooltipster("content",f("Unrar Executable not found.")),e("#unpack").tooltipster("open"),e("#unpack").css("background-color","#FFFFDD"))}))},fill_examples:function(){var t=e("#naming_pattern").val(),i=e("#naming_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:3},(function(t){t?(e("#naming_example").text(t+".ext"),e("#naming_example_div").show()):e("#naming_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:3},(function(t){t?(e("#naming_example_multi").text(t+".ext"),e("#naming_example_multi_div").show()):e("#naming_example_multi_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},(function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))}))},fill_abd_examples:function(){var t=e("#naming_abd_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,abd:"True"},(function(t){t?(e("#naming_abd_example").text(t+".ext"),e("#naming_abd_example_div").show()):e("#naming_abd_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,abd:"True"},(function(t){"invalid"===t?(e("#naming_abd_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_abd_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFFFDD")):(e("#naming_abd_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_abd_pattern").tooltipster("close"),e("#naming_abd_pattern").css("background-color","#FFFFFF"))}))},fill_sports_examples:function(){var t=e("#naming_sports_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,sports:"True"},(function(t){t?(e("#naming_sports_example").text(t+".ext"),e("#naming_sports_example_div").show()):e("#naming_sports_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,sports:"True"},(function(t){"invalid"===t?(e("#naming_sports_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_sports_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFFFDD")):(e("#naming_sports_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_sports_pattern").tooltipster("close"),e("#naming_sports_pattern").css("background-color","#FFFFFF"))}))},fill_anime_examples:function(){var t=e("#naming_anime_pattern").val(),i=e("#naming_anime_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:a},(function(t){t?(e("#naming_example_anime").text(t+".ext"),e("#naming_example_anime_div").show()):e("#naming_example_anime_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:a},(function(t){t?(e("#naming_example_multi_anime").text(t+".ext"),e("#naming_example_multi_anime_div").show()):e("#naming_example_multi_anime_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},(function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))}))},setup_naming:function(){"Custom..."===e("#name_presets :selected").val()?e("#naming_custom").show():(e("#naming_custom").hide(),e("#naming_pattern").val(e("#name_presets :selected").attr("id"))),n.config.postprocessing.fill_examples()},setup_abd_naming:function(){"Custom..."===e("#name_abd_presets :selected").val()?e("#naming_abd_custom").show():(e("#naming_abd_custom").hide(),e("#naming_abd_pattern").val(e("#name_abd_presets :selected").attr("id"))),n.config.postprocessing.fill_abd_examples()},setup_sports_naming:function(){"Custom..."===e("#name_sports_presets :selected").val()?e("#naming_sports_custom").show():(e("#naming_sports_custom").hide(),e("#naming_sports_pattern").val(e("#name_sports_presets :selected").attr("id"))),n.config.postprocessing.fill_sports_examples()},setup_anime_naming:function(){"Custom..."===e("#name_anime_presets :selected").val()?e("#naming_anime_custom").show():(e("#naming_anime_custom").hide(),e("#naming_anime_pattern").val(e("#name_anime_presets :selected").attr("id"))),n.config.postprocessing.fill_anime_examples()},showHideMetadata:function(){e(".metadataDiv").each((function(){var t=e(this).attr("id");e("#metadataType :selected").val()===t?e(this).show():e(this).hide()}))},refreshMetadataConfig:function(t){var i=0,a="";e(".metadataDiv").each((function(){var t=e(this).attr("id"),n=[],o=e("#"+t+"_show_metadata").prop("checked"),r=e("#"+t+"_episode_metadata").prop("checked"),s=e("#"+t+"_fanart").prop("checked"),l=e("#"+t+"_poster").prop("checked"),c=e("#"+t+"_banner").prop("checked"),d=e("#"+t+"_episode_thumbnails").prop("checked"),u=e("#"+t+"_season_posters").prop("checked"),h=e("#"+t+"_season_banners").prop("checked"),f=e("#"+t+"_season_all_poster").prop("checked"),p=e("#"+t+"_season_all_banner").prop("checked"),m=e("#"+t+"_enabled").prop("checked");n.push(o?"1":"0"),n.push(r?"1":"0"),n.push(s?"1":"0"),n.push(l?"1":"0"),n.push(c?"1":"0"),n.push(d?"1":"0"),n.push(u?"1":"0"),n.push(h?"1":"0"),n.push(f?"1":"0"),n.push(p?"1":"0"),n.push(m?"1":"0");for(var g=0,b=0;b<n.length;b++)g+=parseInt(n[b]);g>i&&(i=g,a=t),e("#"+t+"_eg_show_metadata").attr("class",o?"enabled":"disabled"),e("#"+t+"_eg_episode_metadata").attr("class",r?"enabled":"disabled"),e("#"+t+"_eg_fanart").attr("class",s?"enabled":"disabled"),e("#"+t+"_eg_poster").attr("class",l?"enabled":"disabled"),e("#"+t+"_eg_banner").attr("class",c?"enabled":"disabled"),e("#"+t+"_eg_episode_thumbnails").attr("class",d?"enabled":"disabled"),e("#"+t+"_eg_season_posters").attr("class",u?"enabled":"disabled"),e("#"+t+"_eg_season_banners").attr("class",h?"enabled":"disabled"),e("#"+t+"_eg_season_all_poster").attr("class",f?"enabled":"disabled"),e("#"+t+"_eg_season_all_banner").attr("class",p?"enabled":"disabled"),e("#"+t+"_data").val(n.join("|"))})),""!==a&&t&&(e("#metadataType option[value="+a+"]").attr("selected","selected"),n.config.postprocessing.showHideMetadata())}},notifications:{init:function(){e("#testGrowl").click((function(){var t=e.trim(e("#growl_host").val()),i=e.trim(e("#growl_password").val());if(!t)return e("#testGrowl-result").html(f("Please fill out the necessary fields above.")),void e("#growl_host").addClass("warning");e("#growl_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testGrowl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testGrowl",{host:t,password:i}).done((function(t){e("#testGrowl-result").html(t),e("#testGrowl").prop("disabled",!1)}))})),e("#testProwl").click((function(){var t=e.trim(e("#prowl_apikey").val()),i=e("#prowl_priority").val();if(!t)return e("#testProwl-result").html(f("Please fill out the necessary fields above.")),void e("#prowl_apikey").addClass("warning");e("#prowl_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testProwl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testProwl",{prowl_apikey:t,prowl_priority:i}).done((function(t){e("#testProwl-result").html(t),e("#testProwl").prop("disabled",!1)}))})),e("#testKODI").click((function(){var t=e.trim(e("#kodi_host").val()),i=e.trim(e("#kodi_username").val()),a=e.trim(e("#kodi_password").val());if(!t)return e("#testKODI-result").html(f("Please fill out the necessary fields above.")),void e("#kodi_host").addClass("warning");e("#kodi_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testKODI-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testKODI",{host:t,username:i,password:a}).done((function(t){e("#testKODI-result").html(t),e("#testKODI").prop("disabled",!1)}))})),e("#testPMC").click((function(){var t=e.trim(e("#plex_host").val()),i=e.trim(e("#plex_client_username").val()),a=e.trim(e("#plex_client_password").val());if(!t)return e("#testPMC-result").html(f("Please fill out the necessary fields above.")),void e("#plex_host").addClass("warning");e("#plex_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMC-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMC",{host:t,username:i,password:a}).done((function(t){e("#testPMC-result").html(t),e("#testPMC").prop("disabled",!1)}))})),e("#testPMS").click((function(){var t=e.trim(e("#plex_server_host").val()),i=e.trim(e("#plex_username").val()),a=e.trim(e("#plex_password").val()),o=e.trim(e("#plex_server_token").val());if(!t)return e("#testPMS-result").html(f("Please fill out the necessary fields above.")),void e("#plex_server_host").addClass("warning");e("#plex_server_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMS-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMS",{host:t,username:i,password:a,plex_server_token:o}).done((function(t){e("#testPMS-result").html(t),e("#testPMS").prop("disabled",!1)}))})),e("#testEMBY").click((function(){var t=e("#emby_host").val(),i=e("#emby_apikey").val();if(!t||!i)return e("#testEMBY-result").html(f("Please fill out the necessary fields above.")),t?e("#emby_host").removeClass("warning"):e("#emby_host").addClass("warning"),void(i?e("#emby_apikey").removeClass("warning"):e("#emby_apikey").addClass("warning"));e("#emby_host,#emby_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testEMBY-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testEMBY",{host:t,emby_apikey:i}).done((function(t){e("#testEMBY-result").html(t),e("#testEMBY").prop("disabled",!1)}))})),e("#testBoxcar2").click((function(){var t=e.trim(e("#boxcar2_accesstoken").val());if(!t)return e("#testBoxcar2-result").html(f("Please fill out the necessary fields above.")),void e("#boxcar2_accesstoken").addClass("warning");e("#boxcar2_accesstoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testBoxcar2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testBoxcar2",{accesstoken:t}).done((function(t){e("#testBoxcar2-result").html(t),e("#testBoxcar2").prop("disabled",!1)}))})),e("#testPushover").click((function(){var t=e("#pushover_userkey").val(),i=e("#pushover_apikey").val();if(!t||!i)return e("#testPushover-result").html(f("Please fill out the necessary fields above.")),t?e("#pushover_userkey").removeClass("warning"):e("#pushover_userkey").addClass("warning"),void(i?e("#pushover_apikey").removeClass("warning"):e("#pushover_apikey").addClass("warning"));e("#pushover_userkey,#pushover_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushover-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushover",{userKey:t,apiKey:i}).done((function(t){e("#testPushover-result").html(t),e("#testPushover").prop("disabled",!1)}))})),e("#testLibnotify").click((function(){e("#testLibnotify-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testLibnotify",(function(t){e("#testLibnotify-result").html(t)}))})),e("#twitterStep1").click((function(){e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep1",(function(e){window.open(e)})).done((function(){e("#testTwitter-result").html(f("<b>Step1:</b> Confirm Authorization"))}))})),e("#twitterStep2").click((function(){var t=e.trim(e("#twitter_key").val());if(!t)return e("#testTwitter-result").html(f("Please fill out the necessary fields above.")),void e("#twitter_key").addClass("warning");e("#twitter_key").removeClass("warning"),e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep2",{key:t},(function(t){e("#testTwitter-result").html(t)}))})),e("#testTwitter").click((function(){e.get(n.srWebRoot+"/home/testTwitter",(function(t){e("#testTwitter-result").html(t)}))})),e("#testTwilio").on("click",(function(){var t=e.trim(e("#twilio_account_sid").val()),i=e.trim(e("#twilio_phone_sid").val()),a=e.trim(e("#twilio_auth_token").val()),o=e.trim(e("#twilio_to_number").val());e(this).prop("disabled",!0),e("#testTwilio-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTwilio",{account_sid:t,phone_sid:i,auth_token:a,to_number:o}).done((function(t){e("#testTwilio-result").html(t),e("#testTwilio").prop("disabled",!1)}))})),e("#testAlexa").on("click",(function(){e.get(n.srWebRoot+"/home/testAlexa",(function(t){e("#testAlexa-result").html(t)}))})),e("#testSlack").on("click",(function(){e.get(n.srWebRoot+"/home/testSlack",(function(t){e("#testSlack-result").html(t)}))})),e("#testDiscord").on("click",(function(){e.get(n.srWebRoot+"/home/testDiscord",(function(t){e("#testDiscord-result").html(t)}))})),e("#settingsNMJ").click((function(){if(!e("#nmj_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmj_host").focus();e("#testNMJ-result").html(n.loadingHTML);var t=e("#nmj_host").val();e.get(n.srWebRoot+"/home/settingsNMJ",{host:t},(function(t){null===t&&(e("#nmj_database").removeAttr("readonly"),e("#nmj_mount").removeAttr("readonly"));var n=e.parseJSON(t);e("#testNMJ-result").html(n.message),e("#nmj_database").val(n.database),e("#nmj_mount").val(n.mount),n.database?e("#nmj_database").attr("readonly",!0):e("#nmj_database").removeAttr("readonly"),n.mount?e("#nmj_mount").attr("readonly",!0):e("#nmj_mount").removeAttr("readonly")}))})),e("#testNMJ").click((function(){var t=e.trim(e("#nmj_host").val()),i=e("#nmj_database").val(),a=e("#nmj_mount").val();if(!t)return e("#testNMJ-result").html(f("Please fill out the necessary fields above.")),void e("#nmj_host").addClass("warning");e("#nmj_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJ-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJ",{host:t,database:i,mount:a}).done((function(t){e("#testNMJ-result").html(t),e("#testNMJ").prop("disabled",!1)}))})),e("#settingsNMJv2").click((function(){if(!e("#nmjv2_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmjv2_host").focus();e("#testNMJv2-result").html(n.loadingHTML);for(var t,i=e("#nmjv2_host").val(),a=document.getElementsByName("nmjv2_dbloc"),o=0;o<a.length;o++)if(a[o].checked){t=a[o].value;break}var r=e("#NMJv2db_instance").val();e.get(n.srWebRoot+"/home/settingsNMJv2",{host:i,dbloc:t,instance:r},(function(t){null===t&&e("#nmjv2_database").removeAttr("readonly");var n=e.parseJSON(t);e("#testNMJv2-result").html(n.message),e("#nmjv2_database").val(n.database),n.database?e("#nmjv2_database").attr("readonly",!0):e("#nmjv2_database").removeAttr("readonly")}))})),e("#testNMJv2").click((function(){var t=e.trim(e("#nmjv2_host").val());if(!t)return e("#testNMJv2-result").html(f("Please fill out the necessary fields above.")),void e("#nmjv2_host").addClass("warning");e("#nmjv2_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJv2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJv2",{host:t}).done((function(t){e("#testNMJv2-result").html(t),e("#testNMJv2").prop("disabled",!1)}))})),e("#testFreeMobile").click((function(){var t=e.trim(e("#freemobile_id").val()),i=e.trim(e("#freemobile_apikey").val());if(!t||!i)return e("#testFreeMobile-result").html(f("Please fill out the necessary fields above.")),t?e("#freemobile_id").removeClass("warning"):e("#freemobile_id").addClass("warning"),void(i?e("#freemobile_apikey").removeClass("warning"):e("#freemobile_apikey").addClass("warning"));e("#freemobile_id,#freemobile_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testFreeMobile-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testFreeMobile",{freemobile_id:t,freemobile_apikey:i}).done((function(t){e("#testFreeMobile-result").html(t),e("#testFreeMobile").prop("disabled",!1)}))})),e("#testTelegram").on("click",(function(){var t={};if(t.id=e.trim(e("#telegram_id").val()),t.apikey=e.trim(e("#telegram_apikey").val()),!t.id||!t.apikey)return e("#testTelegram-result").html(f("Please fill out the necessary fields above.")),t.id?e("#telegram_id").removeClass("warning"):e("#telegram_id").addClass("warning"),void(t.apikey?e("#telegram_apikey").removeClass("warning"):e("#telegram_apikey").addClass("warning"));e("#telegram_id,#telegram_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testTelegram-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTelegram",{telegram_id:t.id,telegram_apikey:t.apikey}).done((function(t){e("#testTelegram-result").html(t),e("#testTelegram").prop("disabled",!1)}))})),e("#testJoin").on("click",(function(){var t={};if(t.id=e.trim(e("#join_id").val()),t.apikey=e.trim(e("#join_apikey").val()),!t.id||!t.apikey)return e("#testJoin-result").html(f("Please fill out the necessary fields above.")),t.id?e("#join_id").removeClass("warning"):e("#join_id").addClass("warning"),void(t.apikey?e("#join_apikey").removeClass("warning"):e("#join_apikey").addClass("warning"));e("#join_id,#join_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testJoin-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testJoin",{join_id:t.id,join_apikey:t.apikey}).done((function(t){e("#testJoin-result").html(t),e("#testJoin").prop("disabled",!1)}))})),e("#TraktGetPin").click((function(){window.open(e("#trakt_pin_url").val(),"popUp","toolbar=no, scrollbars=no, resizable=no, top=200, left=200, width=650, height=550"),e("#trakt_pin").removeClass("d-none")})),e("#trakt_pin").on("keyup change",(function(){0!==e("#trakt_pin").val().length?(e("#TraktGetPin").addClass("d-none"),e("#authTrakt").removeClass("d-none")):(e("#TraktGetPin").removeClass("d-none"),e("#authTrakt").addClass("d-none"))})),e("#authTrakt").click((function(){0!==e("#trakt_pin").val().length&&e.get(n.srWebRoot+"/home/getTraktToken",{trakt_pin:e("#trakt_pin").val()}).done((function(t){e("#testTrakt-result").html(t),e("#authTrakt").addClass("d-none"),e("#trakt_pin").addClass("d-none"),e("#TraktGetPin").addClass("d-none")}))})),e("#testTrakt").click((function(){var t=e.trim(e("#trakt_username").val()),i=e.trim(e("#trakt_blacklist_name").val());return t?/\s/g.test(i)?(e("#testTrakt-result").html(f("Check blacklist name; the value need to be a trakt slug")),void e("#trakt_blacklist_name").addClass("warning")):(e("#trakt_username").removeClass("warning"),e("#trakt_blacklist_name").removeClass("warning"),e(this).prop("disabled",!0),e("#testTrakt-result").html(n.loadingHTML),void e.get(n.srWebRoot+"/home/testTrakt",{username:t,blacklist_name:i}).done((function(t){e("#testTrakt-result").html(t),e("#testTrakt").prop("disabled",!1)}))):(e("#testTrakt-result").html(f("Please fill out the necessary fields above.")),void(t?e("#trakt_username").removeClass("warning"):e("#trakt_username").addClass("warning")))})),e("#testEmail").click((function(){var t,i,a,o,r,s,l,c,d;(t=e("#testEmail-result")).html(n.loadingHTML),i=(i=e("#email_host").val()).length>0?i:null,a=(a=e("#email_port").val()).length>0?a:null,o=e("#email_tls").prop("checked"),r=(r=e("#email_from").val()).length>0?r:"root@localhost",s=e("#email_user").val().trim(),l=e("#email_password").val(),c="",null===i&&(c+='<li style="color: red;">'+f("You must specify an SMTP hostname!")+"</li>"),null===a?c+='<li style="color: red;">'+f("You must specify an SMTP port!")+"</li>":(null===a.match(/^\d+$/)||parseInt(a,10)>65535)&&(c+='<li style="color: red;">'+f("SMTP port must be between 0 and 65535!")+"</li>"),c.length>0?(c="<ol>"+c+"</ol>",t.html(c)):null===(d=prompt(f("Enter an email address to send the test to:"),null))||0===d.length||null===d.match(/.*@.*/)?t.html('<p style="color: red;">'+f("You must provide a recipient email address!")+"</p>"):e.get(n.srWebRoot+"/home/testEmail",{host:i,port:a,smtp_from:r,use_tls:o,user:s,pwd:l,to:d},(function(t){e("#testEmail-result").html(t)}))})),e("#testNMA").click((function(){var t=e.trim(e("#nma_api").val()),i=e("#nma_priority").val();if(!t)return e("#testNMA-result").html(f("Please fill out the necessary fields above.")),void e("#nma_api").addClass("warning");e("#nma_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMA-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMA",{nma_api:t,nma_priority:i}).done((function(t){e("#testNMA-result").html(t),e("#testNMA").prop("disabled",!1)}))})),e("#testPushalot").click((function(){var t=e.trim(e("#pushalot_authorizationtoken").val());if(!t)return e("#testPushalot-result").html(f("Please fill out the necessary fields above.")),void e("#pushalot_authorizationtoken").addClass("warning");e("#pushalot_authorizationtoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushalot-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushalot",{authorizationToken:t}).done((function(t){e("#testPushalot-result").html(t),e("#testPushalot").prop("disabled",!1)}))})),e("#testPushbullet").click((function(){var t=e.trim(e("#pushbullet_api").val());if(!t)return e("#testPushbullet-result").html(f("Please fill out the necessary fields above.")),void e("#pushbullet_api").addClass("warning");e("#pushbullet_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushbullet-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushbullet",{api:t}).done((function(t){e("#testPushbullet-result").html(t),e("#testPushbullet").prop("disabled",!1)}))})),e("#getPushbulletDevices").click((function(){n.config.notifications.get_pushbullet_devices(f("Device list updated. Please choose a device to push to."))})),e("#use_pushbullet").prop("checked")&&n.config.notifications.get_pushbullet_devices(),e("#email_show").on("change",(function(){var t=parseInt(e("#email_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(n){n._size>0&&e("#email_show_list").val(t>=0?n[t.toString()].list:"")}))})),e("#prowl_show").on("change",(function(){var t=parseInt(e("#prowl_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(n){n._size>0&&e("#prowl_show_list").val(t>=0?n[t.toString()].prowl_notify_list:"")}))})),n.config.notifications.load_show_notify_lists(),e("#email_show_save").click((function(){e.get(n.srWebRoot+"/home/saveShowNotifyList",{show:e("#email_show").val(),series_provider_id:e("#email_series_provider_id").val(),emails:e("#email_show_list").val()}).done((function(){n.config.notifications.load_show_notify_lists()}))})),e("#use_plex").click((function(){e(this).is(":checked")?e(".plexinfo").removeClass("d-none"):e(".plexinfo").addClass("d-none")})),e("#use_alexa").click((function(){e(this).is(":checked")?e(".alexa-info").removeClass("d-none"):e(".alexa-info").addClass("d-none")}))},get_pushbullet_devices:function(t){t&&e("#testPushbullet-result").html(n.loadingHTML);var i=e("#pushbullet_api").val();if(!i)return e("#testPushbullet-result").html(f("You didn't supply a Pushbullet api key")),e("#pushbullet_api").focus(),!1;e.get(n.srWebRoot+"/home/getPushbulletDevices",{api:i},(function(n){var i=e.parseJSON(n).devices,a=e("#pushbullet_device").val();e("#pushbullet_device_list").html("");for(var o=0;o<i.length;o++)!0===i[o].active&&(a===i[o].iden?e("#pushbullet_device_list").append('<option value="'+i[o].iden+'" selected>'+i[o].nickname+"</option>"):e("#pushbullet_device_list").append('<option value="'+i[o].iden+'">'+i[o].nickname+"</option>"));""===a?e("#pushbullet_device_list").prepend('<option value="" selected>All devices</option>'):e("#pushbullet_device_list").prepend('<option value="">All devices</option>'),t&&e("#testPushbullet-result").html(t)})),e("#pushbullet_device_list").change((function(){e("#pushbullet_device").val(e("#pushbullet_device_list").val()),e("#testPushbullet-result").html(f("Don't forget to save your new pushbullet settings."))}))},load_show_notify_lists:function(){e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(t){var n,i;if(0!==t._size){var a=[];for(i in t)Object.prototype.hasOwnProperty.call(t,i)&&"_"!==i.charAt(0)&&a.push(t[i]);var o=a.sort((function(e,t){return e.name<t.name?-1:e.name>t.name?1:0}));for(i in n='<option value="-1">-- Select --</option>',o)Object.prototype.hasOwnProperty.call(o,i)&&o[i].id&&o[i].name&&(n+='<option value="'+o[i].id+'">'+e("<div/>").text(o[i].name).html()+"</option>");e("#email_show").html(n),e("#email_show_list").val(""),e("#prowl_show").html(n),e("#prowl_show_list").val("")}}))}},backup_restore:function(){e("#Backup").click((function(){e("#Backup").attr("disabled",!0),e("#Backup-result").html(n.loadingHTML);var t=e("#backupDir").val();e.get(n.srWebRoot+"/config/backuprestore/backup",{backupDir:t}).done((function(t){e("#Backup-result").html(t),e("#Backup").attr("disabled",!1)}))})),e("#Restore").click((function(){e("#Restore").attr("disabled",!0),e("#Restore-result").html(n.loadingHTML),e.get(n.srWebRoot+"/config/backuprestore/restore",{backupFile:e("#backupFile").val(),restore_database:e("#restore_database").prop("checked"),restore_config:e("#restore_config").prop("checked"),restore_cache:e("#restore_cache").prop("checked")}).done((function(t){e("#Restore-result").html(t),e("#Restore").attr("disabled",!1)}))})),e("#backupDir").fileBrowser({title:f("Select backup folder to save to"),key:"backupPath"}),e("#backupFile").fileBrowser({title:f("Select backup files to restore"),key:"backupFile",includeFiles:1})},providers:{newznabProviders:[],torrentRssProviders:[],newznabProvidersCapabilities:[],init:function(){e(document).on("change",".newznab_key",(function(){var t=e(this).attr("id");t=t.substring(0,t.length-"_key".length);var i=e("#"+t+"_url").val(),a=e("#"+t+"_cat").val(),o=e(this).val();n.config.providers.updateNewznabProvider(t,i,o,a)})),e("#newznab_key,#newznab_url").change((function(){var t=e("#editANewznabProvider :selected").val();if("addNewznab"!==t){var i=e("#newznab_url").val(),a=e("#newznab_key").val(),o=e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(",");n.config.providers.updateNewznabProvider(t,i,a,o)}})),e("#torrentrss_url,#torrentrss_cookies,#torrentrss_titleTAG").change((function(){var t=e("#editATorrentRssProvider :selected").val();if("addTorrentRss"!==t){var i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val();n.config.providers.updateTorrentRssProvider(t,i,a,o)}})),e(document).on("change","#editAProvider",(function(){n.config.providers.showHideProviders()})),e("#editANewznabProvider").change((function(){n.config.providers.populateNewznabSection()})),e("#editATorrentRssProvider").change((function(){n.config.providers.populateTorrentRssSection()})),e(document).on("click",".provider_enabler",(function(){n.config.providers.refreshProviderList()})),e("#newznab_cat_update").click((function(){e("#newznab_cat option").each((function(){e(this).remove()}));var t=[];e("#newznab_cap option:selected").each((function(){var n=e(this).val();t.push({text:n,value:n})})),n.config.providers.replaceProviderOptions("#newznab_cat",t);var i=e("#editANewznabProvider :selected").val();if("addNewznab"!==i){var a=e("#newznab_url").val(),o=e("#newznab_key").val(),r=e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(",");e("#newznab_cat option:not([value])").remove(),n.config.providers.updateNewznabProvider(i,a,o,r)}})),e("#newznab_add").click((function(){var t=e.trim(e("#newznab_name").val()),i=e.trim(e("#newznab_url").val()),a=e.trim(e("#newznab_key").val()),o=e.trim(e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(","));if(t&&i&&a){var r={name:t};e.getJSON(n.srWebRoot+"/config/providers/canAddNewznabProvider",r,(function(e){void 0===e.error?(n.config.providers.addNewznabProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)}))}})),e(".newznab_delete").click((function(){var t=e("#editANewznabProvider :selected").val();n.config.providers.deleteNewznabProvider(t)})),e("#torrentrss_add").click((function(){var t=e("#torrentrss_name").val(),i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val(),r={name:t,url:i,cookies:a,titleTAG:o};e.getJSON(n.srWebRoot+"/config/providers/canAddTorrentRssProvider",r,(function(e){void 0===e.error?(n.config.providers.addTorrentRssProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)}))})),e(".torrentrss_delete").on("click",(function(){n.config.providers.deleteTorrentRssProvider(e("#editATorrentRssProvider :selected").val()),n.config.providers.refreshEditAProvider()})),e(document).on("change","[class='providerDiv_tip'] input",(function(){e("div .providerDiv [name="+e(this).attr("name")+"]").replaceWith(e(this).clone()),e("div .providerDiv [newznab_name="+e(this).attr("id")+"]").replaceWith(e(this).clone())})),e(document).on("change","[class='providerDiv_tip'] select",(function(){e(this).find("option").each((function(){e(this).is(":selected")?e(this).prop("defaultSelected",!0):e(this).prop("defaultSelected",!1)})),e("div .providerDiv [name="+e(this).attr("name")+"]").empty().replaceWith(e(this).clone())})),e(document).on("change",".seed_option",(function(){var t=e(this).attr("id").split("_")[0];n.config.providers.makeTorrentOptionString(t)})),e("#provider_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.providers.refreshProviderList()}}),e("#provider_order_list").disableSelection(),e("#editANewznabProvider").length&&n.config.providers.populateNewznabSection();for(var t=n.getMeta("NEWZNAB_PROVIDERS").split("!!!"),i=0;i<t.length;i++){var a=t[i];a.length>0&&n.config.providers.addNewznabProvider.apply(this,a.split("|"))}for(var o=n.getMeta("TORRENTRSS_PROVIDERS").split("!!!"),r=0;r<o.length;r++){var s=o[r];s.length>0&&n.config.providers.addTorrentRssProvider.apply(this,s.split("|"))}n.config.providers.showHideProviders()},showHideProviders:function(){e(".providerDiv").each((function(){var t=e(this).attr("id");e("#editAProvider :selected").val()+"Div"===t?e(this).show():e(this).hide()}))},findProvider:function(e,t){var n=!1;return e.forEach((function(e){e.name===t&&(n=!0)})),n},getNewznabCategories:function(t,i){var a=i[0],o=i[1],r=i[2];if(a&&o&&r){var s={url:o,name:a,key:r};e(".updating_categories").wrapInner("<span>"+n.loadingHTML+" Updating Categories ...</span>"),e.getJSON(n.srWebRoot+"/config/providers/getNewznabCategories",s,(function(e){n.config.providers.updateNewznabCaps(e,i)})).always((function(){e(".updating_categories").empty()}))}},addNewznabProvider:function(t,i,a,o,r,s,l){(a=e.trim(a))&&(/^https?:\/\//i.test(a)||(a="http://"+a),null===a.match("/$")&&(a+="/"),n.config.providers.newznabProviders[t]=[s,[i,a,o,r]],"true"!==s&&(e("#editANewznabProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateNewznabSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<div class="list-group-item list-group-item-action list-group-item-dark rounded mb-1 p-2" id="'+t+'"><div class="align-middle"><label class="form-check-label" for="enable_'+t+'"><input type="checkbox" id="enable_'+t+'" class="provider_enabler text-left" checked><a href="'+n.anonURL+a+'" class="text-right" target="_new"> <i class="sickrage-search-providers sickrage-search-providers-newznab"></i></a> <span class="font-weight-bold">'+i+'</span></label><span class="float-right d-inline-block"><i class="fas fa-lock text-danger"></i></span></div>'),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList())},updateNewznabProvider:function(e,t,i,a){n.config.providers.newznabProviders[e][1][1]=t,n.config.providers.newznabProviders[e][1][2]=i,n.config.providers.newznabProviders[e][1][3]=a,n.config.providers.populateNewznabSection(),n.config.providers.refreshProviderList()},deleteNewznabProvider:function(t){e("#editANewznabProvider option[value='"+t+"']").remove(),e(".list-group #"+t).remove(),n.config.providers.populateNewznabSection(),delete n.config.providers.newznabProviders[t],n.config.providers.refreshProviderList()},populateNewznabSection:function(){var t=e("#editANewznabProvider :selected").val(),i="",a="",o="";"addNewznab"===t?(i=["","",""],a="false",e("#newznab_add_div").show(),e("#newznab_update_div").hide(),e("#newznab_cat").attr("disabled","disabled"),e("#newznab_cap").attr("disabled","disabled"),e("#newznab_cat_update").attr("disabled","disabled"),e("#newznabcapdiv").hide(),e("#newznab_cat option").each((function(){e(this).remove()})),e("#newznab_cap option").each((function(){e(this).remove()}))):(i=n.config.providers.newznabProviders[t][1],a=n.config.providers.newznabProviders[t][0],e("#newznab_add_div").hide(),e("#newznab_update_div").show(),e("#newznab_cat").removeAttr("disabled"),e("#newznab_cap").removeAttr("disabled"),e("#newznab_cat_update").removeAttr("disabled"),e("#newznabcapdiv").show()),e("#newznab_name").val(i[0]),e("#newznab_url").val(i[1]),e("#newznab_key").val(i[2]),o="string"==typeof i[3]?i[3].split(","):i[3];var r=[];o&&(o.forEach((function(e){""!==e&&r.push({text:e,value:e})})),n.config.providers.replaceProviderOptions("#newznab_cat",r)),"addNewznab"===t?(e("#newznab_name").removeAttr("disabled"),e("#newznab_url").removeAttr("disabled")):(e("#newznab_name").attr("disabled","disabled"),"true"===a?(e("#newznab_url").attr("disabled","disabled"),e("#newznab_delete").attr("disabled","disabled")):(e("#newznab_url").removeAttr("disabled"),e("#newznab_delete").removeAttr("disabled"),i[0]&&i[1]&&i[2]&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,i[0])&&n.config.providers.getNewznabCategories(a,i),n.config.providers.updateNewznabCaps(null,i)))},updateNewznabCaps:function(e,t){e&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,t[0])&&n.config.providers.newznabProvidersCapabilities.push({name:t[0],categories:e.tv_categories}),t[0]&&n.config.providers.newznabProvidersCapabilities.forEach((function(e){if(e.name&&e.name===t[0]&&e.categories instanceof Array){var i=[];e.categories.forEach((function(e){e.id&&e.name&&i.push({value:e.id,text:e.name+"("+e.id+")"})})),n.config.providers.replaceProviderOptions("#newznab_cap",i)}}))},addTorrentRssProvider:function(t,i,a,o,r,s,l){n.config.providers.torrentRssProviders[t]=[i,a,o,r],"true"!==s&&(e("#editATorrentRssProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateTorrentRssSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<div class="list-group-item list-group-item-action list-group-item-secondary rounded mb-1 p-2" id="'+t+'"><div class="align-middle"><label class="form-check-label" for="enable_'+t+'"><input type="checkbox" id="enable_'+t+'" class="provider_enabler text-left" checked><a href="'+n.anonURL+a+'" class="text-right" target="_new"> <i class="sickrage-search-providers sickrage-search-providers-torrentrss"></i></a> <span class="font-weight-bold">'+i+'</span></label><span class="float-right d-inline-block"><i class="fas fa-lock text-danger"></i></span></div>'),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList()},updateTorrentRssProvider:function(e,t,i,a){n.config.providers.torrentRssProviders[e][1]=t,n.config.providers.torrentRssProviders[e][2]=i,n.config.providers.torrentRssProviders[e][3]=a,n.config.providers.populateTorrentRssSection(),n.config.providers.refreshProviderList()},deleteTorrentRssProvider:function(t){e("#editATorrentRssProvider option[value='"+t+"']").remove(),e(".list-group #"+t).remove(),n.config.providers.populateTorrentRssSection(),delete n.config.providers.torrentRssProviders[t],n.config.providers.refreshProviderList()},populateTorrentRssSection:function(){var t=e("#editATorrentRssProvider :selected").val(),i="";"addTorrentRss"===t?(i=["","","","title"],e("#torrentrss_add_div").show(),e("#torrentrss_update_div").hide()):(i=n.config.providers.torrentRssProviders[t],e("#torrentrss_add_div").hide(),e("#torrentrss_update_div").show()),e("#torrentrss_name").val(i[0]),e("#torrentrss_url").val(i[1]),e("#torrentrss_cookies").val(i[2]),e("#torrentrss_titleTAG").val(i[3]),"addTorrentRss"===t?(e("#torrentrss_name").removeAttr("disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled")):(e("#torrentrss_name").attr("disabled","disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled"),e("#torrentrss_delete").removeAttr("disabled"))},makeTorrentOptionString:function(t){var n=e(".providerDiv_tip #"+t+"_seed_ratio").prop("value"),i=e(".providerDiv_tip #"+t+"_seed_time").prop("value"),a=e(".providerDiv_tip #"+t+"_process_method").prop("value");e(".providerDiv_tip #"+t+"_option_string").val([n,i,a].join("|"))},refreshProviderList:function(){var t=e("#provider_order_list").sortable("toArray"),i=[],a=[];for(var o in e.each(t,(function(t,n){var a=+e("#enable_"+n).prop("checked")?"1":"0";i.push(n+":"+a)})),n.config.providers.newznabProviders)Object.prototype.hasOwnProperty.call(n.config.providers.newznabProviders,o)&&a.push("newznab|"+n.config.providers.newznabProviders[o][1].join("|"));for(var r in n.config.providers.torrentRssProviders)Object.prototype.hasOwnProperty.call(n.config.providers.torrentRssProviders,r)&&a.push("torrentrss|"+n.config.providers.torrentRssProviders[r].join("|"));e("#provider_strings").val(a.join("!!!")),e("#provider_order").val(i.join("!!!")),n.config.providers.refreshEditAProvider()},refreshEditAProvider:function(){e("#editAProvider").empty();var t=e("#provider_order_list").sortable("toArray"),i=[];if(e.each(t,(function(t,n){e("#enable_"+n).prop("checked")&&i.push(n)})),i.length>0){e("<select>").prop("id","editAProvider").addClass("form-control input-sm").appendTo("#provider-list");for(var a=0;a<i.length;a++){var o=i[a];e("#editAProvider").append(e("<option>").prop("value",o).text(e.trim(e("#"+o).text()).replace(/\s\*$/,"").replace(/\s\*\*$/,"")))}}else document.getElementsByClassName("component-desc")[0].innerHTML=f("No providers available to configure.");n.config.providers.showHideProviders()},replaceProviderOptions:function(t,n){e(t).empty(),e.each(n,(function(n,i){e(t).append(e("<option></option>").attr("value",i.value).text(i.text))}))}}},manage:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/manage.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},episode_statuses:function(){e(".allCheck").click((function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))})),e(".get_more_eps").click((function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),r=e(this).attr("value");o?"collapse"===r.toLowerCase()?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"expand"===r.toLowerCase()&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showEpisodeStatuses",{series_id:t,whichStatus:e("#oldStatus").val()},(function(n){e.each(n,(function(n,o){e.each(o,(function(o,r){a.after(function(t,n,i,a,o){var r="";return r+=' <tr class="text-dark '+e("#row_class").val()+" show-"+t+'">',r+='  <td align="center"><input type="checkbox" class="'+t+'-epcheck" name="toChange" value="'+t+"-"+n+"x"+i+'"'+(o?" checked":"")+"></td>",r+="  <td>"+n+"x"+i+"</td>",r+='  <td style="width: 100%">'+a+"</td>",r+=" </tr>"}(t,n,o,r,i))}))}))})),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))})),e(".selectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!0)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!0)}))})),e(".unselectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!1)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!1)}))}))},mass_update:function(){e("#massUpdateTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[1,0]],textExtraction:{3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span").text().toLowerCase()},6:function(t){return e(t).find("span").text().toLowerCase()},7:function(t){return e(t).find("span").text().toLowerCase()},8:function(t){return e(t).find("span").text().toLowerCase()},9:function(t){return e(t).find("span").text().toLowerCase()},10:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:!1},1:{sorter:"showNames"},2:{sorter:"showDirs"},3:{sorter:"quality"},4:{sorter:"sports"},5:{sorter:"scene"},6:{sorter:"anime"},7:{sorter:"flatten_folders"},8:{sorter:"skip_downloaded"},9:{sorter:"paused"},10:{sorter:"subtitle"},11:{sorter:"default_ep_status"},12:{sorter:"status"}}}),e("#submitMassEdit").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&(window.location=n.srWebRoot+"/manage/massEdit?toEdit="+t.join("|"))})),e("#submitMassUpdate").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toUpdate:t.join("|")})})),e("#submitMassRescan").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRefresh:t.join("|")})})),e("#submitMassRename").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRename:t.join("|")})})),e("#submitMassDelete").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.confirm({theme:"dark",title:f("Mass Delete"),content:f("You have selected to delete "+t.length+" show(s).  Are you sure you wish to continue? All files will be removed from your system."),buttons:{confirm:function(){e.post(n.srWebRoot+"/manage/massUpdate",{toDelete:t.join("|")})},cancel:{action:function(){}}}})})),e("#submitMassRemove").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRemove:t.join("|")})})),e("#submitMassSubtitle").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toSubtitle:t.join("|")})})),e(".bulkCheck").on("click",(function(){e(".showCheck:visible").each((function(){e(this).disabled||e(this).prop("checked",!this.checked)}))})),e("#checkboxControls input").change((function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)})),e("#checkboxControls input").each((function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each((function(){t?e(this).show():e(this).hide()}))}))},mass_edit:{init:function(){e(".new_root_dir").change((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#display_new_root_dir_"+t).html("<b>"+e(this).val()+"</b>")})),e(".edit_root_dir").click((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id")),i=e("#new_root_dir_"+t).val();e(this).nFileBrowser(n.manage.mass_edit.editRootDir,{initialDir:i,whichId:t})})),e(".delete_root_dir").click((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#new_root_dir_"+t).val(null),e("#display_new_root_dir_"+t).html("<b>"+f("DELETED")+"</b>")}))},findDirIndex:function(e){var t=e.split("_");return t[t.length-1]},editRootDir:function(t,n){e("#new_root_dir_"+n.whichId).val(t),e("#new_root_dir_"+n.whichId).change()}},backlog_overview:function(){e("#pickShow").change((function(){var t=e(this).val();t&&e("html,body").animate({scrollTop:e("#show-"+t).offset().top-25},"slow")}))},failed_downloads:function(){e("#failedTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[0,0]],headers:{3:{sorter:!1}}}),e("#limit").change((function(t){window.location.href=n.srWebRoot+"/manage/failedDownloads/?limit="+e(t.currentTarget).val()})),e("#submitMassRemove").on("click",(function(){var t=[];if(e(".removeCheck").each((function(){!0===this.checked&&t.push(e(this).attr("id").split("-")[1])})),0===t.length)return!1;e.post(n.srWebRoot+"/manage/failedDownloads","toRemove="+t.join("|"),(function(){location.reload(!0)}))})),e(".bulkCheck").on("click",(function(){var t=this,n=e(t).attr("id");e("."+n+":visible").each((function(){e(this).prop("checked",t.checked)}))}))},subtitles_missed:function(){e(".allCheck").click((function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))})),e(".get_more_eps").click((function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),r=e(this).attr("value");o?"Collapse"===r?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"Expand"===r&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showSubtitleMissed",{series_id:t,whichSubs:e("#selectSubLang").val()},(function(n){e.each(n,(function(n,o){e.each(o,(function(e,o){a.after(function(e,t,n,i,a,o){var r="";return r+=' <tr class="good show-'+e+'">',r+='  <td align="center"><input type="checkbox" class="'+e+'-epcheck" name="toDownload" value="'+e+"-"+t+"x"+n+'"'+(o=o?" checked":"")+"></td>",r+='  <td style="width: 1%;">'+t+"x"+n+"</td>",r+="  <td>"+i+"</td>",r+=" </tr>"}(t,n,e,o.name,o.subtitles,i))}))}))})),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))})),e(".selectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!0)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!0)}))})),e(".unselectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!1)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!1)}))}))}},logs:{init:function(){},view:function(){e("#minLevel,#logFilter,#logSearch").on("change keyup",u.default.debounce((function(){e("#logSearch").val().length>0&&(e('#logFilter option[value="<NONE>"]').prop("selected",!0),e("#minLevel option[value=5]").prop("selected",!0)),e("#minLevel").prop("disabled",!0),e("#logFilter").prop("disabled",!0),document.body.style.cursor="wait";var t=n.srWebRoot+"/logs/view/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val();e.get(t,(function(n){history.pushState("data","",t),e("#loglines").html(e(n).find("#loglines").html()),e("#minLevel").prop("disabled",!1),e("#logFilter").prop("disabled",!1),document.body.style.cursor="default"}))}),500)),setInterval((function(){e.getJSON(n.srWebRoot+"/logs/view/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val()+"&toJson=1",(function(t){e("#loglines").html(t.logs)}))}),1e3*parseInt(e("select[name=refreshInterval]").val()))}}};({init:function(){var t=document.body,n=t.getAttribute("data-controller"),i=t.getAttribute("data-action");this.exec("common"),this.exec(n),this.exec(n,i),e(".loading-spinner").hide(),e(".main-container").removeClass("d-none")},exec:function(e,i){i=void 0===i?"init":i,""!==e&&n[e]&&n[e][i]&&{object:n[e][i].init,function:n[e][i]}[t(n[e][i])]()}}).init()}))}).call(this,n(1))},function(e,t,n){
+ */a=[n(1),n(2)],void 0===(o="function"==typeof(i=function(e){return e.fn.extend({uniqueId:(t=0,function(){return this.each((function(){this.id||(this.id="ui-id-"+ ++t)}))}),removeUniqueId:function(){return this.each((function(){/^ui-id-\d+$/.test(this.id)&&e(this).removeAttr("id")}))}});var t})?i.apply(t,a):i)||(e.exports=o)},function(e,t,n){(function(e){var i=void 0!==e&&e||"undefined"!=typeof self&&self||window,a=Function.prototype.apply;function o(e,t){this._id=e,this._clearFn=t}t.setTimeout=function(){return new o(a.call(setTimeout,i,arguments),clearTimeout)},t.setInterval=function(){return new o(a.call(setInterval,i,arguments),clearInterval)},t.clearTimeout=t.clearInterval=function(e){e&&e.close()},o.prototype.unref=o.prototype.ref=function(){},o.prototype.close=function(){this._clearFn.call(i,this._id)},t.enroll=function(e,t){clearTimeout(e._idleTimeoutId),e._idleTimeout=t},t.unenroll=function(e){clearTimeout(e._idleTimeoutId),e._idleTimeout=-1},t._unrefActive=t.active=function(e){clearTimeout(e._idleTimeoutId);var t=e._idleTimeout;t>=0&&(e._idleTimeoutId=setTimeout((function(){e._onTimeout&&e._onTimeout()}),t))},n(97),t.setImmediate="undefined"!=typeof self&&self.setImmediate||void 0!==e&&e.setImmediate||this&&this.setImmediate,t.clearImmediate="undefined"!=typeof self&&self.clearImmediate||void 0!==e&&e.clearImmediate||this&&this.clearImmediate}).call(this,n(8))},function(e,t){var n={}.toString;e.exports=Array.isArray||function(e){return"[object Array]"==n.call(e)}},function(e){e.exports=JSON.parse('[["a140","",62],["a180","",32],["a240","",62],["a280","",32],["a2ab","",5],["a2e3","€"],["a2ef",""],["a2fd",""],["a340","",62],["a380","",31,"　"],["a440","",62],["a480","",32],["a4f4","",10],["a540","",62],["a580","",32],["a5f7","",7],["a640","",62],["a680","",32],["a6b9","",7],["a6d9","",6],["a6ec",""],["a6f3",""],["a6f6","",8],["a740","",62],["a780","",32],["a7c2","",14],["a7f2","",12],["a896","",10],["a8bc","ḿ"],["a8bf","ǹ"],["a8c1",""],["a8ea","",20],["a958",""],["a95b",""],["a95d",""],["a989","〾⿰",11],["a997","",12],["a9f0","",14],["aaa1","",93],["aba1","",93],["aca1","",93],["ada1","",93],["aea1","",93],["afa1","",93],["d7fa","",4],["f8a1","",93],["f9a1","",93],["faa1","",93],["fba1","",93],["fca1","",93],["fda1","",93],["fe50","⺁⺄㑳㑇⺈⺋㖞㘚㘎⺌⺗㥮㤘㧏㧟㩳㧐㭎㱮㳠⺧⺪䁖䅟⺮䌷⺳⺶⺷䎱䎬⺻䏝䓖䙡䙌"],["fe80","䜣䜩䝼䞍⻊䥇䥺䥽䦂䦃䦅䦆䦟䦛䦷䦶䲣䲟䲠䲡䱷䲢䴓",6,"䶮",93],["8135f437",""]]')},function(e){e.exports=JSON.parse('[["0","\\u0000",127],["a140","　，、。．‧；：？！︰…‥﹐﹑﹒·﹔﹕﹖﹗｜–︱—︳╴︴﹏（）︵︶｛｝︷︸〔〕︹︺【】︻︼《》︽︾〈〉︿﹀「」﹁﹂『』﹃﹄﹙﹚"],["a1a1","﹛﹜﹝﹞‘’“”〝〞‵′＃＆＊※§〃○●△▲◎☆★◇◆□■▽▼㊣℅¯￣＿ˍ﹉﹊﹍﹎﹋﹌﹟﹠﹡＋－×÷±√＜＞＝≦≧≠∞≒≡﹢",4,"～∩∪⊥∠∟⊿㏒㏑∫∮∵∴♀♂⊕⊙↑↓←→↖↗↙↘∥∣／"],["a240","＼∕﹨＄￥〒￠￡％＠℃℉﹩﹪﹫㏕㎜㎝㎞㏎㎡㎎㎏㏄°兙兛兞兝兡兣嗧瓩糎▁",7,"▏▎▍▌▋▊▉┼┴┬┤├▔─│▕┌┐└┘╭"],["a2a1","╮╰╯═╞╪╡◢◣◥◤╱╲╳０",9,"Ⅰ",9,"〡",8,"十卄卅Ａ",25,"ａ",21],["a340","ｗｘｙｚΑ",16,"Σ",6,"α",16,"σ",6,"ㄅ",10],["a3a1","ㄐ",25,"˙ˉˊˇˋ"],["a3e1","€"],["a440","一乙丁七乃九了二人儿入八几刀刁力匕十卜又三下丈上丫丸凡久么也乞于亡兀刃勺千叉口土士夕大女子孑孓寸小尢尸山川工己已巳巾干廾弋弓才"],["a4a1","丑丐不中丰丹之尹予云井互五亢仁什仃仆仇仍今介仄元允內六兮公冗凶分切刈勻勾勿化匹午升卅卞厄友及反壬天夫太夭孔少尤尺屯巴幻廿弔引心戈戶手扎支文斗斤方日曰月木欠止歹毋比毛氏水火爪父爻片牙牛犬王丙"],["a540","世丕且丘主乍乏乎以付仔仕他仗代令仙仞充兄冉冊冬凹出凸刊加功包匆北匝仟半卉卡占卯卮去可古右召叮叩叨叼司叵叫另只史叱台句叭叻四囚外"],["a5a1","央失奴奶孕它尼巨巧左市布平幼弁弘弗必戊打扔扒扑斥旦朮本未末札正母民氐永汁汀氾犯玄玉瓜瓦甘生用甩田由甲申疋白皮皿目矛矢石示禾穴立丞丟乒乓乩亙交亦亥仿伉伙伊伕伍伐休伏仲件任仰仳份企伋光兇兆先全"],["a640","共再冰列刑划刎刖劣匈匡匠印危吉吏同吊吐吁吋各向名合吃后吆吒因回囝圳地在圭圬圯圩夙多夷夸妄奸妃好她如妁字存宇守宅安寺尖屹州帆并年"],["a6a1","式弛忙忖戎戌戍成扣扛托收早旨旬旭曲曳有朽朴朱朵次此死氖汝汗汙江池汐汕污汛汍汎灰牟牝百竹米糸缶羊羽老考而耒耳聿肉肋肌臣自至臼舌舛舟艮色艾虫血行衣西阡串亨位住佇佗佞伴佛何估佐佑伽伺伸佃佔似但佣"],["a740","作你伯低伶余佝佈佚兌克免兵冶冷別判利刪刨劫助努劬匣即卵吝吭吞吾否呎吧呆呃吳呈呂君吩告吹吻吸吮吵吶吠吼呀吱含吟听囪困囤囫坊坑址坍"],["a7a1","均坎圾坐坏圻壯夾妝妒妨妞妣妙妖妍妤妓妊妥孝孜孚孛完宋宏尬局屁尿尾岐岑岔岌巫希序庇床廷弄弟彤形彷役忘忌志忍忱快忸忪戒我抄抗抖技扶抉扭把扼找批扳抒扯折扮投抓抑抆改攻攸旱更束李杏材村杜杖杞杉杆杠"],["a840","杓杗步每求汞沙沁沈沉沅沛汪決沐汰沌汨沖沒汽沃汲汾汴沆汶沍沔沘沂灶灼災灸牢牡牠狄狂玖甬甫男甸皂盯矣私秀禿究系罕肖肓肝肘肛肚育良芒"],["a8a1","芋芍見角言谷豆豕貝赤走足身車辛辰迂迆迅迄巡邑邢邪邦那酉釆里防阮阱阪阬並乖乳事些亞享京佯依侍佳使佬供例來侃佰併侈佩佻侖佾侏侑佺兔兒兕兩具其典冽函刻券刷刺到刮制剁劾劻卒協卓卑卦卷卸卹取叔受味呵"],["a940","咖呸咕咀呻呷咄咒咆呼咐呱呶和咚呢周咋命咎固垃坷坪坩坡坦坤坼夜奉奇奈奄奔妾妻委妹妮姑姆姐姍始姓姊妯妳姒姅孟孤季宗定官宜宙宛尚屈居"],["a9a1","屆岷岡岸岩岫岱岳帘帚帖帕帛帑幸庚店府底庖延弦弧弩往征彿彼忝忠忽念忿怏怔怯怵怖怪怕怡性怩怫怛或戕房戾所承拉拌拄抿拂抹拒招披拓拔拋拈抨抽押拐拙拇拍抵拚抱拘拖拗拆抬拎放斧於旺昔易昌昆昂明昀昏昕昊"],["aa40","昇服朋杭枋枕東果杳杷枇枝林杯杰板枉松析杵枚枓杼杪杲欣武歧歿氓氛泣注泳沱泌泥河沽沾沼波沫法泓沸泄油況沮泗泅泱沿治泡泛泊沬泯泜泖泠"],["aaa1","炕炎炒炊炙爬爭爸版牧物狀狎狙狗狐玩玨玟玫玥甽疝疙疚的盂盲直知矽社祀祁秉秈空穹竺糾罔羌羋者肺肥肢肱股肫肩肴肪肯臥臾舍芳芝芙芭芽芟芹花芬芥芯芸芣芰芾芷虎虱初表軋迎返近邵邸邱邶采金長門阜陀阿阻附"],["ab40","陂隹雨青非亟亭亮信侵侯便俠俑俏保促侶俘俟俊俗侮俐俄係俚俎俞侷兗冒冑冠剎剃削前剌剋則勇勉勃勁匍南卻厚叛咬哀咨哎哉咸咦咳哇哂咽咪品"],["aba1","哄哈咯咫咱咻咩咧咿囿垂型垠垣垢城垮垓奕契奏奎奐姜姘姿姣姨娃姥姪姚姦威姻孩宣宦室客宥封屎屏屍屋峙峒巷帝帥帟幽庠度建弈弭彥很待徊律徇後徉怒思怠急怎怨恍恰恨恢恆恃恬恫恪恤扁拜挖按拼拭持拮拽指拱拷"],["ac40","拯括拾拴挑挂政故斫施既春昭映昧是星昨昱昤曷柿染柱柔某柬架枯柵柩柯柄柑枴柚查枸柏柞柳枰柙柢柝柒歪殃殆段毒毗氟泉洋洲洪流津洌洱洞洗"],["aca1","活洽派洶洛泵洹洧洸洩洮洵洎洫炫為炳炬炯炭炸炮炤爰牲牯牴狩狠狡玷珊玻玲珍珀玳甚甭畏界畎畋疫疤疥疢疣癸皆皇皈盈盆盃盅省盹相眉看盾盼眇矜砂研砌砍祆祉祈祇禹禺科秒秋穿突竿竽籽紂紅紀紉紇約紆缸美羿耄"],["ad40","耐耍耑耶胖胥胚胃胄背胡胛胎胞胤胝致舢苧范茅苣苛苦茄若茂茉苒苗英茁苜苔苑苞苓苟苯茆虐虹虻虺衍衫要觔計訂訃貞負赴赳趴軍軌述迦迢迪迥"],["ada1","迭迫迤迨郊郎郁郃酋酊重閂限陋陌降面革韋韭音頁風飛食首香乘亳倌倍倣俯倦倥俸倩倖倆值借倚倒們俺倀倔倨俱倡個候倘俳修倭倪俾倫倉兼冤冥冢凍凌准凋剖剜剔剛剝匪卿原厝叟哨唐唁唷哼哥哲唆哺唔哩哭員唉哮哪"],["ae40","哦唧唇哽唏圃圄埂埔埋埃堉夏套奘奚娑娘娜娟娛娓姬娠娣娩娥娌娉孫屘宰害家宴宮宵容宸射屑展屐峭峽峻峪峨峰島崁峴差席師庫庭座弱徒徑徐恙"],["aea1","恣恥恐恕恭恩息悄悟悚悍悔悌悅悖扇拳挈拿捎挾振捕捂捆捏捉挺捐挽挪挫挨捍捌效敉料旁旅時晉晏晃晒晌晅晁書朔朕朗校核案框桓根桂桔栩梳栗桌桑栽柴桐桀格桃株桅栓栘桁殊殉殷氣氧氨氦氤泰浪涕消涇浦浸海浙涓"],["af40","浬涉浮浚浴浩涌涊浹涅浥涔烊烘烤烙烈烏爹特狼狹狽狸狷玆班琉珮珠珪珞畔畝畜畚留疾病症疲疳疽疼疹痂疸皋皰益盍盎眩真眠眨矩砰砧砸砝破砷"],["afa1","砥砭砠砟砲祕祐祠祟祖神祝祗祚秤秣秧租秦秩秘窄窈站笆笑粉紡紗紋紊素索純紐紕級紜納紙紛缺罟羔翅翁耆耘耕耙耗耽耿胱脂胰脅胭胴脆胸胳脈能脊胼胯臭臬舀舐航舫舨般芻茫荒荔荊茸荐草茵茴荏茲茹茶茗荀茱茨荃"],["b040","虔蚊蚪蚓蚤蚩蚌蚣蚜衰衷袁袂衽衹記訐討訌訕訊託訓訖訏訑豈豺豹財貢起躬軒軔軏辱送逆迷退迺迴逃追逅迸邕郡郝郢酒配酌釘針釗釜釙閃院陣陡"],["b0a1","陛陝除陘陞隻飢馬骨高鬥鬲鬼乾偺偽停假偃偌做偉健偶偎偕偵側偷偏倏偯偭兜冕凰剪副勒務勘動匐匏匙匿區匾參曼商啪啦啄啞啡啃啊唱啖問啕唯啤唸售啜唬啣唳啁啗圈國圉域堅堊堆埠埤基堂堵執培夠奢娶婁婉婦婪婀"],["b140","娼婢婚婆婊孰寇寅寄寂宿密尉專將屠屜屝崇崆崎崛崖崢崑崩崔崙崤崧崗巢常帶帳帷康庸庶庵庾張強彗彬彩彫得徙從徘御徠徜恿患悉悠您惋悴惦悽"],["b1a1","情悻悵惜悼惘惕惆惟悸惚惇戚戛扈掠控捲掖探接捷捧掘措捱掩掉掃掛捫推掄授掙採掬排掏掀捻捩捨捺敝敖救教敗啟敏敘敕敔斜斛斬族旋旌旎晝晚晤晨晦晞曹勗望梁梯梢梓梵桿桶梱梧梗械梃棄梭梆梅梔條梨梟梡梂欲殺"],["b240","毫毬氫涎涼淳淙液淡淌淤添淺清淇淋涯淑涮淞淹涸混淵淅淒渚涵淚淫淘淪深淮淨淆淄涪淬涿淦烹焉焊烽烯爽牽犁猜猛猖猓猙率琅琊球理現琍瓠瓶"],["b2a1","瓷甜產略畦畢異疏痔痕疵痊痍皎盔盒盛眷眾眼眶眸眺硫硃硎祥票祭移窒窕笠笨笛第符笙笞笮粒粗粕絆絃統紮紹紼絀細紳組累終紲紱缽羞羚翌翎習耜聊聆脯脖脣脫脩脰脤舂舵舷舶船莎莞莘荸莢莖莽莫莒莊莓莉莠荷荻荼"],["b340","莆莧處彪蛇蛀蚶蛄蚵蛆蛋蚱蚯蛉術袞袈被袒袖袍袋覓規訪訝訣訥許設訟訛訢豉豚販責貫貨貪貧赧赦趾趺軛軟這逍通逗連速逝逐逕逞造透逢逖逛途"],["b3a1","部郭都酗野釵釦釣釧釭釩閉陪陵陳陸陰陴陶陷陬雀雪雩章竟頂頃魚鳥鹵鹿麥麻傢傍傅備傑傀傖傘傚最凱割剴創剩勞勝勛博厥啻喀喧啼喊喝喘喂喜喪喔喇喋喃喳單喟唾喲喚喻喬喱啾喉喫喙圍堯堪場堤堰報堡堝堠壹壺奠"],["b440","婷媚婿媒媛媧孳孱寒富寓寐尊尋就嵌嵐崴嵇巽幅帽幀幃幾廊廁廂廄弼彭復循徨惑惡悲悶惠愜愣惺愕惰惻惴慨惱愎惶愉愀愒戟扉掣掌描揀揩揉揆揍"],["b4a1","插揣提握揖揭揮捶援揪換摒揚揹敞敦敢散斑斐斯普晰晴晶景暑智晾晷曾替期朝棺棕棠棘棗椅棟棵森棧棹棒棲棣棋棍植椒椎棉棚楮棻款欺欽殘殖殼毯氮氯氬港游湔渡渲湧湊渠渥渣減湛湘渤湖湮渭渦湯渴湍渺測湃渝渾滋"],["b540","溉渙湎湣湄湲湩湟焙焚焦焰無然煮焜牌犄犀猶猥猴猩琺琪琳琢琥琵琶琴琯琛琦琨甥甦畫番痢痛痣痙痘痞痠登發皖皓皴盜睏短硝硬硯稍稈程稅稀窘"],["b5a1","窗窖童竣等策筆筐筒答筍筋筏筑粟粥絞結絨絕紫絮絲絡給絢絰絳善翔翕耋聒肅腕腔腋腑腎脹腆脾腌腓腴舒舜菩萃菸萍菠菅萋菁華菱菴著萊菰萌菌菽菲菊萸萎萄菜萇菔菟虛蛟蛙蛭蛔蛛蛤蛐蛞街裁裂袱覃視註詠評詞証詁"],["b640","詔詛詐詆訴診訶詖象貂貯貼貳貽賁費賀貴買貶貿貸越超趁跎距跋跚跑跌跛跆軻軸軼辜逮逵週逸進逶鄂郵鄉郾酣酥量鈔鈕鈣鈉鈞鈍鈐鈇鈑閔閏開閑"],["b6a1","間閒閎隊階隋陽隅隆隍陲隄雁雅雄集雇雯雲韌項順須飧飪飯飩飲飭馮馭黃黍黑亂傭債傲傳僅傾催傷傻傯僇剿剷剽募勦勤勢勣匯嗟嗨嗓嗦嗎嗜嗇嗑嗣嗤嗯嗚嗡嗅嗆嗥嗉園圓塞塑塘塗塚塔填塌塭塊塢塒塋奧嫁嫉嫌媾媽媼"],["b740","媳嫂媲嵩嵯幌幹廉廈弒彙徬微愚意慈感想愛惹愁愈慎慌慄慍愾愴愧愍愆愷戡戢搓搾搞搪搭搽搬搏搜搔損搶搖搗搆敬斟新暗暉暇暈暖暄暘暍會榔業"],["b7a1","楚楷楠楔極椰概楊楨楫楞楓楹榆楝楣楛歇歲毀殿毓毽溢溯滓溶滂源溝滇滅溥溘溼溺溫滑準溜滄滔溪溧溴煎煙煩煤煉照煜煬煦煌煥煞煆煨煖爺牒猷獅猿猾瑯瑚瑕瑟瑞瑁琿瑙瑛瑜當畸瘀痰瘁痲痱痺痿痴痳盞盟睛睫睦睞督"],["b840","睹睪睬睜睥睨睢矮碎碰碗碘碌碉硼碑碓硿祺祿禁萬禽稜稚稠稔稟稞窟窠筷節筠筮筧粱粳粵經絹綑綁綏絛置罩罪署義羨群聖聘肆肄腱腰腸腥腮腳腫"],["b8a1","腹腺腦舅艇蒂葷落萱葵葦葫葉葬葛萼萵葡董葩葭葆虞虜號蛹蜓蜈蜇蜀蛾蛻蜂蜃蜆蜊衙裟裔裙補裘裝裡裊裕裒覜解詫該詳試詩詰誇詼詣誠話誅詭詢詮詬詹詻訾詨豢貊貉賊資賈賄貲賃賂賅跡跟跨路跳跺跪跤跦躲較載軾輊"],["b940","辟農運遊道遂達逼違遐遇遏過遍遑逾遁鄒鄗酬酪酩釉鈷鉗鈸鈽鉀鈾鉛鉋鉤鉑鈴鉉鉍鉅鈹鈿鉚閘隘隔隕雍雋雉雊雷電雹零靖靴靶預頑頓頊頒頌飼飴"],["b9a1","飽飾馳馱馴髡鳩麂鼎鼓鼠僧僮僥僖僭僚僕像僑僱僎僩兢凳劃劂匱厭嗾嘀嘛嘗嗽嘔嘆嘉嘍嘎嗷嘖嘟嘈嘐嗶團圖塵塾境墓墊塹墅塽壽夥夢夤奪奩嫡嫦嫩嫗嫖嫘嫣孵寞寧寡寥實寨寢寤察對屢嶄嶇幛幣幕幗幔廓廖弊彆彰徹慇"],["ba40","愿態慷慢慣慟慚慘慵截撇摘摔撤摸摟摺摑摧搴摭摻敲斡旗旖暢暨暝榜榨榕槁榮槓構榛榷榻榫榴槐槍榭槌榦槃榣歉歌氳漳演滾漓滴漩漾漠漬漏漂漢"],["baa1","滿滯漆漱漸漲漣漕漫漯澈漪滬漁滲滌滷熔熙煽熊熄熒爾犒犖獄獐瑤瑣瑪瑰瑭甄疑瘧瘍瘋瘉瘓盡監瞄睽睿睡磁碟碧碳碩碣禎福禍種稱窪窩竭端管箕箋筵算箝箔箏箸箇箄粹粽精綻綰綜綽綾綠緊綴網綱綺綢綿綵綸維緒緇綬"],["bb40","罰翠翡翟聞聚肇腐膀膏膈膊腿膂臧臺與舔舞艋蓉蒿蓆蓄蒙蒞蒲蒜蓋蒸蓀蓓蒐蒼蓑蓊蜿蜜蜻蜢蜥蜴蜘蝕蜷蜩裳褂裴裹裸製裨褚裯誦誌語誣認誡誓誤"],["bba1","說誥誨誘誑誚誧豪貍貌賓賑賒赫趙趕跼輔輒輕輓辣遠遘遜遣遙遞遢遝遛鄙鄘鄞酵酸酷酴鉸銀銅銘銖鉻銓銜銨鉼銑閡閨閩閣閥閤隙障際雌雒需靼鞅韶頗領颯颱餃餅餌餉駁骯骰髦魁魂鳴鳶鳳麼鼻齊億儀僻僵價儂儈儉儅凜"],["bc40","劇劈劉劍劊勰厲嘮嘻嘹嘲嘿嘴嘩噓噎噗噴嘶嘯嘰墀墟增墳墜墮墩墦奭嬉嫻嬋嫵嬌嬈寮寬審寫層履嶝嶔幢幟幡廢廚廟廝廣廠彈影德徵慶慧慮慝慕憂"],["bca1","慼慰慫慾憧憐憫憎憬憚憤憔憮戮摩摯摹撞撲撈撐撰撥撓撕撩撒撮播撫撚撬撙撢撳敵敷數暮暫暴暱樣樟槨樁樞標槽模樓樊槳樂樅槭樑歐歎殤毅毆漿潼澄潑潦潔澆潭潛潸潮澎潺潰潤澗潘滕潯潠潟熟熬熱熨牖犛獎獗瑩璋璃"],["bd40","瑾璀畿瘠瘩瘟瘤瘦瘡瘢皚皺盤瞎瞇瞌瞑瞋磋磅確磊碾磕碼磐稿稼穀稽稷稻窯窮箭箱範箴篆篇篁箠篌糊締練緯緻緘緬緝編緣線緞緩綞緙緲緹罵罷羯"],["bda1","翩耦膛膜膝膠膚膘蔗蔽蔚蓮蔬蔭蔓蔑蔣蔡蔔蓬蔥蓿蔆螂蝴蝶蝠蝦蝸蝨蝙蝗蝌蝓衛衝褐複褒褓褕褊誼諒談諄誕請諸課諉諂調誰論諍誶誹諛豌豎豬賠賞賦賤賬賭賢賣賜質賡赭趟趣踫踐踝踢踏踩踟踡踞躺輝輛輟輩輦輪輜輞"],["be40","輥適遮遨遭遷鄰鄭鄧鄱醇醉醋醃鋅銻銷鋪銬鋤鋁銳銼鋒鋇鋰銲閭閱霄霆震霉靠鞍鞋鞏頡頫頜颳養餓餒餘駝駐駟駛駑駕駒駙骷髮髯鬧魅魄魷魯鴆鴉"],["bea1","鴃麩麾黎墨齒儒儘儔儐儕冀冪凝劑劓勳噙噫噹噩噤噸噪器噥噱噯噬噢噶壁墾壇壅奮嬝嬴學寰導彊憲憑憩憊懍憶憾懊懈戰擅擁擋撻撼據擄擇擂操撿擒擔撾整曆曉暹曄曇暸樽樸樺橙橫橘樹橄橢橡橋橇樵機橈歙歷氅濂澱澡"],["bf40","濃澤濁澧澳激澹澶澦澠澴熾燉燐燒燈燕熹燎燙燜燃燄獨璜璣璘璟璞瓢甌甍瘴瘸瘺盧盥瞠瞞瞟瞥磨磚磬磧禦積穎穆穌穋窺篙簑築篤篛篡篩篦糕糖縊"],["bfa1","縑縈縛縣縞縝縉縐罹羲翰翱翮耨膳膩膨臻興艘艙蕊蕙蕈蕨蕩蕃蕉蕭蕪蕞螃螟螞螢融衡褪褲褥褫褡親覦諦諺諫諱謀諜諧諮諾謁謂諷諭諳諶諼豫豭貓賴蹄踱踴蹂踹踵輻輯輸輳辨辦遵遴選遲遼遺鄴醒錠錶鋸錳錯錢鋼錫錄錚"],["c040","錐錦錡錕錮錙閻隧隨險雕霎霑霖霍霓霏靛靜靦鞘頰頸頻頷頭頹頤餐館餞餛餡餚駭駢駱骸骼髻髭鬨鮑鴕鴣鴦鴨鴒鴛默黔龍龜優償儡儲勵嚎嚀嚐嚅嚇"],["c0a1","嚏壕壓壑壎嬰嬪嬤孺尷屨嶼嶺嶽嶸幫彌徽應懂懇懦懋戲戴擎擊擘擠擰擦擬擱擢擭斂斃曙曖檀檔檄檢檜櫛檣橾檗檐檠歜殮毚氈濘濱濟濠濛濤濫濯澀濬濡濩濕濮濰燧營燮燦燥燭燬燴燠爵牆獰獲璩環璦璨癆療癌盪瞳瞪瞰瞬"],["c140","瞧瞭矯磷磺磴磯礁禧禪穗窿簇簍篾篷簌篠糠糜糞糢糟糙糝縮績繆縷縲繃縫總縱繅繁縴縹繈縵縿縯罄翳翼聱聲聰聯聳臆臃膺臂臀膿膽臉膾臨舉艱薪"],["c1a1","薄蕾薜薑薔薯薛薇薨薊虧蟀蟑螳蟒蟆螫螻螺蟈蟋褻褶襄褸褽覬謎謗謙講謊謠謝謄謐豁谿豳賺賽購賸賻趨蹉蹋蹈蹊轄輾轂轅輿避遽還邁邂邀鄹醣醞醜鍍鎂錨鍵鍊鍥鍋錘鍾鍬鍛鍰鍚鍔闊闋闌闈闆隱隸雖霜霞鞠韓顆颶餵騁"],["c240","駿鮮鮫鮪鮭鴻鴿麋黏點黜黝黛鼾齋叢嚕嚮壙壘嬸彝懣戳擴擲擾攆擺擻擷斷曜朦檳檬櫃檻檸櫂檮檯歟歸殯瀉瀋濾瀆濺瀑瀏燻燼燾燸獷獵璧璿甕癖癘"],["c2a1","癒瞽瞿瞻瞼礎禮穡穢穠竄竅簫簧簪簞簣簡糧織繕繞繚繡繒繙罈翹翻職聶臍臏舊藏薩藍藐藉薰薺薹薦蟯蟬蟲蟠覆覲觴謨謹謬謫豐贅蹙蹣蹦蹤蹟蹕軀轉轍邇邃邈醫醬釐鎔鎊鎖鎢鎳鎮鎬鎰鎘鎚鎗闔闖闐闕離雜雙雛雞霤鞣鞦"],["c340","鞭韹額顏題顎顓颺餾餿餽餮馥騎髁鬃鬆魏魎魍鯊鯉鯽鯈鯀鵑鵝鵠黠鼕鼬儳嚥壞壟壢寵龐廬懲懷懶懵攀攏曠曝櫥櫝櫚櫓瀛瀟瀨瀚瀝瀕瀘爆爍牘犢獸"],["c3a1","獺璽瓊瓣疇疆癟癡矇礙禱穫穩簾簿簸簽簷籀繫繭繹繩繪羅繳羶羹羸臘藩藝藪藕藤藥藷蟻蠅蠍蟹蟾襠襟襖襞譁譜識證譚譎譏譆譙贈贊蹼蹲躇蹶蹬蹺蹴轔轎辭邊邋醱醮鏡鏑鏟鏃鏈鏜鏝鏖鏢鏍鏘鏤鏗鏨關隴難霪霧靡韜韻類"],["c440","願顛颼饅饉騖騙鬍鯨鯧鯖鯛鶉鵡鵲鵪鵬麒麗麓麴勸嚨嚷嚶嚴嚼壤孀孃孽寶巉懸懺攘攔攙曦朧櫬瀾瀰瀲爐獻瓏癢癥礦礪礬礫竇競籌籃籍糯糰辮繽繼"],["c4a1","纂罌耀臚艦藻藹蘑藺蘆蘋蘇蘊蠔蠕襤覺觸議譬警譯譟譫贏贍躉躁躅躂醴釋鐘鐃鏽闡霰飄饒饑馨騫騰騷騵鰓鰍鹹麵黨鼯齟齣齡儷儸囁囀囂夔屬巍懼懾攝攜斕曩櫻欄櫺殲灌爛犧瓖瓔癩矓籐纏續羼蘗蘭蘚蠣蠢蠡蠟襪襬覽譴"],["c540","護譽贓躊躍躋轟辯醺鐮鐳鐵鐺鐸鐲鐫闢霸霹露響顧顥饗驅驃驀騾髏魔魑鰭鰥鶯鶴鷂鶸麝黯鼙齜齦齧儼儻囈囊囉孿巔巒彎懿攤權歡灑灘玀瓤疊癮癬"],["c5a1","禳籠籟聾聽臟襲襯觼讀贖贗躑躓轡酈鑄鑑鑒霽霾韃韁顫饕驕驍髒鬚鱉鰱鰾鰻鷓鷗鼴齬齪龔囌巖戀攣攫攪曬欐瓚竊籤籣籥纓纖纔臢蘸蘿蠱變邐邏鑣鑠鑤靨顯饜驚驛驗髓體髑鱔鱗鱖鷥麟黴囑壩攬灞癱癲矗罐羈蠶蠹衢讓讒"],["c640","讖艷贛釀鑪靂靈靄韆顰驟鬢魘鱟鷹鷺鹼鹽鼇齷齲廳欖灣籬籮蠻觀躡釁鑲鑰顱饞髖鬣黌灤矚讚鑷韉驢驥纜讜躪釅鑽鑾鑼鱷鱸黷豔鑿鸚爨驪鬱鸛鸞籲"],["c940","乂乜凵匚厂万丌乇亍囗兀屮彳丏冇与丮亓仂仉仈冘勼卬厹圠夃夬尐巿旡殳毌气爿丱丼仨仜仩仡仝仚刌匜卌圢圣夗夯宁宄尒尻屴屳帄庀庂忉戉扐氕"],["c9a1","氶汃氿氻犮犰玊禸肊阞伎优伬仵伔仱伀价伈伝伂伅伢伓伄仴伒冱刓刉刐劦匢匟卍厊吇囡囟圮圪圴夼妀奼妅奻奾奷奿孖尕尥屼屺屻屾巟幵庄异弚彴忕忔忏扜扞扤扡扦扢扙扠扚扥旯旮朾朹朸朻机朿朼朳氘汆汒汜汏汊汔汋"],["ca40","汌灱牞犴犵玎甪癿穵网艸艼芀艽艿虍襾邙邗邘邛邔阢阤阠阣佖伻佢佉体佤伾佧佒佟佁佘伭伳伿佡冏冹刜刞刡劭劮匉卣卲厎厏吰吷吪呔呅吙吜吥吘"],["caa1","吽呏呁吨吤呇囮囧囥坁坅坌坉坋坒夆奀妦妘妠妗妎妢妐妏妧妡宎宒尨尪岍岏岈岋岉岒岊岆岓岕巠帊帎庋庉庌庈庍弅弝彸彶忒忑忐忭忨忮忳忡忤忣忺忯忷忻怀忴戺抃抌抎抏抔抇扱扻扺扰抁抈扷扽扲扴攷旰旴旳旲旵杅杇"],["cb40","杙杕杌杈杝杍杚杋毐氙氚汸汧汫沄沋沏汱汯汩沚汭沇沕沜汦汳汥汻沎灴灺牣犿犽狃狆狁犺狅玕玗玓玔玒町甹疔疕皁礽耴肕肙肐肒肜芐芏芅芎芑芓"],["cba1","芊芃芄豸迉辿邟邡邥邞邧邠阰阨阯阭丳侘佼侅佽侀侇佶佴侉侄佷佌侗佪侚佹侁佸侐侜侔侞侒侂侕佫佮冞冼冾刵刲刳剆刱劼匊匋匼厒厔咇呿咁咑咂咈呫呺呾呥呬呴呦咍呯呡呠咘呣呧呤囷囹坯坲坭坫坱坰坶垀坵坻坳坴坢"],["cc40","坨坽夌奅妵妺姏姎妲姌姁妶妼姃姖妱妽姀姈妴姇孢孥宓宕屄屇岮岤岠岵岯岨岬岟岣岭岢岪岧岝岥岶岰岦帗帔帙弨弢弣弤彔徂彾彽忞忥怭怦怙怲怋"],["cca1","怴怊怗怳怚怞怬怢怍怐怮怓怑怌怉怜戔戽抭抴拑抾抪抶拊抮抳抯抻抩抰抸攽斨斻昉旼昄昒昈旻昃昋昍昅旽昑昐曶朊枅杬枎枒杶杻枘枆构杴枍枌杺枟枑枙枃杽极杸杹枔欥殀歾毞氝沓泬泫泮泙沶泔沭泧沷泐泂沺泃泆泭泲"],["cd40","泒泝沴沊沝沀泞泀洰泍泇沰泹泏泩泑炔炘炅炓炆炄炑炖炂炚炃牪狖狋狘狉狜狒狔狚狌狑玤玡玭玦玢玠玬玝瓝瓨甿畀甾疌疘皯盳盱盰盵矸矼矹矻矺"],["cda1","矷祂礿秅穸穻竻籵糽耵肏肮肣肸肵肭舠芠苀芫芚芘芛芵芧芮芼芞芺芴芨芡芩苂芤苃芶芢虰虯虭虮豖迒迋迓迍迖迕迗邲邴邯邳邰阹阽阼阺陃俍俅俓侲俉俋俁俔俜俙侻侳俛俇俖侺俀侹俬剄剉勀勂匽卼厗厖厙厘咺咡咭咥哏"],["ce40","哃茍咷咮哖咶哅哆咠呰咼咢咾呲哞咰垵垞垟垤垌垗垝垛垔垘垏垙垥垚垕壴复奓姡姞姮娀姱姝姺姽姼姶姤姲姷姛姩姳姵姠姾姴姭宨屌峐峘峌峗峋峛"],["cea1","峞峚峉峇峊峖峓峔峏峈峆峎峟峸巹帡帢帣帠帤庰庤庢庛庣庥弇弮彖徆怷怹恔恲恞恅恓恇恉恛恌恀恂恟怤恄恘恦恮扂扃拏挍挋拵挎挃拫拹挏挌拸拶挀挓挔拺挕拻拰敁敃斪斿昶昡昲昵昜昦昢昳昫昺昝昴昹昮朏朐柁柲柈枺"],["cf40","柜枻柸柘柀枷柅柫柤柟枵柍枳柷柶柮柣柂枹柎柧柰枲柼柆柭柌枮柦柛柺柉柊柃柪柋欨殂殄殶毖毘毠氠氡洨洴洭洟洼洿洒洊泚洳洄洙洺洚洑洀洝浂"],["cfa1","洁洘洷洃洏浀洇洠洬洈洢洉洐炷炟炾炱炰炡炴炵炩牁牉牊牬牰牳牮狊狤狨狫狟狪狦狣玅珌珂珈珅玹玶玵玴珫玿珇玾珃珆玸珋瓬瓮甮畇畈疧疪癹盄眈眃眄眅眊盷盻盺矧矨砆砑砒砅砐砏砎砉砃砓祊祌祋祅祄秕种秏秖秎窀"],["d040","穾竑笀笁籺籸籹籿粀粁紃紈紁罘羑羍羾耇耎耏耔耷胘胇胠胑胈胂胐胅胣胙胜胊胕胉胏胗胦胍臿舡芔苙苾苹茇苨茀苕茺苫苖苴苬苡苲苵茌苻苶苰苪"],["d0a1","苤苠苺苳苭虷虴虼虳衁衎衧衪衩觓訄訇赲迣迡迮迠郱邽邿郕郅邾郇郋郈釔釓陔陏陑陓陊陎倞倅倇倓倢倰倛俵俴倳倷倬俶俷倗倜倠倧倵倯倱倎党冔冓凊凄凅凈凎剡剚剒剞剟剕剢勍匎厞唦哢唗唒哧哳哤唚哿唄唈哫唑唅哱"],["d140","唊哻哷哸哠唎唃唋圁圂埌堲埕埒垺埆垽垼垸垶垿埇埐垹埁夎奊娙娖娭娮娕娏娗娊娞娳孬宧宭宬尃屖屔峬峿峮峱峷崀峹帩帨庨庮庪庬弳弰彧恝恚恧"],["d1a1","恁悢悈悀悒悁悝悃悕悛悗悇悜悎戙扆拲挐捖挬捄捅挶捃揤挹捋捊挼挩捁挴捘捔捙挭捇挳捚捑挸捗捀捈敊敆旆旃旄旂晊晟晇晑朒朓栟栚桉栲栳栻桋桏栖栱栜栵栫栭栯桎桄栴栝栒栔栦栨栮桍栺栥栠欬欯欭欱欴歭肂殈毦毤"],["d240","毨毣毢毧氥浺浣浤浶洍浡涒浘浢浭浯涑涍淯浿涆浞浧浠涗浰浼浟涂涘洯浨涋浾涀涄洖涃浻浽浵涐烜烓烑烝烋缹烢烗烒烞烠烔烍烅烆烇烚烎烡牂牸"],["d2a1","牷牶猀狺狴狾狶狳狻猁珓珙珥珖玼珧珣珩珜珒珛珔珝珚珗珘珨瓞瓟瓴瓵甡畛畟疰痁疻痄痀疿疶疺皊盉眝眛眐眓眒眣眑眕眙眚眢眧砣砬砢砵砯砨砮砫砡砩砳砪砱祔祛祏祜祓祒祑秫秬秠秮秭秪秜秞秝窆窉窅窋窌窊窇竘笐"],["d340","笄笓笅笏笈笊笎笉笒粄粑粊粌粈粍粅紞紝紑紎紘紖紓紟紒紏紌罜罡罞罠罝罛羖羒翃翂翀耖耾耹胺胲胹胵脁胻脀舁舯舥茳茭荄茙荑茥荖茿荁茦茜茢"],["d3a1","荂荎茛茪茈茼荍茖茤茠茷茯茩荇荅荌荓茞茬荋茧荈虓虒蚢蚨蚖蚍蚑蚞蚇蚗蚆蚋蚚蚅蚥蚙蚡蚧蚕蚘蚎蚝蚐蚔衃衄衭衵衶衲袀衱衿衯袃衾衴衼訒豇豗豻貤貣赶赸趵趷趶軑軓迾迵适迿迻逄迼迶郖郠郙郚郣郟郥郘郛郗郜郤酐"],["d440","酎酏釕釢釚陜陟隼飣髟鬯乿偰偪偡偞偠偓偋偝偲偈偍偁偛偊偢倕偅偟偩偫偣偤偆偀偮偳偗偑凐剫剭剬剮勖勓匭厜啵啶唼啍啐唴唪啑啢唶唵唰啒啅"],["d4a1","唌唲啥啎唹啈唭唻啀啋圊圇埻堔埢埶埜埴堀埭埽堈埸堋埳埏堇埮埣埲埥埬埡堎埼堐埧堁堌埱埩埰堍堄奜婠婘婕婧婞娸娵婭婐婟婥婬婓婤婗婃婝婒婄婛婈媎娾婍娹婌婰婩婇婑婖婂婜孲孮寁寀屙崞崋崝崚崠崌崨崍崦崥崏"],["d540","崰崒崣崟崮帾帴庱庴庹庲庳弶弸徛徖徟悊悐悆悾悰悺惓惔惏惤惙惝惈悱惛悷惊悿惃惍惀挲捥掊掂捽掽掞掭掝掗掫掎捯掇掐据掯捵掜捭掮捼掤挻掟"],["d5a1","捸掅掁掑掍捰敓旍晥晡晛晙晜晢朘桹梇梐梜桭桮梮梫楖桯梣梬梩桵桴梲梏桷梒桼桫桲梪梀桱桾梛梖梋梠梉梤桸桻梑梌梊桽欶欳欷欸殑殏殍殎殌氪淀涫涴涳湴涬淩淢涷淶淔渀淈淠淟淖涾淥淜淝淛淴淊涽淭淰涺淕淂淏淉"],["d640","淐淲淓淽淗淍淣涻烺焍烷焗烴焌烰焄烳焐烼烿焆焓焀烸烶焋焂焎牾牻牼牿猝猗猇猑猘猊猈狿猏猞玈珶珸珵琄琁珽琇琀珺珼珿琌琋珴琈畤畣痎痒痏"],["d6a1","痋痌痑痐皏皉盓眹眯眭眱眲眴眳眽眥眻眵硈硒硉硍硊硌砦硅硐祤祧祩祪祣祫祡离秺秸秶秷窏窔窐笵筇笴笥笰笢笤笳笘笪笝笱笫笭笯笲笸笚笣粔粘粖粣紵紽紸紶紺絅紬紩絁絇紾紿絊紻紨罣羕羜羝羛翊翋翍翐翑翇翏翉耟"],["d740","耞耛聇聃聈脘脥脙脛脭脟脬脞脡脕脧脝脢舑舸舳舺舴舲艴莐莣莨莍荺荳莤荴莏莁莕莙荵莔莩荽莃莌莝莛莪莋荾莥莯莈莗莰荿莦莇莮荶莚虙虖蚿蚷"],["d7a1","蛂蛁蛅蚺蚰蛈蚹蚳蚸蛌蚴蚻蚼蛃蚽蚾衒袉袕袨袢袪袚袑袡袟袘袧袙袛袗袤袬袌袓袎覂觖觙觕訰訧訬訞谹谻豜豝豽貥赽赻赹趼跂趹趿跁軘軞軝軜軗軠軡逤逋逑逜逌逡郯郪郰郴郲郳郔郫郬郩酖酘酚酓酕釬釴釱釳釸釤釹釪"],["d840","釫釷釨釮镺閆閈陼陭陫陱陯隿靪頄飥馗傛傕傔傞傋傣傃傌傎傝偨傜傒傂傇兟凔匒匑厤厧喑喨喥喭啷噅喢喓喈喏喵喁喣喒喤啽喌喦啿喕喡喎圌堩堷"],["d8a1","堙堞堧堣堨埵塈堥堜堛堳堿堶堮堹堸堭堬堻奡媯媔媟婺媢媞婸媦婼媥媬媕媮娷媄媊媗媃媋媩婻婽媌媜媏媓媝寪寍寋寔寑寊寎尌尰崷嵃嵫嵁嵋崿崵嵑嵎嵕崳崺嵒崽崱嵙嵂崹嵉崸崼崲崶嵀嵅幄幁彘徦徥徫惉悹惌惢惎惄愔"],["d940","惲愊愖愅惵愓惸惼惾惁愃愘愝愐惿愄愋扊掔掱掰揎揥揨揯揃撝揳揊揠揶揕揲揵摡揟掾揝揜揄揘揓揂揇揌揋揈揰揗揙攲敧敪敤敜敨敥斌斝斞斮旐旒"],["d9a1","晼晬晻暀晱晹晪晲朁椌棓椄棜椪棬棪棱椏棖棷棫棤棶椓椐棳棡椇棌椈楰梴椑棯棆椔棸棐棽棼棨椋椊椗棎棈棝棞棦棴棑椆棔棩椕椥棇欹欻欿欼殔殗殙殕殽毰毲毳氰淼湆湇渟湉溈渼渽湅湢渫渿湁湝湳渜渳湋湀湑渻渃渮湞"],["da40","湨湜湡渱渨湠湱湫渹渢渰湓湥渧湸湤湷湕湹湒湦渵渶湚焠焞焯烻焮焱焣焥焢焲焟焨焺焛牋牚犈犉犆犅犋猒猋猰猢猱猳猧猲猭猦猣猵猌琮琬琰琫琖"],["daa1","琚琡琭琱琤琣琝琩琠琲瓻甯畯畬痧痚痡痦痝痟痤痗皕皒盚睆睇睄睍睅睊睎睋睌矞矬硠硤硥硜硭硱硪确硰硩硨硞硢祴祳祲祰稂稊稃稌稄窙竦竤筊笻筄筈筌筎筀筘筅粢粞粨粡絘絯絣絓絖絧絪絏絭絜絫絒絔絩絑絟絎缾缿罥"],["db40","罦羢羠羡翗聑聏聐胾胔腃腊腒腏腇脽腍脺臦臮臷臸臹舄舼舽舿艵茻菏菹萣菀菨萒菧菤菼菶萐菆菈菫菣莿萁菝菥菘菿菡菋菎菖菵菉萉萏菞萑萆菂菳"],["dba1","菕菺菇菑菪萓菃菬菮菄菻菗菢萛菛菾蛘蛢蛦蛓蛣蛚蛪蛝蛫蛜蛬蛩蛗蛨蛑衈衖衕袺裗袹袸裀袾袶袼袷袽袲褁裉覕覘覗觝觚觛詎詍訹詙詀詗詘詄詅詒詈詑詊詌詏豟貁貀貺貾貰貹貵趄趀趉跘跓跍跇跖跜跏跕跙跈跗跅軯軷軺"],["dc40","軹軦軮軥軵軧軨軶軫軱軬軴軩逭逴逯鄆鄬鄄郿郼鄈郹郻鄁鄀鄇鄅鄃酡酤酟酢酠鈁鈊鈥鈃鈚鈦鈏鈌鈀鈒釿釽鈆鈄鈧鈂鈜鈤鈙鈗鈅鈖镻閍閌閐隇陾隈"],["dca1","隉隃隀雂雈雃雱雰靬靰靮頇颩飫鳦黹亃亄亶傽傿僆傮僄僊傴僈僂傰僁傺傱僋僉傶傸凗剺剸剻剼嗃嗛嗌嗐嗋嗊嗝嗀嗔嗄嗩喿嗒喍嗏嗕嗢嗖嗈嗲嗍嗙嗂圔塓塨塤塏塍塉塯塕塎塝塙塥塛堽塣塱壼嫇嫄嫋媺媸媱媵媰媿嫈媻嫆"],["dd40","媷嫀嫊媴媶嫍媹媐寖寘寙尟尳嵱嵣嵊嵥嵲嵬嵞嵨嵧嵢巰幏幎幊幍幋廅廌廆廋廇彀徯徭惷慉慊愫慅愶愲愮慆愯慏愩慀戠酨戣戥戤揅揱揫搐搒搉搠搤"],["dda1","搳摃搟搕搘搹搷搢搣搌搦搰搨摁搵搯搊搚摀搥搧搋揧搛搮搡搎敯斒旓暆暌暕暐暋暊暙暔晸朠楦楟椸楎楢楱椿楅楪椹楂楗楙楺楈楉椵楬椳椽楥棰楸椴楩楀楯楄楶楘楁楴楌椻楋椷楜楏楑椲楒椯楻椼歆歅歃歂歈歁殛嗀毻毼"],["de40","毹毷毸溛滖滈溏滀溟溓溔溠溱溹滆滒溽滁溞滉溷溰滍溦滏溲溾滃滜滘溙溒溎溍溤溡溿溳滐滊溗溮溣煇煔煒煣煠煁煝煢煲煸煪煡煂煘煃煋煰煟煐煓"],["dea1","煄煍煚牏犍犌犑犐犎猼獂猻猺獀獊獉瑄瑊瑋瑒瑑瑗瑀瑏瑐瑎瑂瑆瑍瑔瓡瓿瓾瓽甝畹畷榃痯瘏瘃痷痾痼痹痸瘐痻痶痭痵痽皙皵盝睕睟睠睒睖睚睩睧睔睙睭矠碇碚碔碏碄碕碅碆碡碃硹碙碀碖硻祼禂祽祹稑稘稙稒稗稕稢稓"],["df40","稛稐窣窢窞竫筦筤筭筴筩筲筥筳筱筰筡筸筶筣粲粴粯綈綆綀綍絿綅絺綎絻綃絼綌綔綄絽綒罭罫罧罨罬羦羥羧翛翜耡腤腠腷腜腩腛腢腲朡腞腶腧腯"],["dfa1","腄腡舝艉艄艀艂艅蓱萿葖葶葹蒏蒍葥葑葀蒆葧萰葍葽葚葙葴葳葝蔇葞萷萺萴葺葃葸萲葅萩菙葋萯葂萭葟葰萹葎葌葒葯蓅蒎萻葇萶萳葨葾葄萫葠葔葮葐蜋蜄蛷蜌蛺蛖蛵蝍蛸蜎蜉蜁蛶蜍蜅裖裋裍裎裞裛裚裌裐覅覛觟觥觤"],["e040","觡觠觢觜触詶誆詿詡訿詷誂誄詵誃誁詴詺谼豋豊豥豤豦貆貄貅賌赨赩趑趌趎趏趍趓趔趐趒跰跠跬跱跮跐跩跣跢跧跲跫跴輆軿輁輀輅輇輈輂輋遒逿"],["e0a1","遄遉逽鄐鄍鄏鄑鄖鄔鄋鄎酮酯鉈鉒鈰鈺鉦鈳鉥鉞銃鈮鉊鉆鉭鉬鉏鉠鉧鉯鈶鉡鉰鈱鉔鉣鉐鉲鉎鉓鉌鉖鈲閟閜閞閛隒隓隑隗雎雺雽雸雵靳靷靸靲頏頍頎颬飶飹馯馲馰馵骭骫魛鳪鳭鳧麀黽僦僔僗僨僳僛僪僝僤僓僬僰僯僣僠"],["e140","凘劀劁勩勫匰厬嘧嘕嘌嘒嗼嘏嘜嘁嘓嘂嗺嘝嘄嗿嗹墉塼墐墘墆墁塿塴墋塺墇墑墎塶墂墈塻墔墏壾奫嫜嫮嫥嫕嫪嫚嫭嫫嫳嫢嫠嫛嫬嫞嫝嫙嫨嫟孷寠"],["e1a1","寣屣嶂嶀嵽嶆嵺嶁嵷嶊嶉嶈嵾嵼嶍嵹嵿幘幙幓廘廑廗廎廜廕廙廒廔彄彃彯徶愬愨慁慞慱慳慒慓慲慬憀慴慔慺慛慥愻慪慡慖戩戧戫搫摍摛摝摴摶摲摳摽摵摦撦摎撂摞摜摋摓摠摐摿搿摬摫摙摥摷敳斠暡暠暟朅朄朢榱榶槉"],["e240","榠槎榖榰榬榼榑榙榎榧榍榩榾榯榿槄榽榤槔榹槊榚槏榳榓榪榡榞槙榗榐槂榵榥槆歊歍歋殞殟殠毃毄毾滎滵滱漃漥滸漷滻漮漉潎漙漚漧漘漻漒滭漊"],["e2a1","漶潳滹滮漭潀漰漼漵滫漇漎潃漅滽滶漹漜滼漺漟漍漞漈漡熇熐熉熀熅熂熏煻熆熁熗牄牓犗犕犓獃獍獑獌瑢瑳瑱瑵瑲瑧瑮甀甂甃畽疐瘖瘈瘌瘕瘑瘊瘔皸瞁睼瞅瞂睮瞀睯睾瞃碲碪碴碭碨硾碫碞碥碠碬碢碤禘禊禋禖禕禔禓"],["e340","禗禈禒禐稫穊稰稯稨稦窨窫窬竮箈箜箊箑箐箖箍箌箛箎箅箘劄箙箤箂粻粿粼粺綧綷緂綣綪緁緀緅綝緎緄緆緋緌綯綹綖綼綟綦綮綩綡緉罳翢翣翥翞"],["e3a1","耤聝聜膉膆膃膇膍膌膋舕蒗蒤蒡蒟蒺蓎蓂蒬蒮蒫蒹蒴蓁蓍蒪蒚蒱蓐蒝蒧蒻蒢蒔蓇蓌蒛蒩蒯蒨蓖蒘蒶蓏蒠蓗蓔蓒蓛蒰蒑虡蜳蜣蜨蝫蝀蜮蜞蜡蜙蜛蝃蜬蝁蜾蝆蜠蜲蜪蜭蜼蜒蜺蜱蜵蝂蜦蜧蜸蜤蜚蜰蜑裷裧裱裲裺裾裮裼裶裻"],["e440","裰裬裫覝覡覟覞觩觫觨誫誙誋誒誏誖谽豨豩賕賏賗趖踉踂跿踍跽踊踃踇踆踅跾踀踄輐輑輎輍鄣鄜鄠鄢鄟鄝鄚鄤鄡鄛酺酲酹酳銥銤鉶銛鉺銠銔銪銍"],["e4a1","銦銚銫鉹銗鉿銣鋮銎銂銕銢鉽銈銡銊銆銌銙銧鉾銇銩銝銋鈭隞隡雿靘靽靺靾鞃鞀鞂靻鞄鞁靿韎韍頖颭颮餂餀餇馝馜駃馹馻馺駂馽駇骱髣髧鬾鬿魠魡魟鳱鳲鳵麧僿儃儰僸儆儇僶僾儋儌僽儊劋劌勱勯噈噂噌嘵噁噊噉噆噘"],["e540","噚噀嘳嘽嘬嘾嘸嘪嘺圚墫墝墱墠墣墯墬墥墡壿嫿嫴嫽嫷嫶嬃嫸嬂嫹嬁嬇嬅嬏屧嶙嶗嶟嶒嶢嶓嶕嶠嶜嶡嶚嶞幩幝幠幜緳廛廞廡彉徲憋憃慹憱憰憢憉"],["e5a1","憛憓憯憭憟憒憪憡憍慦憳戭摮摰撖撠撅撗撜撏撋撊撌撣撟摨撱撘敶敺敹敻斲斳暵暰暩暲暷暪暯樀樆樗槥槸樕槱槤樠槿槬槢樛樝槾樧槲槮樔槷槧橀樈槦槻樍槼槫樉樄樘樥樏槶樦樇槴樖歑殥殣殢殦氁氀毿氂潁漦潾澇濆澒"],["e640","澍澉澌潢潏澅潚澖潶潬澂潕潲潒潐潗澔澓潝漀潡潫潽潧澐潓澋潩潿澕潣潷潪潻熲熯熛熰熠熚熩熵熝熥熞熤熡熪熜熧熳犘犚獘獒獞獟獠獝獛獡獚獙"],["e6a1","獢璇璉璊璆璁瑽璅璈瑼瑹甈甇畾瘥瘞瘙瘝瘜瘣瘚瘨瘛皜皝皞皛瞍瞏瞉瞈磍碻磏磌磑磎磔磈磃磄磉禚禡禠禜禢禛歶稹窲窴窳箷篋箾箬篎箯箹篊箵糅糈糌糋緷緛緪緧緗緡縃緺緦緶緱緰緮緟罶羬羰羭翭翫翪翬翦翨聤聧膣膟"],["e740","膞膕膢膙膗舖艏艓艒艐艎艑蔤蔻蔏蔀蔩蔎蔉蔍蔟蔊蔧蔜蓻蔫蓺蔈蔌蓴蔪蓲蔕蓷蓫蓳蓼蔒蓪蓩蔖蓾蔨蔝蔮蔂蓽蔞蓶蔱蔦蓧蓨蓰蓯蓹蔘蔠蔰蔋蔙蔯虢"],["e7a1","蝖蝣蝤蝷蟡蝳蝘蝔蝛蝒蝡蝚蝑蝞蝭蝪蝐蝎蝟蝝蝯蝬蝺蝮蝜蝥蝏蝻蝵蝢蝧蝩衚褅褌褔褋褗褘褙褆褖褑褎褉覢覤覣觭觰觬諏諆誸諓諑諔諕誻諗誾諀諅諘諃誺誽諙谾豍貏賥賟賙賨賚賝賧趠趜趡趛踠踣踥踤踮踕踛踖踑踙踦踧"],["e840","踔踒踘踓踜踗踚輬輤輘輚輠輣輖輗遳遰遯遧遫鄯鄫鄩鄪鄲鄦鄮醅醆醊醁醂醄醀鋐鋃鋄鋀鋙銶鋏鋱鋟鋘鋩鋗鋝鋌鋯鋂鋨鋊鋈鋎鋦鋍鋕鋉鋠鋞鋧鋑鋓"],["e8a1","銵鋡鋆銴镼閬閫閮閰隤隢雓霅霈霂靚鞊鞎鞈韐韏頞頝頦頩頨頠頛頧颲餈飺餑餔餖餗餕駜駍駏駓駔駎駉駖駘駋駗駌骳髬髫髳髲髱魆魃魧魴魱魦魶魵魰魨魤魬鳼鳺鳽鳿鳷鴇鴀鳹鳻鴈鴅鴄麃黓鼏鼐儜儓儗儚儑凞匴叡噰噠噮"],["e940","噳噦噣噭噲噞噷圜圛壈墽壉墿墺壂墼壆嬗嬙嬛嬡嬔嬓嬐嬖嬨嬚嬠嬞寯嶬嶱嶩嶧嶵嶰嶮嶪嶨嶲嶭嶯嶴幧幨幦幯廩廧廦廨廥彋徼憝憨憖懅憴懆懁懌憺"],["e9a1","憿憸憌擗擖擐擏擉撽撉擃擛擳擙攳敿敼斢曈暾曀曊曋曏暽暻暺曌朣樴橦橉橧樲橨樾橝橭橶橛橑樨橚樻樿橁橪橤橐橏橔橯橩橠樼橞橖橕橍橎橆歕歔歖殧殪殫毈毇氄氃氆澭濋澣濇澼濎濈潞濄澽澞濊澨瀄澥澮澺澬澪濏澿澸"],["ea40","澢濉澫濍澯澲澰燅燂熿熸燖燀燁燋燔燊燇燏熽燘熼燆燚燛犝犞獩獦獧獬獥獫獪瑿璚璠璔璒璕璡甋疀瘯瘭瘱瘽瘳瘼瘵瘲瘰皻盦瞚瞝瞡瞜瞛瞢瞣瞕瞙"],["eaa1","瞗磝磩磥磪磞磣磛磡磢磭磟磠禤穄穈穇窶窸窵窱窷篞篣篧篝篕篥篚篨篹篔篪篢篜篫篘篟糒糔糗糐糑縒縡縗縌縟縠縓縎縜縕縚縢縋縏縖縍縔縥縤罃罻罼罺羱翯耪耩聬膱膦膮膹膵膫膰膬膴膲膷膧臲艕艖艗蕖蕅蕫蕍蕓蕡蕘"],["eb40","蕀蕆蕤蕁蕢蕄蕑蕇蕣蔾蕛蕱蕎蕮蕵蕕蕧蕠薌蕦蕝蕔蕥蕬虣虥虤螛螏螗螓螒螈螁螖螘蝹螇螣螅螐螑螝螄螔螜螚螉褞褦褰褭褮褧褱褢褩褣褯褬褟觱諠"],["eba1","諢諲諴諵諝謔諤諟諰諈諞諡諨諿諯諻貑貒貐賵賮賱賰賳赬赮趥趧踳踾踸蹀蹅踶踼踽蹁踰踿躽輶輮輵輲輹輷輴遶遹遻邆郺鄳鄵鄶醓醐醑醍醏錧錞錈錟錆錏鍺錸錼錛錣錒錁鍆錭錎錍鋋錝鋺錥錓鋹鋷錴錂錤鋿錩錹錵錪錔錌"],["ec40","錋鋾錉錀鋻錖閼闍閾閹閺閶閿閵閽隩雔霋霒霐鞙鞗鞔韰韸頵頯頲餤餟餧餩馞駮駬駥駤駰駣駪駩駧骹骿骴骻髶髺髹髷鬳鮀鮅鮇魼魾魻鮂鮓鮒鮐魺鮕"],["eca1","魽鮈鴥鴗鴠鴞鴔鴩鴝鴘鴢鴐鴙鴟麈麆麇麮麭黕黖黺鼒鼽儦儥儢儤儠儩勴嚓嚌嚍嚆嚄嚃噾嚂噿嚁壖壔壏壒嬭嬥嬲嬣嬬嬧嬦嬯嬮孻寱寲嶷幬幪徾徻懃憵憼懧懠懥懤懨懞擯擩擣擫擤擨斁斀斶旚曒檍檖檁檥檉檟檛檡檞檇檓檎"],["ed40","檕檃檨檤檑橿檦檚檅檌檒歛殭氉濌澩濴濔濣濜濭濧濦濞濲濝濢濨燡燱燨燲燤燰燢獳獮獯璗璲璫璐璪璭璱璥璯甐甑甒甏疄癃癈癉癇皤盩瞵瞫瞲瞷瞶"],["eda1","瞴瞱瞨矰磳磽礂磻磼磲礅磹磾礄禫禨穜穛穖穘穔穚窾竀竁簅簏篲簀篿篻簎篴簋篳簂簉簃簁篸篽簆篰篱簐簊糨縭縼繂縳顈縸縪繉繀繇縩繌縰縻縶繄縺罅罿罾罽翴翲耬膻臄臌臊臅臇膼臩艛艚艜薃薀薏薧薕薠薋薣蕻薤薚薞"],["ee40","蕷蕼薉薡蕺蕸蕗薎薖薆薍薙薝薁薢薂薈薅蕹蕶薘薐薟虨螾螪螭蟅螰螬螹螵螼螮蟉蟃蟂蟌螷螯蟄蟊螴螶螿螸螽蟞螲褵褳褼褾襁襒褷襂覭覯覮觲觳謞"],["eea1","謘謖謑謅謋謢謏謒謕謇謍謈謆謜謓謚豏豰豲豱豯貕貔賹赯蹎蹍蹓蹐蹌蹇轃轀邅遾鄸醚醢醛醙醟醡醝醠鎡鎃鎯鍤鍖鍇鍼鍘鍜鍶鍉鍐鍑鍠鍭鎏鍌鍪鍹鍗鍕鍒鍏鍱鍷鍻鍡鍞鍣鍧鎀鍎鍙闇闀闉闃闅閷隮隰隬霠霟霘霝霙鞚鞡鞜"],["ef40","鞞鞝韕韔韱顁顄顊顉顅顃餥餫餬餪餳餲餯餭餱餰馘馣馡騂駺駴駷駹駸駶駻駽駾駼騃骾髾髽鬁髼魈鮚鮨鮞鮛鮦鮡鮥鮤鮆鮢鮠鮯鴳鵁鵧鴶鴮鴯鴱鴸鴰"],["efa1","鵅鵂鵃鴾鴷鵀鴽翵鴭麊麉麍麰黈黚黻黿鼤鼣鼢齔龠儱儭儮嚘嚜嚗嚚嚝嚙奰嬼屩屪巀幭幮懘懟懭懮懱懪懰懫懖懩擿攄擽擸攁攃擼斔旛曚曛曘櫅檹檽櫡櫆檺檶檷櫇檴檭歞毉氋瀇瀌瀍瀁瀅瀔瀎濿瀀濻瀦濼濷瀊爁燿燹爃燽獶"],["f040","璸瓀璵瓁璾璶璻瓂甔甓癜癤癙癐癓癗癚皦皽盬矂瞺磿礌礓礔礉礐礒礑禭禬穟簜簩簙簠簟簭簝簦簨簢簥簰繜繐繖繣繘繢繟繑繠繗繓羵羳翷翸聵臑臒"],["f0a1","臐艟艞薴藆藀藃藂薳薵薽藇藄薿藋藎藈藅薱薶藒蘤薸薷薾虩蟧蟦蟢蟛蟫蟪蟥蟟蟳蟤蟔蟜蟓蟭蟘蟣螤蟗蟙蠁蟴蟨蟝襓襋襏襌襆襐襑襉謪謧謣謳謰謵譇謯謼謾謱謥謷謦謶謮謤謻謽謺豂豵貙貘貗賾贄贂贀蹜蹢蹠蹗蹖蹞蹥蹧"],["f140","蹛蹚蹡蹝蹩蹔轆轇轈轋鄨鄺鄻鄾醨醥醧醯醪鎵鎌鎒鎷鎛鎝鎉鎧鎎鎪鎞鎦鎕鎈鎙鎟鎍鎱鎑鎲鎤鎨鎴鎣鎥闒闓闑隳雗雚巂雟雘雝霣霢霥鞬鞮鞨鞫鞤鞪"],["f1a1","鞢鞥韗韙韖韘韺顐顑顒颸饁餼餺騏騋騉騍騄騑騊騅騇騆髀髜鬈鬄鬅鬩鬵魊魌魋鯇鯆鯃鮿鯁鮵鮸鯓鮶鯄鮹鮽鵜鵓鵏鵊鵛鵋鵙鵖鵌鵗鵒鵔鵟鵘鵚麎麌黟鼁鼀鼖鼥鼫鼪鼩鼨齌齕儴儵劖勷厴嚫嚭嚦嚧嚪嚬壚壝壛夒嬽嬾嬿巃幰"],["f240","徿懻攇攐攍攉攌攎斄旞旝曞櫧櫠櫌櫑櫙櫋櫟櫜櫐櫫櫏櫍櫞歠殰氌瀙瀧瀠瀖瀫瀡瀢瀣瀩瀗瀤瀜瀪爌爊爇爂爅犥犦犤犣犡瓋瓅璷瓃甖癠矉矊矄矱礝礛"],["f2a1","礡礜礗礞禰穧穨簳簼簹簬簻糬糪繶繵繸繰繷繯繺繲繴繨罋罊羃羆羷翽翾聸臗臕艤艡艣藫藱藭藙藡藨藚藗藬藲藸藘藟藣藜藑藰藦藯藞藢蠀蟺蠃蟶蟷蠉蠌蠋蠆蟼蠈蟿蠊蠂襢襚襛襗襡襜襘襝襙覈覷覶觶譐譈譊譀譓譖譔譋譕"],["f340","譑譂譒譗豃豷豶貚贆贇贉趬趪趭趫蹭蹸蹳蹪蹯蹻軂轒轑轏轐轓辴酀鄿醰醭鏞鏇鏏鏂鏚鏐鏹鏬鏌鏙鎩鏦鏊鏔鏮鏣鏕鏄鏎鏀鏒鏧镽闚闛雡霩霫霬霨霦"],["f3a1","鞳鞷鞶韝韞韟顜顙顝顗颿颽颻颾饈饇饃馦馧騚騕騥騝騤騛騢騠騧騣騞騜騔髂鬋鬊鬎鬌鬷鯪鯫鯠鯞鯤鯦鯢鯰鯔鯗鯬鯜鯙鯥鯕鯡鯚鵷鶁鶊鶄鶈鵱鶀鵸鶆鶋鶌鵽鵫鵴鵵鵰鵩鶅鵳鵻鶂鵯鵹鵿鶇鵨麔麑黀黼鼭齀齁齍齖齗齘匷嚲"],["f440","嚵嚳壣孅巆巇廮廯忀忁懹攗攖攕攓旟曨曣曤櫳櫰櫪櫨櫹櫱櫮櫯瀼瀵瀯瀷瀴瀱灂瀸瀿瀺瀹灀瀻瀳灁爓爔犨獽獼璺皫皪皾盭矌矎矏矍矲礥礣礧礨礤礩"],["f4a1","禲穮穬穭竷籉籈籊籇籅糮繻繾纁纀羺翿聹臛臙舋艨艩蘢藿蘁藾蘛蘀藶蘄蘉蘅蘌藽蠙蠐蠑蠗蠓蠖襣襦覹觷譠譪譝譨譣譥譧譭趮躆躈躄轙轖轗轕轘轚邍酃酁醷醵醲醳鐋鐓鏻鐠鐏鐔鏾鐕鐐鐨鐙鐍鏵鐀鏷鐇鐎鐖鐒鏺鐉鏸鐊鏿"],["f540","鏼鐌鏶鐑鐆闞闠闟霮霯鞹鞻韽韾顠顢顣顟飁飂饐饎饙饌饋饓騲騴騱騬騪騶騩騮騸騭髇髊髆鬐鬒鬑鰋鰈鯷鰅鰒鯸鱀鰇鰎鰆鰗鰔鰉鶟鶙鶤鶝鶒鶘鶐鶛"],["f5a1","鶠鶔鶜鶪鶗鶡鶚鶢鶨鶞鶣鶿鶩鶖鶦鶧麙麛麚黥黤黧黦鼰鼮齛齠齞齝齙龑儺儹劘劗囃嚽嚾孈孇巋巏廱懽攛欂櫼欃櫸欀灃灄灊灈灉灅灆爝爚爙獾甗癪矐礭礱礯籔籓糲纊纇纈纋纆纍罍羻耰臝蘘蘪蘦蘟蘣蘜蘙蘧蘮蘡蘠蘩蘞蘥"],["f640","蠩蠝蠛蠠蠤蠜蠫衊襭襩襮襫觺譹譸譅譺譻贐贔趯躎躌轞轛轝酆酄酅醹鐿鐻鐶鐩鐽鐼鐰鐹鐪鐷鐬鑀鐱闥闤闣霵霺鞿韡顤飉飆飀饘饖騹騽驆驄驂驁騺"],["f6a1","騿髍鬕鬗鬘鬖鬺魒鰫鰝鰜鰬鰣鰨鰩鰤鰡鶷鶶鶼鷁鷇鷊鷏鶾鷅鷃鶻鶵鷎鶹鶺鶬鷈鶱鶭鷌鶳鷍鶲鹺麜黫黮黭鼛鼘鼚鼱齎齥齤龒亹囆囅囋奱孋孌巕巑廲攡攠攦攢欋欈欉氍灕灖灗灒爞爟犩獿瓘瓕瓙瓗癭皭礵禴穰穱籗籜籙籛籚"],["f740","糴糱纑罏羇臞艫蘴蘵蘳蘬蘲蘶蠬蠨蠦蠪蠥襱覿覾觻譾讄讂讆讅譿贕躕躔躚躒躐躖躗轠轢酇鑌鑐鑊鑋鑏鑇鑅鑈鑉鑆霿韣顪顩飋饔饛驎驓驔驌驏驈驊"],["f7a1","驉驒驐髐鬙鬫鬻魖魕鱆鱈鰿鱄鰹鰳鱁鰼鰷鰴鰲鰽鰶鷛鷒鷞鷚鷋鷐鷜鷑鷟鷩鷙鷘鷖鷵鷕鷝麶黰鼵鼳鼲齂齫龕龢儽劙壨壧奲孍巘蠯彏戁戃戄攩攥斖曫欑欒欏毊灛灚爢玂玁玃癰矔籧籦纕艬蘺虀蘹蘼蘱蘻蘾蠰蠲蠮蠳襶襴襳觾"],["f840","讌讎讋讈豅贙躘轤轣醼鑢鑕鑝鑗鑞韄韅頀驖驙鬞鬟鬠鱒鱘鱐鱊鱍鱋鱕鱙鱌鱎鷻鷷鷯鷣鷫鷸鷤鷶鷡鷮鷦鷲鷰鷢鷬鷴鷳鷨鷭黂黐黲黳鼆鼜鼸鼷鼶齃齏"],["f8a1","齱齰齮齯囓囍孎屭攭曭曮欓灟灡灝灠爣瓛瓥矕礸禷禶籪纗羉艭虃蠸蠷蠵衋讔讕躞躟躠躝醾醽釂鑫鑨鑩雥靆靃靇韇韥驞髕魙鱣鱧鱦鱢鱞鱠鸂鷾鸇鸃鸆鸅鸀鸁鸉鷿鷽鸄麠鼞齆齴齵齶囔攮斸欘欙欗欚灢爦犪矘矙礹籩籫糶纚"],["f940","纘纛纙臠臡虆虇虈襹襺襼襻觿讘讙躥躤躣鑮鑭鑯鑱鑳靉顲饟鱨鱮鱭鸋鸍鸐鸏鸒鸑麡黵鼉齇齸齻齺齹圞灦籯蠼趲躦釃鑴鑸鑶鑵驠鱴鱳鱱鱵鸔鸓黶鼊"],["f9a1","龤灨灥糷虪蠾蠽蠿讞貜躩軉靋顳顴飌饡馫驤驦驧鬤鸕鸗齈戇欞爧虌躨钂钀钁驩驨鬮鸙爩虋讟钃鱹麷癵驫鱺鸝灩灪麤齾齉龘碁銹裏墻恒粧嫺╔╦╗╠╬╣╚╩╝╒╤╕╞╪╡╘╧╛╓╥╖╟╫╢╙╨╜║═╭╮╰╯▓"]]')},function(e,t,n){"use strict";(function(t,i){var a=n(25);e.exports=y;var o,r=n(45);y.ReadableState=v;n(32).EventEmitter;var s=function(e,t){return e.listeners(t).length},l=n(49),c=n(33).Buffer,d=t.Uint8Array||function(){};var u=Object.create(n(19));u.inherits=n(20);var h=n(120),f=void 0;f=h&&h.debuglog?h.debuglog("stream"):function(){};var p,m=n(121),g=n(50);u.inherits(y,l);var b=["error","close","destroy","pause","resume"];function v(e,t){e=e||{};var i=t instanceof(o=o||n(15));this.objectMode=!!e.objectMode,i&&(this.objectMode=this.objectMode||!!e.readableObjectMode);var a=e.highWaterMark,r=e.readableHighWaterMark,s=this.objectMode?16:16384;this.highWaterMark=a||0===a?a:i&&(r||0===r)?r:s,this.highWaterMark=Math.floor(this.highWaterMark),this.buffer=new m,this.length=0,this.pipes=null,this.pipesCount=0,this.flowing=null,this.ended=!1,this.endEmitted=!1,this.reading=!1,this.sync=!0,this.needReadable=!1,this.emittedReadable=!1,this.readableListening=!1,this.resumeScheduled=!1,this.destroyed=!1,this.defaultEncoding=e.defaultEncoding||"utf8",this.awaitDrain=0,this.readingMore=!1,this.decoder=null,this.encoding=null,e.encoding&&(p||(p=n(29).StringDecoder),this.decoder=new p(e.encoding),this.encoding=e.encoding)}function y(e){if(o=o||n(15),!(this instanceof y))return new y(e);this._readableState=new v(e,this),this.readable=!0,e&&("function"==typeof e.read&&(this._read=e.read),"function"==typeof e.destroy&&(this._destroy=e.destroy)),l.call(this)}function _(e,t,n,i,a){var o,r=e._readableState;null===t?(r.reading=!1,function(e,t){if(t.ended)return;if(t.decoder){var n=t.decoder.end();n&&n.length&&(t.buffer.push(n),t.length+=t.objectMode?1:n.length)}t.ended=!0,S(e)}(e,r)):(a||(o=function(e,t){var n;i=t,c.isBuffer(i)||i instanceof d||"string"==typeof t||void 0===t||e.objectMode||(n=new TypeError("Invalid non-string/buffer chunk"));var i;return n}(r,t)),o?e.emit("error",o):r.objectMode||t&&t.length>0?("string"==typeof t||r.objectMode||Object.getPrototypeOf(t)===c.prototype||(t=function(e){return c.from(e)}(t)),i?r.endEmitted?e.emit("error",new Error("stream.unshift() after end event")):w(e,r,t,!0):r.ended?e.emit("error",new Error("stream.push() after EOF")):(r.reading=!1,r.decoder&&!n?(t=r.decoder.write(t),r.objectMode||0!==t.length?w(e,r,t,!1):C(e,r)):w(e,r,t,!1))):i||(r.reading=!1));return function(e){return!e.ended&&(e.needReadable||e.length<e.highWaterMark||0===e.length)}(r)}function w(e,t,n,i){t.flowing&&0===t.length&&!t.sync?(e.emit("data",n),e.read(0)):(t.length+=t.objectMode?1:n.length,i?t.buffer.unshift(n):t.buffer.push(n),t.needReadable&&S(e)),C(e,t)}Object.defineProperty(y.prototype,"destroyed",{get:function(){return void 0!==this._readableState&&this._readableState.destroyed},set:function(e){this._readableState&&(this._readableState.destroyed=e)}}),y.prototype.destroy=g.destroy,y.prototype._undestroy=g.undestroy,y.prototype._destroy=function(e,t){this.push(null),t(e)},y.prototype.push=function(e,t){var n,i=this._readableState;return i.objectMode?n=!0:"string"==typeof e&&((t=t||i.defaultEncoding)!==i.encoding&&(e=c.from(e,t),t=""),n=!0),_(this,e,t,!1,n)},y.prototype.unshift=function(e){return _(this,e,null,!0,!1)},y.prototype.isPaused=function(){return!1===this._readableState.flowing},y.prototype.setEncoding=function(e){return p||(p=n(29).StringDecoder),this._readableState.decoder=new p(e),this._readableState.encoding=e,this};function k(e,t){return e<=0||0===t.length&&t.ended?0:t.objectMode?1:e!=e?t.flowing&&t.length?t.buffer.head.data.length:t.length:(e>t.highWaterMark&&(t.highWaterMark=function(e){return e>=8388608?e=8388608:(e--,e|=e>>>1,e|=e>>>2,e|=e>>>4,e|=e>>>8,e|=e>>>16,e++),e}(e)),e<=t.length?e:t.ended?t.length:(t.needReadable=!0,0))}function S(e){var t=e._readableState;t.needReadable=!1,t.emittedReadable||(f("emitReadable",t.flowing),t.emittedReadable=!0,t.sync?a.nextTick(A,e):A(e))}function A(e){f("emit readable"),e.emit("readable"),I(e)}function C(e,t){t.readingMore||(t.readingMore=!0,a.nextTick(x,e,t))}function x(e,t){for(var n=t.length;!t.reading&&!t.flowing&&!t.ended&&t.length<t.highWaterMark&&(f("maybeReadMore read 0"),e.read(0),n!==t.length);)n=t.length;t.readingMore=!1}function T(e){f("readable nexttick read 0"),e.read(0)}function E(e,t){t.reading||(f("resume read 0"),e.read(0)),t.resumeScheduled=!1,t.awaitDrain=0,e.emit("resume"),I(e),t.flowing&&!t.reading&&e.read(0)}function I(e){var t=e._readableState;for(f("flow",t.flowing);t.flowing&&null!==e.read(););}function M(e,t){return 0===t.length?null:(t.objectMode?n=t.buffer.shift():!e||e>=t.length?(n=t.decoder?t.buffer.join(""):1===t.buffer.length?t.buffer.head.data:t.buffer.concat(t.length),t.buffer.clear()):n=function(e,t,n){var i;e<t.head.data.length?(i=t.head.data.slice(0,e),t.head.data=t.head.data.slice(e)):i=e===t.head.data.length?t.shift():n?function(e,t){var n=t.head,i=1,a=n.data;e-=a.length;for(;n=n.next;){var o=n.data,r=e>o.length?o.length:e;if(r===o.length?a+=o:a+=o.slice(0,e),0===(e-=r)){r===o.length?(++i,n.next?t.head=n.next:t.head=t.tail=null):(t.head=n,n.data=o.slice(r));break}++i}return t.length-=i,a}(e,t):function(e,t){var n=c.allocUnsafe(e),i=t.head,a=1;i.data.copy(n),e-=i.data.length;for(;i=i.next;){var o=i.data,r=e>o.length?o.length:e;if(o.copy(n,n.length-e,0,r),0===(e-=r)){r===o.length?(++a,i.next?t.head=i.next:t.head=t.tail=null):(t.head=i,i.data=o.slice(r));break}++a}return t.length-=a,n}(e,t);return i}(e,t.buffer,t.decoder),n);var n}function O(e){var t=e._readableState;if(t.length>0)throw new Error('"endReadable()" called on non-empty stream');t.endEmitted||(t.ended=!0,a.nextTick(P,t,e))}function P(e,t){e.endEmitted||0!==e.length||(e.endEmitted=!0,t.readable=!1,t.emit("end"))}function D(e,t){for(var n=0,i=e.length;n<i;n++)if(e[n]===t)return n;return-1}y.prototype.read=function(e){f("read",e),e=parseInt(e,10);var t=this._readableState,n=e;if(0!==e&&(t.emittedReadable=!1),0===e&&t.needReadable&&(t.length>=t.highWaterMark||t.ended))return f("read: emitReadable",t.length,t.ended),0===t.length&&t.ended?O(this):S(this),null;if(0===(e=k(e,t))&&t.ended)return 0===t.length&&O(this),null;var i,a=t.needReadable;return f("need readable",a),(0===t.length||t.length-e<t.highWaterMark)&&f("length less than watermark",a=!0),t.ended||t.reading?f("reading or ended",a=!1):a&&(f("do read"),t.reading=!0,t.sync=!0,0===t.length&&(t.needReadable=!0),this._read(t.highWaterMark),t.sync=!1,t.reading||(e=k(n,t))),null===(i=e>0?M(e,t):null)?(t.needReadable=!0,e=0):t.length-=e,0===t.length&&(t.ended||(t.needReadable=!0),n!==e&&t.ended&&O(this)),null!==i&&this.emit("data",i),i},y.prototype._read=function(e){this.emit("error",new Error("_read() is not implemented"))},y.prototype.pipe=function(e,t){var n=this,o=this._readableState;switch(o.pipesCount){case 0:o.pipes=e;break;case 1:o.pipes=[o.pipes,e];break;default:o.pipes.push(e)}o.pipesCount+=1,f("pipe count=%d opts=%j",o.pipesCount,t);var l=(!t||!1!==t.end)&&e!==i.stdout&&e!==i.stderr?d:y;function c(t,i){f("onunpipe"),t===n&&i&&!1===i.hasUnpiped&&(i.hasUnpiped=!0,f("cleanup"),e.removeListener("close",b),e.removeListener("finish",v),e.removeListener("drain",u),e.removeListener("error",g),e.removeListener("unpipe",c),n.removeListener("end",d),n.removeListener("end",y),n.removeListener("data",m),h=!0,!o.awaitDrain||e._writableState&&!e._writableState.needDrain||u())}function d(){f("onend"),e.end()}o.endEmitted?a.nextTick(l):n.once("end",l),e.on("unpipe",c);var u=function(e){return function(){var t=e._readableState;f("pipeOnDrain",t.awaitDrain),t.awaitDrain&&t.awaitDrain--,0===t.awaitDrain&&s(e,"data")&&(t.flowing=!0,I(e))}}(n);e.on("drain",u);var h=!1;var p=!1;function m(t){f("ondata"),p=!1,!1!==e.write(t)||p||((1===o.pipesCount&&o.pipes===e||o.pipesCount>1&&-1!==D(o.pipes,e))&&!h&&(f("false write response, pause",n._readableState.awaitDrain),n._readableState.awaitDrain++,p=!0),n.pause())}function g(t){f("onerror",t),y(),e.removeListener("error",g),0===s(e,"error")&&e.emit("error",t)}function b(){e.removeListener("finish",v),y()}function v(){f("onfinish"),e.removeListener("close",b),y()}function y(){f("unpipe"),n.unpipe(e)}return n.on("data",m),function(e,t,n){if("function"==typeof e.prependListener)return e.prependListener(t,n);e._events&&e._events[t]?r(e._events[t])?e._events[t].unshift(n):e._events[t]=[n,e._events[t]]:e.on(t,n)}(e,"error",g),e.once("close",b),e.once("finish",v),e.emit("pipe",n),o.flowing||(f("pipe resume"),n.resume()),e},y.prototype.unpipe=function(e){var t=this._readableState,n={hasUnpiped:!1};if(0===t.pipesCount)return this;if(1===t.pipesCount)return e&&e!==t.pipes||(e||(e=t.pipes),t.pipes=null,t.pipesCount=0,t.flowing=!1,e&&e.emit("unpipe",this,n)),this;if(!e){var i=t.pipes,a=t.pipesCount;t.pipes=null,t.pipesCount=0,t.flowing=!1;for(var o=0;o<a;o++)i[o].emit("unpipe",this,n);return this}var r=D(t.pipes,e);return-1===r||(t.pipes.splice(r,1),t.pipesCount-=1,1===t.pipesCount&&(t.pipes=t.pipes[0]),e.emit("unpipe",this,n)),this},y.prototype.on=function(e,t){var n=l.prototype.on.call(this,e,t);if("data"===e)!1!==this._readableState.flowing&&this.resume();else if("readable"===e){var i=this._readableState;i.endEmitted||i.readableListening||(i.readableListening=i.needReadable=!0,i.emittedReadable=!1,i.reading?i.length&&S(this):a.nextTick(T,this))}return n},y.prototype.addListener=y.prototype.on,y.prototype.resume=function(){var e=this._readableState;return e.flowing||(f("resume"),e.flowing=!0,function(e,t){t.resumeScheduled||(t.resumeScheduled=!0,a.nextTick(E,e,t))}(this,e)),this},y.prototype.pause=function(){return f("call pause flowing=%j",this._readableState.flowing),!1!==this._readableState.flowing&&(f("pause"),this._readableState.flowing=!1,this.emit("pause")),this},y.prototype.wrap=function(e){var t=this,n=this._readableState,i=!1;for(var a in e.on("end",(function(){if(f("wrapped end"),n.decoder&&!n.ended){var e=n.decoder.end();e&&e.length&&t.push(e)}t.push(null)})),e.on("data",(function(a){(f("wrapped data"),n.decoder&&(a=n.decoder.write(a)),n.objectMode&&null==a)||(n.objectMode||a&&a.length)&&(t.push(a)||(i=!0,e.pause()))})),e)void 0===this[a]&&"function"==typeof e[a]&&(this[a]=function(t){return function(){return e[t].apply(e,arguments)}}(a));for(var o=0;o<b.length;o++)e.on(b[o],this.emit.bind(this,b[o]));return this._read=function(t){f("wrapped _read",t),i&&(i=!1,e.resume())},this},Object.defineProperty(y.prototype,"readableHighWaterMark",{enumerable:!1,get:function(){return this._readableState.highWaterMark}}),y._fromList=M}).call(this,n(8),n(12))},function(e,t,n){e.exports=n(32).EventEmitter},function(e,t,n){"use strict";var i=n(25);function a(e,t){e.emit("error",t)}e.exports={destroy:function(e,t){var n=this,o=this._readableState&&this._readableState.destroyed,r=this._writableState&&this._writableState.destroyed;return o||r?(t?t(e):!e||this._writableState&&this._writableState.errorEmitted||i.nextTick(a,this,e),this):(this._readableState&&(this._readableState.destroyed=!0),this._writableState&&(this._writableState.destroyed=!0),this._destroy(e||null,(function(e){!t&&e?(i.nextTick(a,n,e),n._writableState&&(n._writableState.errorEmitted=!0)):t&&t(e)})),this)},undestroy:function(){this._readableState&&(this._readableState.destroyed=!1,this._readableState.reading=!1,this._readableState.ended=!1,this._readableState.endEmitted=!1),this._writableState&&(this._writableState.destroyed=!1,this._writableState.ended=!1,this._writableState.ending=!1,this._writableState.finished=!1,this._writableState.errorEmitted=!1)}}},function(e,t,n){"use strict";(function(t,i,a){var o=n(25);function r(e){var t=this;this.next=null,this.entry=null,this.finish=function(){!function(e,t,n){var i=e.entry;e.entry=null;for(;i;){var a=i.callback;t.pendingcb--,a(n),i=i.next}t.corkedRequestsFree?t.corkedRequestsFree.next=e:t.corkedRequestsFree=e}(t,e)}}e.exports=v;var s,l=!t.browser&&["v0.10","v0.9."].indexOf(t.version.slice(0,5))>-1?i:o.nextTick;v.WritableState=b;var c=Object.create(n(19));c.inherits=n(20);var d={deprecate:n(123)},u=n(49),h=n(33).Buffer,f=a.Uint8Array||function(){};var p,m=n(50);function g(){}function b(e,t){s=s||n(15),e=e||{};var i=t instanceof s;this.objectMode=!!e.objectMode,i&&(this.objectMode=this.objectMode||!!e.writableObjectMode);var a=e.highWaterMark,c=e.writableHighWaterMark,d=this.objectMode?16:16384;this.highWaterMark=a||0===a?a:i&&(c||0===c)?c:d,this.highWaterMark=Math.floor(this.highWaterMark),this.finalCalled=!1,this.needDrain=!1,this.ending=!1,this.ended=!1,this.finished=!1,this.destroyed=!1;var u=!1===e.decodeStrings;this.decodeStrings=!u,this.defaultEncoding=e.defaultEncoding||"utf8",this.length=0,this.writing=!1,this.corked=0,this.sync=!0,this.bufferProcessing=!1,this.onwrite=function(e){!function(e,t){var n=e._writableState,i=n.sync,a=n.writecb;if(function(e){e.writing=!1,e.writecb=null,e.length-=e.writelen,e.writelen=0}(n),t)!function(e,t,n,i,a){--t.pendingcb,n?(o.nextTick(a,i),o.nextTick(A,e,t),e._writableState.errorEmitted=!0,e.emit("error",i)):(a(i),e._writableState.errorEmitted=!0,e.emit("error",i),A(e,t))}(e,n,i,t,a);else{var r=k(n);r||n.corked||n.bufferProcessing||!n.bufferedRequest||w(e,n),i?l(_,e,n,r,a):_(e,n,r,a)}}(t,e)},this.writecb=null,this.writelen=0,this.bufferedRequest=null,this.lastBufferedRequest=null,this.pendingcb=0,this.prefinished=!1,this.errorEmitted=!1,this.bufferedRequestCount=0,this.corkedRequestsFree=new r(this)}function v(e){if(s=s||n(15),!(p.call(v,this)||this instanceof s))return new v(e);this._writableState=new b(e,this),this.writable=!0,e&&("function"==typeof e.write&&(this._write=e.write),"function"==typeof e.writev&&(this._writev=e.writev),"function"==typeof e.destroy&&(this._destroy=e.destroy),"function"==typeof e.final&&(this._final=e.final)),u.call(this)}function y(e,t,n,i,a,o,r){t.writelen=i,t.writecb=r,t.writing=!0,t.sync=!0,n?e._writev(a,t.onwrite):e._write(a,o,t.onwrite),t.sync=!1}function _(e,t,n,i){n||function(e,t){0===t.length&&t.needDrain&&(t.needDrain=!1,e.emit("drain"))}(e,t),t.pendingcb--,i(),A(e,t)}function w(e,t){t.bufferProcessing=!0;var n=t.bufferedRequest;if(e._writev&&n&&n.next){var i=t.bufferedRequestCount,a=new Array(i),o=t.corkedRequestsFree;o.entry=n;for(var s=0,l=!0;n;)a[s]=n,n.isBuf||(l=!1),n=n.next,s+=1;a.allBuffers=l,y(e,t,!0,t.length,a,"",o.finish),t.pendingcb++,t.lastBufferedRequest=null,o.next?(t.corkedRequestsFree=o.next,o.next=null):t.corkedRequestsFree=new r(t),t.bufferedRequestCount=0}else{for(;n;){var c=n.chunk,d=n.encoding,u=n.callback;if(y(e,t,!1,t.objectMode?1:c.length,c,d,u),n=n.next,t.bufferedRequestCount--,t.writing)break}null===n&&(t.lastBufferedRequest=null)}t.bufferedRequest=n,t.bufferProcessing=!1}function k(e){return e.ending&&0===e.length&&null===e.bufferedRequest&&!e.finished&&!e.writing}function S(e,t){e._final((function(n){t.pendingcb--,n&&e.emit("error",n),t.prefinished=!0,e.emit("prefinish"),A(e,t)}))}function A(e,t){var n=k(t);return n&&(!function(e,t){t.prefinished||t.finalCalled||("function"==typeof e._final?(t.pendingcb++,t.finalCalled=!0,o.nextTick(S,e,t)):(t.prefinished=!0,e.emit("prefinish")))}(e,t),0===t.pendingcb&&(t.finished=!0,e.emit("finish"))),n}c.inherits(v,u),b.prototype.getBuffer=function(){for(var e=this.bufferedRequest,t=[];e;)t.push(e),e=e.next;return t},function(){try{Object.defineProperty(b.prototype,"buffer",{get:d.deprecate((function(){return this.getBuffer()}),"_writableState.buffer is deprecated. Use _writableState.getBuffer instead.","DEP0003")})}catch(e){}}(),"function"==typeof Symbol&&Symbol.hasInstance&&"function"==typeof Function.prototype[Symbol.hasInstance]?(p=Function.prototype[Symbol.hasInstance],Object.defineProperty(v,Symbol.hasInstance,{value:function(e){return!!p.call(this,e)||this===v&&(e&&e._writableState instanceof b)}})):p=function(e){return e instanceof this},v.prototype.pipe=function(){this.emit("error",new Error("Cannot pipe, not readable"))},v.prototype.write=function(e,t,n){var i,a=this._writableState,r=!1,s=!a.objectMode&&(i=e,h.isBuffer(i)||i instanceof f);return s&&!h.isBuffer(e)&&(e=function(e){return h.from(e)}(e)),"function"==typeof t&&(n=t,t=null),s?t="buffer":t||(t=a.defaultEncoding),"function"!=typeof n&&(n=g),a.ended?function(e,t){var n=new Error("write after end");e.emit("error",n),o.nextTick(t,n)}(this,n):(s||function(e,t,n,i){var a=!0,r=!1;return null===n?r=new TypeError("May not write null values to stream"):"string"==typeof n||void 0===n||t.objectMode||(r=new TypeError("Invalid non-string/buffer chunk")),r&&(e.emit("error",r),o.nextTick(i,r),a=!1),a}(this,a,e,n))&&(a.pendingcb++,r=function(e,t,n,i,a,o){if(!n){var r=function(e,t,n){e.objectMode||!1===e.decodeStrings||"string"!=typeof t||(t=h.from(t,n));return t}(t,i,a);i!==r&&(n=!0,a="buffer",i=r)}var s=t.objectMode?1:i.length;t.length+=s;var l=t.length<t.highWaterMark;l||(t.needDrain=!0);if(t.writing||t.corked){var c=t.lastBufferedRequest;t.lastBufferedRequest={chunk:i,encoding:a,isBuf:n,callback:o,next:null},c?c.next=t.lastBufferedRequest:t.bufferedRequest=t.lastBufferedRequest,t.bufferedRequestCount+=1}else y(e,t,!1,s,i,a,o);return l}(this,a,s,e,t,n)),r},v.prototype.cork=function(){this._writableState.corked++},v.prototype.uncork=function(){var e=this._writableState;e.corked&&(e.corked--,e.writing||e.corked||e.finished||e.bufferProcessing||!e.bufferedRequest||w(this,e))},v.prototype.setDefaultEncoding=function(e){if("string"==typeof e&&(e=e.toLowerCase()),!(["hex","utf8","utf-8","ascii","binary","base64","ucs2","ucs-2","utf16le","utf-16le","raw"].indexOf((e+"").toLowerCase())>-1))throw new TypeError("Unknown encoding: "+e);return this._writableState.defaultEncoding=e,this},Object.defineProperty(v.prototype,"writableHighWaterMark",{enumerable:!1,get:function(){return this._writableState.highWaterMark}}),v.prototype._write=function(e,t,n){n(new Error("_write() is not implemented"))},v.prototype._writev=null,v.prototype.end=function(e,t,n){var i=this._writableState;"function"==typeof e?(n=e,e=null,t=null):"function"==typeof t&&(n=t,t=null),null!=e&&this.write(e,t),i.corked&&(i.corked=1,this.uncork()),i.ending||i.finished||function(e,t,n){t.ending=!0,A(e,t),n&&(t.finished?o.nextTick(n):e.once("finish",n));t.ended=!0,e.writable=!1}(this,i,n)},Object.defineProperty(v.prototype,"destroyed",{get:function(){return void 0!==this._writableState&&this._writableState.destroyed},set:function(e){this._writableState&&(this._writableState.destroyed=e)}}),v.prototype.destroy=m.destroy,v.prototype._undestroy=m.undestroy,v.prototype._destroy=function(e,t){this.end(),t(e)}}).call(this,n(12),n(44).setImmediate,n(8))},function(e,t,n){"use strict";e.exports=r;var i=n(15),a=Object.create(n(19));function o(e,t){var n=this._transformState;n.transforming=!1;var i=n.writecb;if(!i)return this.emit("error",new Error("write callback called multiple times"));n.writechunk=null,n.writecb=null,null!=t&&this.push(t),i(e);var a=this._readableState;a.reading=!1,(a.needReadable||a.length<a.highWaterMark)&&this._read(a.highWaterMark)}function r(e){if(!(this instanceof r))return new r(e);i.call(this,e),this._transformState={afterTransform:o.bind(this),needTransform:!1,transforming:!1,writecb:null,writechunk:null,writeencoding:null},this._readableState.needReadable=!0,this._readableState.sync=!1,e&&("function"==typeof e.transform&&(this._transform=e.transform),"function"==typeof e.flush&&(this._flush=e.flush)),this.on("prefinish",s)}function s(){var e=this;"function"==typeof this._flush?this._flush((function(t,n){l(e,t,n)})):l(this,null,null)}function l(e,t,n){if(t)return e.emit("error",t);if(null!=n&&e.push(n),e._writableState.length)throw new Error("Calling transform done when ws.length != 0");if(e._transformState.transforming)throw new Error("Calling transform done when still transforming");return e.push(null)}a.inherits=n(20),a.inherits(r,i),r.prototype.push=function(e,t){return this._transformState.needTransform=!1,i.prototype.push.call(this,e,t)},r.prototype._transform=function(e,t,n){throw new Error("_transform() is not implemented")},r.prototype._write=function(e,t,n){var i=this._transformState;if(i.writecb=n,i.writechunk=e,i.writeencoding=t,!i.transforming){var a=this._readableState;(i.needTransform||a.needReadable||a.length<a.highWaterMark)&&this._read(a.highWaterMark)}},r.prototype._read=function(e){var t=this._transformState;null!==t.writechunk&&t.writecb&&!t.transforming?(t.transforming=!0,this._transform(t.writechunk,t.writeencoding,t.afterTransform)):t.needTransform=!0},r.prototype._destroy=function(e,t){var n=this;i.prototype._destroy.call(this,e,(function(e){t(e),n.emit("close")}))}},function(e,t,n){var i,a;!function(o,r){i=[n(54)],void 0===(a=function(e){return function(e,t){"use strict";var n={extend:function(e,t){for(var n in t)e[n]=t[n];return e},modulo:function(e,t){return(e%t+t)%t}},i=Array.prototype.slice;n.makeArray=function(e){return Array.isArray(e)?e:null==e?[]:"object"==typeof e&&"number"==typeof e.length?i.call(e):[e]},n.removeFrom=function(e,t){var n=e.indexOf(t);-1!=n&&e.splice(n,1)},n.getParent=function(e,n){for(;e.parentNode&&e!=document.body;)if(e=e.parentNode,t(e,n))return e},n.getQueryElement=function(e){return"string"==typeof e?document.querySelector(e):e},n.handleEvent=function(e){var t="on"+e.type;this[t]&&this[t](e)},n.filterFindElements=function(e,i){e=n.makeArray(e);var a=[];return e.forEach((function(e){if(e instanceof HTMLElement)if(i){t(e,i)&&a.push(e);for(var n=e.querySelectorAll(i),o=0;o<n.length;o++)a.push(n[o])}else a.push(e)})),a},n.debounceMethod=function(e,t,n){n=n||100;var i=e.prototype[t],a=t+"Timeout";e.prototype[t]=function(){var e=this[a];clearTimeout(e);var t=arguments,o=this;this[a]=setTimeout((function(){i.apply(o,t),delete o[a]}),n)}},n.docReady=function(e){var t=document.readyState;"complete"==t||"interactive"==t?setTimeout(e):document.addEventListener("DOMContentLoaded",e)},n.toDashed=function(e){return e.replace(/(.)([A-Z])/g,(function(e,t,n){return t+"-"+n})).toLowerCase()};var a=e.console;return n.htmlInit=function(t,i){n.docReady((function(){var o=n.toDashed(i),r="data-"+o,s=document.querySelectorAll("["+r+"]"),l=document.querySelectorAll(".js-"+o),c=n.makeArray(s).concat(n.makeArray(l)),d=r+"-options",u=e.jQuery;c.forEach((function(e){var n,o=e.getAttribute(r)||e.getAttribute(d);try{n=o&&JSON.parse(o)}catch(t){return void(a&&a.error("Error parsing "+r+" on "+e.className+": "+t))}var s=new t(e,n);u&&u.data(e,i,s)}))}))},n}(o,e)}.apply(t,i))||(e.exports=a)}(window)},function(e,t,n){var i,a;!function(o,r){"use strict";void 0===(a="function"==typeof(i=r)?i.call(t,n,t,e):i)||(e.exports=a)}(window,(function(){"use strict";var e=function(){var e=window.Element.prototype;if(e.matches)return"matches";if(e.matchesSelector)return"matchesSelector";for(var t=["webkit","moz","ms","o"],n=0;n<t.length;n++){var i=t[n]+"MatchesSelector";if(e[i])return i}}();return function(t,n){return t[e](n)}}))},function(e,t,n){"use strict";n.d(t,"a",(function(){return i}));var i=function(){function e(){this._hasWeakSet="function"==typeof WeakSet,this._inner=this._hasWeakSet?new WeakSet:[]}return e.prototype.memoize=function(e){if(this._hasWeakSet)return!!this._inner.has(e)||(this._inner.add(e),!1);for(var t=0;t<this._inner.length;t++){if(this._inner[t]===e)return!0}return this._inner.push(e),!1},e.prototype.unmemoize=function(e){if(this._hasWeakSet)this._inner.delete(e);else for(var t=0;t<this._inner.length;t++)if(this._inner[t]===e){this._inner.splice(t,1);break}},e}()},function(e,t,n){n(57),e.exports=n(58)},function(e,t,n){(function(e){("undefined"!=typeof window?window:void 0!==e?e:"undefined"!=typeof self?self:{}).SENTRY_RELEASE={id:"10.0.8"}}).call(this,n(8))},function(e,t,n){"use strict";n(59),n(60),n(61),n(62),n(63),n(64),n(65),n(66)},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){},function(e,t,n){"use strict";(function(e){var t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};n(67),n(69),n(70),n(71),n(72),n(73),n(74),n(75),n(35),n(76),n(77),n(78),n(88),n(90),n(91),n(92);var i=n(93),a=n(95),o=h(n(131)),r=h(n(5)),s=h(n(132)),l=h(n(133)),c=h(n(140)),d=h(n(141)),u=h(n(142));function h(e){return e&&e.__esModule?e:{default:e}}(function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(t[n]=e[n]);return t.default=e,t})(n(145)).init({dsn:"https://d4bf4ed225c946c8972c7238ad07d124@sentry.sickrage.ca/2",release:"10.0.8",beforeSend:function(e,t){return e.exception&&e.exception.values[0].stacktrace.frames.forEach((function(e){e.filename=e.filename.substring(e.filename.lastIndexOf("/"))})),e}}),(0,s.default)("isotope",l.default,e),(0,s.default)("imagesLoaded",c.default,e);var f=function(e){return(0,i.gettext)(e)};e(document).ready((function(e){var n={ws_notifications:function(){var t="https:"===window.location.protocol?"wss:":"ws:";new WebSocket(t+"//"+window.location.hostname+":"+window.location.port+n.srWebRoot+"/ws/ui").onmessage=function(t){var i=e.parseJSON(t.data);switch(i.type){case"NOTIFICATION":n.notify(i.data.type,i.data.title,i.data.body);break;case"redirect":window.location.href=i.data.url}}},text_viewer:function(){var t=e("p.text-viewer");t.each((function(){var t=e(this).text();t.length<500||e(this).html(t.slice(0,500)+'<span>... </span><a href="#" class="read-more"> Read More</a><span style="display:none;">'+t.slice(500,t.length)+' <a href="#" class="read-less"> Read Less </a></span>')})),e("a.read-more",t).click((function(t){t.preventDefault(),e(this).hide().prev().hide(),e(this).next().show()})),e("a.read-less",t).click((function(t){t.preventDefault(),e(this).parent().hide().prev().show().prev().show()}))},notify:function(e,t,i){r.default.modules.Desktop.permission(),new r.default({stack:{dir1:"up",dir2:"left",firstpos1:25,firstpos2:25},icons:"fontawesome5",styling:"bootstrap4",addclass:"stack-bottomright",delay:5e3,hide:!0,history:!1,shadow:!1,width:"340px",target:document.body,data:{modules:{Desktop:{desktop:!0,icon:n.srWebRoot+"/images/logo-badge.png"}},type:e,title:t,text:i.replace(/<br[\s/]*(?:\s[^>]*)?>/gi,"\n").replace(/<[/]?b(?:\s[^>]*)?>/gi,"*").replace(/<i(?:\s[^>]*)?>/gi,"[").replace(/<[/]i>/gi,"]").replace(/<(?:[/]?ul|\/li)(?:\s[^>]*)?>/gi,"").replace(/<li(?:\s[^>]*)?>/gi,"\n* ")}})},isMeta:function(t,n){return new RegExp(n.length>1?n.join("|"):n).test(e('meta[data-var="'+t+'"]').data("content"))},getMeta:function(t){return e('meta[data-var="'+t+'"]').data("content")},metaToBool:function(t){var n=e('meta[data-var="'+t+'"]').data("content");return void 0===n?n:!("false"===(n=isNaN(n)?n.toLowerCase():n.toString())||"none"===n||"0"===n)},popupWindow:function(e,t,n,i){var a=(screen.width-n)/2,o=(screen.height-i)/4;return window.open(e,t,"toolbar=no, location=no, directories=no, status=no, menubar=no, scrollbars=no, resizable=no, copyhistory=no, width="+n+", height="+i+", top="+o+", left="+a)},showHideRows:function(t,n){e("tr."+t).each((function(){n?e(this).show():e(this).hide()}))},updateUrlParameter:function(e,t,n){var i=e.indexOf("#"),a=-1===i?"":e.substr(i);e=-1===i?e:e.substr(0,i);var o=new RegExp("([?&])"+t+"=.*?(&|$)","i"),r=-1!==e.indexOf("?")?"&":"?";return n?e=e.match(o)?e.replace(o,"$1"+t+"="+n+"$2"):e+r+t+"="+n:("?"===(e=e.replace(new RegExp("([?&]?)"+t+"=[^&]*","i"),"")).slice(-1)&&(e=e.slice(0,-1)),-1===e.indexOf("?")&&(e=e.replace(/&/,"?"))),e+a},quicksearch:function(){e.widget("custom.catcomplete",e.ui.autocomplete,{_create:function(){this._super(),this.widget().menu("option","items","> :not(.ui-autocomplete-category)")},_renderMenu:function(t,n){var i=this,a="";e.each(n,(function(e,n){var o;n.category!=a&&(t.append("<li class='ui-autocomplete-category text-warning p-1'><strong class='text-uppercase'>"+n.category+"</strong></li>"),a=n.category),o=i._renderItemData(t,n),n.category&&o.attr("aria-label",n.category+" : "+n.name)}))},_renderItem:function(t,i){var a=e('<li class="bg-transparent m-1">'),o=e("<img>"),r=e("<a>");return a.attr("data-value",i.name),o.attr({src:i.img,alt:i.name,class:"img-fluid w-100"}),"shows"===i.category?(i.series_id?r.attr({href:n.srWebRoot+"/home/displayShow?show="+i.series_id,class:"btn btn-dark btn-block d-inline-block text-left"}):r.attr({href:n.srWebRoot+"/home/addShows/newShow?search_string="+i.name,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(r),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="show-name" class="text-white text-truncate"></strong></div><div class="row"><strong id="show-seasons" class="text-secondary"></strong></div></div></div>')),a.find("#show-img").append(o),i.series_id?a.find("#show-name").append(i.name):a.find("#show-name").append("Add new show: "+i.name),a.find("#show-seasons").append(i.seasons+" seasons")):(r.attr({href:n.srWebRoot+"/home/displayShow?show="+i.series_id+"#S"+i.season+"E"+i.episode,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(r),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="ep-name" class="text-white"></strong></div><div class="row"><strong id="show-name" class="text-secondary text-truncate"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#ep-name").append(i.name),a.find("#show-name").append(i.showname)),a.appendTo(t)}}),e("#quicksearch").catcomplete({delay:1e3,minLength:1,source:function(t,i){e.ajax({url:n.srWebRoot+"/quicksearch.json",dataType:"json",type:"POST",data:{term:t.term},success:function(e){i(e)}})},focus:function(t,n){return e("#quicksearch").val(n.item.name),!1},open:function(){e(".quicksearch-input-container").append('<button type="button" class="quicksearch-input-btn"><i class="fas fa-1x fa-times-circle text-white m-2" aria-hidden="true"></i></button>'),e("ul.ui-menu").width(e(this).innerWidth()),e("ul.ui-menu").css("border","none"),e("ul.ui-menu").css("outline","none"),e("ul.ui-menu").addClass("bg-dark shadow rounded"),e(".quicksearch-input-btn").click((function(){e("#quicksearch").catcomplete("close").val(""),e(this).remove()}))}})},updateProfileBadge:function(){var t=0;e.getJSON(n.srWebRoot+"/logs/errorCount",(function(n){n.count?(t+=n.count,e("#numErrors").text(n.count),e("#numErrors").parent().removeClass("d-none")):e("#numErrors").parent().addClass("d-none"),t?e("#profile-badge").text(t):e("#profile-badge").text("")})),e.getJSON(n.srWebRoot+"/logs/warningCount",(function(n){n.count?(t+=n.count,e("#numWarnings").text(n.count),e("#numWarnings").parent().removeClass("d-none")):e("#numWarnings").parent().addClass("d-none"),t?e("#profile-badge").text(t):e("#profile-badge").text("")})),e.getJSON(n.srWebRoot+"/announcements/announcementCount",(function(n){n.count?(t+=n.count,e("#numAnnouncements").text(n.count)):e("#numAnnouncements").text(""),t?e("#profile-badge").text(t):e("#profile-badge").text("")}))},common:{init:function(){n.srPID=n.getMeta("srPID"),n.srWebRoot=n.getMeta("srWebRoot"),n.srDefaultPage=n.getMeta("srDefaultPage"),n.loadingHTML='<i class="fas fa-spinner fa-spin fa-fw"></i>',n.anonURL=n.getMeta("anonURL"),n.ws_notifications(),n.updateProfileBadge(),e.get(n.srWebRoot+"/messages.po",(function(e){e&&((0,i.addLocale)(n.getMeta("srLocale"),a.po.parse(e)),(0,i.useLocale)(n.getMeta("srLocale")))})),n.quicksearch(),e(window).scroll((function(){e(this).scrollTop()>50?e("#back-to-top").fadeIn():e("#back-to-top").fadeOut()})),e("#back-to-top").click((function(){return e("body,html").animate({scrollTop:0},800),!1})),e('[title!=""]').tooltipster();for(var t=document.getElementsByTagName("img"),r=0;r<t.length;r++)t[r].getAttribute("data-src")&&t[r].setAttribute("src",t[r].getAttribute("data-src"));(navigator.maxTouchPoints||0)<2&&e(".dropdown-toggle").on("click",(function(){"true"===e(this).attr("aria-expanded")&&(window.location.href=e(this).attr("href"))})),n.metaToBool("sickrage.FUZZY_DATING")&&(e.timeago.settings.allowFuture=!0,e.timeago.settings.strings={prefixAgo:null,prefixFromNow:"In ",suffixAgo:"ago",suffixFromNow:"",seconds:"less than a minute",minute:"about a minute",minutes:"%d minutes",hour:"an hour",hours:"%d hours",day:"a day",days:"%d days",month:"a month",months:"%d months",year:"a year",years:"%d years",wordSeparator:" ",numbers:[]},e("[datetime]").timeago()),e.tablesorter.addParser({id:"loadingNames",is:function(){return!1},format:function(e){return 0===e.indexOf("Loading...")?e.replace("Loading...","000"):n.metaToBool("sickrage.SORT_ARTICLE")?e||"":(e||"").replace(/^(The|A|An)\s/i,"")},type:"text"}),e.tablesorter.addParser({id:"quality",is:function(){return!1},format:function(e){return e.replace("hd1080p",5).replace("hd720p",4).replace("hd",3).replace("sd",2).replace("any",1).replace("best",0).replace("custom",7)},type:"numeric"}),e.tablesorter.addParser({id:"realISODate",is:function(){return!1},format:function(e){return new Date(e).getTime()},type:"numeric"}),e.tablesorter.addParser({id:"cDate",is:function(){return!1},format:function(e){return e},type:"numeric"}),e.tablesorter.addParser({id:"eps",is:function(){return!1},format:function(e){var t=e.match(/^(.*)/);if(null===t||"?"===t[1])return-10;var i=t[1].split(" / ");if(-1!==i[0].indexOf("+")){var a=i[0].split("+");i[0]=a[0]}if(i[0]=parseInt(i[0]),i[1]=parseInt(i[1]),0===i[0])return i[1];var o=parseInt(n.getMeta("max_download_count")*i[0]/i[1]),r=Math.round(i[0]/i[1]*100)/1e3;return o>0&&(o+=i[0]),o+r},type:"numeric"}),o.default.defaults={theme:"dark",type:"blue",typeAnimated:!0,confirm:function(){location.href=this.$target.attr("href")}},e("a.shutdown").confirm({theme:"dark",title:f("Shutdown"),content:f("Are you sure you want to shutdown SiCKRAGE ?")}),e("a.restart").confirm({theme:"dark",title:f("Restart"),content:f("Are you sure you want to restart SiCKRAGE ?")}),e("a.submiterrors").confirm({theme:"dark",title:f("Submit Errors"),content:f("Are you sure you want to submit these errors ?")+'<br><br><span class="text-danger">'+f("Make sure SiCKRAGE is updated and trigger")+"<br>"+f("this error with debug enabled before submitting")+"</span>"}),e("#removeW").click((function(){e("#white option:selected").remove().appendTo("#pool")})),e("#addW").click((function(){e("#pool option:selected").remove().appendTo("#white")})),e("#addB").click((function(){e("#pool option:selected").remove().appendTo("#black")})),e("#removeP").click((function(){e("#pool option:selected").remove()})),e("#removeB").click((function(){e("#black option:selected").remove().appendTo("#pool")})),e("#addToWhite").click((function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#white"),e("#addToPoolText").val("")}})),e("#addToBlack").click((function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#black"),e("#addToPoolText").val("")}})),e("input:checkbox.enabler").each((function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).show():e("#content_"+e(this).attr("id")).hide()})),e("input:checkbox.enabler").on("click",(function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).fadeIn("fast","linear"):e("#content_"+e(this).attr("id")).fadeOut("fast","linear")})),e(".modal").on("shown.bs.modal",(function(){e("body").addClass("modal-open"),e("body").removeAttr("style")})),n.browser.init(),n.quality_chooser.init(),e("#changelog").on("click",(function(t){t.preventDefault(),e("#changelogModal").find(".modal-body").load(n.srWebRoot+"/changelog"),e("#changelogModal").modal()})),n.text_viewer()}},ajax_search:{searchStatusUrl:"/home/getManualSearchStatus",failedDownload:!1,qualityDownload:!1,selectedEpisode:"",manualSearches:[],searchStatusCursor:0,init:function(){n.ajax_search.searchStatusUrl=n.srWebRoot+n.ajax_search.searchStatusUrl,n.ajax_search.ajaxEpSearch({colorRow:!0}),n.ajax_search.checkManualSearches(),n.ajax_search.ajaxEpSubtitlesSearch()},enableLink:function(e){e.on("click.disabled",!1),e.prop("enableClick","1"),e.fadeTo("fast",1)},disableLink:function(e){e.off("click.disabled"),e.prop("enableClick","0"),e.fadeTo("fast",.5)},updateImages:function(t){e.each(t.episodes,(function(t,i){var a="",o=e("a[id="+i.show+"x"+i.season+"x"+i.episode+"]"),r=o.children("i"),s=o.parent();if(o){var l="";"searching"===i.searchstatus.toLowerCase()?(r.prop("class","fas fa-spinner fa-spin fa-fw"),r.prop("title",f("Searching")),r.prop("alt",f("Searching")),n.ajax_search.disableLink(o),a=i.searchstatus):"queued"===i.searchstatus.toLowerCase()?(r.prop("class","fas fa-clock"),r.prop("title",f("Queued")),r.prop("alt",f("Queued")),n.ajax_search.disableLink(o),a=i.searchstatus):"finished"===i.searchstatus.toLowerCase()&&(r.prop("class","fas fa-search"),r.prop("title",f("Search")),r.prop("alt",f("Search")),"N/A"!==i.quality&&r.parent().prop("class","epRetry"),n.ajax_search.enableLink(o),l=/(\w+)\s\((.+?)\)/,a=i.status.replace(l,'$1 <span class="badge text-white '+i.quality+'">$2</span>'),s.closest("tr").prop("class",i.overview+" season-"+i.season+" seasonstyle font-weight-bold text-dark")),s.siblings(".col-status").html(a)}var c=e("a[id=forceUpdate-"+i.show+"x"+i.season+"x"+i.episode+"]"),d=c.children("i");c&&("searching"===i.searchstatus.toLowerCase()?(d.prop("title",f("Searching")),d.prop("alt",f("Searching")),d.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(c)):"queued"===i.searchstatus.toLowerCase()?(d.prop("title",f("Queued")),d.prop("alt",f("Queued")),d.prop("class","fas fa-clock")):"finished"===i.searchstatus.toLowerCase()&&(d.prop("title",f("Search")),d.prop("alt",f("Search")),d.prop("class","fas fa-search"),"snatched"===i.overview.toLowerCase()?c.closest("tr").remove():n.ajax_search.enableLink(c)))}))},manualSearch:function(t){var i,a,o,r=n.ajax_search.selectedEpisode.parent(),s=n.ajax_search.selectedEpisode,l=n.ajax_search.selectedEpisode.children("i");l.prop("title",f("loading")),l.prop("class",t.loadingIcon);var c=n.ajax_search.selectedEpisode.prop("href");return!1===n.ajax_search.failedDownload&&(c=c.replace("retryEpisode","searchEpisode")),c=c+"&downCurQuality="+(n.ajax_search.qualityDownload?"1":"0"),e.getJSON(c,(function(e){if("failure"===e.result.toLowerCase())i=t.noIcon,a="failed";else{i=t.loadingIcon,a="success",t.colorRow&&r.parent().removeClass("skipped wanted qual good unaired").addClass("snatched");o=e.result.replace(/(\w+)\s\((.+?)\)/,'$1 <span class="badge text-white '+e.quality+'">$2</span>'),r.siblings(".col-status").html(o),n.ajax_search.disableLink(s)}l.prop("title",a),l.prop("height",t.size),l.prop("class",i)})),!1},checkManualSearches:function(){var t=e("#series_id").val();if(void 0!==t){var i=5e3;e.ajax({url:n.ajax_search.searchStatusUrl+"?show="+t+"&cursor="+n.ajax_search.searchStatusCursor,success:function(e){n.ajax_search.searchStatusCursor=e.cursor||0,i=e.episodes&&e.episodes.length?5e3:15e3,n.ajax_search.updateImages(e)},error:function(){i=3e4},type:"GET",dataType:"json",complete:function(){setTimeout(n.ajax_search.checkManualSearches,i)},timeout:15e3})}},ajaxEpSearch:function(t){t=e.extend({},{size:16,colorRow:!1,loadingIcon:"fas fa-spinner fa-spin fa-fw",queuedIcon:"fas fa-clock",noIcon:"fas fa-times",yesIcon:"fas fa-check"},t),e(".epRetry").click((function(t){if(t.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e("#manualSearchModalFailed").modal()})),e(".epSearch").click((function(i){if(i.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e(this).parent().parent().children(".col-status").children(".quality").length?e("#manualSearchModalQuality").modal():n.ajax_search.manualSearch(t)})),e("#manualSearchModalFailed .btn").click((function(){n.ajax_search.failedDownload=this.classList.contains("btn-success")})),e("#manualSearchModalQuality .btn").click((function(){n.ajax_search.qualityDownload=this.classList.contains("btn-success"),n.ajax_search.manualSearch(t)}))},ajaxEpSubtitlesSearch:function(){e(".epSubtitlesSearch").click((function(){var t=e(this).parent().siblings(".col-subtitles"),n=e(this);return n.empty(),n.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),(function(i){if("failure"!==i.result.toLowerCase()&&"no subtitles downloaded"!==i.result.toLowerCase()){var a=i.subtitles.split(",");t.empty(),e.each(a,(function(n,i){""!==i&&"und"!==i&&(a.length,t.append(e("<i/>").attr({class:"sickrage-flags sickrage-flags-"+i})))})),n.remove()}else n.remove()})),!1}))},ajaxEpMergeSubtitles:function(){e(".epMergeSubtitles").click((function(){var t=e(this);return t.empty(),t.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),(function(){t.remove()})),!1}))}},browser:{defaults:{title:f("Choose Directory"),url:"/browser/",autocompleteURL:"/browser/complete",includeFiles:0,fileTypes:[],showBrowseButton:!0},fileBrowserDialog:null,currentBrowserPath:null,currentRequest:null,init:function(){n.browser.defaults.url=n.srWebRoot+n.browser.defaults.url,n.browser.defaults.autocomplete=n.srWebRoot+n.browser.defaults.autocompleteURL,e.fn.fileBrowser=n.browser.fileBrowser,e.fn.nFileBrowser=n.browser.nFileBrowser},browse:function(t,i,a,o){n.browser.currentBrowserPath!==t&&(n.browser.currentBrowserPath=t,n.browser.currentRequest&&n.browser.currentRequest.abort(),n.browser.currentRequest=e.getJSON(i,{path:t,includeFiles:a,fileTypes:o.join(",")},(function(t){n.browser.fileBrowserDialog.find(".modal-body").empty();var r,s=t[0],l=0,c=null;t=e.grep(t,(function(){return 0!=l++})),e('<input class="form-control mb-1">').val(s.currentPath).on("keypress",(function(e){13===e.which&&n.browser.browse(e.target.value,i,a,o)})).appendTo(n.browser.fileBrowserDialog.find(".modal-body")).fileBrowser({showBrowseButton:!1}).on("autocompleteselect",(function(e,t){n.browser.browse(t.item.value,i,a,o)})),r=e('<div class="list-group">').appendTo(n.browser.fileBrowserDialog.find(".modal-body")),e.each(t,(function(t,s){if(s.isFile&&o&&(!s.isAllowed||-1!==o.indexOf("images")&&!s.isImage))return!0;c=e('<a href="javascript:void(0)">').on("click",(function(){s.isFile?(n.browser.currentBrowserPath=s.path,n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click()):n.browser.browse(s.path,i,a,o)})).text(s.name),s.isImage?c.prepend('<span class="fas fa-file-image ml-1 mr-1"></span>'):s.isFile?c.prepend('<span class="fas fa-file ml-1 mr-1"></span>'):c.prepend('<span class="fas fa-folder ml-1 mr-1"></span>').on("mouseenter",(function(){e("span",this).addClass("fa-folder-open")})).on("mouseleave",(function(){e("span",this).removeClass("fa-folder-open")})),c.appendTo(r)})),e("a",r).wrap('<div class="list-group-item list-group-item-action list-group-item-dark p-0">')})))},nFileBrowser:function(t,i){i=e.extend({},n.browser.defaults,i),n.browser.fileBrowserDialog?n.browser.fileBrowserDialog.find(".modal-title").text(i.title):(n.browser.fileBrowserDialog=e("#fileBrowserDialog").modal(),n.browser.fileBrowserDialog.find(".modal-body").addClass("ui-front"),n.browser.fileBrowserDialog.find(".modal-title").text(i.title),n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click((function(){t(n.browser.currentBrowserPath,i),n.browser.fileBrowserDialog.modal("hide")})));var a="";return i.initialDir&&(a=i.initialDir),n.browser.browse(a,i.url,i.includeFiles,i.fileTypes),n.browser.fileBrowserDialog.modal(),!1},fileBrowser:function(t){if((t=e.extend({},n.browser.defaults,t)).field=e(this),t.field.autocomplete&&t.autocompleteURL){var i="";t.field.autocomplete({position:{my:"top",at:"bottom",collision:"flipfit"},source:function(n,a){i=e.ui.autocomplete.escapeRegex(n.term,t.includeFiles),e.ajax({url:t.autocompleteURL,data:n,dataType:"json",success:function(t){var n=new RegExp("^"+i,"i"),o=e.grep(t,(function(e){return n.test(e)}));a(o)}})},open:function(){e(".ui-autocomplete li.ui-menu-item a").removeClass("ui-corner-all")}}).data("ui-autocomplete")._renderItem=function(t,n){var a=n.label,o=new RegExp("(?![^&;]+;)(?!<[^<>]*)("+i+")(?![^<>]*>)(?![^&;]+;)","gi");return a=a.replace(o,(function(e){return"<b>"+e+"</b>"})),e("<li></li>").data("ui-autocomplete-item",n).append("<a class='text-nowrap'>"+a+"</a>").appendTo(t)}}var a,o,r=!1;try{r=!!localStorage.getItem}catch(e){r=null}return r&&t.key&&(a=localStorage["fileBrowser-"+t.key]),t.key&&0===t.field.val().length&&a&&t.field.val(a),o=function(e,t){t.field.val(e),r&&t.key&&(localStorage["fileBrowser-"+t.key]=e)},t.field.addClass("fileBrowserField"),t.showBrowseButton&&t.field.after(e('<div class="input-group-append"><span class="input-group-text"><a href="#" class="fileBrowser fas fa-search""></a></span></div>').on("click",(function(){var n=t.field.val()||t.key&&a||"",i=e.extend({},t,{initialDir:n});return e(this).nFileBrowser(o,i),!1}))),t.field}},root_dirs:{init:function(){for(var t=["assert","clear","count","debug","dir","dirxml","error","exception","group","groupCollapsed","groupEnd","info","log","markTimeline","profile","profileEnd","table","time","timeEnd","timeStamp","trace","warn"],i=t.length,a=window.console=window.console||{};i--;){var o=t[i];a[o]||(a[o]=function(){})}e("#addRootDir").click((function(){e(this).nFileBrowser(n.root_dirs.addRootDir)})),e("#editRootDir").click((function(){e(this).nFileBrowser(n.root_dirs.editRootDir,{initialDir:e("#rootDirs option:selected").val()})})),e("#deleteRootDir").click((function(){if(e("#rootDirs option:selected").length){var t=e("#rootDirs option:selected"),i=t.attr("id")===e("#whichDefaultRootDir").val(),o=e("#rootDirs option:selected").attr("id").substr(3);if(t.remove(),n.root_dirs.syncOptionIDs(),i)a.log("new default when deleting"),e("#whichDefaultRootDir").val(""),e("#rootDirs option").length&&n.root_dirs.setDefault(e("#rootDirs option").attr("id"));else if(e("#whichDefaultRootDir").val().length){var r=e("#whichDefaultRootDir").val().substr(3);r>o&&e("#whichDefaultRootDir").val("rd-"+(r-1))}}n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})})),e("#defaultRootDir").click((function(){e("#rootDirs option:selected").length&&n.root_dirs.setDefault(e("#rootDirs option:selected").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})})),e("#rootDirs").click((function(){n.root_dirs.refreshRootDirs()})),n.root_dirs.syncOptionIDs(),n.root_dirs.setDefault(e("#whichDefaultRootDir").val(),!0),n.root_dirs.refreshRootDirs()},addRootDir:function(t){if(t.length){var i=!1;return e("#whichDefaultRootDir").val().length||(i=!0),e("#rootDirs").append('<option value="'+t+'">'+t+"</option>"),n.root_dirs.syncOptionIDs(),i&&n.root_dirs.setDefault(e("#rootDirs option").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}),!1}},editRootDir:function(t){t.length&&(e("#rootDirs option:selected").length&&(e("#rootDirs option:selected").attr("id")===e("#whichDefaultRootDir").val()?e("#rootDirs option:selected").text("*"+t):e("#rootDirs option:selected").text(t),e("#rootDirs option:selected").val(t)),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}))},setDefault:function(t,n){if((void 0===t||t.length)&&(e("#whichDefaultRootDir").val()!==t||!0===n)){if("*"!==e("#"+t).text().charAt(0)&&e("#"+t).text("*"+e("#"+t).text()),e("#whichDefaultRootDir").val()&&!0!==n){var i=e("#"+e("#whichDefaultRootDir").val());i.text(i.text().substring(1))}e("#whichDefaultRootDir").val(t)}},syncOptionIDs:function(){var t=0;e("#rootDirs option").each((function(){e(this).attr("id","rd-"+t++)}))},refreshRootDirs:function(){if(e("#rootDirs").length){var t="true";n.root_dirs.syncOptionIDs(),!e("#rootDirs option:selected").length&&e("#whichDefaultRootDir").val().length&&e("#"+e("#whichDefaultRootDir").val()).prop("selected",!0),e("#rootDirs option:selected").length&&(t=""),e("#deleteRootDir").prop("disabled",t),e("#defaultRootDir").prop("disabled",t),e("#editRootDir").prop("disabled",t);var i="";e("#whichDefaultRootDir").val().length>=4&&(i=e("#whichDefaultRootDir").val().substr(3)),e("#rootDirs option").each((function(){i.length&&(i+="|"+e(this).val())})),e("#rootDirText").val(i),e("#rootDirText").change()}}},quality_chooser:{init:function(){e("#qualityPreset").change((function(){n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())})),n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())},setFromPresets:function(t){if(0===parseInt(t))return e("#qualityPreset_label").hide(),void e("#customQuality").show();e("#customQuality").hide(),e("#qualityPreset_label").show(),e("#anyQualities option").each((function(){(t&e(this).val())>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)})),e("#bestQualities option").each((function(){(t&e(this).val()<<16)>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)}))}},root:{init:function(){},schedule:function(){if(n.ajax_search.init(),e.backstretch(n.srWebRoot+"/images/backdrops/schedule.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),n.isMeta("sickrage.COMING_EPS_LAYOUT",["LIST"])){var t={DATE:0,SHOW:2,NETWORK:5},i=n.getMeta("sickrage.COMING_EPS_SORT"),a=i in t?[[t[i],0]]:[[0,0]];e("#showListTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["stickyHeaders","filter","columnSelector","saveSort"],sortList:a,textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},7:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"loadingNames"},7:{sorter:"quality"},8:{sorter:!1},9:{sorter:!1}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_saveFilters:!0,columnSelector_mediaquery:!1}:{filter_columnFilters:!1,columnSelector_mediaquery:!1}})}n.isMeta("sickrage.COMING_EPS_LAYOUT",["BANNER","POSTER"])&&(e(".ep_summary").hide(),e(".ep_summaryTrigger").click((function(){e(this).next(".ep_summary").slideToggle("normal",(function(){e(this).prev(".ep_summaryTrigger").attr("class",(function(t,n){return e(this).next(".ep_summary").is(":visible")?n.replace("fa-plus-square","fa-minus-square"):n.replace("fa-minus-square","fa-plus-square")}))}))}))),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e.tablesorter.columnSelector.attachTo(e("#showListTable"),"#popover-target")}))},history:function(){e.backstretch(n.srWebRoot+"/images/backdrops/history.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#historyTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["filter"],sortList:[[0,1]],textExtraction:n.isMeta("sickrage.HISTORY_LAYOUT",["DETAILED"])?{0:function(t){return e(t).find("time").attr("datetime")},4:function(t){return e(t).find("span").text().toLowerCase()}}:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("span").text().toLowerCase()},2:function(t){return e(t).attr("data-provider").toLowerCase()},5:function(t){return e(t).attr("data-quality").toLowerCase()}},headers:n.isMeta("sickrage.HISTORY_LAYOUT",["DETAILED"])?{0:{sorter:"realISODate"},4:{sorter:"data-quality"}}:{0:{sorter:"realISODate"},4:{sorter:!1},5:{sorter:"data-quality"}}}),e("#history_limit").on("change",(function(){window.location.href=n.srWebRoot+"/history/?limit="+e(this).val()})),e("a.clearhistory").confirm({theme:"dark",title:f("Clear History"),content:f("Are you sure you want to clear all download history ?")}),e("a.trimhistory").confirm({theme:"dark",title:f("Trim History"),content:f("Are you sure you want to trim all download history older than 30 days ?")})},api_builder:function(){e("[data-action=api-call]").on("click",(function(){var t=e("[data-command="+e(this).data("command-name")+"]"),n=e("#option-profile").is(":checked"),i=e(this).data("target"),a=e(this).data("time"),o=e("#"+e(this).data("base-url")).text(),r=e(this).data("url");e.each(t,(function(t,n){var i=e(n).attr("name"),a=e(n).val();void 0!==i&&void 0!==a&&i!==a&&a&&(e.isArray(a)&&(a=a.join("|")),o+="&"+i+"="+a)})),n&&(o+="&profile=1");var s=(new Date).getTime();e.get(o,(function(t,n,l){var c=(new Date).getTime()-s,d=e("#option-jsonp").is(":checked"),u=l.getResponseHeader("content-type")||"",h=e(i);if(e(a).text(c+"ms"),e(r).text(o+(d?"&jsonp=foo":"")),"image/"===u.slice(0,6))h.html(e("<img/>").attr("src",o));else{var f=JSON.stringify(t,null,4);d?h.text("foo("+f+");"):h.text(f)}h.parents(".result-wrapper").removeClass("d-none")}))})),e("[data-action=clear-result]").on("click",(function(){e(e(this).data("target")).html("").parents(".result-wrapper").addClass("d-none")})),e("[data-action=update-episodes]").on("change",(function(){var t=e(this).data("command"),i=e("[data-command="+t+"][name=episode]"),a=e(this).val(),o=e("[data-command="+t+"][name=series_id]").val(),r=e.parseJSON(window.atob(n.getMeta("episodes")));if(void 0!==i)for(var s in i.removeClass("d-none"),i.find("option:gt(0)").remove(),r[o][a])Object.prototype.hasOwnProperty.call(r[o][a],s)&&i.append(e("<option>",{value:s,label:"Episode "+s}))})),e("[data-action=update-seasons]").on("change",(function(){var t=e(this).data("command"),i=e("[data-command="+t+"][name=season]"),a=e(this).val(),o=e.parseJSON(window.atob(n.getMeta("episodes")));if(void 0!==i)for(var r in i.removeClass("d-none"),i.find("option:gt(0)").remove(),o[a])Object.prototype.hasOwnProperty.call(o[a],r)&&i.append(e("<option>",{value:r,label:0===r?"Specials":"Season "+r}))}))},announcements:function(){e(".mark-seen").on("click",(function(){var t=e(this);e.post(n.srWebRoot+"/announcements/mark-seen",{ahash:e(this).closest(".announcement")[0].id},(function(){n.updateProfileBadge(),t.hide()}))}))}},home:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/home.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},index:function(){var t=new IntersectionObserver((function(t,i){t.forEach((function(t){t.isIntersecting&&e.getJSON(n.srWebRoot+"/home/showProgress",{"show-id":e(t.target).data("show-id")},(function(n){var a=n.progressbar_percent,o=100===a?100:a>80?80:a>60?60:a>40?40:20;e(t.target).append('<div class="progressbarText" title="'+n.progress_tip+'">'+n.progress_text+"</div>"),e(t.target).css({width:a+"%"}),e(t.target).addClass("progress-"+o),i.unobserve(t.target)}))}))}));function i(t){var n,i,a;t<125?a=3:t<175?(n=9,i=.6,a=4):(n=11,i=1,a=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():(e(".show-details").show(),e(".show-dlstats, .show-quality").css("fontSize",n),e(".show-network-image").css("transform","scale("+i+")")),e(".show-container").css({width:t,borderRadius:a})}document.querySelectorAll("div.progress-bar").forEach((function(e){t.observe(e)})),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.posterSize||188,change:function(t,n){window.localStorage&&localStorage.setItem("posterSize",n.value),i(n.value),e(".show-grid").isotope("layout")}}),e("#showListTableShows:has(tbody tr), #showListTableAnime:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[7,1],[2,0]],textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span:first").text()},6:function(t){return e(t).data("show-size")},7:function(t){return e(t).find("span").text().toLowerCase()}},widgets:["saveSort","stickyHeaders","filter","columnSelector"],headers:n.metaToBool("sickrage.FILTER_ROW")?{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"},7:{filter:"parsed"}}:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_functions:{5:function(e,t,n){var i=!1,a=Math.floor(t%1*1e3);if(""===n)i=!0;else{var o=n.match(/(<|<=|>=|>)\s(\d+)/i);o&&("<"===o[1]?a<parseInt(o[2])&&(i=!0):"<="===o[1]?a<=parseInt(o[2])&&(i=!0):">="===o[1]?a>=parseInt(o[2])&&(i=!0):">"===o[1]&&a>parseInt(o[2])&&(i=!0)),(o=n.match(/(\d+)\s(-|to)\s(\d+)/i))&&("-"!==o[2]&&"to"!==o[2]||a>=parseInt(o[1])&&a<=parseInt(o[3])&&(i=!0)),(o=n.match(/(=)?\s?(\d+)\s?(=)?/i))&&("="!==o[1]&&"="!==o[3]||parseInt(o[2])===a&&(i=!0)),!isNaN(parseFloat(n))&&isFinite(n)&&parseInt(n)===a&&(i=!0)}return i}},columnSelector_mediaquery:!1}:{filter_columnFilters:!1},sortStable:!0,sortAppend:[[2,0]]}),e(".show-grid").imagesLoaded((function(){i(parseInt(localStorage.posterSize||188)),e(".show-grid").removeClass("d-none"),e(".show-grid").isotope({itemSelector:".show-container",sortBy:n.getMeta("sickrage.POSTER_SORT_BY"),sortAscending:n.getMeta("sickrage.POSTER_SORT_BY"),layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{NAME:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^((?:The|A|An)\s)/i,"")).toLowerCase()}}});var t=null;e(".show-container").on("mouseenter",(function(){var n=e(this);"none"===n.find(".show-details").css("display")&&(t=setTimeout((function(){t=null,e("#posterPopup").remove();var i=n.clone().attr({id:"posterPopup"}),a=n.offset().left,o=n.offset().top;i.css({position:"absolute",margin:0,top:o,left:a,zIndex:9999}),i.find(".show-details").show(),i.on("mouseleave",(function(){e(this).remove()})),i.appendTo("body");var r=o+n.height()/2-219,s=a+n.width()/2-125,l=e(window).scrollTop(),c=e(window).scrollLeft(),d=l+e(window).innerHeight(),u=c+e(window).innerWidth();r<l+5&&(r=l+5),s<c+5&&(s=c+5),r+438+5>d&&(r=d-438-5),s+250+5>u&&(s=u-250-5),i.animate({top:r,left:s,width:250,height:438})}),300))})).on("mouseleave",(function(){null!==t&&clearTimeout(t)}))})),e("#postersort").on("change",(function(){var t=e(this).val();e(".show-grid").isotope({sortBy:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))})),e("#postersortdirection").on("change",(function(){var t="true"===e(this).val();e(".show-grid").isotope({sortAscending:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))})),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e.tablesorter.columnSelector.attachTo(e("#showListTableShows"),"#popover-target"),e("#showListTableAnime").length&&n.metaToBool("sickrage.ANIME_SPLIT_HOME")&&e.tablesorter.columnSelector.attachTo(e("#showListTableAnime"),"#popover-target")}))},display_show:{init:function(){n.home.display_show.imdbRating(),n.metaToBool("sickrage.FANART_BACKGROUND")&&(e.backstretch(n.srWebRoot+"/images/"+e("#series_id").attr("value")+".fanart.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")),e("#showTable, #animeTable").tablesorter({theme:"bootstrap",widgets:["saveSort","columnSelector"],widgetOptions:{columnSelector_saveColumns:!0,columnSelector_layout:'<br><label><input type="checkbox">{name}</label>',columnSelector_mediaquery:!1,columnSelector_cssChecked:"checked"}}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",(function(){e(".displayShowTable").each((function(t,n){e.tablesorter.columnSelector.attachTo(n,"#popover-target")}))})),e("#seasonJump").on("change",(function(){var t=e("#seasonJump option:selected").val();if(t&&"jump"!==t){var n=e("#seasonJump option:selected").data("season");e("html,body").animate({scrollTop:e('[name ="'+t.substring(1)+'"]').offset().top-50},"slow"),e("#collapseSeason-"+n).collapse("show"),location.hash=t}e(this).val("jump")})),e("#prevShow").on("click",(function(){e("#pickShow option:selected").prev().prop("selected","selected"),e("#pickShow").change()})),e("#nextShow").on("click",(function(){e("#pickShow option:selected").next().prop("selected","selected"),e("#pickShow").change()})),e("#changeStatus").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/manage/setEpisodeStatus?show="+e("#series_id").attr("value")+"&eps="+t.join("|")+"&status="+e("#statusSelect").val()})),e("#deleteEpisode").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/deleteEpisode?show="+e("#series_id").attr("value")+"&eps="+t.join("|")})),e(".seasonCheck").on("click",(function(){var t=this,n=e(this).attr("id");e("#collapseSeason-"+n).collapse("show"),e(".epCheck:visible").each((function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)}))}));var t=null;e(".epCheck").on("click",(function(n){if(t&&n.shiftKey){var i=this,a=0;e(".epCheck").each((function(){switch(a){case 2:return!1;case 1:e(this).prop("checked",t.checked)}e(this)!==i&&e(this)!==t||a++}))}else t=this})),e(".seriesCheck").on("click",(function(){e(".epCheck:visible").each((function(){e(this).prop("checked",!0)})),e(".seasonCheck:visible").each((function(){e(this).prop("checked",!0)}))})),e(".clearAll").on("click",(function(){e(".epCheck:visible").each((function(){e(this).prop("checked",!1)})),e(".seasonCheck:visible").each((function(){e(this).prop("checked",!1)}))})),e("#pickShow").on("change",(function(){var t=e(this).val();0!==t&&(window.location.href=n.srWebRoot+"/home/displayShow?show="+t)})),e("#checkboxControls input").change((function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)})),e("#checkboxControls input").each((function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each((function(){t?e(this).show():e(this).hide()}))})),e("tr.seasonheader").each((function(){var t=0,n=e(this).attr("id");e("tr."+n+" :visible").each((function(){t++})),0===t?(e(this).hide(),e("#"+n+"-cols").hide()):(e(this).show(),e("#"+n+"-cols").show())})),e(".sceneSeasonXEpisode").on("change",(function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-season"),i=e(this).attr("data-for-episode"),a=e(this).val().match(/^(\d+)x(\d+)$/i),o=null,r=null;a&&(o=a[1],r=a[2]),n.home.display_show.setEpisodeSceneNumbering(t,i,o,r)})),e(".sceneAbsolute").on("change",(function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-absolute"),i=e(this).val().match(/^(\d{1,3})$/i),a=null;i&&(a=i[1]),n.home.display_show.setAbsoluteSceneNumbering(t,a)})),n.ajax_search.init(),e("a.removeshow").confirm({theme:"dark",title:f("Remove Show"),content:f("Are you sure you want to remove")+'<span class="footerhighlight">'+e("#showtitle").data("showname")+"</span>"+f(" from the database?")+'<br><br><input type="checkbox" id="deleteFiles" name="deleteFiles"/>&nbsp;<label for="deleteFiles" class="text-danger">'+f("Check to delete files as well. IRREVERSIBLE")+"</label>",buttons:{confirm:function(){var e=this.$content.find("#deleteFiles").prop("checked");location.href=this.$target.attr("href")+(e?"&full=1":"")},cancel:{action:function(){}}}})},imdbRating:function(){for(var t=e("#imdbstars"),n=t.data("imdb-rating"),i=e("<i>").addClass("fas fa-star text-warning"),a=0;a<n;a++)t.append(i.clone())},setEpisodeSceneNumbering:function(t,i,a,o){var r=e("#series_id").val(),s=e("#series_provider_id").val();""===a&&(a=null),""===o&&(o=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{series_id:r,series_provider_id:s,forSeason:t,forEpisode:i,sceneSeason:a,sceneEpisode:o},(function(n){null===n.sceneSeason||null===n.sceneEpisode?e("#sceneSeasonXEpisode_"+r+"_"+t+"_"+i).val(""):e("#sceneSeasonXEpisode_"+r+"_"+t+"_"+i).val(n.sceneSeason+"x"+n.sceneEpisode),n.success?null===n.sceneSeason||null===n.sceneEpisode?alert(f("Scene numbering cleared for season "+t+" episode "+i)):alert(f("Scene numbering set for season "+t+" episode "+i)):n.errorMessage?alert(n.errorMessage):alert(f("Update failed."))}))},setAbsoluteSceneNumbering:function(t,i){var a=e("#series_id").val(),o=e("#series_provider_id").val();""===i&&(i=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:a,series_provider_id:o,forAbsolute:t,sceneAbsolute:i},(function(n){null===n.sceneAbsolute?e("#sceneAbsolute_"+a+"_"+t).val(""):e("#sceneAbsolute_"+a+"_"+t).val(n.sceneAbsolute),n.success?null===n.sceneAbsolute?alert(f("Scene absolute numbering cleared for absolute "+t)):alert(f("Scene absolute numbering set for absolute "+t)):n.errorMessage?alert(n.errorMessage):alert(f("Update failed."))}))}},edit_show:{init:function(){var t=[];e("#location").fileBrowser({title:f("Select Show Location")}),e("#submit").click((function(){var t=[];e("#exceptions_list option").each((function(){t.push(e(this).val())})),e("#exceptions_list").val(t),n.metaToBool("show.is_anime")&&n.home.generate_bwlist()})),e("#addSceneName").click((function(){var n=e("#SceneName").val(),i=e("<option>");if(t=[],e("#exceptions_list option").each((function(){t.push(e(this).val())})),e("#SceneName").val(""),!(e.inArray(n,t)>-1||""===n))return e("#SceneException").show(),i.attr("value",n),i.html(n),i.appendTo("#exceptions_list")})),e("#removeSceneName").click((function(){e("#exceptions_list option:selected").remove(),n.home.edit_show.toggleSceneException()})),n.home.edit_show.toggleSceneException()},toggleSceneException:function(){var t=[];e("#exceptions_list option").each((function(){t.push(e(this).val())})),""===t?e("#SceneException").hide():e("#SceneException").show()}},add_shows:function(){e.backstretch(n.srWebRoot+"/images/backdrops/addshows.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},add_existing_shows:{init:function(){n.home.add_show_options(),n.root_dirs.init(),e("#tableDiv").on("click","#checkAll",(function(){e(".dirCheck").not(this).prop("checked",this.checked)})),e("#submitShowDirs").on("click",(function(){var t=!1,n=e("#addShowForm");if(e(".dirCheck").each((function(){if(!0===this.checked){var i=e(this).attr("id"),a=e(this).closest("tr").find("select").val();e("<input>",{type:"hidden",name:"shows_to_add",value:a+"|"+i}).appendTo(n),t=!0}})),!1===t)return!1;e("<input>",{type:"hidden",name:"promptForSettings",value:e("#promptForSettings").prop("checked")?"on":"off"}).appendTo(n),n.submit()}));var t="";e("#rootDirText").on("change",(function(){if(t===e("#rootDirText").val())return!1;t=e("#rootDirText").val(),e("#rootDirStaticList").html(""),e("#rootDirs option").each((function(t,n){e("#rootDirStaticList").append('<div class="list-group-item-dark mb-1"><div class="align-middle m-1"><label class="form-check-label" for="\' + $(w).val() + \'"><input type="checkbox" class="dir_check" id="'+e(n).val()+'" checked=checked><b>'+e(n).val()+"</b></label></div></div>")})),n.home.add_existing_shows.loadContent()})),e("#rootDirStaticList").on("click",".dir_check",n.home.add_existing_shows.loadContent),e("#tableDiv").on("click",".showManage",(function(t){t.preventDefault(),e("html,body").animate({scrollTop:0},1e3)})),e("#rootDirs option").attr("selected","selected").parent().focus(),e("#rootDirs option").click()},loadContent:function(){var t="";e(".dir_check").each((function(n,i){e(i).is(":checked")&&(t.length&&(t+="&"),t+="rootDir="+encodeURIComponent(e(i).attr("id")))})),e("#tableDiv").html("<span>"+n.loadingHTML+f("loading folders...")+"</span>"),e.get(n.srWebRoot+"/home/addShows/massAddTable/",t,(function(t){e("#tableDiv").html(t),e("#addRootDirTable").tablesorter({theme:"bootstrap",sortList:[[1,0]],headers:{0:{sorter:!1}}})}))}},postprocess:function(){e("#episodeDir").fileBrowser({title:f("Select Unprocessed Episode Folder"),key:"postprocessPath"})},trakt_shows:{init:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#showsort").val("original"),e("#showsortdirection").val("asc"),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.traktPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("traktPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded((function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})})),e("#showsort").on("change",(function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})})),e("#showsortdirection").on("change",(function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})})),e("#traktlist").on("change",(function(e){document.location.href=n.updateUrlParameter(document.location.href,"list",e.target.value)})),e("#limit").on("change",(function(e){document.location.href=n.updateUrlParameter(document.location.href,"limit",e.target.value)}))}},popular_shows:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.imdbPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("imdbPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded((function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})})),e("#showsort").on("change",(function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})})),e("#showsortdirection").on("change",(function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})}))},test_renaming:function(){e(".seriesCheck").on("click",(function(){var t=this;e(".seasonCheck:visible").each((function(){e(this).prop("checked",t.checked)})),e(".epCheck:visible").each((function(){e(this).prop("checked",t.checked)}))})),e(".seasonCheck").click((function(){var t=this,n=e(t).attr("id");e(".epCheck:visible").each((function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)}))})),e("input[type=submit]").on("click",(function(){var t=[];if(e(".epCheck").each((function(){e(this).prop("checked")&&t.push(e(this).attr("id"))})),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/doRename?show="+e("#series_id").attr("value")+"&eps="+t.join("|")}))},new_show:{init:function(){var t=e("div.setup-panel div a"),i=e(".setup-content"),a=e(".nextBtn"),o=document.getElementById("addShowForm");o&&o.addEventListener("submit",(function(e){!1===o.checkValidity()&&(e.preventDefault(),e.stopPropagation()),o.classList.add("was-validated")}),!1),i.hide(),n.root_dirs.init(),n.home.add_show_options(),n.quality_chooser.init(),e("input:hidden[name=whichSeries]").length&&(e("#addShowForm")[0].classList.add("was-validated"),n.home.update_bwlist(e("#providedSeriesName").val()),t.addClass("disabled"),t.removeClass("btn-success").addClass("btn-dark"),e("#fullShowPath").length?(e('div.setup-panel div a[href="#step-3"]').removeClass("btn-dark").addClass("btn-success"),i.hide(),e("#step-3").show()):(e('div.setup-panel div a[href="#step-2"]').removeClass("btn-dark").addClass("btn-success"),i.hide(),e("#step-2").show())),e("#nameToSearch").focus(),e("#searchName").click((function(){!0===e("#addShowForm")[0].checkValidity()&&(e("#addShowForm")[0].classList.add("was-validated"),e(".nextBtn").removeClass("disabled"))})),e("#addShowForm").submit((function(){n.home.generate_bwlist()})),t.click((function(n){n.preventDefault();var a=e(e(this).attr("href")),o=e(this);o.hasClass("disabled")||(t.removeClass("btn-success").addClass("btn-dark"),o.removeClass("btn-dark").addClass("btn-success"),i.hide(),a.show(),a.find("input:eq(0)").focus())})),a.click((function(){var t=e(this).closest(".setup-content").attr("id"),i=e('div.setup-panel div a[href="#'+t+'"]').parent().next().children("a"),a=!0,o="";"step-1"==t&&(e("input:radio[name=whichSeries]:checked").length?o=e("input:radio[name=whichSeries]:checked").val().split("|")[4]:e("input:hidden[name=whichSeries]").length&&e("input:hidden[name=whichSeries]").val().length&&(o=e("#providedSeriesName").val()),o.length?n.home.update_bwlist(o):a=!1),"step-2"==t&&(e("#rootDirs option").length||e("#fullShowPath").length||(e("#step-2-messages").empty().html('<div style="color: red;"><b>'+f("You must add a root TV show directory!")+"</b></div>"),a=!1)),a&&i.removeClass("disabled").trigger("click")})),e("#searchName").on("click",(function(){e("#searchName").prop("disabled",!0),n.home.new_show.searchSeriesProvider(),e("#searchName").prop("disabled",!1)})),e("#skipShowButton").on("click",(function(){e("#skipShow").val("1"),e("#addShowForm").submit()})),e("#nameToSearch").keypress((function(t){13===(t.keyCode?t.keyCode:t.which)&&(t.preventDefault(),e("#searchName").click())})),e("div.setup-panel div a.btn-success").trigger("click")},searchSeriesProvider:function(){if(e("#nameToSearch").val().length){var t="<b>"+e("#nameToSearch").val().trim()+"</b> on "+e("#providedSeriesProviderID option:selected").text()+"<br/>";e("#step-1-messages").empty().html('<i id="searchingAnim" class="fas fa-spinner fa-spin fa-fw"></i> searching for '+t),e.ajax({url:n.srWebRoot+"/home/addShows/searchSeriesProviderForShowName",data:{search_term:e("#nameToSearch").val().trim(),lang:e("#seriesProviderLanguage").val(),series_provider_id:e("#providedSeriesProviderID").val()},timeout:1e3*parseInt(e("#series_provider_timeout").val(),10),dataType:"json",error:function(){e("#step-1-messages").empty().html(f("search timed out, try increasing timeout for series provider"))},success:function(t){var i=!0,a='<legend class="legend">'+f("Search Results:")+"</legend>\n",o="";0===t.results.length?a+="<b>"+f("No results found, try a different search or language.")+"</b>":(e.each(t.results,(function(e,r){i&&"disabled"!==r[6]?(o=" checked",i=!1):o="";var s=r.join("|");if(a+='<input type="radio" class="pull-left" id="whichSeries" name="whichSeries" value="'+s.replace(/"/g,"")+'"'+o+" "+r[6]+" /> ",a+='<a href="'+n.anonURL+r[2]+r[3]+"&lid="+t.langid+'" onclick="window.open(this.href, \'_blank\'); return false;" ><b>'+r[4]+"</b></a>",null!==r[5]){var l=new Date(r[5]),c=new Date;a+=l>c?f(" (will debut on ")+r[5]+")":f(" (started on ")+r[5]+")"}null!==r[0]&&(a+=" ["+r[0]+"]"),"disabled"===r[6]&&(a+='<div class="d-inline text-danger font-weight-bold">'+f(" already exists in show library")+"</div>"),a+="<br/>"})),a+="</ul>"),a+="<br/>",e("#step-1-messages").html(a)}})}}},add_show_options:function(){e("#saveDefaultsButton").on("click",(function(){var t=[],i=[];e("#anyQualities option:selected").each((function(n,i){t.push(e(i).val())})),e("#bestQualities option:selected").each((function(t,n){i.push(e(n).val())})),e.get(n.srWebRoot+"/config/general/saveAddShowDefaults",{defaultStatus:e("#statusSelect").val(),qualityPreset:e("#qualityPreset").val(),anyQualities:t.join(","),bestQualities:i.join(","),defaultFlattenFolders:e("#flatten_folders").prop("checked"),subtitles:e("#subtitles").prop("checked"),anime:e("#anime").prop("checked"),search_format:e("#search_format").val(),defaultStatusAfter:e("#statusSelectAfter").val(),scene:e("#scene").prop("checked"),skip_downloaded:e("#skip_downloaded").prop("checked"),add_show_year:e("#add_show_year").prop("checked")}),e(this).attr("disabled",!0),n.notify("info",f("Saved Defaults"),f('Your "add show" defaults have been set to your current selections.'))})),e("#statusSelect, #qualityPreset, #flatten_folders, #anyQualities, #bestQualities, #subtitles, #search_format, #anime, #statusSelectAfter, #scene, #skip_downloaded, #add_show_year").change((function(){e("#saveDefaultsButton").attr("disabled",!1)}))},generate_bwlist:function(){var t=[];e("#white option").each((function(n,i){t[n]=e(i).val()})),e("#whitelist").val(t.join(",")),t=[],e("#black option").each((function(n,i){t[n]=e(i).val()})),e("#blacklist").val(t.join(","))},update_bwlist:function(t){e("#white").children().remove(),e("#black").children().remove(),e("#pool").children().remove(),e("#anime").prop("checked")?(e("#blackwhitelist").show(),t&&e.getJSON(n.srWebRoot+"/home/fetch_releasegroups",{show_name:t},(function(t){"success"===t.result&&e.each(t.groups,(function(t,n){var i=e("<option>");i.attr("value",n.name),i.html(n.name+" | "+n.rating+" | "+n.range),i.appendTo("#pool")}))}))):e("#blackwhitelist").hide()},server_status:{init:function(){e("#schedulerStatusTable").tablesorter({theme:"bootstrap",widgets:["saveSort"]}),e("#queueStatusTable").tablesorter({theme:"bootstrap",sortList:[[3,0],[4,0],[2,1]],widgets:["saveSort"]}),e(".forceSchedulerJob").click((function(t){t.preventDefault(),e.get(e(this).data("target"))}))}}},config:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/config.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500");var t=document.getElementById("configForm");t&&t.addEventListener("submit",(function(e){!1===t.checkValidity()&&(e.preventDefault(),e.stopPropagation()),t.classList.add("was-validated")}),!1),e("#configForm").ajaxForm({beforeSubmit:function(){e(".config_submitter .config_submitter_refresh").each((function(){e(this).attr("disabled","disabled"),e(this).after("<span>"+n.loadingHTML+f(" Saving...")+"</span>"),e(this).hide()}))},success:function(){setTimeout((function(){e(".config_submitter").each((function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show()})),e(".config_submitter_refresh").each((function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show(),window.location.reload()})),e("#email_show").trigger("notify")}),2e3)}}),e("#config-menus a").click((function(t){t.preventDefault(),e(this).tab("show")})),e("ul.nav-pills > li > a").on("shown.bs.tab",(function(t){window.location.hash=e(t.target).attr("href").substr(1)})),e('#config-menus a[href="'+window.location.hash+'"]').tab("show"),e("a.resetConfig").confirm({theme:"dark",title:f("Reset Config to Defaults"),content:f("Are you sure you want to reset config to defaults?")})},general:{is_account_linked:"",init:function(){n.root_dirs.init(),0===e("input[name='proxy_setting']").val().length&&(e("input[id='proxy_series_providers']").prop("checked",!1),e("label[for='proxy_series_providers']").hide()),e("input[name='proxy_setting']").on("input",(function(){0===e(this).val().length?(e("input[id='proxy_series_providers']").prop("checked",!1),e("label[for='proxy_series_providers']").hide()):e("label[for='proxy_series_providers']").show()})),e(".viewIf").on("click",(function(){e(this).prop("checked")?(e(".hide_if_"+e(this).attr("id")).css("display","none"),e(".show_if_"+e(this).attr("id")).fadeIn("fast","linear")):(e(".show_if_"+e(this).attr("id")).css("display","none"),e(".hide_if_"+e(this).attr("id")).fadeIn("fast","linear"))})),e(".datePresets").on("click",(function(){var t=e("#date_presets").val();e(this).prop("checked")&&"%x"===t?(t="%a, %b %d, %Y",e("#date_use_system_default").html("1")):e(this).prop("checked")||"1"!==e("#date_use_system_default").html()||(t="%x"),e("#date_presets").attr("name","date_preset_old"),e("#date_presets").attr("id","date_presets_old"),e("#date_presets_na").attr("name","date_preset"),e("#date_presets_na").attr("id","date_presets"),e("#date_presets_old").attr("name","date_preset_na"),e("#date_presets_old").attr("id","date_presets_na"),t&&e("#date_presets").val(t)})),e("#api_key").on("click",(function(){e("#api_key").select()})),e("#generate_new_apikey").on("click",(function(){e.get(n.srWebRoot+"/config/general/generateApiKey",(function(t){void 0===t.error?e("#api_key").val(t):alert(t.error)}))})),e("#syncRemote").click((function(){function t(){e.getJSON(n.srWebRoot+"/googleDrive/getProgress",(function(t){e("#current_info").html(t.current_info)})).error((function(){clearInterval(window.progressInterval),e("#current_info").html("Uh oh, something went wrong")}))}e.ajax({type:"GET",url:n.srWebRoot+"/googleDrive/syncRemote",beforeSend:function(){window.progressInterval=setInterval(t,100),e("#pleaseWaitDialog").modal()},success:function(){clearInterval(window.progressInterval),e("#pleaseWaitDialog").modal("hide")}})})),e("#pip3_path").length&&(e("#pip3_path").fileBrowser({title:f("Select path to pip3"),key:"pip3_path",includeFiles:1}),e("#verifyPipPath").click((function(){var t=e.trim(e("#pip3_path").val());if(!t)return e("#testPIP-result").html(f("Please fill out the necessary fields above.")),void e("#pip3_path").addClass("warning");e("#pip3_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testPIP-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done((function(t){e("#testPIP-result").html(t),e("#verifyPipPath").prop("disabled",!1)}))}))),e("#git_path").length&&(e("#git_path").fileBrowser({title:f("Select path to git"),key:"git_path",includeFiles:1}),e("#verifyGitPath").click((function(){var t=e.trim(e("#git_path").val());if(!t)return e("#testGIT-result").html(f("Please fill out the necessary fields above.")),void e("#git_path").addClass("warning");e("#git_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testGIT-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done((function(t){e("#testGIT-result").html(t),e("#verifyGitPath").prop("disabled",!1)}))}))),e("#installRequirements").on("click",(function(){window.location.href=n.srWebRoot+"/home/installRequirements"})),e("#branchCheckout").on("click",(function(){window.location.href=n.srWebRoot+"/home/branchCheckout?branch="+e("#branchVersion").val()})),e("#web_auth_method").change((function(){e(this).find("option:selected").each((function(){"local_auth"===e(this).val()?(e("#content_use_local_auth").show(),e("#web_username").prop("required",!0),e("#web_password").prop("required",!0)):(e("#content_use_local_auth").hide(),e("#web_username").prop("required",!1),e("#web_password").prop("required",!1))}))})).change(),e("#enable_sickrage_api").on("change",(function(){var t=e(this).prop("checked"),i=null;t?i=n.popupWindow(n.srWebRoot+"/account/link","Link SiCKRAGE Account",1200,650):e.get(n.srWebRoot+"/account/unlink");var a=setInterval((function(e){n.config.general.checkIsAccountLinked(),t&&"true"===n.config.general.is_account_linked?(e.close(),clearInterval(a)):t||"false"!==n.config.general.is_account_linked||clearInterval(a)}),1e3,i)}))},checkIsAccountLinked:function(){e.ajax({url:n.srWebRoot+"/account/is-linked",dataType:"json",success:function(t){"true"===t.linked?(e("#link_sickrage_account").addClass("d-none"),e("#unlink_sickrage_account").removeClass("d-none")):(e("#unlink_sickrage_account").addClass("d-none"),e("#link_sickrage_account").removeClass("d-none")),n.config.general.is_account_linked=t.linked}})}},subtitles:{init:function(){e.getJSON(n.srWebRoot+"/config/subtitles/wanted_languages",(function(e){new d.default({el:document.querySelector("#subtitles_languages"),remote:{url:n.srWebRoot+"/config/subtitles/get_code"},setItems:e,itemName:"subtitles_languages",newitemName:"subtitles_languages_new"})})),e("#subtitles_dir").fileBrowser({title:f("Select Subtitles Download Directory")}),e("#editAService").change((function(){n.config.subtitles.showHideServices()})),e(".service_enabler").on("click",(function(){n.config.subtitles.refreshServiceList()})),n.config.subtitles.showHideServices(),e("#service_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.subtitles.refreshServiceList()}}),e("#service_order_list").disableSelection()},showHideServices:function(){e(".serviceDiv").each((function(){var t=e(this).attr("id");e("#editAService :selected").val()+"Div"===t?e(this).show():e(this).hide()}))},addService:function(t,i,a,o,r,s){if(null===a.match("/$")&&(a+="/"),0===e("#service_order_list > #"+t).length&&!1!==s){var l='<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="service_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/newznab.gif" alt="'+i+'" width="16" height="16"></a> '+i+"</li>";e("#service_order_list").append(l),e("#service_order_list").sortable("refresh")}},deleteService:function(t){e("#service_order_list > #"+t).remove()},refreshServiceList:function(){var t=e("#service_order_list").sortable("toArray"),n=[];e.each(t,(function(t,i){var a=+e("#enable_"+i).prop("checked")?"1":"0";n.push(i+":"+a)})),e("#service_order").val(n.join(" "))}},search:{init:function(){e("#nzb_method").change(n.config.search.nzbMethodHandler),e("#torrent_method").change(n.config.search.torrentMethodHandler),n.config.search.nzbMethodHandler(),n.config.search.torrentMethodHandler(),e("#testSABnzbd").click((function(){e("#testSABnzbd_result").html(n.loadingHTML);var t=e("#sab_host").val(),i=e("#sab_username").val(),a=e("#sab_password").val(),o=e("#sab_apikey").val();e.get(n.srWebRoot+"/home/testSABnzbd",{host:t,username:i,password:a,apikey:o},(function(t){e("#testSABnzbd_result").html(t)}))})),e("#testSynologyDSM").click((function(){e("#testSynologyDSM_result").html(n.loadingHTML);var t=e("#nzb_method").val(),i=e("#syno_dsm_host").val(),a=e("#syno_dsm_username").val(),o=e("#syno_dsm_password").val();e.get(n.srWebRoot+"/home/testSynologyDSM",{nzb_method:t,host:i,username:a,password:o},(function(t){e("#testSynologyDSM_result").html(t)}))})),e("#use_torrents").click((function(){n.config.search.toggleTorrentTitle()})),e("#test_torrent").click((function(){e("#test_torrent_result").html(n.loadingHTML);var t=e("#torrent_method :selected").val(),i=e("#torrent_host").val(),a=e("#torrent_username").val(),o=e("#torrent_password").val();e.get(n.srWebRoot+"/home/testTorrent",{torrent_method:t,host:i,username:a,password:o},(function(t){e("#test_torrent_result").html(t)}))})),n.config.search.rtorrentScgi(),e("#torrent_host").change(n.config.search.rtorrentScgi),e("#nzb_dir").fileBrowser({title:f("Select .nzb blackhole/watch location")}),e("#torrent_dir").fileBrowser({title:f("Select .torrent blackhole/watch location")}),e("#torrent_path").fileBrowser({title:f("Select .torrent download location")})},toggleTorrentTitle:function(){e("#use_torrents").prop("checked")?e("#no_torrents").show():e("#no_torrents").hide()},nzbMethodHandler:function(){e("#blackhole_settings").hide(),e("#sabnzbd_settings").hide(),e("#nzbget_settings").hide(),e("#download_station_settings").hide(),e("#testSABnzbd").hide(),e("#testSABnzbd_result").hide(),e("#testSynologyDSM").hide(),e("#testSynologyDSM_result").hide(),e("#nzbget_host").prop("required",!1),e("#sab_host").prop("required",!1),e("#syno_dsm_host").prop("required",!1);var t=e("#nzb_method").val();"blackhole"!==t.toLowerCase()?"nzbget"===t.toLowerCase()?(e("#nzbget_settings").show(),e("#nzbget_host").prop("required",!0)):"sabnzbd"===t.toLowerCase()?(e("#sabnzbd_settings").show(),e("#testSABnzbd").show(),e("#testSABnzbd_result").show(),e("#sab_host").prop("required",!0)):"download_station"===t.toLowerCase()&&(e("#download_station_settings").show(),e("#testSynologyDSM").show(),e("#testSynologyDSM_result").show(),e("#syno_dsm_host").prop("required",!0)):(e("#blackhole_settings").show(),e("#nzbget_host").prop("required",!1),e("#sab_host").prop("required",!1),e("#syno_dsm_host").prop("required",!1))},torrentMethodHandler:function(){e("#options_torrent_clients").hide(),e("#options_torrent_blackhole").hide(),e("#torrent_host").prop("required",!1);var t=e("#torrent_method").val(),n="",i="#options_torrent_blackhole";"blackhole"!==t.toLowerCase()&&(e("#label_warning_deluge").hide(),e("#label_anime_warning_deluge").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_auth_type_option").hide(),e("#torrent_path_option").show(),e("#torrent_path_option").find(".fileBrowser").show(),e("#torrent_seed_time_option").hide(),e("#torrent_high_bandwidth_option").hide(),e("#torrent_label_option").show(),e("#torrent_label_anime_option").show(),e("#path_synology").hide(),e("#torrent_paused_option").show(),e("#torrent_rpc_url_option").hide(),"utorrent"===t.toLowerCase()?(n="uTorrent",e("#torrent_path_option").hide(),e("#torrent_seed_time_label").text(f("Minimum seeding time is")),e("#torrent_seed_time_option").show(),e("#torrent_host").attr("placeholder",f("URL to your uTorrent client (e.g. http://localhost:8000)")),e("#torrent_host").prop("required",!0)):"transmission"===t.toLowerCase()?(n="Transmission",e("#torrent_seed_time_label").text(f("Stop seeding when inactive for")),e("#torrent_seed_time_option").show(),e("#torrent_high_bandwidth_option").show(),e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_rpc_url_option").show(),e("#torrent_host").attr("placeholder",f("URL to your Transmission client (e.g. http://localhost:9091)")),e("#torrent_host").prop("required",!0)):"deluge"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").show(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_host").attr("placeholder",f("URL to your Deluge client (e.g. http://localhost:8112)")),e("#torrent_host").prop("required",!0)):"deluged"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").show(),e("#torrent_host").attr("placeholder",f("IP or Hostname of your Deluge Daemon (e.g. scgi://localhost:58846)")),e("#torrent_host").prop("required",!0)):"download_station"===t.toLowerCase()?(n="Synology DS",e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_path_option").find(".fileBrowser").hide(),e("#torrent_host").attr("placeholder",f("URL to your Synology DS client (e.g. http://localhost:5000)")),e("#torrent_host").prop("required",!0),e("#path_synology").show()):"rtorrent"===t.toLowerCase()?(n="rTorrent",e("#torrent_paused_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your rTorrent client (e.g. scgi://localhost:5000 or https://localhost/rutorrent/plugins/httprpc/action.php)")),e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").show(),e("#torrent_auth_type_option").show(),e("#torrent_host").prop("required",!0)):"qbittorrent"===t.toLowerCase()?(n="qbittorrent",e("#torrent_path_option").hide(),e("#label_warning_qbittorrent").show(),e("#label_anime_warning_qbittorrent").show(),e("#torrent_host").attr("placeholder",f("URL to your qbittorrent client (e.g. http://localhost:8080)")),e("#torrent_host").prop("required",!0)):"mlnet"===t.toLowerCase()?(n="mlnet",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your MLDonkey (e.g. http://localhost:4080)")),e("#torrent_host").prop("required",!0)):"putio"===t.toLowerCase()&&(n="putio",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host_option").hide(),e("#torrent_host").attr("placeholder",f("URL to your putio client (e.g. http://localhost:8080)")),e("#torrent_host").prop("required",!0)),e("#host_title").text(n+" host:port"),e("#username_title").text(n+" username"),e("#password_title").text(n+" password"),e("#torrent_client").text(n),e("#rpcurl_title").text(n+" RPC URL"),i="#options_torrent_clients"),e(i).show()},rtorrentScgi:function(){"rtorrent"===e("#torrent_method :selected").val().toLowerCase()&&("scgi://"===e("#torrent_host").val().substr(0,7)?(e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_password_option").hide(),e("#torrent_password").prop("value",""),e("#torrent_auth_type_option").hide(),e("#torrent_auth_type option[value=none]").attr("selected","selected")):(e("#torrent_username_option").show(),e("#torrent_password_option").show(),e("#torrent_auth_type_option").show()))}},postprocessing:{init:function(){e("#unpack").on("change",(function(){e(this).prop("checked")?n.config.postprocessing.israr_supported():e("#unpack").tooltipster("close")})),e("#name_presets").on("change",(function(){n.config.postprocessing.setup_naming()})),e("#name_abd_presets").on("change",(function(){n.config.postprocessing.setup_abd_naming()})),e("#naming_custom_abd").on("change",(function(){n.config.postprocessing.setup_abd_naming()})),e("#name_sports_presets").on("change",(function(){n.config.postprocessing.setup_sports_naming()})),e("#naming_custom_sports").on("change",(function(){n.config.postprocessing.setup_sports_naming()})),e("#name_anime_presets").on("change",(function(){n.config.postprocessing.setup_anime_naming()})),e("#naming_custom_anime").on("change",(function(){n.config.postprocessing.setup_anime_naming()})),e('input[name="naming_anime"]').on("click",(function(){n.config.postprocessing.setup_anime_naming()})),e("#naming_multi_ep").change(n.config.postprocessing.fill_examples),e("#naming_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_examples()}),500)})),e("#naming_anime_multi_ep").change(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_anime_examples()}),500)})),e("#naming_abd_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_abd_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_abd_examples()}),500)})),e("#naming_sports_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_sports_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_sports_examples()}),500)})),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_anime_pattern").keyup((function(){n.config.postprocessing.typewatch((function(){n.config.postprocessing.fill_anime_examples()}),500)})),e("#show_naming_key").on("click",(function(){e("#naming_key").toggleClass("d-none")})),e("#show_naming_abd_key").on("click",(function(){e("#naming_abd_key").toggleClass("d-none")})),e("#show_naming_sports_key").on("click",(function(){e("#naming_sports_key").toggleClass("d-none")})),e("#show_naming_anime_key").on("click",(function(){e("#naming_anime_key").toggleClass("d-none")})),e("#do_custom").on("click",(function(){e("#naming_pattern").val(e("#name_presets :selected").attr("id")),e("#naming_custom").show(),e("#naming_pattern").focus()})),n.config.postprocessing.setup_naming(),n.config.postprocessing.setup_abd_naming(),n.config.postprocessing.setup_sports_naming(),n.config.postprocessing.setup_anime_naming(),e("#metadataType").on("change keyup",(function(){n.config.postprocessing.showHideMetadata()})),n.config.postprocessing.showHideMetadata(),e(".metadata_checkbox").on("click",(function(){n.config.postprocessing.refreshMetadataConfig(!1)})),n.config.postprocessing.refreshMetadataConfig(!0),e("img[title]").tooltipster({position:{viewport:e(window),at:"bottom center",my:"top right"}}),e("i[title]").tooltipster({position:{viewport:e(window),at:"top center",my:"bottom center"}}),e(".custom-pattern,#unpack").tooltipster("content",f("validating...")),e("#tv_download_dir").fileBrowser({title:f("Select TV Download Directory")}),e("#unpack_dir").fileBrowser({title:f("Select UNPACK Directory")})},typewatch:function(){var e=0;return function(t,n){clearTimeout(e),e=setTimeout(t,n)}},israr_supported:function(){e.get(n.srWebRoot+"/config/postProcessing/isRarSupported",(function(t){"supported"!==t&&(e("#unpack").tooltipster("content",f("Unrar Executable not found.")),e("#unpack").tooltipster("open"),e("#unpack").css("background-color","#FFFFDD"))}))},fill_examples:function(){var t=e("#naming_pattern").val(),i=e("#naming_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:3},(function(t){t?(e("#naming_example").text(t+".ext"),e("#naming_example_div").show()):e("#naming_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:3},(function(t){t?(e("#naming_example_multi").text(t+".ext"),e("#naming_example_multi_div").show()):e("#naming_example_multi_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},(function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))}))},fill_abd_examples:function(){var t=e("#naming_abd_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,abd:"True"},(function(t){t?(e("#naming_abd_example").text(t+".ext"),e("#naming_abd_example_div").show()):e("#naming_abd_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,abd:"True"},(function(t){"invalid"===t?(e("#naming_abd_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_abd_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFFFDD")):(e("#naming_abd_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_abd_pattern").tooltipster("close"),e("#naming_abd_pattern").css("background-color","#FFFFFF"))}))},fill_sports_examples:function(){var t=e("#naming_sports_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,sports:"True"},(function(t){t?(e("#naming_sports_example").text(t+".ext"),e("#naming_sports_example_div").show()):e("#naming_sports_example_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,sports:"True"},(function(t){"invalid"===t?(e("#naming_sports_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_sports_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFFFDD")):(e("#naming_sports_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_sports_pattern").tooltipster("close"),e("#naming_sports_pattern").css("background-color","#FFFFFF"))}))},fill_anime_examples:function(){var t=e("#naming_anime_pattern").val(),i=e("#naming_anime_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:a},(function(t){t?(e("#naming_example_anime").text(t+".ext"),e("#naming_example_anime_div").show()):e("#naming_example_anime_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:a},(function(t){t?(e("#naming_example_multi_anime").text(t+".ext"),e("#naming_example_multi_anime_div").show()):e("#naming_example_multi_anime_div").hide()})),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},(function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))}))},setup_naming:function(){"Custom..."===e("#name_presets :selected").val()?e("#naming_custom").show():(e("#naming_custom").hide(),e("#naming_pattern").val(e("#name_presets :selected").attr("id"))),n.config.postprocessing.fill_examples()},setup_abd_naming:function(){"Custom..."===e("#name_abd_presets :selected").val()?e("#naming_abd_custom").show():(e("#naming_abd_custom").hide(),e("#naming_abd_pattern").val(e("#name_abd_presets :selected").attr("id"))),n.config.postprocessing.fill_abd_examples()},setup_sports_naming:function(){"Custom..."===e("#name_sports_presets :selected").val()?e("#naming_sports_custom").show():(e("#naming_sports_custom").hide(),e("#naming_sports_pattern").val(e("#name_sports_presets :selected").attr("id"))),n.config.postprocessing.fill_sports_examples()},setup_anime_naming:function(){"Custom..."===e("#name_anime_presets :selected").val()?e("#naming_anime_custom").show():(e("#naming_anime_custom").hide(),e("#naming_anime_pattern").val(e("#name_anime_presets :selected").attr("id"))),n.config.postprocessing.fill_anime_examples()},showHideMetadata:function(){e(".metadataDiv").each((function(){var t=e(this).attr("id");e("#metadataType :selected").val()===t?e(this).show():e(this).hide()}))},refreshMetadataConfig:function(t){var i=0,a="";e(".metadataDiv").each((function(){var t=e(this).attr("id"),n=[],o=e("#"+t+"_show_metadata").prop("checked"),r=e("#"+t+"_episode_metadata").prop("checked"),s=e("#"+t+"_fanart").prop("checked"),l=e("#"+t+"_poster").prop("checked"),c=e("#"+t+"_banner").prop("checked"),d=e("#"+t+"_episode_thumbnails").prop("checked"),u=e("#"+t+"_season_posters").prop("checked"),h=e("#"+t+"_season_banners").prop("checked"),f=e("#"+t+"_season_all_poster").prop("checked"),p=e("#"+t+"_season_all_banner").prop("checked"),m=e("#"+t+"_enabled").prop("checked");n.push(o?"1":"0"),n.push(r?"1":"0"),n.push(s?"1":"0"),n.push(l?"1":"0"),n.push(c?"1":"0"),n.push(d?"1":"0"),n.push(u?"1":"0"),n.push(h?"1":"0"),n.push(f?"1":"0"),n.push(p?"1":"0"),n.push(m?"1":"0");for(var g=0,b=0;b<n.length;b++)g+=parseInt(n[b]);g>i&&(i=g,a=t),e("#"+t+"_eg_show_metadata").attr("class",o?"enabled":"disabled"),e("#"+t+"_eg_episode_metadata").attr("class",r?"enabled":"disabled"),e("#"+t+"_eg_fanart").attr("class",s?"enabled":"disabled"),e("#"+t+"_eg_poster").attr("class",l?"enabled":"disabled"),e("#"+t+"_eg_banner").attr("class",c?"enabled":"disabled"),e("#"+t+"_eg_episode_thumbnails").attr("class",d?"enabled":"disabled"),e("#"+t+"_eg_season_posters").attr("class",u?"enabled":"disabled"),e("#"+t+"_eg_season_banners").attr("class",h?"enabled":"disabled"),e("#"+t+"_eg_season_all_poster").attr("class",f?"enabled":"disabled"),e("#"+t+"_eg_season_all_banner").attr("class",p?"enabled":"disabled"),e("#"+t+"_data").val(n.join("|"))})),""!==a&&t&&(e("#metadataType option[value="+a+"]").attr("selected","selected"),n.config.postprocessing.showHideMetadata())}},notifications:{init:function(){e("#testGrowl").click((function(){var t=e.trim(e("#growl_host").val()),i=e.trim(e("#growl_password").val());if(!t)return e("#testGrowl-result").html(f("Please fill out the necessary fields above.")),void e("#growl_host").addClass("warning");e("#growl_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testGrowl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testGrowl",{host:t,password:i}).done((function(t){e("#testGrowl-result").html(t),e("#testGrowl").prop("disabled",!1)}))})),e("#testProwl").click((function(){var t=e.trim(e("#prowl_apikey").val()),i=e("#prowl_priority").val();if(!t)return e("#testProwl-result").html(f("Please fill out the necessary fields above.")),void e("#prowl_apikey").addClass("warning");e("#prowl_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testProwl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testProwl",{prowl_apikey:t,prowl_priority:i}).done((function(t){e("#testProwl-result").html(t),e("#testProwl").prop("disabled",!1)}))})),e("#testKODI").click((function(){var t=e.trim(e("#kodi_host").val()),i=e.trim(e("#kodi_username").val()),a=e.trim(e("#kodi_password").val());if(!t)return e("#testKODI-result").html(f("Please fill out the necessary fields above.")),void e("#kodi_host").addClass("warning");e("#kodi_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testKODI-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testKODI",{host:t,username:i,password:a}).done((function(t){e("#testKODI-result").html(t),e("#testKODI").prop("disabled",!1)}))})),e("#testPMC").click((function(){var t=e.trim(e("#plex_host").val()),i=e.trim(e("#plex_client_username").val()),a=e.trim(e("#plex_client_password").val());if(!t)return e("#testPMC-result").html(f("Please fill out the necessary fields above.")),void e("#plex_host").addClass("warning");e("#plex_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMC-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMC",{host:t,username:i,password:a}).done((function(t){e("#testPMC-result").html(t),e("#testPMC").prop("disabled",!1)}))})),e("#testPMS").click((function(){var t=e.trim(e("#plex_server_host").val()),i=e.trim(e("#plex_username").val()),a=e.trim(e("#plex_password").val()),o=e.trim(e("#plex_server_token").val());if(!t)return e("#testPMS-result").html(f("Please fill out the necessary fields above.")),void e("#plex_server_host").addClass("warning");e("#plex_server_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMS-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMS",{host:t,username:i,password:a,plex_server_token:o}).done((function(t){e("#testPMS-result").html(t),e("#testPMS").prop("disabled",!1)}))})),e("#testEMBY").click((function(){var t=e("#emby_host").val(),i=e("#emby_apikey").val();if(!t||!i)return e("#testEMBY-result").html(f("Please fill out the necessary fields above.")),t?e("#emby_host").removeClass("warning"):e("#emby_host").addClass("warning"),void(i?e("#emby_apikey").removeClass("warning"):e("#emby_apikey").addClass("warning"));e("#emby_host,#emby_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testEMBY-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testEMBY",{host:t,emby_apikey:i}).done((function(t){e("#testEMBY-result").html(t),e("#testEMBY").prop("disabled",!1)}))})),e("#testBoxcar2").click((function(){var t=e.trim(e("#boxcar2_accesstoken").val());if(!t)return e("#testBoxcar2-result").html(f("Please fill out the necessary fields above.")),void e("#boxcar2_accesstoken").addClass("warning");e("#boxcar2_accesstoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testBoxcar2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testBoxcar2",{accesstoken:t}).done((function(t){e("#testBoxcar2-result").html(t),e("#testBoxcar2").prop("disabled",!1)}))})),e("#testPushover").click((function(){var t=e("#pushover_userkey").val(),i=e("#pushover_apikey").val();if(!t||!i)return e("#testPushover-result").html(f("Please fill out the necessary fields above.")),t?e("#pushover_userkey").removeClass("warning"):e("#pushover_userkey").addClass("warning"),void(i?e("#pushover_apikey").removeClass("warning"):e("#pushover_apikey").addClass("warning"));e("#pushover_userkey,#pushover_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushover-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushover",{userKey:t,apiKey:i}).done((function(t){e("#testPushover-result").html(t),e("#testPushover").prop("disabled",!1)}))})),e("#testLibnotify").click((function(){e("#testLibnotify-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testLibnotify",(function(t){e("#testLibnotify-result").html(t)}))})),e("#twitterStep1").click((function(){e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep1",(function(e){window.open(e)})).done((function(){e("#testTwitter-result").html(f("<b>Step1:</b> Confirm Authorization"))}))})),e("#twitterStep2").click((function(){var t=e.trim(e("#twitter_key").val());if(!t)return e("#testTwitter-result").html(f("Please fill out the necessary fields above.")),void e("#twitter_key").addClass("warning");e("#twitter_key").removeClass("warning"),e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep2",{key:t},(function(t){e("#testTwitter-result").html(t)}))})),e("#testTwitter").click((function(){e.get(n.srWebRoot+"/home/testTwitter",(function(t){e("#testTwitter-result").html(t)}))})),e("#testTwilio").on("click",(function(){var t=e.trim(e("#twilio_account_sid").val()),i=e.trim(e("#twilio_phone_sid").val()),a=e.trim(e("#twilio_auth_token").val()),o=e.trim(e("#twilio_to_number").val());e(this).prop("disabled",!0),e("#testTwilio-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTwilio",{account_sid:t,phone_sid:i,auth_token:a,to_number:o}).done((function(t){e("#testTwilio-result").html(t),e("#testTwilio").prop("disabled",!1)}))})),e("#testAlexa").on("click",(function(){e.get(n.srWebRoot+"/home/testAlexa",(function(t){e("#testAlexa-result").html(t)}))})),e("#testSlack").on("click",(function(){e.get(n.srWebRoot+"/home/testSlack",(function(t){e("#testSlack-result").html(t)}))})),e("#testDiscord").on("click",(function(){e.get(n.srWebRoot+"/home/testDiscord",(function(t){e("#testDiscord-result").html(t)}))})),e("#settingsNMJ").click((function(){if(!e("#nmj_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmj_host").focus();e("#testNMJ-result").html(n.loadingHTML);var t=e("#nmj_host").val();e.get(n.srWebRoot+"/home/settingsNMJ",{host:t},(function(t){null===t&&(e("#nmj_database").removeAttr("readonly"),e("#nmj_mount").removeAttr("readonly"));var n=e.parseJSON(t);e("#testNMJ-result").html(n.message),e("#nmj_database").val(n.database),e("#nmj_mount").val(n.mount),n.database?e("#nmj_database").attr("readonly",!0):e("#nmj_database").removeAttr("readonly"),n.mount?e("#nmj_mount").attr("readonly",!0):e("#nmj_mount").removeAttr("readonly")}))})),e("#testNMJ").click((function(){var t=e.trim(e("#nmj_host").val()),i=e("#nmj_database").val(),a=e("#nmj_mount").val();if(!t)return e("#testNMJ-result").html(f("Please fill out the necessary fields above.")),void e("#nmj_host").addClass("warning");e("#nmj_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJ-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJ",{host:t,database:i,mount:a}).done((function(t){e("#testNMJ-result").html(t),e("#testNMJ").prop("disabled",!1)}))})),e("#settingsNMJv2").click((function(){if(!e("#nmjv2_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmjv2_host").focus();e("#testNMJv2-result").html(n.loadingHTML);for(var t,i=e("#nmjv2_host").val(),a=document.getElementsByName("nmjv2_dbloc"),o=0;o<a.length;o++)if(a[o].checked){t=a[o].value;break}var r=e("#NMJv2db_instance").val();e.get(n.srWebRoot+"/home/settingsNMJv2",{host:i,dbloc:t,instance:r},(function(t){null===t&&e("#nmjv2_database").removeAttr("readonly");var n=e.parseJSON(t);e("#testNMJv2-result").html(n.message),e("#nmjv2_database").val(n.database),n.database?e("#nmjv2_database").attr("readonly",!0):e("#nmjv2_database").removeAttr("readonly")}))})),e("#testNMJv2").click((function(){var t=e.trim(e("#nmjv2_host").val());if(!t)return e("#testNMJv2-result").html(f("Please fill out the necessary fields above.")),void e("#nmjv2_host").addClass("warning");e("#nmjv2_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJv2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJv2",{host:t}).done((function(t){e("#testNMJv2-result").html(t),e("#testNMJv2").prop("disabled",!1)}))})),e("#testFreeMobile").click((function(){var t=e.trim(e("#freemobile_id").val()),i=e.trim(e("#freemobile_apikey").val());if(!t||!i)return e("#testFreeMobile-result").html(f("Please fill out the necessary fields above.")),t?e("#freemobile_id").removeClass("warning"):e("#freemobile_id").addClass("warning"),void(i?e("#freemobile_apikey").removeClass("warning"):e("#freemobile_apikey").addClass("warning"));e("#freemobile_id,#freemobile_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testFreeMobile-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testFreeMobile",{freemobile_id:t,freemobile_apikey:i}).done((function(t){e("#testFreeMobile-result").html(t),e("#testFreeMobile").prop("disabled",!1)}))})),e("#testTelegram").on("click",(function(){var t={};if(t.id=e.trim(e("#telegram_id").val()),t.apikey=e.trim(e("#telegram_apikey").val()),!t.id||!t.apikey)return e("#testTelegram-result").html(f("Please fill out the necessary fields above.")),t.id?e("#telegram_id").removeClass("warning"):e("#telegram_id").addClass("warning"),void(t.apikey?e("#telegram_apikey").removeClass("warning"):e("#telegram_apikey").addClass("warning"));e("#telegram_id,#telegram_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testTelegram-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTelegram",{telegram_id:t.id,telegram_apikey:t.apikey}).done((function(t){e("#testTelegram-result").html(t),e("#testTelegram").prop("disabled",!1)}))})),e("#testJoin").on("click",(function(){var t={};if(t.id=e.trim(e("#join_id").val()),t.apikey=e.trim(e("#join_apikey").val()),!t.id||!t.apikey)return e("#testJoin-result").html(f("Please fill out the necessary fields above.")),t.id?e("#join_id").removeClass("warning"):e("#join_id").addClass("warning"),void(t.apikey?e("#join_apikey").removeClass("warning"):e("#join_apikey").addClass("warning"));e("#join_id,#join_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testJoin-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testJoin",{join_id:t.id,join_apikey:t.apikey}).done((function(t){e("#testJoin-result").html(t),e("#testJoin").prop("disabled",!1)}))})),e("#TraktGetPin").click((function(){window.open(e("#trakt_pin_url").val(),"popUp","toolbar=no, scrollbars=no, resizable=no, top=200, left=200, width=650, height=550"),e("#trakt_pin").removeClass("d-none")})),e("#trakt_pin").on("keyup change",(function(){0!==e("#trakt_pin").val().length?(e("#TraktGetPin").addClass("d-none"),e("#authTrakt").removeClass("d-none")):(e("#TraktGetPin").removeClass("d-none"),e("#authTrakt").addClass("d-none"))})),e("#authTrakt").click((function(){0!==e("#trakt_pin").val().length&&e.get(n.srWebRoot+"/home/getTraktToken",{trakt_pin:e("#trakt_pin").val()}).done((function(t){e("#testTrakt-result").html(t),e("#authTrakt").addClass("d-none"),e("#trakt_pin").addClass("d-none"),e("#TraktGetPin").addClass("d-none")}))})),e("#testTrakt").click((function(){var t=e.trim(e("#trakt_username").val()),i=e.trim(e("#trakt_blacklist_name").val());return t?/\s/g.test(i)?(e("#testTrakt-result").html(f("Check blacklist name; the value need to be a trakt slug")),void e("#trakt_blacklist_name").addClass("warning")):(e("#trakt_username").removeClass("warning"),e("#trakt_blacklist_name").removeClass("warning"),e(this).prop("disabled",!0),e("#testTrakt-result").html(n.loadingHTML),void e.get(n.srWebRoot+"/home/testTrakt",{username:t,blacklist_name:i}).done((function(t){e("#testTrakt-result").html(t),e("#testTrakt").prop("disabled",!1)}))):(e("#testTrakt-result").html(f("Please fill out the necessary fields above.")),void(t?e("#trakt_username").removeClass("warning"):e("#trakt_username").addClass("warning")))})),e("#testEmail").click((function(){var t,i,a,o,r,s,l,c,d;(t=e("#testEmail-result")).html(n.loadingHTML),i=(i=e("#email_host").val()).length>0?i:null,a=(a=e("#email_port").val()).length>0?a:null,o=e("#email_tls").prop("checked"),r=(r=e("#email_from").val()).length>0?r:"root@localhost",s=e("#email_user").val().trim(),l=e("#email_password").val(),c="",null===i&&(c+='<li style="color: red;">'+f("You must specify an SMTP hostname!")+"</li>"),null===a?c+='<li style="color: red;">'+f("You must specify an SMTP port!")+"</li>":(null===a.match(/^\d+$/)||parseInt(a,10)>65535)&&(c+='<li style="color: red;">'+f("SMTP port must be between 0 and 65535!")+"</li>"),c.length>0?(c="<ol>"+c+"</ol>",t.html(c)):null===(d=prompt(f("Enter an email address to send the test to:"),null))||0===d.length||null===d.match(/.*@.*/)?t.html('<p style="color: red;">'+f("You must provide a recipient email address!")+"</p>"):e.get(n.srWebRoot+"/home/testEmail",{host:i,port:a,smtp_from:r,use_tls:o,user:s,pwd:l,to:d},(function(t){e("#testEmail-result").html(t)}))})),e("#testNMA").click((function(){var t=e.trim(e("#nma_api").val()),i=e("#nma_priority").val();if(!t)return e("#testNMA-result").html(f("Please fill out the necessary fields above.")),void e("#nma_api").addClass("warning");e("#nma_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMA-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMA",{nma_api:t,nma_priority:i}).done((function(t){e("#testNMA-result").html(t),e("#testNMA").prop("disabled",!1)}))})),e("#testPushalot").click((function(){var t=e.trim(e("#pushalot_authorizationtoken").val());if(!t)return e("#testPushalot-result").html(f("Please fill out the necessary fields above.")),void e("#pushalot_authorizationtoken").addClass("warning");e("#pushalot_authorizationtoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushalot-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushalot",{authorizationToken:t}).done((function(t){e("#testPushalot-result").html(t),e("#testPushalot").prop("disabled",!1)}))})),e("#testPushbullet").click((function(){var t=e.trim(e("#pushbullet_api").val());if(!t)return e("#testPushbullet-result").html(f("Please fill out the necessary fields above.")),void e("#pushbullet_api").addClass("warning");e("#pushbullet_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushbullet-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushbullet",{api:t}).done((function(t){e("#testPushbullet-result").html(t),e("#testPushbullet").prop("disabled",!1)}))})),e("#getPushbulletDevices").click((function(){n.config.notifications.get_pushbullet_devices(f("Device list updated. Please choose a device to push to."))})),e("#use_pushbullet").prop("checked")&&n.config.notifications.get_pushbullet_devices(),e("#email_show").on("change",(function(){var t=parseInt(e("#email_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(n){n._size>0&&e("#email_show_list").val(t>=0?n[t.toString()].list:"")}))})),e("#prowl_show").on("change",(function(){var t=parseInt(e("#prowl_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(n){n._size>0&&e("#prowl_show_list").val(t>=0?n[t.toString()].prowl_notify_list:"")}))})),n.config.notifications.load_show_notify_lists(),e("#email_show_save").click((function(){e.get(n.srWebRoot+"/home/saveShowNotifyList",{show:e("#email_show").val(),series_provider_id:e("#email_series_provider_id").val(),emails:e("#email_show_list").val()}).done((function(){n.config.notifications.load_show_notify_lists()}))})),e("#use_plex").click((function(){e(this).is(":checked")?e(".plexinfo").removeClass("d-none"):e(".plexinfo").addClass("d-none")})),e("#use_alexa").click((function(){e(this).is(":checked")?e(".alexa-info").removeClass("d-none"):e(".alexa-info").addClass("d-none")}))},get_pushbullet_devices:function(t){t&&e("#testPushbullet-result").html(n.loadingHTML);var i=e("#pushbullet_api").val();if(!i)return e("#testPushbullet-result").html(f("You didn't supply a Pushbullet api key")),e("#pushbullet_api").focus(),!1;e.get(n.srWebRoot+"/home/getPushbulletDevices",{api:i},(function(n){var i=e.parseJSON(n).devices,a=e("#pushbullet_device").val();e("#pushbullet_device_list").html("");for(var o=0;o<i.length;o++)!0===i[o].active&&(a===i[o].iden?e("#pushbullet_device_list").append('<option value="'+i[o].iden+'" selected>'+i[o].nickname+"</option>"):e("#pushbullet_device_list").append('<option value="'+i[o].iden+'">'+i[o].nickname+"</option>"));""===a?e("#pushbullet_device_list").prepend('<option value="" selected>All devices</option>'):e("#pushbullet_device_list").prepend('<option value="">All devices</option>'),t&&e("#testPushbullet-result").html(t)})),e("#pushbullet_device_list").change((function(){e("#pushbullet_device").val(e("#pushbullet_device_list").val()),e("#testPushbullet-result").html(f("Don't forget to save your new pushbullet settings."))}))},load_show_notify_lists:function(){e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",(function(t){var n,i;if(0!==t._size){var a=[];for(i in t)Object.prototype.hasOwnProperty.call(t,i)&&"_"!==i.charAt(0)&&a.push(t[i]);var o=a.sort((function(e,t){return e.name<t.name?-1:e.name>t.name?1:0}));for(i in n='<option value="-1">-- Select --</option>',o)Object.prototype.hasOwnProperty.call(o,i)&&o[i].id&&o[i].name&&(n+='<option value="'+o[i].id+'">'+e("<div/>").text(o[i].name).html()+"</option>");e("#email_show").html(n),e("#email_show_list").val(""),e("#prowl_show").html(n),e("#prowl_show_list").val("")}}))}},backup_restore:function(){e("#Backup").click((function(){e("#Backup").attr("disabled",!0),e("#Backup-result").html(n.loadingHTML);var t=e("#backupDir").val();e.get(n.srWebRoot+"/config/backuprestore/backup",{backupDir:t}).done((function(t){e("#Backup-result").html(t),e("#Backup").attr("disabled",!1)}))})),e("#Restore").click((function(){e("#Restore").attr("disabled",!0),e("#Restore-result").html(n.loadingHTML),e.get(n.srWebRoot+"/config/backuprestore/restore",{backupFile:e("#backupFile").val(),restore_database:e("#restore_database").prop("checked"),restore_config:e("#restore_config").prop("checked"),restore_cache:e("#restore_cache").prop("checked")}).done((function(t){e("#Restore-result").html(t),e("#Restore").attr("disabled",!1)}))})),e("#backupDir").fileBrowser({title:f("Select backup folder to save to"),key:"backupPath"}),e("#backupFile").fileBrowser({title:f("Select backup files to restore"),key:"backupFile",includeFiles:1})},providers:{newznabProviders:[],torrentRssProviders:[],newznabProvidersCapabilities:[],init:function(){e(document).on("change",".newznab_key",(function(){var t=e(this).attr("id");t=t.substring(0,t.length-"_key".length);var i=e("#"+t+"_url").val(),a=e("#"+t+"_cat").val(),o=e(this).val();n.config.providers.updateNewznabProvider(t,i,o,a)})),e("#newznab_key,#newznab_url").change((function(){var t=e("#editANewznabProvider :selected").val();if("addNewznab"!==t){var i=e("#newznab_url").val(),a=e("#newznab_key").val(),o=e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(",");n.config.providers.updateNewznabProvider(t,i,a,o)}})),e("#torrentrss_url,#torrentrss_cookies,#torrentrss_titleTAG").change((function(){var t=e("#editATorrentRssProvider :selected").val();if("addTorrentRss"!==t){var i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val();n.config.providers.updateTorrentRssProvider(t,i,a,o)}})),e(document).on("change","#editAProvider",(function(){n.config.providers.showHideProviders()})),e("#editANewznabProvider").change((function(){n.config.providers.populateNewznabSection()})),e("#editATorrentRssProvider").change((function(){n.config.providers.populateTorrentRssSection()})),e(document).on("click",".provider_enabler",(function(){n.config.providers.refreshProviderList()})),e("#newznab_cat_update").click((function(){e("#newznab_cat option").each((function(){e(this).remove()}));var t=[];e("#newznab_cap option:selected").each((function(){var n=e(this).val();t.push({text:n,value:n})})),n.config.providers.replaceProviderOptions("#newznab_cat",t);var i=e("#editANewznabProvider :selected").val();if("addNewznab"!==i){var a=e("#newznab_url").val(),o=e("#newznab_key").val(),r=e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(",");e("#newznab_cat option:not([value])").remove(),n.config.providers.updateNewznabProvider(i,a,o,r)}})),e("#newznab_add").click((function(){var t=e.trim(e("#newznab_name").val()),i=e.trim(e("#newznab_url").val()),a=e.trim(e("#newznab_key").val()),o=e.trim(e("#newznab_cat option").map((function(t,n){return e(n).text()})).toArray().join(","));if(t&&i&&a){var r={name:t};e.getJSON(n.srWebRoot+"/config/providers/canAddNewznabProvider",r,(function(e){void 0===e.error?(n.config.providers.addNewznabProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)}))}})),e(".newznab_delete").click((function(){var t=e("#editANewznabProvider :selected").val();n.config.providers.deleteNewznabProvider(t)})),e("#torrentrss_add").click((function(){var t=e("#torrentrss_name").val(),i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val(),r={name:t,url:i,cookies:a,titleTAG:o};e.getJSON(n.srWebRoot+"/config/providers/canAddTorrentRssProvider",r,(function(e){void 0===e.error?(n.config.providers.addTorrentRssProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)}))})),e(".torrentrss_delete").on("click",(function(){n.config.providers.deleteTorrentRssProvider(e("#editATorrentRssProvider :selected").val()),n.config.providers.refreshEditAProvider()})),e(document).on("change","[class='providerDiv_tip'] input",(function(){e("div .providerDiv [name="+e(this).attr("name")+"]").replaceWith(e(this).clone()),e("div .providerDiv [newznab_name="+e(this).attr("id")+"]").replaceWith(e(this).clone())})),e(document).on("change","[class='providerDiv_tip'] select",(function(){e(this).find("option").each((function(){e(this).is(":selected")?e(this).prop("defaultSelected",!0):e(this).prop("defaultSelected",!1)})),e("div .providerDiv [name="+e(this).attr("name")+"]").empty().replaceWith(e(this).clone())})),e(document).on("change",".seed_option",(function(){var t=e(this).attr("id").split("_")[0];n.config.providers.makeTorrentOptionString(t)})),e("#provider_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.providers.refreshProviderList()}}),e("#provider_order_list").disableSelection(),e("#editANewznabProvider").length&&n.config.providers.populateNewznabSection();for(var t=n.getMeta("NEWZNAB_PROVIDERS").split("!!!"),i=0;i<t.length;i++){var a=t[i];a.length>0&&n.config.providers.addNewznabProvider.apply(this,a.split("|"))}for(var o=n.getMeta("TORRENTRSS_PROVIDERS").split("!!!"),r=0;r<o.length;r++){var s=o[r];s.length>0&&n.config.providers.addTorrentRssProvider.apply(this,s.split("|"))}n.config.providers.showHideProviders()},showHideProviders:function(){e(".providerDiv").each((function(){var t=e(this).attr("id");e("#editAProvider :selected").val()+"Div"===t?e(this).show():e(this).hide()}))},findProvider:function(e,t){var n=!1;return e.forEach((function(e){e.name===t&&(n=!0)})),n},getNewznabCategories:function(t,i){var a=i[0],o=i[1],r=i[2];if(a&&o&&r){var s={url:o,name:a,key:r};e(".updating_categories").wrapInner("<span>"+n.loadingHTML+" Updating Categories ...</span>"),e.getJSON(n.srWebRoot+"/config/providers/getNewznabCategories",s,(function(e){n.config.providers.updateNewznabCaps(e,i)})).always((function(){e(".updating_categories").empty()}))}},addNewznabProvider:function(t,i,a,o,r,s,l){(a=e.trim(a))&&(/^https?:\/\//i.test(a)||(a="http://"+a),null===a.match("/$")&&(a+="/"),n.config.providers.newznabProviders[t]=[s,[i,a,o,r]],"true"!==s&&(e("#editANewznabProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateNewznabSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<div class="list-group-item list-group-item-action list-group-item-dark rounded mb-1 p-2" id="'+t+'"><div class="align-middle"><label class="form-check-label" for="enable_'+t+'"><input type="checkbox" id="enable_'+t+'" class="provider_enabler text-left" checked><a href="'+n.anonURL+a+'" class="text-right" target="_new"> <i class="sickrage-search-providers sickrage-search-providers-newznab"></i></a> <span class="font-weight-bold">'+i+'</span></label><span class="float-right d-inline-block"><i class="fas fa-lock text-danger"></i></span></div>'),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList())},updateNewznabProvider:function(e,t,i,a){n.config.providers.newznabProviders[e][1][1]=t,n.config.providers.newznabProviders[e][1][2]=i,n.config.providers.newznabProviders[e][1][3]=a,n.config.providers.populateNewznabSection(),n.config.providers.refreshProviderList()},deleteNewznabProvider:function(t){e("#editANewznabProvider option[value='"+t+"']").remove(),e(".list-group #"+t).remove(),n.config.providers.populateNewznabSection(),delete n.config.providers.newznabProviders[t],n.config.providers.refreshProviderList()},populateNewznabSection:function(){var t=e("#editANewznabProvider :selected").val(),i="",a="",o="";"addNewznab"===t?(i=["","",""],a="false",e("#newznab_add_div").show(),e("#newznab_update_div").hide(),e("#newznab_cat").attr("disabled","disabled"),e("#newznab_cap").attr("disabled","disabled"),e("#newznab_cat_update").attr("disabled","disabled"),e("#newznabcapdiv").hide(),e("#newznab_cat option").each((function(){e(this).remove()})),e("#newznab_cap option").each((function(){e(this).remove()}))):(i=n.config.providers.newznabProviders[t][1],a=n.config.providers.newznabProviders[t][0],e("#newznab_add_div").hide(),e("#newznab_update_div").show(),e("#newznab_cat").removeAttr("disabled"),e("#newznab_cap").removeAttr("disabled"),e("#newznab_cat_update").removeAttr("disabled"),e("#newznabcapdiv").show()),e("#newznab_name").val(i[0]),e("#newznab_url").val(i[1]),e("#newznab_key").val(i[2]),o="string"==typeof i[3]?i[3].split(","):i[3];var r=[];o&&(o.forEach((function(e){""!==e&&r.push({text:e,value:e})})),n.config.providers.replaceProviderOptions("#newznab_cat",r)),"addNewznab"===t?(e("#newznab_name").removeAttr("disabled"),e("#newznab_url").removeAttr("disabled")):(e("#newznab_name").attr("disabled","disabled"),"true"===a?(e("#newznab_url").attr("disabled","disabled"),e("#newznab_delete").attr("disabled","disabled")):(e("#newznab_url").removeAttr("disabled"),e("#newznab_delete").removeAttr("disabled"),i[0]&&i[1]&&i[2]&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,i[0])&&n.config.providers.getNewznabCategories(a,i),n.config.providers.updateNewznabCaps(null,i)))},updateNewznabCaps:function(e,t){e&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,t[0])&&n.config.providers.newznabProvidersCapabilities.push({name:t[0],categories:e.tv_categories}),t[0]&&n.config.providers.newznabProvidersCapabilities.forEach((function(e){if(e.name&&e.name===t[0]&&e.categories instanceof Array){var i=[];e.categories.forEach((function(e){e.id&&e.name&&i.push({value:e.id,text:e.name+"("+e.id+")"})})),n.config.providers.replaceProviderOptions("#newznab_cap",i)}}))},addTorrentRssProvider:function(t,i,a,o,r,s,l){n.config.providers.torrentRssProviders[t]=[i,a,o,r],"true"!==s&&(e("#editATorrentRssProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateTorrentRssSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<div class="list-group-item list-group-item-action list-group-item-secondary rounded mb-1 p-2" id="'+t+'"><div class="align-middle"><label class="form-check-label" for="enable_'+t+'"><input type="checkbox" id="enable_'+t+'" class="provider_enabler text-left" checked><a href="'+n.anonURL+a+'" class="text-right" target="_new"> <i class="sickrage-search-providers sickrage-search-providers-torrentrss"></i></a> <span class="font-weight-bold">'+i+'</span></label><span class="float-right d-inline-block"><i class="fas fa-lock text-danger"></i></span></div>'),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList()},updateTorrentRssProvider:function(e,t,i,a){n.config.providers.torrentRssProviders[e][1]=t,n.config.providers.torrentRssProviders[e][2]=i,n.config.providers.torrentRssProviders[e][3]=a,n.config.providers.populateTorrentRssSection(),n.config.providers.refreshProviderList()},deleteTorrentRssProvider:function(t){e("#editATorrentRssProvider option[value='"+t+"']").remove(),e(".list-group #"+t).remove(),n.config.providers.populateTorrentRssSection(),delete n.config.providers.torrentRssProviders[t],n.config.providers.refreshProviderList()},populateTorrentRssSection:function(){var t=e("#editATorrentRssProvider :selected").val(),i="";"addTorrentRss"===t?(i=["","","","title"],e("#torrentrss_add_div").show(),e("#torrentrss_update_div").hide()):(i=n.config.providers.torrentRssProviders[t],e("#torrentrss_add_div").hide(),e("#torrentrss_update_div").show()),e("#torrentrss_name").val(i[0]),e("#torrentrss_url").val(i[1]),e("#torrentrss_cookies").val(i[2]),e("#torrentrss_titleTAG").val(i[3]),"addTorrentRss"===t?(e("#torrentrss_name").removeAttr("disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled")):(e("#torrentrss_name").attr("disabled","disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled"),e("#torrentrss_delete").removeAttr("disabled"))},makeTorrentOptionString:function(t){var n=e(".providerDiv_tip #"+t+"_seed_ratio").prop("value"),i=e(".providerDiv_tip #"+t+"_seed_time").prop("value"),a=e(".providerDiv_tip #"+t+"_process_method").prop("value");e(".providerDiv_tip #"+t+"_option_string").val([n,i,a].join("|"))},refreshProviderList:function(){var t=e("#provider_order_list").sortable("toArray"),i=[],a=[];for(var o in e.each(t,(function(t,n){var a=+e("#enable_"+n).prop("checked")?"1":"0";i.push(n+":"+a)})),n.config.providers.newznabProviders)Object.prototype.hasOwnProperty.call(n.config.providers.newznabProviders,o)&&a.push("newznab|"+n.config.providers.newznabProviders[o][1].join("|"));for(var r in n.config.providers.torrentRssProviders)Object.prototype.hasOwnProperty.call(n.config.providers.torrentRssProviders,r)&&a.push("torrentrss|"+n.config.providers.torrentRssProviders[r].join("|"));e("#provider_strings").val(a.join("!!!")),e("#provider_order").val(i.join("!!!")),n.config.providers.refreshEditAProvider()},refreshEditAProvider:function(){e("#editAProvider").empty();var t=e("#provider_order_list").sortable("toArray"),i=[];if(e.each(t,(function(t,n){e("#enable_"+n).prop("checked")&&i.push(n)})),i.length>0){e("<select>").prop("id","editAProvider").addClass("form-control input-sm").appendTo("#provider-list");for(var a=0;a<i.length;a++){var o=i[a];e("#editAProvider").append(e("<option>").prop("value",o).text(e.trim(e("#"+o).text()).replace(/\s\*$/,"").replace(/\s\*\*$/,"")))}}else document.getElementsByClassName("component-desc")[0].innerHTML=f("No providers available to configure.");n.config.providers.showHideProviders()},replaceProviderOptions:function(t,n){e(t).empty(),e.each(n,(function(n,i){e(t).append(e("<option></option>").attr("value",i.value).text(i.text))}))}}},manage:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/manage.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},episode_statuses:function(){e(".allCheck").click((function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))})),e(".get_more_eps").click((function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),r=e(this).attr("value");o?"collapse"===r.toLowerCase()?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"expand"===r.toLowerCase()&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showEpisodeStatuses",{series_id:t,whichStatus:e("#oldStatus").val()},(function(n){e.each(n,(function(n,o){e.each(o,(function(o,r){a.after(function(t,n,i,a,o){var r="";return r+=' <tr class="text-dark '+e("#row_class").val()+" show-"+t+'">',r+='  <td align="center"><input type="checkbox" class="'+t+'-epcheck" name="toChange" value="'+t+"-"+n+"x"+i+'"'+(o?" checked":"")+"></td>",r+="  <td>"+n+"x"+i+"</td>",r+='  <td style="width: 100%">'+a+"</td>",r+=" </tr>"}(t,n,o,r,i))}))}))})),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))})),e(".selectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!0)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!0)}))})),e(".unselectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!1)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!1)}))}))},mass_update:function(){e("#massUpdateTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[1,0]],textExtraction:{3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span").text().toLowerCase()},6:function(t){return e(t).find("span").text().toLowerCase()},7:function(t){return e(t).find("span").text().toLowerCase()},8:function(t){return e(t).find("span").text().toLowerCase()},9:function(t){return e(t).find("span").text().toLowerCase()},10:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:!1},1:{sorter:"showNames"},2:{sorter:"showDirs"},3:{sorter:"quality"},4:{sorter:"sports"},5:{sorter:"scene"},6:{sorter:"anime"},7:{sorter:"flatten_folders"},8:{sorter:"skip_downloaded"},9:{sorter:"paused"},10:{sorter:"subtitle"},11:{sorter:"default_ep_status"},12:{sorter:"status"}}}),e("#submitMassEdit").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&(window.location=n.srWebRoot+"/manage/massEdit?toEdit="+t.join("|"))})),e("#submitMassUpdate").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toUpdate:t.join("|")})})),e("#submitMassRescan").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRefresh:t.join("|")})})),e("#submitMassRename").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRename:t.join("|")})})),e("#submitMassDelete").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.confirm({theme:"dark",title:f("Mass Delete"),content:f("You have selected to delete "+t.length+" show(s).  Are you sure you wish to continue? All files will be removed from your system."),buttons:{confirm:function(){e.post(n.srWebRoot+"/manage/massUpdate",{toDelete:t.join("|")})},cancel:{action:function(){}}}})})),e("#submitMassRemove").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toRemove:t.join("|")})})),e("#submitMassSubtitle").on("click",(function(){var t=[];e(".showCheck:checked").each((function(){t.push(e(this).attr("id"))})),0!==t.length&&e.post(n.srWebRoot+"/manage/massUpdate",{toSubtitle:t.join("|")})})),e(".bulkCheck").on("click",(function(){e(".showCheck:visible").each((function(){e(this).disabled||e(this).prop("checked",!this.checked)}))})),e("#checkboxControls input").change((function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)})),e("#checkboxControls input").each((function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each((function(){t?e(this).show():e(this).hide()}))}))},mass_edit:{init:function(){e(".new_root_dir").change((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#display_new_root_dir_"+t).html("<b>"+e(this).val()+"</b>")})),e(".edit_root_dir").click((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id")),i=e("#new_root_dir_"+t).val();e(this).nFileBrowser(n.manage.mass_edit.editRootDir,{initialDir:i,whichId:t})})),e(".delete_root_dir").click((function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#new_root_dir_"+t).val(null),e("#display_new_root_dir_"+t).html("<b>"+f("DELETED")+"</b>")}))},findDirIndex:function(e){var t=e.split("_");return t[t.length-1]},editRootDir:function(t,n){e("#new_root_dir_"+n.whichId).val(t),e("#new_root_dir_"+n.whichId).change()}},backlog_overview:function(){e("#pickShow").change((function(){var t=e(this).val();t&&e("html,body").animate({scrollTop:e("#show-"+t).offset().top-25},"slow")}))},failed_downloads:function(){e("#failedTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[0,0]],headers:{3:{sorter:!1}}}),e("#limit").change((function(t){window.location.href=n.srWebRoot+"/manage/failedDownloads/?limit="+e(t.currentTarget).val()})),e("#submitMassRemove").on("click",(function(){var t=[];if(e(".removeCheck").each((function(){!0===this.checked&&t.push(e(this).attr("id").split("-")[1])})),0===t.length)return!1;e.post(n.srWebRoot+"/manage/failedDownloads","toRemove="+t.join("|"),(function(){location.reload(!0)}))})),e(".bulkCheck").on("click",(function(){var t=this,n=e(t).attr("id");e("."+n+":visible").each((function(){e(this).prop("checked",t.checked)}))}))},subtitles_missed:function(){e(".allCheck").click((function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))})),e(".get_more_eps").click((function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),r=e(this).attr("value");o?"Collapse"===r?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"Expand"===r&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showSubtitleMissed",{series_id:t,whichSubs:e("#selectSubLang").val()},(function(n){e.each(n,(function(n,o){e.each(o,(function(e,o){a.after(function(e,t,n,i,a,o){var r="";return r+=' <tr class="good show-'+e+'">',r+='  <td align="center"><input type="checkbox" class="'+e+'-epcheck" name="toDownload" value="'+e+"-"+t+"x"+n+'"'+(o=o?" checked":"")+"></td>",r+='  <td style="width: 1%;">'+t+"x"+n+"</td>",r+="  <td>"+i+"</td>",r+=" </tr>"}(t,n,e,o.name,o.subtitles,i))}))}))})),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))})),e(".selectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!0)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!0)}))})),e(".unselectAllShows").click((function(){e(".allCheck").each((function(){e(this).prop("checked",!1)})),e('input[class*="-epcheck"]').each((function(){e(this).prop("checked",!1)}))}))}},logs:{init:function(){},view:function(){e("#minLevel,#logFilter,#logSearch").on("change keyup",u.default.debounce((function(){e("#logSearch").val().length>0&&(e('#logFilter option[value="<NONE>"]').prop("selected",!0),e("#minLevel option[value=5]").prop("selected",!0)),e("#minLevel").prop("disabled",!0),e("#logFilter").prop("disabled",!0),document.body.style.cursor="wait";var t=n.srWebRoot+"/logs/view/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val();e.get(t,(function(n){history.pushState("data","",t),e("#loglines").html(e(n).find("#loglines").html()),e("#minLevel").prop("disabled",!1),e("#logFilter").prop("disabled",!1),document.body.style.cursor="default"}))}),500)),setInterval((function(){e.getJSON(n.srWebRoot+"/logs/view/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val()+"&toJson=1",(function(t){e("#loglines").html(t.logs)}))}),1e3*parseInt(e("select[name=refreshInterval]").val()))}}};({init:function(){var t=document.body,n=t.getAttribute("data-controller"),i=t.getAttribute("data-action");this.exec("common"),this.exec(n),this.exec(n,i),e(".loading-spinner").hide(),e(".main-container").removeClass("d-none")},exec:function(e,i){i=void 0===i?"init":i,""!==e&&n[e]&&n[e][i]&&{object:n[e][i].init,function:n[e][i]}[t(n[e][i])]()}}).init()}))}).call(this,n(1))},function(e,t,n){
 /*!
   * Bootstrap v4.4.1 (https://getbootstrap.com/)
   * Copyright 2011-2019 The Bootstrap Authors (https://github.com/twbs/bootstrap/graphs/contributors)
@@ -10,7 +10,7 @@ c<%inherit file="../layouts/config.mako"/>
     import sickrage
     from sickrage.core.common import Quality, EpisodeStatus
     from sickrage.core.helpers.srdatetime import SRDateTime, date_presets, time_presets
-    from sickrage.core.helpers import anon_url
+    from sickrage.core.helpers import anon_url, HTML_PARSERS
     from sickrage.metadata_providers import MetadataProvider
     from sickrage.core.enums import DefaultHomePage, UITheme, TimezoneDisplay,  SeriesProviderID, CpuPreset
 %>
@@ -1088,6 +1088,46 @@ c<%inherit file="../layouts/config.mako"/>
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser workers')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <input id="name_parser_workers" name="name_parser_workers" type="number"
+                                   value="${sickrage.app.config.general.name_parser_workers}" min="1"
+                                   title="${_('Number of processes used to parse release names in bulk, 1 parses in the main process')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('HTML parser')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <select id="html_parser" name="html_parser" class="form-control"
+                                    title="${_('Parser used to read search provider pages, lxml is the fastest, html5lib the most lenient')}">
+                                % for item in HTML_PARSERS:
+                                    <option value="${item}" ${('', 'selected')[sickrage.app.config.general.html_parser == item]}>${item}</option>
+                                % endfor
+                            </select>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Anonymous redirect')}</label>
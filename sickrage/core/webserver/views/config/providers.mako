@@ -1041,6 +1041,10 @@
                                                type="button"
                                                id="newznab_cat_update"
                                                value=${_('Update Categories')}/>
+                                        <input class="btn newznab_caps_refresh"
+                                               type="button"
+                                               id="newznab_caps_refresh"
+                                               value=${_('Refresh Capabilities')}/>
                                     </div>
                                 </div>
                             </div>
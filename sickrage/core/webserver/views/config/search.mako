@@ -35,6 +35,96 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Adaptive Provider Order')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <label for="adaptive_provider_order">
+                            <input type="checkbox" class="enabler toggle color-primary is-material"
+                                   name="adaptive_provider_order" id="adaptive_provider_order"
+                                ${('', 'checked')[bool(sickrage.app.config.general.adaptive_provider_order)]}/>
+                            ${_('search the healthiest providers first, ranked by success rate, latency and snatched results')}
+                        </label>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Provider Circuit Breaker')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <label for="provider_circuit_breaker">
+                            <input type="checkbox" class="enabler toggle color-primary is-material"
+                                   name="provider_circuit_breaker" id="provider_circuit_breaker"
+                                ${('', 'checked')[bool(sickrage.app.config.general.provider_circuit_breaker)]}/>
+                            ${_('skip providers that failed too many searches in a row for a while, manual searches still ask them')}
+                        </label>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent provider searches')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <input id="search_provider_workers" name="search_provider_workers" type="number"
+                                   value="${sickrage.app.config.general.search_provider_workers}" min="1"
+                                   title="${_('Number of providers searched at the same time')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Provider search timeout')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="search_provider_timeout" name="search_provider_timeout" type="number"
+                                   value="${sickrage.app.config.general.search_provider_timeout}" min="1"
+                                   title="${_('Time a single provider may take before its results are skipped')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    seconds
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Search deadline')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="search_deadline" name="search_deadline" type="number"
+                                   value="${sickrage.app.config.general.search_deadline}" min="1"
+                                   title="${_('Time after which a search stops waiting for providers')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    seconds
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Download propers')}</label>
@@ -61,6 +151,47 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent RSS cache updates')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <input id="rss_cache_workers" name="rss_cache_workers" type="number"
+                                   value="${sickrage.app.config.general.rss_cache_workers}" min="1"
+                                   title="${_('Number of provider RSS feeds updated at the same time')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('RSS cache update timeout')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="rss_cache_timeout" name="rss_cache_timeout" type="number"
+                                   value="${sickrage.app.config.general.rss_cache_timeout}" min="1"
+                                   title="${_('Time a provider RSS feed update may take before the next provider takes its place')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    seconds
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
 
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
@@ -168,6 +299,19 @@
                             </div>
                         </div>
                     </div>
+                    <div class="form-row form-group">
+                        <div class="col-lg-3 col-md-4 col-sm-5">
+                            <label class="component-title">${_('Propers from RSS cache')}</label>
+                        </div>
+                        <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                            <label for="propers_from_rss_cache">
+                                <input type="checkbox" class="toggle color-primary is-material"
+                                       name="propers_from_rss_cache" id="propers_from_rss_cache"
+                                    ${('', 'checked')[bool(sickrage.app.config.general.propers_from_rss_cache)]}/>
+                                ${_('look for propers in the RSS cache of providers with an RSS feed instead of searching them')}
+                            </label>
+                        </div>
+                    </div>
                 </div>
 
                 <div class="form-row form-group">
@@ -196,6 +340,61 @@
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Backlog search budget')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <input id="backlog_search_budget" name="backlog_search_budget" type="number"
+                                   value="${sickrage.app.config.general.backlog_search_budget}" min="0"
+                                   title="${_('Provider requests spread over each backlog search frequency, 0 for unlimited')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    requests
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Search history')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="form-row">
+                            <div class="col-md-6">
+                                <div class="input-group">
+                                    <input id="search_history_size" name="search_history_size" type="number"
+                                           value="${sickrage.app.config.general.search_history_size}" min="1"
+                                           title="${_('Number of snatched episodes and manual searches remembered by the search queue')}"
+                                           class="form-control" autocapitalize="off"/>
+                                    <div class="input-group-append">
+                                        <span class="input-group-text">
+                                            entries
+                                        </span>
+                                    </div>
+                                </div>
+                            </div>
+                            <div class="col-md-6">
+                                <div class="input-group">
+                                    <input id="search_history_age" name="search_history_age" type="number"
+                                           value="${sickrage.app.config.general.search_history_age}" min="1"
+                                           title="${_('Time snatched episodes and manual searches are remembered by the search queue')}"
+                                           class="form-control" autocapitalize="off"/>
+                                    <div class="input-group-append">
+                                        <span class="input-group-text">
+                                            min
+                                        </span>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Daily search frequency')}</label>
@@ -61,6 +61,9 @@ class WebSession(Session):
         # cloudflare
         self.cloudflare = cloudflare
 
+        # cache polling its feeds with conditional requests, see TVCache.conditional_requests
+        self.conditional = None
+
         # add hooks
         self.hooks['response'] += [WebHooks.log_url]
 
@@ -93,6 +96,11 @@ class WebSession(Session):
         if not verify:
             disable_warnings()
 
+        # requests that are no feed, such as api lookups of single results, opt out of conditional requests
+        conditional = kwargs.pop('conditional', True)
+        if conditional and self.conditional and method.upper() == 'GET':
+            self.conditional.prepare_request(self, url, kwargs)
+
         for i in range(5):
             resp = None
 
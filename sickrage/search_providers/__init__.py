@@ -22,6 +22,7 @@
 
 import datetime
 import enum
+import functools
 import importlib
 import inspect
 import itertools
@@ -31,10 +32,13 @@ import pkgutil
 import random
 import re
 import threading
+import time
 from base64 import b16encode, b32decode
 from collections import OrderedDict, defaultdict
+from hashlib import sha1
 from time import sleep
 from urllib.parse import urljoin
+from xml.etree import ElementTree
 from xml.sax import SAXParseException
 
 from bencode3 import bdecode, bencode
@@ -44,14 +48,19 @@ from requests.utils import add_dict_to_cookiejar, dict_from_cookiejar
 import sickrage
 from sickrage.core.caches.tv_cache import TVCache
 from sickrage.core.common import MULTI_EP_RESULT, SEASON_RESULT
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.enums import SearchFormat, CpuPreset
-from sickrage.core.helpers import chmod_as_parent, sanitize_file_name, clean_url, bs4_parser, \
+from sickrage.core.helpers import chmod_as_parent, sanitize_file_name, clean_url, \
     validate_url, try_int, convert_size
 from sickrage.core.helpers.show_names import all_possible_show_names
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
 from sickrage.core.common import Quality, Qualities
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.websession import WebSession
+from sickrage.search_providers.content_cache import content_cache
+from sickrage.search_providers.health import provider_health
+from sickrage.search_providers.newznab_feed import parse_newznab_caps, parse_newznab_feed
+from sickrage.search_providers.sessions import provider_sessions
 
 
 class SearchProviderType(enum.Enum):
@@ -225,6 +234,14 @@ class SearchProvider(object):
         # web session
         self.session = WebSession(cloudflare=True)
 
+        # login session, restored from the cache database before the first login and logged in again when it expired
+        self.login_lock = threading.RLock()
+        self.login_restored = False
+        self.logging_in = False
+        if type(self).login is not SearchProvider.login:
+            self.login = self._login_session(self.login)
+            self.session.hooks['response'] += [self._check_login_session]
+
         # custom settings
         self.custom_settings = {}
 
@@ -277,6 +294,69 @@ class SearchProvider(object):
     def login(self):
         return True
 
+    def _login_session(self, login):
+        """
+        Wraps the login of the provider, the stored session is restored before the first login and the session cookies
+        are stored again whenever a login changed them
+        """
+
+        @functools.wraps(login)
+        def wrapper(*args, **kwargs):
+            with self.login_lock:
+                if not self.login_restored:
+                    self.login_restored = True
+                    if provider_sessions.restore(self):
+                        sickrage.app.log.debug('Restored login session for provider {}'.format(self.name))
+
+                cookies = dict_from_cookiejar(self.session.cookies)
+
+                self.logging_in = True
+                try:
+                    result = login(*args, **kwargs)
+                finally:
+                    self.logging_in = False
+
+                if result and dict_from_cookiejar(self.session.cookies) != cookies:
+                    provider_sessions.save(self)
+                    provider_health.record_login(self.id)
+
+                return result
+
+        return wrapper
+
+    def _check_login_session(self, response, **kwargs):
+        """
+        Response hook detecting an expired login session from a 401 response or a redirect to the login page, the
+        session is cleared and the request sent again once logged in again
+        """
+        if self.logging_in or not self.session.cookies:
+            return
+
+        login_url = self.urls.get('login', '').split('?')[0]
+        if login_url and response.request.url.split('?')[0] == login_url:
+            return
+
+        if response.status_code != 401 and not (login_url and response.is_redirect and
+                                                urljoin(response.url, response.headers['Location']).split('?')[0] == login_url):
+            return
+
+        sickrage.app.log.debug('Login session for provider {} expired, logging in again'.format(self.name))
+
+        with self.login_lock:
+            self.session.cookies.clear()
+            provider_sessions.clear(self)
+            if not self.login():
+                return
+
+            self.logging_in = True
+            try:
+                request = response.request.copy()
+                request.headers.pop('Cookie', None)
+                request.prepare_cookies(self.session.cookies)
+                return self.session.send(request, **kwargs)
+            finally:
+                self.logging_in = False
+
     def get_result(self, season=None, episodes=None):
         """
         Returns a result of the correct type for this provider
@@ -284,6 +364,10 @@ class SearchProvider(object):
         return SearchProviderResult(season, episodes)
 
     def get_content(self, url):
+        content = content_cache.get(url)
+        if content is not None:
+            return content
+
         if self.login():
             headers = {}
             if url.startswith('http'):
@@ -291,7 +375,8 @@ class SearchProvider(object):
 
             if not url.startswith('magnet'):
                 try:
-                    return self.session.get(url, verify=False, headers=headers).content
+                    response = self.session.get(url, verify=False, headers=headers)
+                    return response.content
                 except Exception:
                     pass
 
@@ -434,7 +519,8 @@ class SearchProvider(object):
         leechers = item.get('leechers', -1)
         return try_int(seeders, -1), try_int(leechers, -1)
 
-    def find_search_results(self, series_id, series_provider_id, season, episode, search_mode, manualSearch=False, downCurQuality=False, cacheOnly=False):
+    def find_search_results(self, series_id, series_provider_id, season, episode, search_mode, manualSearch=False, downCurQuality=False, cacheOnly=False,
+                            plan=None):
         provider_results = {}
         item_list = []
 
@@ -464,7 +550,10 @@ class SearchProvider(object):
 
         for curString in search_strings:
             try:
-                item_list += self.search(curString, series_id=series_id, series_provider_id=series_provider_id, season=season, episode=episode)
+                if plan:
+                    item_list += plan.search(self, curString, series_id=series_id, series_provider_id=series_provider_id, season=season, episode=episode)
+                else:
+                    item_list += self.search(curString, series_id=series_id, series_provider_id=series_provider_id, season=season, episode=episode)
             except SAXParseException:
                 continue
 
@@ -487,20 +576,26 @@ class SearchProvider(object):
             # extend the list with the unknown qualities, now sorted at the bottom of the list
             items_list.extend(unknown_items)
 
-        # filter results
+        # ignore invalid non-magnet urls
+        valid_items = []
         for item in item_list:
-            provider_result = self.get_result()
+            title, url = self._get_title_and_url(item)
+            if not validate_url(url) and not url.startswith('magnet'):
+                continue
+            valid_items.append((item, title, url))
 
-            provider_result.name, provider_result.url = self._get_title_and_url(item)
+        # parse all result names in one batch
+        parse_results = NameParser(series_id=series_id, series_provider_id=series_provider_id).parse_many([title for item, title, url in valid_items])
 
-            # ignore invalid non-magnet urls
-            if not validate_url(provider_result.url) and not provider_result.url.startswith('magnet'):
-                continue
+        # filter results
+        for item, title, url in valid_items:
+            provider_result = self.get_result()
 
-            try:
-                parse_result = NameParser(series_id=series_id, series_provider_id=series_provider_id).parse(provider_result.name)
-            except (InvalidNameException, InvalidShowException) as e:
-                sickrage.app.log.debug("{}".format(e))
+            provider_result.name, provider_result.url = title, url
+
+            parse_result = parse_results[provider_result.name]
+            if isinstance(parse_result, (InvalidNameException, InvalidShowException)):
+                sickrage.app.log.debug("{}".format(parse_result))
                 continue
 
             provider_result.series_id = parse_result.series_id
@@ -512,7 +607,8 @@ class SearchProvider(object):
             provider_result.seeders, provider_result.leechers = self._get_result_stats(item)
 
             sickrage.app.log.debug("Adding item from search to cache: {}".format(provider_result.name))
-            self.cache.add_cache_entry(provider_result.name, provider_result.url, provider_result.seeders, provider_result.leechers, provider_result.size)
+            self.cache.add_cache_entry(provider_result.name, provider_result.url, provider_result.seeders, provider_result.leechers, provider_result.size,
+                                       parse_result=parse_result)
 
             if not provider_result.series_id or not provider_result.series_provider_id:
                 continue
@@ -525,7 +621,8 @@ class SearchProvider(object):
                 sickrage.app.log.debug("This is supposed to be a date search but the result {} didn't parse as one, skipping it".format(provider_result.name))
                 continue
 
-            if search_mode == 'sponly':
+            # planned season searches replace the episode searches, so results of the episode are kept as well
+            if search_mode == 'sponly' and not (plan and len(parse_result.episode_numbers)):
                 if len(parse_result.episode_numbers):
                     sickrage.app.log.debug("This is supposed to be a season pack search but the result {} is not "
                                            "a valid season pack, skipping it".format(provider_result.name))
@@ -771,13 +868,21 @@ class TorrentProvider(SearchProvider):
     def get_content(self, url):
         result = None
 
+        # torrents verified before are cached with their info hash
+        if content_cache.info_hash(url):
+            return content_cache.get(url)
+
         def verify_torrent(content):
             try:
-                if bdecode(content).get('info'):
+                info = bdecode(content).get('info')
+                if info:
+                    content_cache.add(url, content, sha1(bencode(info)).hexdigest())
                     return content
             except Exception:
                 pass
 
+            content_cache.discard(url)
+
         if url.startswith('magnet') and sickrage.app.config.general.torrent_magnet_to_file:
             # get hash
             info_hash = str(re.findall(r'urn:btih:([\w]{32,40})', url)[0]).upper()
@@ -926,6 +1031,35 @@ class NZBProvider(SearchProvider):
     def _get_size(self, item):
         return item.get('size', -1)
 
+    def get_content(self, url):
+        content = content_cache.get(url)
+        if content is not None:
+            return content
+
+        content = super(NZBProvider, self).get_content(url)
+
+        # login pages, limit pages and newznab error documents are not cached, only nzbs and torznab torrents
+        if content and (self._is_nzb(content) or self._is_torrent(content)):
+            content_cache.add(url, content)
+        else:
+            content_cache.discard(url)
+
+        return content
+
+    @staticmethod
+    def _is_nzb(content):
+        try:
+            return ElementTree.fromstring(content).tag.rpartition('}')[2] == 'nzb'
+        except Exception:
+            return False
+
+    @staticmethod
+    def _is_torrent(content):
+        try:
+            return bool(bdecode(content).get('info'))
+        except Exception:
+            return False
+
     def download_result(self, result):
         """
         Downloads a result to the appropriate black hole folder.
@@ -1119,6 +1253,9 @@ class TorrentRssProvider(TorrentProvider):
 class NewznabProvider(NZBProvider):
     provider_type = SearchProviderType.NEWZNAB
 
+    caps_ttl = 24 * 60 * 60
+    caps_retry = 60 * 60
+
     def __init__(self, name, url, key='0', catIDs='5030,5040', search_mode='eponly', search_fallback=False,
                  enable_daily=False, enable_backlog=False, default=False):
         super(NewznabProvider, self).__init__(name, clean_url(url), bool(key != '0'))
@@ -1137,27 +1274,65 @@ class NewznabProvider(NZBProvider):
         self.cap_tv_search = None
         self.force_query = False
 
+        # capabilities of the indexer and when they were cached
+        self._caps = None
+        self.caps_lock = threading.Lock()
+
         self.provider_deleted = False
 
         self.cache = TVCache(self, min_time=30)
 
-    def set_caps(self, data):
+    def set_caps(self, caps):
         """
         Set caps.
         """
-        if not data:
-            return
+        self.cap_tv_search = caps['searching'].get('tv-search', []) if caps else None
+        self.caps = any(self.cap_tv_search or [])
+
+    def get_caps(self, refresh=False):
+        """
+        Gets the capabilities of the indexer, from memory or the cache database while they are younger than
+        caps_ttl seconds, otherwise from its t=caps api.  When the api fails the previous capabilities are kept and it
+        is not asked again for caps_retry seconds.
+
+        :param refresh: ask the api even if the cached capabilities did not expire
+        :return: dict of capabilities as returned by parse_newznab_caps or None
+        """
+        with self.caps_lock:
+            if not refresh and self._caps and time.time() - self._caps[1] < (self.caps_ttl if self._caps[0] else self.caps_retry):
+                return self._caps[0]
 
-        def _parse_cap(tag):
-            elm = data.find(tag)
-            is_supported = elm and all([elm.get('supportedparams'), elm.get('available') == 'yes'])
-            return elm['supportedparams'].split(',') if is_supported else []
+            session = sickrage.app.cache_db.session()
 
-        self.cap_tv_search = _parse_cap('tv-search')
+            cached = session.query(CacheDB.NewznabCaps).filter_by(provider_id=self.id, url=self.urls['base_url']).one_or_none()
+            if not refresh and cached and time.time() - cached.time < self.caps_ttl:
+                self._caps = (json.loads(cached.caps), cached.time)
+                self.set_caps(self._caps[0])
+                return self._caps[0]
 
-        self.caps = any(self.cap_tv_search)
+            caps = None
+            if self._check_auth():
+                url_params = {'t': 'caps'}
+                if self.private and self.key:
+                    url_params['apikey'] = self.key
+
+                try:
+                    caps = parse_newznab_caps(self.session.get(urljoin(self.urls['base_url'], 'api'), params=url_params, conditional=False).text)
+                except Exception:
+                    caps = None
+
+            if caps:
+                session.merge(CacheDB.NewznabCaps(provider_id=self.id, url=self.urls['base_url'], caps=json.dumps(caps), time=int(time.time())))
+                session.commit()
+            else:
+                sickrage.app.log.debug('Error getting caps xml for [{}]'.format(self.name))
+                caps = json.loads(cached.caps) if cached else None
 
-    def get_newznab_categories(self, just_caps=False):
+            self._caps = (caps, time.time())
+            self.set_caps(caps)
+            return caps
+
+    def get_newznab_categories(self, just_caps=False, refresh=False):
         """
         Use the newznab provider url and apikey to get the capabilities.
 
@@ -1165,40 +1340,17 @@ class NewznabProvider(NZBProvider):
         Returns a tuple with (succes or not, array with dicts [{'id': '5070', 'name': 'Anime'},
         {'id': '5080', 'name': 'Documentary'}, {'id': '5020', 'name': 'Foreign'}...etc}], error message)
         """
-        return_categories = []
-
         if not self._check_auth():
-            return False, return_categories, 'Provider requires auth and your key is not set'
-
-        url_params = {'t': 'caps'}
-        if self.private and self.key:
-            url_params['apikey'] = self.key
+            return False, [], 'Provider requires auth and your key is not set'
 
-        try:
-            response = self.session.get(urljoin(self.urls['base_url'], 'api'), params=url_params).text
-        except Exception:
-            error_string = 'Error getting caps xml for [{}]'.format(self.name)
-            sickrage.app.log.warning(error_string)
-            return False, return_categories, error_string
-
-        with bs4_parser(response) as html:
-            if not html.find('categories'):
-                error_string = 'Error parsing caps xml for [{}]'.format(self.name)
-                sickrage.app.log.debug(error_string)
-                return False, return_categories, error_string
-
-            self.set_caps(html.find('searching'))
-            if just_caps:
-                return
+        caps = self.get_caps(refresh=refresh)
+        if just_caps:
+            return
 
-            for category in html('category'):
-                if 'TV' in category.get('name', '') and category.get('id', ''):
-                    return_categories.append({'id': category['id'], 'name': category['name']})
-                    for subcat in category('subcat'):
-                        if subcat.get('name', '') and subcat.get('id', ''):
-                            return_categories.append({'id': subcat['id'], 'name': subcat['name']})
+        if not caps:
+            return False, [], 'Error getting caps xml for [{}]'.format(self.name)
 
-            return True, return_categories, ''
+        return True, caps['categories'], ''
 
     def _doGeneralSearch(self, search_string):
         return self.search({'q': search_string})
@@ -1214,19 +1366,13 @@ class NewznabProvider(NZBProvider):
         """
         Check that the returned data is valid.
 
+        :param data: NewznabFeed
         :return: _check_auth if valid otherwise False if there is an error
         """
-        if data('categories') + data('item'):
+        if data.categories or data.items or not data.error:
             return self._check_auth()
 
-        try:
-            err_desc = data.error.attrs['description']
-            if not err_desc:
-                raise Exception
-        except (AttributeError, TypeError):
-            return self._check_auth()
-
-        sickrage.app.log.info(err_desc)
+        sickrage.app.log.info(data.error)
 
         return False
 
@@ -1247,15 +1393,16 @@ class NewznabProvider(NZBProvider):
 
         episode_object = show_object.get_episode(season, episode)
 
-        # For providers that don't have caps, or for which the t=caps is not working.
-        if not self.caps:
-            self.get_newznab_categories(just_caps=True)
+        # without caps the indexer is assumed to support tvsearch with all its params
+        caps = self.get_caps()
+        tv_search_params = caps['searching'].get('tv-search', []) if caps else ['q', 'tvdbid', 'season', 'ep']
+        limit = min(100, caps['limits'].get('max') or 100) if caps else 100
 
         for mode in search_strings:
             self.torznab = False
             search_params = {
                 't': 'search',
-                'limit': 100,
+                'limit': limit,
                 'offset': 0,
                 'cat': self.catIDs.strip(', ') or '5030,5040',
                 'maxage': sickrage.app.config.general.usenet_retention
@@ -1265,7 +1412,8 @@ class NewznabProvider(NZBProvider):
                 search_params['apikey'] = self.key
 
             if mode != 'RSS':
-                if (self.cap_tv_search or not self.cap_tv_search == 'True') and not self.force_query:
+                # id based tvsearch only when the indexer supports it, otherwise a query search
+                if 'tvdbid' in tv_search_params and not self.force_query:
                     search_params['t'] = 'tvsearch'
                     search_params.update({'tvdbid': series_id})
 
@@ -1277,6 +1425,10 @@ class NewznabProvider(NZBProvider):
                     else:
                         search_params['season'], search_params['ep'] = episode_object.get_season_episode_numbering()
 
+                    for param in ['season', 'ep']:
+                        if param not in tv_search_params:
+                            search_params.pop(param)
+
                 if mode == 'Season':
                     search_params.pop('ep', '')
 
@@ -1296,7 +1448,7 @@ class NewznabProvider(NZBProvider):
                 sleep(sickrage.app.config.general.cpu_preset.value)
 
                 try:
-                    data = self.session.get(urljoin(self.urls['base_url'], 'api'), params=search_params).text
+                    data = self.session.get(urljoin(self.urls['base_url'], 'api'), params=search_params).content
                     results += self.parse(data, mode)
                 except Exception:
                     sickrage.app.log.debug('No data returned from provider')
@@ -1317,71 +1469,52 @@ class NewznabProvider(NZBProvider):
     def parse(self, data, mode, **kwargs):
         results = []
 
-        with bs4_parser(data) as html:
-            if not self._check_auth_from_data(html):
-                return results
+        feed = parse_newznab_feed(data)
+        if not self._check_auth_from_data(feed):
+            return results
+
+        self.torznab = feed.torznab
 
+        if not feed.items:
+            sickrage.app.log.debug('No results returned from provider. Check chosen Newznab '
+                                   'search categories in provider settings and/or usenet '
+                                   'retention')
+            return results
+
+        for item in feed.items:
             try:
-                self.torznab = 'xmlns:torznab' in html.rss.attrs
-            except AttributeError:
-                self.torznab = False
+                title = item['title']
+                download_url = next((url for url in item['links'] if validate_url(url) or url.startswith('magnet')), None)
 
-            if not html('item'):
-                sickrage.app.log.debug('No results returned from provider. Check chosen Newznab '
-                                       'search categories in provider settings and/or usenet '
-                                       'retention')
-                return results
+                if not (title and download_url):
+                    continue
 
-            for item in html('item'):
-                try:
-                    title = item.title.get_text(strip=True)
-                    download_url = None
-                    if item.link:
-                        url = item.link.get_text(strip=True)
-                        if validate_url(url) or url.startswith('magnet'):
-                            download_url = url
-
-                        if not download_url:
-                            url = item.link.next.strip()
-                            if validate_url(url) or url.startswith('magnet'):
-                                download_url = url
-
-                    if not download_url and item.enclosure:
-                        url = item.enclosure.get('url', '').strip()
-                        if validate_url(url) or url.startswith('magnet'):
-                            download_url = url
-
-                    if not (title and download_url):
-                        continue
-
-                    seeders = leechers = -1
-                    if 'gingadaddy' in self.urls['base_url']:
-                        size_regex = re.search(r'\d*.?\d* [KMGT]B', str(item.description))
-                        item_size = size_regex.group() if size_regex else -1
-                    else:
-                        item_size = item.size.get_text(strip=True) if item.size else -1
+                seeders = leechers = -1
+                if 'gingadaddy' in self.urls['base_url']:
+                    size_regex = re.search(r'\d*.?\d* [KMGT]B', item['description'])
+                    item_size = size_regex.group() if size_regex else -1
+                else:
+                    item_size = item['size'] if item['size'] is not None else -1
 
-                        newznab_attrs = item(re.compile('newznab:attr'))
-                        torznab_attrs = item(re.compile('torznab:attr'))
-                        for attr in newznab_attrs + torznab_attrs:
-                            item_size = attr['value'] if attr['name'] == 'size' else item_size
-                            seeders = try_int(attr['value']) if attr['name'] == 'seeders' else seeders
-                            peers = try_int(attr['value']) if attr['name'] == 'peers' else None
-                            leechers = peers - seeders if peers else leechers
+                    for name, value in item['attrs']:
+                        item_size = value if name == 'size' else item_size
+                        seeders = try_int(value) if name == 'seeders' else seeders
+                        peers = try_int(value) if name == 'peers' else None
+                        leechers = peers - seeders if peers else leechers
 
-                    if not item_size or (self.torznab and (seeders == -1 or leechers == -1)):
-                        continue
+                if not item_size or (self.torznab and (seeders == -1 or leechers == -1)):
+                    continue
 
-                    size = convert_size(item_size, -1)
+                size = convert_size(item_size, -1)
 
-                    results += [
-                        {'title': title, 'link': download_url, 'size': size, 'seeders': seeders, 'leechers': leechers}
-                    ]
+                results += [
+                    {'title': title, 'link': download_url, 'size': size, 'seeders': seeders, 'leechers': leechers}
+                ]
 
-                    if mode != 'RSS':
-                        sickrage.app.log.debug('Found result: {}'.format(title))
-                except (AttributeError, TypeError, KeyError, ValueError, IndexError):
-                    sickrage.app.log.error('Failed parsing provider')
+                if mode != 'RSS':
+                    sickrage.app.log.debug('Found result: {}'.format(title))
+            except (AttributeError, TypeError, KeyError, ValueError, IndexError):
+                sickrage.app.log.error('Failed parsing provider')
 
         return results
 
@@ -0,0 +1,129 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+import threading
+import time
+from collections import OrderedDict
+from hashlib import sha1
+
+
+class ContentCache(object):
+    """
+    Short lived cache of the .torrent and .nzb payloads downloaded from search providers, so a result is downloaded
+    once for its verification and its snatch.  Only payloads verified to be a torrent or an nzb are added.
+
+    Urls point to the sha1 hash of their payload and every payload is kept once, together with the info hash computed
+    when a torrent was verified.  Urls expire after ttl seconds and the oldest ones are dropped once the payloads take
+    more than max_size bytes.
+    """
+
+    def __init__(self, max_size=32 * 1024 * 1024, ttl=900, clock=time.monotonic):
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.urls = OrderedDict()
+        self.contents = {}
+        self.size = 0
+
+    def _expire(self):
+        expire_time = self.clock() - self.ttl
+        while self.urls and (self.size > self.max_size or next(iter(self.urls.values()))[1] < expire_time):
+            self._remove(next(iter(self.urls)))
+
+    def _remove(self, url):
+        content_hash, __ = self.urls.pop(url)
+        entry = self.contents[content_hash]
+        entry['urls'] -= 1
+        if not entry['urls']:
+            del self.contents[content_hash]
+            self.size -= len(entry['content'])
+
+    def _get(self, url):
+        self._expire()
+        if url not in self.urls:
+            return None
+
+        return self.contents[self.urls[url][0]]
+
+    def get(self, url):
+        """
+        Returns the cached payload of a url or None
+        """
+        with self.lock:
+            entry = self._get(url)
+            return entry['content'] if entry else None
+
+    def info_hash(self, url):
+        """
+        Returns the info hash computed when the cached torrent of a url was verified or None
+        """
+        with self.lock:
+            entry = self._get(url)
+            return entry['info_hash'] if entry else None
+
+    def add(self, url, content, info_hash=None):
+        """
+        Caches the payload of a url, payloads larger than max_size are not cached
+
+        :param url: url the payload was downloaded from
+        :param content: payload as bytes
+        :param info_hash: info hash of a verified torrent payload
+        :return: sha1 hash of the payload
+        """
+        content_hash = sha1(content).hexdigest()
+        if len(content) > self.max_size:
+            return content_hash
+
+        with self.lock:
+            if url in self.urls:
+                self._remove(url)
+
+            entry = self.contents.setdefault(content_hash, {'content': content, 'info_hash': None, 'urls': 0})
+            if not entry['urls']:
+                self.size += len(content)
+            entry['urls'] += 1
+            entry['info_hash'] = info_hash or entry['info_hash']
+
+            self.urls[url] = (content_hash, self.clock())
+            self._expire()
+
+        return content_hash
+
+    def discard(self, url):
+        """
+        Drops the cached payload of a url, if any
+        """
+        with self.lock:
+            if url in self.urls:
+                self._remove(url)
+
+    def clear(self):
+        with self.lock:
+            self.urls.clear()
+            self.contents.clear()
+            self.size = 0
+
+
+content_cache = ContentCache()
@@ -0,0 +1,197 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import threading
+import time
+from collections import deque
+
+
+class ProviderHealth(object):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, window):
+        self.searches = deque(maxlen=window)
+        self.total_searches = 0
+        self.snatches = 0
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = None
+        self.probing = False
+        self.logins = deque()
+
+
+class ProviderHealthTracker(object):
+    """
+    Tracks the health of search providers from the outcome of their searches.
+
+    Every provider keeps a rolling window of its searches for its success rate and latency percentiles, and counts its
+    snatched results for its yield.  A provider failing failure_threshold searches in a row trips its circuit breaker
+    and is skipped until cooldown seconds passed, then a single half open probe search decides whether it is closed
+    again or stays open for another cool down.
+    """
+
+    def __init__(self, window=50, failure_threshold=5, cooldown=600, clock=time.monotonic):
+        self.lock = threading.Lock()
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.providers = {}
+
+    def _get(self, provider_id):
+        if provider_id not in self.providers:
+            self.providers[provider_id] = ProviderHealth(self.window)
+        return self.providers[provider_id]
+
+    def record_search(self, provider_id, success, latency, results=0):
+        """
+        Records the outcome of a provider search
+
+        :param provider_id: id of the search provider
+        :param success: False if the search failed or timed out
+        :param latency: search duration in seconds
+        :param results: number of results found
+        """
+        with self.lock:
+            health = self._get(provider_id)
+            health.searches.append((success, latency, results))
+            health.total_searches += 1
+
+            if success:
+                health.consecutive_failures = 0
+                health.state = ProviderHealth.CLOSED
+            else:
+                health.consecutive_failures += 1
+                if health.state == ProviderHealth.HALF_OPEN or health.consecutive_failures >= self.failure_threshold:
+                    health.state = ProviderHealth.OPEN
+                    health.opened_at = self.clock()
+
+            health.probing = False
+
+    def record_snatch(self, provider_id):
+        """
+        Records a snatched result of a provider
+        """
+        with self.lock:
+            self._get(provider_id).snatches += 1
+
+    def record_login(self, provider_id):
+        """
+        Records a login of a provider, logins older than an hour are dropped
+        """
+        with self.lock:
+            logins = self._get(provider_id).logins
+            logins.append(self.clock())
+            while logins[0] < logins[-1] - 3600:
+                logins.popleft()
+
+    def allow(self, provider_id):
+        """
+        Checks the circuit breaker of a provider, once the cool down of an open breaker passed a single probe search
+        is allowed until its outcome is recorded
+
+        :param provider_id: id of the search provider
+        :return: True if the provider may be searched
+        """
+        with self.lock:
+            health = self._get(provider_id)
+
+            if health.state == ProviderHealth.OPEN and self.clock() - health.opened_at >= self.cooldown:
+                health.state = ProviderHealth.HALF_OPEN
+
+            if health.state == ProviderHealth.HALF_OPEN:
+                if health.probing:
+                    return False
+                health.probing = True
+                return True
+
+            return health.state == ProviderHealth.CLOSED
+
+    def release(self, provider_id):
+        """
+        Releases the half open probe of a provider whose search was cancelled before it started, so the next search
+        may probe it instead
+        """
+        with self.lock:
+            self._get(provider_id).probing = False
+
+    def order(self, providers):
+        """
+        Orders providers by their score, providers without searches yet and providers with equal scores keep their
+        configured order
+
+        :param providers: list of search providers in configured order
+        :return: list of search providers, healthiest first
+        """
+        return sorted(providers, key=lambda x: -self.score(x.id))
+
+    def score(self, provider_id):
+        """
+        Scores a provider from its success rate, yield and median latency, a provider without searches scores 1.0
+
+        :param provider_id: id of the search provider
+        :return: score, higher is better
+        """
+        stats = self.stats(provider_id)
+        if not stats['searches']:
+            return 1.0
+
+        return round(stats['success_rate'] * (1 + stats['yield']) / (1 + stats['latency_p50'] / 10), 4)
+
+    def stats(self, provider_id):
+        with self.lock:
+            health = self._get(provider_id)
+
+            searches = list(health.searches)
+            logins_per_hour = len([x for x in health.logins if x >= self.clock() - 3600])
+            latencies = sorted(latency for success, latency, results in searches)
+
+            def percentile(percent):
+                if not latencies:
+                    return 0
+                return round(latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))], 3)
+
+            return {
+                'state': health.state,
+                'searches': len(searches),
+                'success_rate': round(len([x for x in searches if x[0]]) / len(searches), 4) if searches else 0,
+                'latency_p50': percentile(50),
+                'latency_p95': percentile(95),
+                'results': sum(results for success, latency, results in searches),
+                'snatches': health.snatches,
+                'yield': round(health.snatches / health.total_searches, 4) if health.total_searches else 0,
+                'consecutive_failures': health.consecutive_failures,
+                'logins_per_hour': logins_per_hour,
+            }
+
+    def reset(self, provider_id=None):
+        with self.lock:
+            if provider_id:
+                self.providers.pop(provider_id, None)
+            else:
+                self.providers.clear()
+
+
+provider_health = ProviderHealthTracker()
@@ -0,0 +1,233 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+import io
+import re
+
+import sickrage
+from sickrage.core.helpers import bs4_parser, try_int
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+NEWZNAB_NAMESPACES = ('newznab', 'torznab')
+
+
+class NewznabFeed(object):
+    """
+    Fields of a newznab/torznab api response that the newznab provider uses.
+
+    Each item is a dict with the title, candidate download urls in order of preference (links), size, description,
+    pubdate and the newznab/torznab attributes as a list of (name, value) tuples, newznab attributes first.
+    """
+
+    def __init__(self):
+        self.torznab = False
+        self.error = None
+        self.categories = 0
+        self.items = []
+
+
+def parse_newznab_feed(data):
+    """
+    Parses a newznab/torznab api response, with lxml if it is installed and the response is well formed xml,
+    otherwise with BeautifulSoup
+
+    :param data: response body, bytes or str
+    :return: NewznabFeed
+    """
+    if etree is not None:
+        try:
+            return parse_newznab_feed_lxml(data)
+        except etree.XMLSyntaxError as e:
+            sickrage.app.log.debug('Unable to parse newznab response as xml, falling back to html parser: {}'.format(e))
+
+    return parse_newznab_feed_bs4(data)
+
+
+def parse_newznab_feed_lxml(data):
+    """
+    Streams the response through lxml iterparse, reading only the item fields and clearing every item once read
+
+    :param data: response body, bytes or str
+    :return: NewznabFeed
+    """
+    feed = NewznabFeed()
+    namespaces = {}
+
+    kwargs = {}
+    if isinstance(data, str):
+        # the declared encoding no longer applies to decoded text
+        data, kwargs['encoding'] = data.encode('utf-8'), 'utf-8'
+
+    item = None
+    for event, elem in etree.iterparse(io.BytesIO(data), events=('start-ns', 'start', 'end'), resolve_entities=False, **kwargs):
+        if event == 'start-ns':
+            prefix, uri = elem
+            namespaces[uri] = prefix
+            feed.torznab |= prefix == 'torznab'
+            continue
+
+        namespace, tag = _split_tag(elem.tag)
+
+        if event == 'start':
+            if tag == 'item' and not namespace:
+                item = {'title': '', 'links': [], 'size': None, 'description': '', 'pubdate': '', 'attrs': []}
+            elif tag == 'error' and not namespace and item is None:
+                feed.error = elem.get('description')
+            elif tag == 'categories':
+                feed.categories += 1
+            continue
+
+        if item is None:
+            continue
+
+        if tag == 'item' and not namespace:
+            item['attrs'].sort(key=lambda x: x[0] != 'newznab')
+            item['attrs'] = [(name, value) for prefix, name, value in item['attrs']]
+            feed.items.append(item)
+            item = None
+
+            # drop the item and the items before it from the tree, only the current item is kept in memory
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        elif tag == 'attr' and namespaces.get(namespace) in NEWZNAB_NAMESPACES:
+            item['attrs'].append((namespaces[namespace], elem.get('name'), elem.get('value')))
+        elif namespace:
+            continue
+        elif tag == 'title':
+            item['title'] = _get_text(elem)
+        elif tag == 'link':
+            item['links'].insert(0, _get_text(elem))
+        elif tag == 'enclosure':
+            item['links'].append((elem.get('url') or '').strip())
+        elif tag == 'size':
+            item['size'] = _get_text(elem)
+        elif tag == 'description':
+            item['description'] = _get_text(elem)
+        elif tag == 'pubDate':
+            item['pubdate'] = _get_text(elem)
+
+    return feed
+
+
+def parse_newznab_feed_bs4(data):
+    """
+    Reads the response with BeautifulSoup, used when lxml is not installed or the response is not well formed xml
+
+    :param data: response body, bytes or str
+    :return: NewznabFeed
+    """
+    feed = NewznabFeed()
+
+    with bs4_parser(data, 'html5lib') as html:
+        try:
+            feed.torznab = 'xmlns:torznab' in html.rss.attrs
+        except AttributeError:
+            pass
+
+        if html.error:
+            feed.error = html.error.attrs.get('description')
+
+        feed.categories = len(html('categories'))
+
+        for elem in html('item'):
+            item = {'title': '', 'links': [], 'size': None, 'description': '', 'pubdate': '', 'attrs': []}
+
+            if elem.title:
+                item['title'] = elem.title.get_text(strip=True)
+
+            if elem.link:
+                # html5lib treats link as a void element, its url follows it
+                item['links'] += [elem.link.get_text(strip=True), str(elem.link.next or '').strip()]
+
+            if elem.enclosure:
+                item['links'].append(elem.enclosure.get('url', '').strip())
+
+            if elem.size:
+                item['size'] = elem.size.get_text(strip=True)
+
+            if elem.description:
+                item['description'] = elem.description.get_text(strip=True)
+
+            if elem.pubdate:
+                item['pubdate'] = elem.pubdate.get_text(strip=True)
+
+            for prefix in NEWZNAB_NAMESPACES:
+                item['attrs'] += [(attr.get('name'), attr.get('value')) for attr in elem(re.compile(prefix + ':attr'))]
+
+            feed.items.append(item)
+
+    return feed
+
+
+def parse_newznab_caps(data):
+    """
+    Parses a newznab/torznab caps response
+
+    :param data: response body, bytes or str
+    :return: dict of the TV categories with their subcategories, the available search functions with their supported
+        params and the result limits, None if the response has no categories
+    """
+    with bs4_parser(data) as html:
+        if not html.find('categories'):
+            return None
+
+        caps = {'categories': [], 'searching': {}, 'limits': {}}
+
+        searching = html.find('searching')
+        for elm in searching.find_all(True) if searching else []:
+            if elm.get('available') == 'yes':
+                caps['searching'][elm.name] = [x.strip() for x in (elm.get('supportedparams') or 'q').split(',') if x.strip()]
+
+        limits = html.find('limits')
+        if limits:
+            caps['limits'] = {'max': try_int(limits.get('max')), 'default': try_int(limits.get('default'))}
+
+        for category in html('category'):
+            if 'TV' in category.get('name', '') and category.get('id', ''):
+                caps['categories'].append({'id': category['id'], 'name': category['name']})
+                for subcat in category('subcat'):
+                    if subcat.get('name', '') and subcat.get('id', ''):
+                        caps['categories'].append({'id': subcat['id'], 'name': subcat['name']})
+
+        return caps
+
+
+def _split_tag(tag):
+    if not isinstance(tag, str):
+        return None, None
+
+    if tag.startswith('{'):
+        namespace, tag = tag[1:].split('}', 1)
+        return namespace, tag
+
+    return None, tag
+
+
+def _get_text(elem):
+    return ''.join(elem.itertext()).strip()
@@ -0,0 +1,84 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+import json
+import threading
+import time
+
+from requests.cookies import create_cookie
+
+import sickrage
+from sickrage.core.databases.cache import CacheDB
+
+
+class ProviderSessionStore(object):
+    """
+    Keeps the cookies of logged in search provider sessions in the cache database, so a restart reuses the session a
+    provider logged in with instead of logging in again before its first search.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def restore(self, provider):
+        """
+        Adds the stored cookies of a provider to its web session
+
+        :param provider: search provider
+        :return: True if cookies were restored
+        """
+        with self.lock:
+            session = sickrage.app.cache_db.session()
+            stored = session.query(CacheDB.ProviderSession).filter_by(provider_id=provider.id).one_or_none()
+            if not stored:
+                return False
+
+            now = time.time()
+            for cookie in json.loads(stored.cookies):
+                if cookie['expires'] and cookie['expires'] < now:
+                    continue
+                provider.session.cookies.set_cookie(create_cookie(**cookie))
+
+            return bool(provider.session.cookies)
+
+    def save(self, provider):
+        """
+        Stores the cookies of the web session of a provider
+        """
+        cookies = [{'name': x.name, 'value': x.value, 'domain': x.domain, 'path': x.path, 'expires': x.expires, 'secure': x.secure}
+                   for x in provider.session.cookies]
+
+        with self.lock:
+            session = sickrage.app.cache_db.session()
+            session.merge(CacheDB.ProviderSession(provider_id=provider.id, cookies=json.dumps(cookies), time=int(time.time())))
+            session.commit()
+
+    def clear(self, provider):
+        with self.lock:
+            session = sickrage.app.cache_db.session()
+            session.query(CacheDB.ProviderSession).filter_by(provider_id=provider.id).delete()
+            session.commit()
+
+
+provider_sessions = ProviderSessionStore()
@@ -121,7 +121,7 @@ class LimeTorrentsProvider(TorrentProvider):
                         continue
 
                     try:
-                        self.session.get(self.urls['update'], timeout=30,
+                        self.session.get(self.urls['update'], timeout=30, conditional=False,
                                          params={'torrent_id': torrent_id, 'infohash': info_hash})
                     except Exception:
                         pass
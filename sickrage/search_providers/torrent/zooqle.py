@@ -52,7 +52,7 @@ class ZooqleProvider(TorrentProvider):
 
     def _get_torrent_info(self, torrent_hash):
         try:
-            return self.session.get(self.urls['api'] % torrent_hash).json()
+            return self.session.get(self.urls['api'] % torrent_hash, conditional=False).json()
         except Exception:
             return {}
 
@@ -627,6 +627,7 @@ $(document).ready(function ($) {
             qualityDownload: false,
             selectedEpisode: '',
             manualSearches: [],
+            searchStatusCursor: 0,
 
             init: function () {
                 //PNotify.prototype.options.maxonscreen = 5;
@@ -790,9 +791,11 @@ $(document).ready(function ($) {
                     let pollInterval = 5000;
 
                     $.ajax({
-                        url: SICKRAGE.ajax_search.searchStatusUrl + `?show=${series_id}`,
+                        url: SICKRAGE.ajax_search.searchStatusUrl + `?show=${series_id}&cursor=${SICKRAGE.ajax_search.searchStatusCursor}`,
                         success: function (data) {
-                            if (data.episodes) {
+                            SICKRAGE.ajax_search.searchStatusCursor = data.cursor || 0;
+
+                            if (data.episodes && data.episodes.length) {
                                 pollInterval = 5000;
                             } else {
                                 pollInterval = 15000;
@@ -4936,6 +4939,16 @@ $(document).ready(function ($) {
                         SICKRAGE.config.providers.refreshProviderList();
                     });
 
+                    $('#newznab_caps_refresh').click(function () {
+                        var selectedProvider = $("#editANewznabProvider :selected").val();
+                        if (selectedProvider === "addNewznab") {
+                            return;
+                        }
+
+                        var provider = SICKRAGE.config.providers.newznabProviders[selectedProvider];
+                        SICKRAGE.config.providers.getNewznabCategories(provider[0], provider[1], true);
+                    });
+
                     $('#newznab_cat_update').click(function () {
                         // Maybe check if there is anything selected?
                         $("#newznab_cat option").each(function () {
@@ -5103,7 +5116,7 @@ $(document).ready(function ($) {
                     return found;
                 },
 
-                getNewznabCategories: function (isDefault, selectedProvider) {
+                getNewznabCategories: function (isDefault, selectedProvider, refresh) {
 
                     var name = selectedProvider[0];
                     var url = selectedProvider[1];
@@ -5113,10 +5126,15 @@ $(document).ready(function ($) {
                         return;
                     }
 
-                    var params = {url: url, name: name, key: key};
+                    var params = {url: url, name: name, key: key, refresh: refresh ? 1 : 0};
 
                     $(".updating_categories").wrapInner('<span>' + SICKRAGE.loadingHTML + ' Updating Categories ...</span>');
                     $.getJSON(SICKRAGE.srWebRoot + '/config/providers/getNewznabCategories', params, function (data) {
+                        if (refresh) {
+                            SICKRAGE.config.providers.newznabProvidersCapabilities = SICKRAGE.config.providers.newznabProvidersCapabilities.filter(function (newzNabCap) {
+                                return newzNabCap.name !== name;
+                            });
+                        }
                         SICKRAGE.config.providers.updateNewznabCaps(data, selectedProvider);
                     }).always(function () {
                         $(".updating_categories").empty();
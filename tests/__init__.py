@@ -28,6 +28,7 @@ import site
 import sys
 import threading
 import unittest
+from http.server import ThreadingHTTPServer
 
 from sickrage.core import Core, Logger
 
@@ -51,6 +52,7 @@ import sickrage
 from sickrage.core.tv import episode
 from sickrage.search_providers import SearchProviders
 from sickrage.core.helpers import encryption
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 
 
@@ -131,6 +133,25 @@ class SiCKRAGETestCase(unittest.TestCase):
     def _fake_specify_ep(self, season, episode):
         pass
 
+    def start_http_server(self, handler, **attributes):
+        """
+        Serves a request handler on a free local port until the test is cleaned up
+
+        :param handler: request handler class
+        :param attributes: attributes set on the server for the handler
+        :return: the server
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        server.daemon_threads = True
+        for name, value in attributes.items():
+            setattr(server, name, value)
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        return server
+
 
 class SiCKRAGETestDBCase(SiCKRAGETestCase):
     def setUp(self):
@@ -142,6 +163,26 @@ class SiCKRAGETestDBCase(SiCKRAGETestCase):
             os.unlink(sickrage.app.main_db.db_path)
 
 
+class SiCKRAGETestCacheDBCase(SiCKRAGETestDBCase):
+    def setUp(self):
+        super(SiCKRAGETestCacheDBCase, self).setUp()
+
+        sickrage.app.cache_db = CacheDB(db_type='sqlite',
+                                        db_prefix='sickrage',
+                                        db_host='localhost',
+                                        db_port='3306',
+                                        db_username='sickrage',
+                                        db_password='sickrage')
+        sickrage.app.cache_db.initialize()
+
+    def tearDown(self):
+        sickrage.app.cache_db.engine.dispose()
+        if os.path.isfile(sickrage.app.cache_db.db_path):
+            os.unlink(sickrage.app.cache_db.db_path)
+
+        super(SiCKRAGETestCacheDBCase, self).tearDown()
+
+
 def load_tests(loader, tests):
     global TESTALL
     TESTALL = True
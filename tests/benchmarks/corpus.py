@@ -0,0 +1,190 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+"""
+Deterministic generator for the synthetic release name corpus used by the release name benchmarks.
+
+The generated corpus is committed as tests/benchmarks/data/release_names.txt so that every run measures exactly the
+same names, regenerate it only when the mix of names needs to change.
+
+Usage: python -m tests.benchmarks.corpus [--names 5000] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+CORPUS_FILE = os.path.join(DATA_DIR, 'release_names.txt')
+
+CATEGORIES = ['tv', 'multi_episode', 'daily', 'sports', 'anime']
+
+SHOWS = ['Show Name', 'Another Show 2010', 'The Last Ship', 'Doctor Who 2005', 'Grey\'s Anatomy', 'Marvel\'s Agents of S.H.I.E.L.D',
+         'Mr. Robot', 'House of Cards US', 'Law and Order SVU', 'The 100', '24', 'Star Trek Discovery', 'This Is Us',
+         'Brooklyn Nine-Nine', 'Top Gear UK', 'Its Always Sunny in Philadelphia', 'American Dad!', 'Bob\'s Burgers',
+         'The Office (US)', 'Planet Earth II', 'Westworld', 'Better Call Saul', 'CSI Miami', 'Hawaii Five-0 2010']
+DAILY_SHOWS = ['The Daily Show', 'The Tonight Show Starring Jimmy Fallon', 'Late Night with Seth Meyers', 'Conan',
+               'Jimmy Kimmel Live', 'The Late Show with Stephen Colbert', 'Real Time with Bill Maher', 'WWE Monday Night Raw']
+SPORTS = ['NFL', 'NBA', 'NHL', 'MLB', 'Formula1', 'UFC', 'WWE SmackDown', 'Premier League', 'MotoGP', 'NASCAR Cup Series']
+TEAMS = ['Patriots', 'Giants', 'Lakers', 'Celtics', 'Rangers', 'Bruins', 'Yankees', 'Dodgers', 'Arsenal', 'Chelsea']
+ANIME = ['One Piece', 'Boruto - Naruto Next Generations', 'Shingeki no Kyojin', 'Fairy Tail', 'Dragon Ball Super',
+         'Boku no Hero Academia', 'Black Clover', 'Detective Conan', 'Sword Art Online Alicization', 'Gintama']
+FANSUBS = ['HorribleSubs', 'Erai-raws', 'SubsPlease', 'Commie', 'Coalgirls', 'DeadFish', 'FFF', 'Underwater']
+GROUPS = ['LOL', 'DIMENSION', 'KILLERS', 'SVA', 'AVS', 'NTb', 'TBS', 'FLEET', 'CtrlHD', 'BATV', 'W4F', 'ION10', 'RARBG']
+
+QUALITIES = ['HDTV.x264', '720p.HDTV.x264', '1080i.HDTV.MPEG2.DD5.1', '720p.WEB-DL.DD5.1.H.264', '1080p.WEB-DL.DD5.1.H.264',
+             '720p.WEBRip.x264', '1080p.AMZN.WEBRip.DDP5.1.x264', '2160p.NF.WEB-DL.DDP5.1.HEVC', '720p.BluRay.x264',
+             '1080p.BluRay.x264', '2160p.BluRay.REMUX.HEVC', 'DVDRip.XviD', 'PDTV.XviD', 'HR.WS.PDTV.x264', 'WEB.h264',
+             '480p.x264', 'iTunes.720p.H.264', '1080p.HDDVD.x264']
+ANIME_QUALITIES = ['480p', '720p', '1080p', 'BD 1080p', 'BD 720p', 'HEVC 1080p', 'WEB 720p', '1920x1080 AAC', '1280x720 x264']
+EXTRAS = ['PROPER', 'REPACK', 'INTERNAL', 'SUBBED', 'German', 'FRENCH', 'DUBBED', 'sample', 'READNFO', 'NFOFIX']
+SEPARATORS = ['.', ' ', '_']
+EXTENSIONS = ['', '', '', '.mkv', '.mp4', '.avi']
+
+
+def _dotted(text):
+    return text.replace(' - ', ' ').replace('. ', ' ').replace(' ', '.')
+
+
+def _extra(rng):
+    return '.' + rng.choice(EXTRAS) if rng.random() < 0.15 else ''
+
+
+def generate_tv(rng):
+    season, episode = rng.randint(1, 30), rng.randint(1, 24)
+    if rng.random() < 0.2:
+        return '{} - {}x{:02d} - Episode Title{}'.format(rng.choice(SHOWS), season, episode, rng.choice(EXTENSIONS))
+
+    name = '{}.S{:02d}E{:02d}{}.{}-{}'.format(_dotted(rng.choice(SHOWS)), season, episode, _extra(rng),
+                                              rng.choice(QUALITIES), rng.choice(GROUPS))
+    return name.replace('.', rng.choice(SEPARATORS)) + rng.choice(EXTENSIONS)
+
+
+def generate_multi_episode(rng):
+    show = _dotted(rng.choice(SHOWS))
+    season, episode = rng.randint(1, 30), rng.randint(1, 20)
+    style = rng.randint(0, 3)
+    if style == 0:
+        episodes = ''.join('E{:02d}'.format(x) for x in range(episode, episode + rng.randint(2, 4)))
+        number = 'S{:02d}{}'.format(season, episodes)
+    elif style == 1:
+        number = 'S{:02d}E{:02d}-E{:02d}'.format(season, episode, episode + rng.randint(1, 3))
+    elif style == 2:
+        number = '{}x{:02d}-{:02d}'.format(season, episode, episode + 1)
+    else:
+        number = 'S{:02d}E{:02d}E{:02d}'.format(season, episode, episode + 1)
+    return '{}.{}{}.{}-{}{}'.format(show, number, _extra(rng), rng.choice(QUALITIES), rng.choice(GROUPS), rng.choice(EXTENSIONS))
+
+
+def generate_daily(rng):
+    show = _dotted(rng.choice(DAILY_SHOWS))
+    year, month, day = rng.randint(2005, 2020), rng.randint(1, 12), rng.randint(1, 28)
+    if rng.random() < 0.5:
+        date = '{}.{:02d}.{:02d}'.format(year, month, day)
+    else:
+        date = '{}-{:02d}-{:02d}'.format(year, month, day)
+    guest = '.Guest.Name' if rng.random() < 0.3 else ''
+    return '{}.{}{}{}.{}-{}{}'.format(show, date, guest, _extra(rng), rng.choice(QUALITIES), rng.choice(GROUPS), rng.choice(EXTENSIONS))
+
+
+def generate_sports(rng):
+    league = _dotted(rng.choice(SPORTS))
+    year, month, day = rng.randint(2010, 2020), rng.randint(1, 12), rng.randint(1, 28)
+    home, away = rng.sample(TEAMS, 2)
+    if rng.random() < 0.5:
+        return '{}.{}.{:02d}.{:02d}.{}.vs.{}.{}-{}'.format(league, year, month, day, home, away, rng.choice(QUALITIES), rng.choice(GROUPS))
+    return '{}.{}.Round.{:02d}.{}.vs.{}.{}-{}'.format(league, year, rng.randint(1, 38), home, away, rng.choice(QUALITIES), rng.choice(GROUPS))
+
+
+def generate_anime(rng):
+    show = rng.choice(ANIME)
+    episode = rng.randint(1, 999)
+    style = rng.randint(0, 3)
+    crc = '{:08X}'.format(rng.getrandbits(32))
+    if style == 0:
+        return '[{}] {} - {:02d} [{}]{}'.format(rng.choice(FANSUBS), show, episode, rng.choice(ANIME_QUALITIES), rng.choice(EXTENSIONS))
+    elif style == 1:
+        return '[{}] {} - {:03d} ({}) [{}]{}'.format(rng.choice(FANSUBS), show, episode, rng.choice(ANIME_QUALITIES), crc,
+                                                    rng.choice(EXTENSIONS))
+    elif style == 2:
+        return '[{}] {} - {:02d}-{:02d} [{}]'.format(rng.choice(FANSUBS), show, episode, episode + 1, rng.choice(ANIME_QUALITIES))
+    return '[{}]_{}_-_{:03d}_[{}][{}]'.format(rng.choice(FANSUBS), show.replace(' ', '_'), episode,
+                                              rng.choice(ANIME_QUALITIES).replace(' ', '_'), crc)
+
+
+GENERATORS = {
+    'tv': generate_tv,
+    'multi_episode': generate_multi_episode,
+    'daily': generate_daily,
+    'sports': generate_sports,
+    'anime': generate_anime,
+}
+
+
+def generate_corpus(names_per_category=5000, seed=1):
+    """
+    Generates a list of (category, release name) tuples, the same seed always yields the same corpus
+    """
+    rng = random.Random(seed)
+
+    corpus = []
+    for category in CATEGORIES:
+        for __ in range(names_per_category):
+            corpus.append((category, GENERATORS[category](rng)))
+
+    return corpus
+
+
+def load_corpus(path=CORPUS_FILE, categories=None):
+    """
+    Loads the committed corpus as a list of (category, release name) tuples
+    """
+    corpus = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            category, __, name = line.rstrip('\n').partition('\t')
+            if categories and category not in categories:
+                continue
+            corpus.append((category, name))
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--names', type=int, default=5000, help='names per category')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    corpus = generate_corpus(args.names, args.seed)
+    with open(CORPUS_FILE, 'w', encoding='utf-8', newline='\n') as f:
+        for category, name in corpus:
+            f.write('{}\t{}\n'.format(category, name))
+
+    print('Wrote {} names to {}'.format(len(corpus), CORPUS_FILE))
+
+
+if __name__ == '__main__':
+    main()
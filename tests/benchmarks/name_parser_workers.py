@@ -0,0 +1,89 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+"""
+Measures how the regex stage of NameParser.parse_many scales with the number of worker processes.
+
+Usage: python -m tests.benchmarks.name_parser_workers [--names 20000] [--workers 1 2 4 8] [--rounds 3]
+"""
+
+import argparse
+import itertools
+import time
+
+from sickrage.core.nameparser import NameParser, name_parser_pool
+
+
+def generate_names(count):
+    shows = ['Show.Name', 'Another.Show.2010', 'The.Daily.Show', 'Anime.Show']
+    sources = ['720p.HDTV.x264', '1080p.WEB-DL.DD5.1.H.264', 'HDTV.XviD', '2160p.AMZN.WEB-DL.DDP5.1.HEVC']
+    groups = ['GRP', 'LOL', 'NTb', 'DIMENSION']
+
+    names = []
+    for i, (show, source, group) in enumerate(itertools.cycle(itertools.product(shows, sources, groups))):
+        if i >= count:
+            break
+
+        season, episode = i % 30 + 1, i % 99 + 1
+        if i % 4 == 0:
+            names.append('{}.S{:02d}E{:02d}.{}-{}'.format(show, season, episode, source, group))
+        elif i % 4 == 1:
+            names.append('{}.S{:02d}E{:02d}E{:02d}.{}-{}'.format(show, season, episode, episode + 1, source, group))
+        elif i % 4 == 2:
+            names.append('{}.{}.{:02d}.{:02d}.{}-{}'.format(show, 2000 + i % 20, i % 12 + 1, i % 28 + 1, source, group))
+        else:
+            names.append('[{}] {} - {:03d} [{}]'.format(group, show.replace('.', ' '), i % 999 + 1, source))
+
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--names', type=int, default=20000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    names = generate_names(args.names)
+
+    baseline = None
+    print('{:>8} {:>12} {:>10}'.format('workers', 'names/sec', 'speedup'))
+    for workers in args.workers:
+        # warm up the pool so process start up is not measured
+        name_parser_pool.map(names[:workers * name_parser_pool.min_chunk_size], False, NameParser.ALL_REGEX, workers)
+
+        best = None
+        for __ in range(args.rounds):
+            start = time.perf_counter()
+            name_parser_pool.map(names, False, NameParser.ALL_REGEX, workers)
+            elapsed = time.perf_counter() - start
+            best = min(best or elapsed, elapsed)
+
+        rate = len(names) / best
+        baseline = baseline or rate
+        print('{:>8} {:>12.0f} {:>9.2f}x'.format(workers, rate, rate / baseline))
+
+    name_parser_pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+"""
+Measures the throughput of the newznab/torznab response readers on the saved fixture pages
+(tests/benchmarks/data/newznab_search.xml and torznab_search.xml, 100 items each), the lxml iterparse reader against
+the BeautifulSoup reader, and NewznabProvider.parse end to end with either reader.
+
+Usage: python -m tests.benchmarks.newznab_parse [--rounds 20]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from unittest import mock
+
+from sickrage.search_providers import NewznabProvider, newznab_feed
+from sickrage.search_providers.newznab_feed import parse_newznab_feed_bs4, parse_newznab_feed_lxml
+from tests.benchmarks.corpus import DATA_DIR
+from tests.benchmarks.release_names import setup_app
+
+FIXTURES = ['newznab_search.xml', 'torznab_search.xml']
+
+
+def measure(func, data, rounds):
+    func(data)
+
+    best = None
+    for __ in range(rounds):
+        start = time.perf_counter()
+        func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+
+        provider = NewznabProvider('Benchmark', 'https://indexer.example.com')
+
+        def parse_bs4(data):
+            with mock.patch.object(newznab_feed, 'etree', None):
+                return provider.parse(data, 'RSS')
+
+        benchmarks = OrderedDict([
+            ('bs4 reader', parse_newznab_feed_bs4),
+            ('lxml reader', parse_newznab_feed_lxml),
+            ('parse with bs4', parse_bs4),
+            ('parse with lxml', lambda data: provider.parse(data, 'RSS')),
+        ])
+
+        print('{:>20} {:>20} {:>12} {:>10}'.format('fixture', 'benchmark', 'items/sec', 'ms/page'))
+        for fixture in FIXTURES:
+            with open(os.path.join(DATA_DIR, fixture), 'rb') as f:
+                data = f.read()
+
+            items = len(parse_newznab_feed_lxml(data).items)
+            for name, func in benchmarks.items():
+                elapsed = measure(func, data, args.rounds)
+                print('{:>20} {:>20} {:>12} {:>10.2f}'.format(fixture, name, round(items / elapsed), elapsed * 1000))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
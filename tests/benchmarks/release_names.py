@@ -0,0 +1,233 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+"""
+Release name parsing benchmark and regression harness.
+
+Runs the committed corpus (tests/benchmarks/data/release_names.txt) through the regex stage of the name parser,
+Quality.scene_quality and show_names.filter_bad_releases and reports names/sec, p50/p99 per name latency and the
+peak memory and retained allocations of each run.
+
+Results are compared against tests/benchmarks/data/release_names_baseline.json and the run exits with a non-zero
+status when any benchmark regresses beyond the threshold.  Timings are machine dependent, refresh the baseline with
+--update-baseline when running on a different machine or after an intended change.
+
+Usage: python -m tests.benchmarks.release_names [--rounds 3] [--threshold 0.25] [--categories tv anime ...]
+                                                [--benchmarks name_parser ...] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import sickrage
+from sickrage.core import Core, Logger
+from sickrage.core.common import Quality
+from sickrage.core.config import Config
+from sickrage.core.helpers.show_names import filter_bad_releases
+from sickrage.core.nameparser import NameParser, match_names, split_name
+from sickrage.search_providers import SearchProviders
+from tests.benchmarks.corpus import CATEGORIES, DATA_DIR, load_corpus
+
+BASELINE_FILE = os.path.join(DATA_DIR, 'release_names_baseline.json')
+
+
+def bench_name_parser(category, name):
+    match_names([split_name(name)], NameParser.ALL_REGEX)
+
+
+def bench_scene_quality(category, name):
+    Quality.scene_quality(name, category == 'anime')
+
+
+def bench_filter_bad_releases(category, name):
+    filter_bad_releases(name, parse=False)
+
+
+BENCHMARKS = OrderedDict([
+    ('name_parser', bench_name_parser),
+    ('scene_quality', bench_scene_quality),
+    ('filter_bad_releases', bench_filter_bad_releases),
+])
+
+
+def setup_app(data_dir):
+    """
+    Sets up the minimum of the application the benchmarked code depends on, a logger and a default config
+    """
+    sickrage.app = Core()
+    sickrage.app.data_dir = data_dir
+    sickrage.app.log = Logger(consoleLogging=False)
+    sickrage.app.search_providers = SearchProviders()
+    sickrage.app.config = Config(db_type='sqlite',
+                                 db_prefix='sickrage',
+                                 db_host='localhost',
+                                 db_port='3306',
+                                 db_username='sickrage',
+                                 db_password='sickrage')
+    sickrage.app.config.db.setup()
+    sickrage.app.config.load()
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def measure_time(func, corpus, rounds):
+    best = None
+    for __ in range(rounds):
+        latencies = []
+        for category, name in corpus:
+            start = time.perf_counter()
+            func(category, name)
+            latencies.append(time.perf_counter() - start)
+
+        if best is None or sum(latencies) < sum(best):
+            best = latencies
+
+    return {
+        'names_per_sec': round(len(best) / sum(best)),
+        'p50_us': round(percentile(best, 50) * 1e6, 2),
+        'p99_us': round(percentile(best, 99) * 1e6, 2),
+    }
+
+
+def measure_memory(func, corpus):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for category, name in corpus:
+            func(category, name)
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'peak_kib': round(peak / 1024, 1),
+        'retained_blocks': sum(stat.count_diff for stat in after.compare_to(before, 'filename')),
+    }
+
+
+def run(corpus, benchmarks, rounds):
+    results = OrderedDict()
+    for benchmark in benchmarks:
+        func = BENCHMARKS[benchmark]
+
+        # warm up regex and config caches so they are not measured
+        for category, name in corpus[:100]:
+            func(category, name)
+
+        results[benchmark] = measure_time(func, corpus, rounds)
+        results[benchmark].update(measure_memory(func, corpus))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns a list of regression messages, throughput may not drop and latency and peak memory may not grow by more
+    than the threshold, any growth in retained allocations counts as a regression
+    """
+    regressions = []
+    for benchmark, result in results.items():
+        if benchmark not in baseline:
+            continue
+
+        expected = baseline[benchmark]
+        if result['names_per_sec'] < expected['names_per_sec'] * (1 - threshold):
+            regressions.append('{}: {} names/sec is below the baseline of {}'.format(benchmark, result['names_per_sec'],
+                                                                                  expected['names_per_sec']))
+        for key in ['p50_us', 'p99_us', 'peak_kib']:
+            if result[key] > expected[key] * (1 + threshold):
+                regressions.append('{}: {} of {} is above the baseline of {}'.format(benchmark, key, result[key], expected[key]))
+        if result['retained_blocks'] > max(expected['retained_blocks'], 0) * (1 + threshold) + 100:
+            regressions.append('{}: {} retained blocks is above the baseline of {}'.format(benchmark, result['retained_blocks'],
+                                                                                       expected['retained_blocks']))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed regression as a fraction of the baseline')
+    parser.add_argument('--categories', nargs='+', choices=CATEGORIES, default=None)
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--update-baseline', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+
+        corpus = load_corpus(categories=args.categories)
+        results = run(corpus, args.benchmarks, args.rounds)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    print('{} names'.format(len(corpus)))
+    print('{:>20} {:>12} {:>10} {:>10} {:>10} {:>10}'.format('benchmark', 'names/sec', 'p50 us', 'p99 us', 'peak KiB', 'retained'))
+    for benchmark, result in results.items():
+        print('{:>20} {names_per_sec:>12} {p50_us:>10.2f} {p99_us:>10.2f} {peak_kib:>10.1f} {retained_blocks:>10}'.format(benchmark, **result))
+
+    if args.categories:
+        print('Baseline comparison only applies to the full corpus')
+        return
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE_FILE):
+            with open(BASELINE_FILE) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+            f.write('\n')
+
+        print('Baseline updated')
+        return
+
+    if not os.path.exists(BASELINE_FILE):
+        print('No baseline found, run with --update-baseline to create one')
+        return
+
+    with open(BASELINE_FILE) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+
+    for regression in regressions:
+        print('REGRESSION ' + regression)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+"""
+Compares Quality.scene_quality against the regex chain it replaced.
+
+Usage: python -m tests.benchmarks.scene_quality [--names 20000] [--rounds 5]
+"""
+
+import argparse
+import itertools
+import pathlib
+import re
+import time
+
+from sickrage.core.common import Quality, Qualities
+
+
+def legacy_scene_quality(name, anime=False):
+    """
+    The original elif chain of Quality.scene_quality, kept as the reference implementation
+    for the regression tests and as the baseline for this benchmark.
+    """
+
+    ret = Qualities.UNKNOWN
+    if not name:
+        return ret
+
+    name = pathlib.Path(name).name
+
+    check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+
+    if anime:
+        dvd_options = check_name([r"dvd", r"dvdrip"], any)
+        blue_ray_options = check_name([r"BD", r"blue?-?ray"], any)
+        sd_options = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
+        hd_options = check_name([r"720p", r"1280x720", r"960x720"], any)
+        full_hd = check_name([r"1080p", r"1920x1080"], any)
+
+        if sd_options and not blue_ray_options and not dvd_options:
+            ret = Qualities.SDTV
+        elif dvd_options:
+            ret = Qualities.SDDVD
+        elif hd_options and not blue_ray_options and not full_hd:
+            ret = Qualities.HDTV
+        elif full_hd and not blue_ray_options and not hd_options:
+            ret = Qualities.FULLHDTV
+        elif hd_options and not blue_ray_options and not full_hd:
+            ret = Qualities.HDWEBDL
+        elif blue_ray_options and hd_options and not full_hd:
+            ret = Qualities.HDBLURAY
+        elif blue_ray_options and full_hd and not hd_options:
+            ret = Qualities.FULLHDBLURAY
+
+        return ret
+
+    if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"], all)
+            and not check_name([r"(720|1080|2160|4320)[pi]"], all)
+            and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Qualities.SDTV
+    elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
+          and not check_name([r"(720|1080|2160|4320)[pi]"], all)
+          and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Qualities.SDDVD
+    elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
+          or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
+        ret = Qualities.HDTV
+    elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
+          or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
+        ret = Qualities.RAWHDTV
+    elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
+        ret = Qualities.FULLHDTV
+    elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Qualities.HDWEBDL
+    elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Qualities.FULLHDWEBDL
+    elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Qualities.HDBLURAY
+    elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Qualities.FULLHDBLURAY
+    elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Qualities.UHD_4K_TV
+    elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Qualities.UHD_8K_TV
+    elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Qualities.UHD_4K_WEBDL
+    elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Qualities.UHD_8K_WEBDL
+    elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Qualities.UHD_4K_BLURAY
+    elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Qualities.UHD_8K_BLURAY
+
+    return ret
+
+
+RESOLUTIONS = ['', '360p', '480p', '480i', '576p', '720p', '720i', '1080p', '1080i', '2160p', '4320p', '848x480', '1280x720', '960x720', '1920x1080']
+SOURCES = ['', 'HDTV', 'HD.TV', 'PDTV', 'SDTV', 'DSR', 'TVRip', 'SATRip', 'WEB', 'WEB-DL', 'WEBRip', 'WEBHD', 'iTunes', 'DVDRip', 'DVDMux', 'BDRip',
+           'BRRip', 'BluRay', 'Blu-Ray', 'BD', 'HDDVD', 'DVD', 'HR.WS.PDTV']
+CODECS = ['', 'x264', 'h264', 'H.264', 'x265', 'HEVC', 'XviD', 'DivX', 'MPEG2', 'MPEG-2', 'AVC']
+EXTRAS = ['', 'PROPER', 'REPACK', 'DD5.1', 'AAC2.0', 'Web', 'hdtv.1080p', 'INTERNAL']
+SEPARATORS = ['.', ' ', '_', '-']
+
+
+def generate_names(count=None):
+    """
+    Yields synthetic release names covering every combination of resolution, source and codec
+    """
+
+    combinations = itertools.product(RESOLUTIONS, SOURCES, CODECS, EXTRAS, SEPARATORS)
+    for i, (resolution, source, codec, extra, separator) in enumerate(combinations):
+        if count is not None and i >= count:
+            break
+
+        parts = ['Show', 'Name', 'S01E{:02d}'.format(i % 99 + 1)] + [x for x in (resolution, source, codec, extra) if x]
+        if i % 3 == 0:
+            parts = [x for x in (source, resolution, codec) if x] + parts[:3]
+
+        name = separator.join(parts) + '-GRP'
+        yield name + '.mkv' if i % 2 else name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--names', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    names = list(generate_names(args.names))
+
+    print('{:>24} {:>12} {:>10}'.format('implementation', 'names/sec', 'speedup'))
+
+    baseline = None
+    for label, func in [('legacy', legacy_scene_quality), ('scene_quality', Quality.scene_quality)]:
+        for anime in (False, True):
+            best = None
+            for __ in range(args.rounds):
+                start = time.perf_counter()
+                for name in names:
+                    func(name, anime)
+                elapsed = time.perf_counter() - start
+                best = min(best or elapsed, elapsed)
+
+            rate = len(names) / best
+            if not anime:
+                baseline = baseline or rate
+            print('{:>24} {:>12.0f} {:>9.2f}x'.format(label + (' (anime)' if anime else ''), rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    main()
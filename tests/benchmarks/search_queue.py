@@ -0,0 +1,121 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+"""
+Measures the membership checks of the search queue with 10000 queued tasks, the secondary indexes of SearchQueue
+against scanning every queued task, as the checks did before the indexes.
+
+Usage: python -m tests.benchmarks.search_queue [--tasks 10000] [--checks 10000]
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+import sickrage
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.queues.search import BacklogSearchTask, FailedSearchTask, ManualSearchTask, SearchQueue
+from sickrage.search_providers import TorrentRssProvider
+from tests.benchmarks.release_names import setup_app
+
+
+def setup_queue(tasks):
+    random.seed(1)
+
+    sickrage.app.config.general.use_torrents = True
+
+    provider = TorrentRssProvider('provider1', 'http://localhost/provider1')
+    provider.enabled = True
+    sickrage.app.search_providers[TorrentRssProvider.provider_type.name][provider.id] = provider
+
+    search_queue = SearchQueue()
+    for i in range(tasks):
+        task_type = random.choice([BacklogSearchTask, BacklogSearchTask, BacklogSearchTask, ManualSearchTask, FailedSearchTask])
+        search_queue.put(task_type(i // 100 + 1, SeriesProviderID.THETVDB, i % 100 // 20 + 1, i % 20 + 1))
+
+    return search_queue
+
+
+def legacy_checks(search_queue, series_id, season, episode):
+    """
+    Scans every queued task, as the membership checks did before the indexes
+    """
+    tasks = search_queue.tasks.copy().values()
+    return (any(isinstance(x, BacklogSearchTask) and x.series_id == series_id and x.season == season and x.episode == episode for x in tasks),
+            any(isinstance(x, (ManualSearchTask, FailedSearchTask)) and x.series_id == series_id and x.season == season and x.episode == episode for x in tasks),
+            any(x.series_id == series_id for x in search_queue.tasks.copy().values()))
+
+
+def indexed_checks(search_queue, series_id, season, episode):
+    return (search_queue.is_in_queue(series_id, season, episode),
+            search_queue.is_ep_in_queue(series_id, season, episode),
+            search_queue.is_show_in_queue(series_id))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=10000)
+    parser.add_argument('--checks', type=int, default=10000)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+
+        start = time.perf_counter()
+        search_queue = setup_queue(args.tasks)
+        put_time = time.perf_counter() - start
+
+        checks = [(random.randint(1, args.tasks // 100 + 2), random.randint(1, 6), random.randint(1, 21)) for __ in range(args.checks)]
+
+        start = time.perf_counter()
+        legacy = [legacy_checks(search_queue, *x) for x in checks]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [indexed_checks(search_queue, *x) for x in checks]
+        indexed_time = time.perf_counter() - start
+
+        assert indexed == legacy, 'indexed checks differ from the task scan'
+
+        start = time.perf_counter()
+        for __ in range(args.checks):
+            search_queue.queue_length()
+            search_queue.is_manual_search_in_progress()
+            search_queue.is_backlog_in_progress()
+        status_time = time.perf_counter() - start
+
+        print('{} queued tasks, {} checks'.format(len(search_queue.tasks), args.checks))
+        print('{:>30} {:>10.3f}s'.format('put', put_time))
+        print('{:>30} {:>10.3f}s'.format('task scan', legacy_time))
+        print('{:>30} {:>10.3f}s'.format('indexed', indexed_time))
+        print('{:>30} {:>10.3f}s'.format('queue status', status_time))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
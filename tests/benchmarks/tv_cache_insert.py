@@ -0,0 +1,108 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+"""
+Measures TVCache insertion of a synthetic RSS feed, adding every item on its own versus adding the whole feed batch
+with TVCache.add_cache_entries.
+
+Release names come from the benchmark corpus and are given pre-built parse results, so no show lookups are made.
+
+Usage: python -m tests.benchmarks.tv_cache_insert [--items 10000]
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import sickrage
+from sickrage.core.caches.tv_cache import TVCache
+from sickrage.core.common import Qualities
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.nameparser import ParseResult
+from sickrage.search_providers import TorrentRssProvider
+from tests.benchmarks.corpus import load_corpus
+from tests.benchmarks.release_names import setup_app
+
+
+def generate_entries(count):
+    entries, parse_results = [], {}
+    for i, (category, name) in enumerate(load_corpus()[:count]):
+        name = '{}.{}'.format(name, i)
+        entries.append((name, 'https://tracker.example.com/download/{}.torrent'.format(i), i % 100, i % 10, 1024 * 1024 * (i % 2000)))
+        parse_results[name] = ParseResult(name,
+                                          series_name='Show Name',
+                                          season_number=i % 30 + 1,
+                                          episode_numbers=[i % 99 + 1],
+                                          release_group='GRP',
+                                          series_id=1,
+                                          series_provider_id=SeriesProviderID.THETVDB,
+                                          quality=Qualities.HDTV)
+
+    return entries, parse_results
+
+
+def bench_single(cache, entries, parse_results):
+    for name, url, seeders, leechers, size in entries:
+        cache.add_cache_entry(name, url, seeders, leechers, size, parse_result=parse_results[name])
+
+
+def bench_batch(cache, entries, parse_results):
+    cache.add_cache_entries(entries, parse_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=10000)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+        sickrage.app.config.general.enable_sickrage_api = False
+        sickrage.app.cache_db = CacheDB('sqlite', 'sickrage', 'localhost', '3306', 'sickrage', 'sickrage')
+        sickrage.app.cache_db.initialize()
+
+        entries, parse_results = generate_entries(args.items)
+        cache = TVCache(TorrentRssProvider('Benchmark', 'https://tracker.example.com/rss'))
+
+        print('{:>8} {:>12} {:>12}'.format('mode', 'items/sec', 'seconds'))
+        for mode, func in [('single', bench_single), ('batch', bench_batch)]:
+            session = sickrage.app.cache_db.session()
+            session.query(CacheDB.Provider).delete()
+            session.commit()
+
+            start = time.perf_counter()
+            func(cache, entries, parse_results)
+            elapsed = time.perf_counter() - start
+
+            # every item of the feed must have been cached
+            assert session.query(CacheDB.Provider).count() == len(entries)
+
+            print('{:>8} {:>12.0f} {:>12.2f}'.format(mode, len(entries) / elapsed, elapsed))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+"""
+Measures TVCache.search_cache on a provider cache holding 200k rows spread over 100 shows, for every episode of a
+show with a mix of wanted, skipped and downloaded episodes.
+
+Usage: python -m tests.benchmarks.tv_cache_search [--rows 200000] [--shows 100]
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+import sickrage
+from sickrage.core.caches.tv_cache import TVCache
+from sickrage.core.common import EpisodeStatus, Qualities, Quality
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.tv.show import TVShow
+from sickrage.search_providers import TorrentRssProvider
+from tests.benchmarks.release_names import setup_app
+
+SEASONS = 5
+EPISODES = 20
+QUALITIES = [Qualities.SDTV, Qualities.HDTV, Qualities.FULLHDTV, Qualities.HDWEBDL, Qualities.FULLHDWEBDL, Qualities.HDBLURAY,
+             Qualities.FULLHDBLURAY, Qualities.UHD_4K_TV]
+
+
+def setup_show():
+    with sickrage.app.main_db.session() as session:
+        session.add(MainDB.TVShow(**{
+            'series_id': 1,
+            'series_provider_id': SeriesProviderID.THETVDB,
+            'name': 'Show Name',
+            'lang': 'en',
+            'location': '',
+            'quality': Quality.combine_qualities([Qualities.HDTV, Qualities.HDWEBDL], [Qualities.FULLHDBLURAY])
+        }))
+
+        for season in range(1, SEASONS + 1):
+            for episode in range(1, EPISODES + 1):
+                status = [EpisodeStatus.WANTED, EpisodeStatus.SKIPPED, Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV)][episode % 3]
+                session.add(MainDB.TVEpisode(**{
+                    'series_id': 1,
+                    'series_provider_id': SeriesProviderID.THETVDB,
+                    'episode_id': season * 100 + episode,
+                    'season': season,
+                    'episode': episode,
+                    'location': '',
+                    'status': status
+                }))
+
+        session.commit()
+
+    return TVShow(1, SeriesProviderID.THETVDB)
+
+
+def setup_cache(provider_id, rows, shows):
+    rng = random.Random(1)
+
+    data = []
+    for i in range(rows):
+        season, episode = rng.randint(1, SEASONS), rng.randint(1, EPISODES)
+        episodes = [episode, episode + 1] if i % 10 == 0 and episode < EPISODES else [episode]
+        data.append({
+            'provider': provider_id,
+            'name': 'Show.{}.S{:02d}E{:02d}.720p.HDTV.x264-GRP{}'.format(i % shows, season, episode, i),
+            'season': season,
+            'episodes': "|" + "|".join(map(str, episodes)) + "|",
+            'series_id': i % shows + 1,
+            'series_provider_id': SeriesProviderID.THETVDB,
+            'url': 'https://tracker.example.com/download/{}.torrent'.format(i),
+            'time': int(time.time()),
+            'quality': int(rng.choice(QUALITIES)),
+            'release_group': 'GRP',
+            'version': -1,
+            'seeders': 1,
+            'leechers': 1,
+            'size': 1
+        })
+
+    session = sickrage.app.cache_db.session()
+    session.bulk_insert_mappings(CacheDB.Provider, data)
+    session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--shows', type=int, default=100)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+        sickrage.app.config.general.enable_sickrage_api = False
+        sickrage.app.shows = {}
+        sickrage.app.main_db = MainDB('sqlite', 'sickrage', 'localhost', '3306', 'sickrage', 'sickrage')
+        sickrage.app.main_db.initialize()
+        sickrage.app.cache_db = CacheDB('sqlite', 'sickrage', 'localhost', '3306', 'sickrage', 'sickrage')
+        sickrage.app.cache_db.initialize()
+
+        show = setup_show()
+        cache = TVCache(TorrentRssProvider('Benchmark', 'https://tracker.example.com/rss'))
+        setup_cache(cache.providerID, args.rows, args.shows)
+
+        found = 0
+        start = time.perf_counter()
+        for season in range(1, SEASONS + 1):
+            for episode in range(1, EPISODES + 1):
+                found += sum(len(x) for x in cache.search_cache(show.series_id, show.series_provider_id, season, episode).values())
+        elapsed = time.perf_counter() - start
+
+        searches = SEASONS * EPISODES
+        print('{:>10} {:>10} {:>14} {:>10}'.format('rows', 'searches', 'ms/search', 'results'))
+        print('{:>10} {:>10} {:>14.2f} {:>10}'.format(args.rows, searches, elapsed / searches * 1000, found))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+
+"""
+Measures the wanted episode selection of the daily and backlog searchers on a synthetic library of 1000 shows with
+100 episodes each, the single query of get_wanted_episodes against walking the episode objects of every show, and
+the bulk status update of newly aired episodes.
+
+Usage: python -m tests.benchmarks.wanted_episodes [--shows 1000] [--episodes 100]
+"""
+
+import argparse
+import datetime
+import random
+import shutil
+import tempfile
+import time
+
+import sickrage
+from sickrage.core.common import EpisodeStatus, Qualities, Quality
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.searchers import get_wanted_episodes, set_new_episode_statuses
+from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.helpers import get_show_list
+from tests.benchmarks.release_names import setup_app
+
+SHOW_QUALITIES = [Qualities.SD, Qualities.HD720P, Qualities.HD1080P, Quality.combine_qualities([Qualities.HDTV], [Qualities.FULLHDBLURAY])]
+EPISODE_STATUSES = [EpisodeStatus.WANTED, EpisodeStatus.SKIPPED, EpisodeStatus.IGNORED, EpisodeStatus.UNAIRED,
+                    Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.SDTV),
+                    Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV),
+                    Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.FULLHDBLURAY),
+                    Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.HDTV)]
+
+
+def setup_library(shows, episodes):
+    random.seed(1)
+    today = datetime.date.today()
+
+    with sickrage.app.main_db.session() as session:
+        for series_id in range(1, shows + 1):
+            session.add(MainDB.TVShow(**{
+                'series_id': series_id,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'name': 'Show {}'.format(series_id),
+                'lang': 'en',
+                'location': '',
+                'paused': series_id % 10 == 0,
+                'skip_downloaded': series_id % 7 == 0,
+                'quality': SHOW_QUALITIES[series_id % len(SHOW_QUALITIES)],
+                'default_ep_status': EpisodeStatus.WANTED
+            }))
+
+        session.commit()
+
+        session.bulk_insert_mappings(MainDB.TVEpisode, [{
+            'series_id': series_id,
+            'series_provider_id': SeriesProviderID.THETVDB,
+            'episode_id': series_id * 1000 + episode,
+            'season': episode // 20,
+            'episode': episode % 20 + 1,
+            'location': '',
+            'status': random.choice(EPISODE_STATUSES),
+            'airdate': today - datetime.timedelta(days=episodes - episode * 1.1)
+        } for series_id in range(1, shows + 1) for episode in range(episodes)])
+        session.commit()
+
+    for series_id in range(1, shows + 1):
+        TVShow(series_id, SeriesProviderID.THETVDB)
+
+
+def legacy_get_wanted(from_date, to_date):
+    """
+    Walks the episode objects of every show and checks their status and quality, as the searchers did before
+    get_wanted_episodes
+    """
+    wanted = {}
+    for show in get_show_list():
+        if show.paused:
+            continue
+
+        any_qualities, best_qualities = Quality.split_quality(show.quality)
+
+        for episode_object in show.episodes:
+            if not episode_object.season > 0 or not to_date > episode_object.airdate > from_date:
+                continue
+
+            cur_status, cur_quality = Quality.split_composite_status(episode_object.status)
+            if cur_status not in (EpisodeStatus.WANTED, EpisodeStatus.DOWNLOADED, EpisodeStatus.SNATCHED, EpisodeStatus.SNATCHED_PROPER):
+                continue
+
+            if cur_status != EpisodeStatus.WANTED:
+                qualities = best_qualities or any_qualities
+                if cur_quality in qualities or (cur_quality != Qualities.UNKNOWN and cur_quality > max(qualities)):
+                    continue
+
+            if cur_status == EpisodeStatus.DOWNLOADED and show.skip_downloaded:
+                continue
+
+            wanted.setdefault((show.series_id, show.series_provider_id), []).append((episode_object.season, episode_object.episode))
+
+    return dict((key, sorted(value)) for key, value in wanted.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shows', type=int, default=1000)
+    parser.add_argument('--episodes', type=int, default=100)
+    parser.add_argument('--no-walk', action='store_true', help='skip the episode walk, it takes minutes on the full library')
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        setup_app(data_dir)
+
+        sickrage.app.shows = {}
+        sickrage.app.main_db = MainDB(db_type='sqlite',
+                                      db_prefix='sickrage',
+                                      db_host='localhost',
+                                      db_port='3306',
+                                      db_username='sickrage',
+                                      db_password='sickrage')
+        sickrage.app.main_db.initialize()
+
+        setup_library(args.shows, args.episodes)
+
+        today = datetime.date.today()
+
+        start = time.perf_counter()
+        wanted = get_wanted_episodes(MainDB.TVEpisode.airdate > datetime.date.min, MainDB.TVEpisode.airdate < today)
+        query_time = time.perf_counter() - start
+
+        if not args.no_walk:
+            start = time.perf_counter()
+            legacy_wanted = legacy_get_wanted(datetime.date.min, today)
+            legacy_time = time.perf_counter() - start
+
+            assert wanted == legacy_wanted, 'wanted episodes differ from the episode walk'
+
+        start = time.perf_counter()
+        updated = set_new_episode_statuses()
+        update_time = time.perf_counter() - start
+
+        print('{} shows, {} episodes, {} wanted episodes'.format(args.shows, args.shows * args.episodes, sum(len(x) for x in wanted.values())))
+        if not args.no_walk:
+            print('{:>30} {:>10.3f}s'.format('episode walk', legacy_time))
+        print('{:>30} {:>10.3f}s'.format('get_wanted_episodes', query_time))
+        print('{:>30} {:>10.3f}s ({} episodes)'.format('set_new_episode_statuses', update_time, len(updated)))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,7 +22,9 @@
 
 
 
+import os
 import unittest
+from unittest import mock
 
 import tests
 
@@ -126,6 +128,14 @@ class QualityTests(tests.SiCKRAGETestCase):
         from sickrage.core.common import Quality
         self.assertEqual(Qualities.UNKNOWN, Quality.name_quality("Test.Show.S01E02-SICKRAGE"))
 
+    def test_scene_quality_regression(self):
+        from sickrage.core.common import Quality
+        from tests.benchmarks.scene_quality import generate_names, legacy_scene_quality
+
+        for name in generate_names():
+            for anime in (False, True):
+                self.assertEqual(legacy_scene_quality(name, anime), Quality.scene_quality(name, anime), '{} (anime: {})'.format(name, anime))
+
 
 # def test_reverse_parsing(self):
 #        self.assertEqual(Qualities.SDTV, Quality.nameQuality("Test Show - S01E02 - SDTV - GROUP"))
@@ -139,6 +149,58 @@ class QualityTests(tests.SiCKRAGETestCase):
 #        self.assertEqual(Quality.FULLHDBLURAY, Quality.nameQuality("Test Show - S01E02 - 1080p BluRay - GROUP"))
 #        self.assertEqual(Quality.UNKNOWN, Quality.nameQuality("Test Show - S01E02 - Unknown - SiCKRAGE"))
 
+
+class FileMetaQualityCacheTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(FileMetaQualityCacheTests, self).setUp()
+
+        from sickrage.core.caches.file_meta_cache import file_meta_quality_cache
+        file_meta_quality_cache.clear()
+
+        self.library = []
+        for episode in range(1, 4):
+            filename = os.path.join(self.SHOWDIR, 'show name - s01e0{}.mkv'.format(episode))
+            with open(filename, 'wb') as f:
+                f.write(b'foo bar')
+            self.library.append(filename)
+
+    def _refresh(self):
+        from sickrage.core.common import Quality
+        return [Quality.name_quality(filename) for filename in self.library]
+
+    def test_unchanged_library_is_not_reopened(self):
+        from sickrage.core.caches.file_meta_cache import file_meta_quality_cache
+
+        with mock.patch('sickrage.core.common.get_file_metadata', return_value={}) as get_file_metadata:
+            first = self._refresh()
+            self.assertEqual(get_file_metadata.call_count, len(self.library))
+
+            second = self._refresh()
+            self.assertEqual(get_file_metadata.call_count, len(self.library))
+            self.assertEqual(first, second)
+            self.assertEqual(file_meta_quality_cache.stats()['hits'], len(self.library))
+
+            # a changed file has its metadata read again
+            with open(self.library[0], 'ab') as f:
+                f.write(b'more foo bar')
+            self._refresh()
+            self.assertEqual(get_file_metadata.call_count, len(self.library) + 1)
+            self.assertEqual(file_meta_quality_cache.stats()['stale'], 1)
+
+    def test_failed_read_is_not_cached(self):
+        from sickrage.core.caches.file_meta_cache import file_meta_quality_cache
+
+        with mock.patch('sickrage.core.common.get_file_metadata', side_effect=OSError):
+            self._refresh()
+            self.assertEqual(file_meta_quality_cache.stats()['hits'], 0)
+
+        # the files are read again once the metadata can be read
+        with mock.patch('sickrage.core.common.get_file_metadata', return_value={}) as get_file_metadata:
+            self._refresh()
+            self.assertEqual(get_file_metadata.call_count, len(self.library))
+            self.assertEqual(file_meta_quality_cache.stats()['hits'], 0)
+
+
 if __name__ == "__main__":
     print("==================")
     print("STARTING - COMMON TESTS")
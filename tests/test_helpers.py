@@ -25,6 +25,7 @@
 import unittest
 
 import tests
+from sickrage.core.helpers import show_names
 
 test_result = 'Show.Name.S01E01.HDTV.x264-RLSGROUP'
 test_cases = {
@@ -70,7 +71,30 @@ test_cases = {
 
 
 class HelpersTests(tests.SiCKRAGETestCase):
-    pass
+    def test_containsAtLeastOneWord(self):
+        self.assertEqual(show_names.contains_at_least_one_word('Show.S02.German.Stuff-Grp', 'french, german'), 'german')
+        self.assertEqual(show_names.contains_at_least_one_word('Show.S02.German.French-Grp', ['french', 'german']), 'french')
+        self.assertFalse(show_names.contains_at_least_one_word('Show.S02.Germany-Grp', 'german'))
+        self.assertFalse(show_names.contains_at_least_one_word('Show.S02.German-Grp', []))
+
+        # changing the words compiles a new matcher, reusing them hits the cache
+        show_names.compile_words.cache_clear()
+        show_names.contains_at_least_one_word('Show.S02.German-Grp', 'german')
+        show_names.contains_at_least_one_word('Show.S02.German-Grp', 'german')
+        self.assertEqual(show_names.compile_words.cache_info().misses, 1)
+        self.assertEqual(show_names.contains_at_least_one_word('Show.S02.German-Grp', 'grp'), 'grp')
+        self.assertEqual(show_names.compile_words.cache_info().misses, 2)
+
+    def test_isProper(self):
+        self.assertTrue(show_names.is_proper('Show.Name.S01E02.PROPER.720p.HDTV.x264-GRP'))
+        self.assertTrue(show_names.is_proper('Show.Name.1x02.REPACK.HDTV.x264-GRP'))
+        self.assertTrue(show_names.is_proper('Real.Time.with.Bill.Maher.2021.10.15.REAL.720p.WEB.h264-GRP'))
+        self.assertTrue(show_names.is_proper('[Grp] Show Name - 05 REPACK [720p]'))
+
+        # proper tokens in the show name are not
+        self.assertFalse(show_names.is_proper('The.Real.Housewives.of.Atlanta.S13E10.720p.HDTV.x264-GRP'))
+        self.assertFalse(show_names.is_proper('Real.Time.with.Bill.Maher.2021.10.15.720p.WEB.h264-GRP'))
+        self.assertFalse(show_names.is_proper('Proper.Show.Name'))
 
 
 def test_generator(test_strings):
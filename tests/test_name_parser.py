@@ -27,7 +27,7 @@ import unittest
 from datetime import date
 
 import tests
-from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException, name_parser_pool
 from sickrage.core.tv.show import TVShow
 
 DEBUG = VERBOSE = False
@@ -277,6 +277,37 @@ class ComboTests(tests.SiCKRAGETestDBCase):
             self._test_combo(os.path.normpath(name), result, which_regexes)
 
 
+class BatchTests(tests.SiCKRAGETestDBCase):
+    def _test_batch(self, workers):
+        names = [os.path.normpath(name) for (name, result, which_regexes) in combination_test_cases]
+        names += [name for (name, result) in unicode_test_cases] + failure_cases
+
+        parse_results = NameParser(True, validate_show=False).parse_many(names, cache_result=False, workers=workers)
+        self.assertEqual(list(parse_results.keys()), names)
+
+        for name in names:
+            try:
+                expected = NameParser(True, validate_show=False).parse(name, cache_result=False)
+            except (InvalidNameException, InvalidShowException) as e:
+                self.assertIsInstance(parse_results[name], e.__class__)
+            else:
+                self.assertEqual(parse_results[name], expected)
+                self.assertEqual(parse_results[name].which_regex, expected.which_regex)
+
+    def test_parse_many(self):
+        self._test_batch(workers=1)
+
+    def test_parse_many_process_pool(self):
+        # force the small test batch through the process pool
+        min_chunk_size, name_parser_pool.min_chunk_size = name_parser_pool.min_chunk_size, 1
+
+        try:
+            self._test_batch(workers=2)
+        finally:
+            name_parser_pool.min_chunk_size = min_chunk_size
+            name_parser_pool.shutdown()
+
+
 class AnimeTests(tests.SiCKRAGETestDBCase):
     def setUp(self):
         super(AnimeTests, self).setUp()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import os
+import unittest
+from unittest import mock
+
+import tests
+from sickrage.search_providers import NewznabProvider, newznab_feed
+from sickrage.search_providers.newznab_feed import parse_newznab_feed, parse_newznab_feed_bs4, parse_newznab_feed_lxml
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'benchmarks', 'data')
+
+ERROR_RESPONSE = b'<?xml version="1.0" encoding="UTF-8"?>\n<error code="100" description="Incorrect user credentials"/>'
+
+
+class NewznabFeedTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(NewznabFeedTests, self).setUp()
+        self.provider = NewznabProvider('Test', 'https://indexer.example.com')
+
+    def _read(self, filename):
+        with open(os.path.join(DATA_DIR, filename), 'rb') as f:
+            return f.read()
+
+    def _fields(self, feed):
+        return [(x['title'], next(filter(None, x['links'])), x['size'], x['pubdate'], x['attrs']) for x in feed.items]
+
+    def test_backends_are_equivalent(self):
+        for filename, torznab in [('newznab_search.xml', False), ('torznab_search.xml', True)]:
+            data = self._read(filename)
+
+            lxml_feed = parse_newznab_feed_lxml(data)
+            bs4_feed = parse_newznab_feed_bs4(data)
+
+            self.assertEqual(len(lxml_feed.items), 100)
+            self.assertEqual(self._fields(lxml_feed), self._fields(bs4_feed))
+            self.assertEqual((lxml_feed.torznab, bs4_feed.torznab), (torznab, torznab))
+
+            # decoded text is parsed the same as the raw response
+            self.assertEqual(self._fields(parse_newznab_feed_lxml(data.decode('utf-8'))), self._fields(lxml_feed))
+
+    def test_parse_results(self):
+        for filename in ['newznab_search.xml', 'torznab_search.xml']:
+            data = self._read(filename)
+
+            results = self.provider.parse(data, 'RSS')
+            with mock.patch.object(newznab_feed, 'etree', None):
+                self.assertEqual(self.provider.parse(data, 'RSS'), results)
+
+            self.assertEqual(len(results), 100)
+            self.assertTrue(all(x['size'] > 0 for x in results))
+
+        # torznab results carry the seeders and leechers of their attributes
+        self.assertTrue(self.provider.torznab)
+        self.assertTrue(all(x['seeders'] >= 0 and x['leechers'] >= 0 for x in results))
+
+    def test_error_response(self):
+        feed = parse_newznab_feed(ERROR_RESPONSE)
+        self.assertEqual(feed.error, 'Incorrect user credentials')
+        self.assertEqual(parse_newznab_feed_bs4(ERROR_RESPONSE).error, feed.error)
+        self.assertEqual(self.provider.parse(ERROR_RESPONSE, 'RSS'), [])
+
+    def test_malformed_response(self):
+        # the unescaped ampersand is not well formed xml, the html parser still reads the item
+        data = self._read('newznab_search.xml').replace(b'&amp;i=1', b'&i=1')
+
+        feed = parse_newznab_feed(data)
+        self.assertEqual(len(feed.items), 100)
+        self.assertEqual(self.provider.parse(data, 'RSS'), self.provider.parse(self._read('newznab_search.xml'), 'RSS'))
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - NEWZNAB FEED TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,109 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+import sickrage
+import tests
+from sickrage.core.updaters.rsscache_updater import RSSCacheUpdater
+from sickrage.search_providers import SearchProviders, TorrentRssProvider
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+<title>{name}</title>
+<item>
+<title>Show.Name.S01E01.720p.HDTV.x264-{name}</title>
+<link>magnet:?xt=urn:btih:{name}0000000000000000000000000000000000001</link>
+</item>
+<item>
+<title>Show.Name.S01E02.720p.HDTV.x264-{name}</title>
+<link>magnet:?xt=urn:btih:{name}0000000000000000000000000000000000002</link>
+</item>
+</channel>
+</rss>"""
+
+
+class FakeFeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        name = self.path.strip('/')
+        time.sleep(self.server.delays.get(name, 0))
+
+        data = RSS_FEED.format(name=name).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class RSSCacheUpdaterTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(RSSCacheUpdaterTests, self).setUp()
+
+        self.server = self.start_http_server(FakeFeedHandler, delays={'slow': 5})
+
+        self.providers = []
+        for name in ['slow', 'fast1', 'fast2', 'fast3']:
+            provider = TorrentRssProvider(name, 'http://127.0.0.1:{}/{}'.format(self.server.server_port, name))
+            provider.enabled = True
+            self.providers.append(provider)
+
+        sickrage.app.search_providers = SearchProviders()
+        for provider_type in sickrage.app.search_providers:
+            sickrage.app.search_providers[provider_type] = {}
+        sickrage.app.search_providers[TorrentRssProvider.provider_type.name] = dict((p.id, p) for p in self.providers)
+
+        sickrage.app.config.general.rss_cache_workers = 2
+        sickrage.app.config.general.rss_cache_timeout = 1
+
+    def test_slow_feed_does_not_block_others(self):
+        updater = RSSCacheUpdater()
+
+        start = time.monotonic()
+        updater.task(force=True)
+
+        self.assertLess(time.monotonic() - start, 4)
+        self.assertEqual(updater.metrics['slow']['status'], 'timeout')
+        for name in ['fast1', 'fast2', 'fast3']:
+            self.assertEqual(updater.metrics[name]['status'], 'updated')
+            self.assertEqual(updater.metrics[name]['items'], 2)
+            self.assertLess(updater.metrics[name]['duration'], 1)
+
+        # the hung update is not started a second time while it is still running
+        self.assertIn('slow', updater.in_flight)
+        updater.task(force=True)
+        self.assertEqual(updater.metrics['slow']['status'], 'timeout')
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - RSS CACHE UPDATER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
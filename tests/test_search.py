@@ -0,0 +1,738 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import datetime
+import hashlib
+import time
+import unittest
+from base64 import b16decode, b32encode
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urljoin, urlparse
+
+import sickrage
+import tests
+from bencode3 import bencode
+from requests.utils import dict_from_cookiejar
+
+from sickrage.clients import TorrentClient
+from sickrage.core.common import EpisodeStatus, Qualities
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.search import ResultDeduplicator, SearchPlan, SearchProviderFanOut
+from sickrage.core.tv.show import TVShow
+from sickrage.search_providers import NewznabProvider, TorrentProvider, TorrentRssProvider
+from sickrage.search_providers.content_cache import ContentCache, content_cache
+from sickrage.search_providers.health import ProviderHealth, ProviderHealthTracker, provider_health
+
+NEWZNAB_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:newznab="http://www.newznab.com/DTD/2010/feeds/attributes/">
+<channel>
+<item>
+<title>{name}.Show.Name.S01E01.720p.HDTV.x264-GRP</title>
+<link>https://{name}.example.com/getnzb/1.nzb</link>
+<newznab:attr name="size" value="1073741824"/>
+</item>
+</channel>
+</rss>"""
+
+TORZNAB_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:torznab="http://torznab.com/schemas/2015/feed">
+<channel>
+<item>
+<title>{name}.Show.Name.S01E01.1080p.WEB-DL.x264-GRP</title>
+<link>https://{name}.example.com/download/1.torrent</link>
+<torznab:attr name="size" value="2147483648"/>
+<torznab:attr name="seeders" value="10"/>
+<torznab:attr name="peers" value="15"/>
+</item>
+</channel>
+</rss>"""
+
+
+class FakeIndexerHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        name = self.path.strip('/').split('/')[0]
+        delay, feed = self.server.indexers[name]
+
+        self.server.requests.append(name)
+        time.sleep(delay)
+
+        if feed is None:
+            self.send_error(500)
+            return
+
+        data = feed.format(name=name).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeIndexerTestCase(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(FakeIndexerTestCase, self).setUp()
+
+        self.server = self.start_http_server(FakeIndexerHandler, indexers={}, requests=[])
+
+    def _providers(self, *indexers):
+        providers = []
+        for name, delay, feed in indexers:
+            self.server.indexers[name] = (delay, feed)
+            providers.append(NewznabProvider(name, 'http://127.0.0.1:{}/{}/'.format(self.server.server_port, name)))
+        return providers
+
+
+class SearchProviderFanOutTests(FakeIndexerTestCase):
+    @staticmethod
+    def _search(provider):
+        data = provider.session.get(urljoin(provider.urls['base_url'], 'api'), params={'t': 'search'}, timeout=30).text
+        return provider.parse(data, 'RSS')
+
+    def test_providers_are_searched_concurrently(self):
+        providers = self._providers(*[('indexer{}'.format(i), 1, (NEWZNAB_FEED, TORZNAB_FEED)[i % 2]) for i in range(4)])
+
+        start = time.monotonic()
+        results = list(SearchProviderFanOut(workers=4).run(self._search, providers))
+        elapsed = time.monotonic() - start
+
+        # well below the sum of the injected latencies
+        self.assertLess(elapsed, 3)
+        self.assertEqual([provider for provider, __ in results], providers)
+        for provider, found_results in results:
+            self.assertEqual(len(found_results), 1)
+            self.assertTrue(found_results[0]['title'].startswith(provider.name))
+        self.assertEqual(results[1][1][0]['seeders'], 10)
+
+    def test_slow_provider_times_out(self):
+        providers = self._providers(('slow', 5, NEWZNAB_FEED), ('fast', 0, TORZNAB_FEED))
+
+        start = time.monotonic()
+        results = dict(SearchProviderFanOut(workers=2, provider_timeout=2).run(self._search, providers))
+
+        self.assertLess(time.monotonic() - start, 4)
+        self.assertIsNone(results[providers[0]])
+        self.assertEqual(len(results[providers[1]]), 1)
+
+    def test_deadline(self):
+        providers = self._providers(*[('indexer{}'.format(i), 1, NEWZNAB_FEED) for i in range(4)])
+
+        start = time.monotonic()
+        results = list(SearchProviderFanOut(workers=1, provider_timeout=10, deadline=2.5).run(self._search, providers))
+
+        self.assertLess(time.monotonic() - start, 3.5)
+        self.assertEqual(len(results[0][1]), 1)
+        self.assertEqual([found_results for __, found_results in results[2:]], [None, None])
+
+    def test_early_termination(self):
+        providers = self._providers(*[('indexer{}'.format(i), 0.2, NEWZNAB_FEED) for i in range(6)])
+
+        run = SearchProviderFanOut(workers=2).run(self._search, providers)
+        provider, found_results = next(run)
+        run.close()
+
+        self.assertEqual(provider, providers[0])
+        self.assertEqual(len(found_results), 1)
+
+        # searches that had not been picked up by a worker yet never reach the indexers
+        time.sleep(0.5)
+        self.assertLess(len(self.server.requests), len(providers))
+
+
+class ProviderHealthTrackerTests(FakeIndexerTestCase):
+    def setUp(self):
+        super(ProviderHealthTrackerTests, self).setUp()
+        self.now = 0
+        self.health = ProviderHealthTracker(window=10, failure_threshold=3, cooldown=60, clock=lambda: self.now)
+
+    def _search(self, provider):
+        start = time.monotonic()
+        try:
+            # an error response counts as a failed search
+            resp = provider.session.get(urljoin(provider.urls['base_url'], 'api'), params={'t': 'search'}, timeout=30)
+            resp.raise_for_status()
+            found_results = provider.parse(resp.text, 'RSS')
+            self.health.record_search(provider.id, True, time.monotonic() - start, len(found_results))
+            return found_results
+        except Exception:
+            self.health.record_search(provider.id, False, time.monotonic() - start)
+            raise
+
+    def _run(self, providers):
+        providers = [x for x in self.health.order(providers) if self.health.allow(x.id)]
+        return [provider for provider, __ in SearchProviderFanOut(workers=4).run(self._search, providers)]
+
+    def test_adaptive_order(self):
+        broken, slow, fast = self._providers(('broken', 0, None), ('slow', 0.5, NEWZNAB_FEED), ('fast', 0, TORZNAB_FEED))
+
+        # unknown providers keep their configured order
+        self.assertEqual(self._run([broken, slow, fast]), [broken, slow, fast])
+
+        # failing and slow providers drop behind, a provider with snatched results moves up
+        self.assertEqual(self._run([broken, slow, fast]), [fast, slow, broken])
+        self.health.record_snatch(slow.id)
+        self.assertEqual(self.health.order([broken, slow, fast]), [slow, fast, broken])
+
+        stats = self.health.stats(broken.id)
+        self.assertEqual(stats['success_rate'], 0)
+        self.assertEqual(stats['consecutive_failures'], 2)
+        self.assertEqual(self.health.stats(fast.id)['results'], 2)
+        self.assertGreater(self.health.stats(slow.id)['latency_p50'], 0.5)
+
+    def test_circuit_breaker(self):
+        broken, fast = self._providers(('broken', 0, None), ('fast', 0, NEWZNAB_FEED))
+
+        for __ in range(3):
+            self._run([broken, fast])
+        self.assertEqual(self.health.stats(broken.id)['state'], ProviderHealth.OPEN)
+
+        # skipped during the cool down
+        del self.server.requests[:]
+        self.assertEqual(self._run([broken, fast]), [fast])
+        self.assertEqual(self.server.requests, ['fast'])
+
+        # a single half open probe after the cool down, a failed probe opens the breaker again
+        self.now = 60
+        self.assertTrue(self.health.allow(broken.id))
+        self.assertFalse(self.health.allow(broken.id))
+        self.health.record_search(broken.id, False, 0.1)
+        self.assertEqual(self.health.stats(broken.id)['state'], ProviderHealth.OPEN)
+        self.assertFalse(self.health.allow(broken.id))
+
+        # a successful probe closes it
+        self.now = 120
+        self.server.indexers['broken'] = (0, NEWZNAB_FEED)
+        self.assertEqual(self._run([broken, fast]), [fast, broken])
+        self.assertEqual(self.health.stats(broken.id)['state'], ProviderHealth.CLOSED)
+
+    def test_cancelled_probe(self):
+        first, second, broken = self._providers(('first', 0.5, NEWZNAB_FEED), ('second', 0.5, NEWZNAB_FEED),
+                                                ('broken', 0, None))
+
+        for __ in range(3):
+            self.health.record_search(broken.id, False, 0.1)
+
+        # the probe search is cancelled before a worker picked it up, its outcome is never recorded
+        self.now = 60
+        self.assertTrue(self.health.allow(broken.id))
+        run = SearchProviderFanOut(workers=1).run(self._search, [first, second, broken],
+                                                   cancelled=lambda x: self.health.release(x.id))
+        self.assertEqual(next(run)[0], first)
+        run.close()
+
+        self.assertNotIn('broken', self.server.requests)
+        self.assertEqual(self.health.stats(broken.id)['state'], ProviderHealth.HALF_OPEN)
+        self.assertTrue(self.health.allow(broken.id))
+
+
+class FakeTrackerHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+
+        if self.path.startswith('/login.php'):
+            self._send(200, 'please sign in')
+        elif 'uid={}'.format(self.server.session_id) in self.headers.get('Cookie', ''):
+            self._send(200, 'search results')
+        else:
+            self.send_response(302)
+            self.send_header('Location', '/login.php?returnto=browse.php')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def do_POST(self):
+        self.server.requests.append(self.path)
+
+        data = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        if data != 'username=user&password=pass':
+            self._send(200, 'please sign in')
+            return
+
+        self.server.logins += 1
+        self.server.session_id = 'session{}'.format(self.server.logins)
+        self._send(200, 'logged in', {'Set-Cookie': 'uid={}; Path=/'.format(self.server.session_id)})
+
+    def _send(self, status, text, headers=None):
+        data = text.encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeTrackerProvider(TorrentProvider):
+    def __init__(self, url):
+        super(FakeTrackerProvider, self).__init__('FakeTracker', url, True)
+        self._urls.update({'login': urljoin(url, 'login.php'), 'search': urljoin(url, 'browse.php')})
+        self.custom_settings = {'username': 'user', 'password': 'pass'}
+
+    def login(self):
+        if any(dict_from_cookiejar(self.session.cookies).values()):
+            return True
+
+        response = self.session.post(self.urls['login'], data=self.custom_settings).text
+        return 'logged in' in response
+
+    def search(self, search_strings, **kwargs):
+        if not self.login():
+            return ''
+
+        return self.session.get(self.urls['search']).text
+
+
+class ProviderLoginSessionTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(ProviderLoginSessionTests, self).setUp()
+
+        self.server = self.start_http_server(FakeTrackerHandler, requests=[], logins=0, session_id=None)
+
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_port)
+        provider_health.reset()
+
+    def test_login_session(self):
+        provider = FakeTrackerProvider(self.url)
+        self.assertEqual(provider.search({}), 'search results')
+        self.assertEqual(provider.search({}), 'search results')
+        self.assertEqual(self.server.logins, 1)
+
+        # a restarted provider reuses the stored session
+        provider = FakeTrackerProvider(self.url)
+        self.assertEqual(provider.search({}), 'search results')
+        self.assertEqual(self.server.logins, 1)
+
+        # an expired session redirects to the login page, the provider logs in again and repeats the search
+        self.server.session_id = 'expired'
+        del self.server.requests[:]
+        self.assertEqual(provider.search({}), 'search results')
+        self.assertEqual(self.server.logins, 2)
+        self.assertEqual(self.server.requests, ['/browse.php', '/login.php', '/browse.php'])
+
+        provider = FakeTrackerProvider(self.url)
+        self.assertEqual(provider.search({}), 'search results')
+        self.assertEqual(self.server.logins, 2)
+
+        self.assertEqual(provider_health.stats(provider.id)['logins_per_hour'], 2)
+
+
+class ContentCacheTests(FakeIndexerTestCase):
+    INFO = {'name': 'Show.Name.S01E01.720p.HDTV.x264-GRP.mkv', 'length': 1, 'piece length': 1, 'pieces': ''}
+
+    def setUp(self):
+        super(ContentCacheTests, self).setUp()
+        content_cache.clear()
+
+    def test_verify_then_snatch(self):
+        torrent = bencode({'announce': 'http://tracker.example.com/announce', 'info': self.INFO})
+        self.server.indexers['tracker'] = (0, torrent.decode())
+        self.server.indexers['broken'] = (0, 'not a torrent')
+
+        provider = TorrentRssProvider('provider', 'http://127.0.0.1:{}/'.format(self.server.server_port))
+        url = urljoin(provider.urls['base_url'], 'tracker/1.torrent')
+        broken_url = urljoin(provider.urls['base_url'], 'broken/1.torrent')
+
+        # verifying and snatching the result downloads it once, a payload that is no torrent is not cached
+        self.assertEqual(provider.get_content(url), torrent)
+        self.assertEqual(provider.get_content(url), torrent)
+        self.assertIsNone(provider.get_content(broken_url))
+        self.assertIsNone(provider.get_content(broken_url))
+        self.assertEqual(self.server.requests, ['tracker', 'broken', 'broken'])
+
+        # the torrent client reuses the info hash of the verification
+        result = provider.get_result(1, [1])
+        result.url, result.content = url, torrent
+        self.assertEqual(TorrentClient._get_torrent_hash(result).hash, hashlib.sha1(bencode(self.INFO)).hexdigest())
+        self.assertEqual(content_cache.info_hash(url), result.hash)
+        self.assertEqual(ResultDeduplicator.info_hash(result), result.hash.upper())
+
+    def test_nzb_payloads(self):
+        nzb = '<?xml version="1.0" encoding="UTF-8"?>\n<nzb xmlns="http://www.newzbin.com/DTD/2003/nzb"><file/></nzb>'
+        self.server.indexers['indexer'] = (0, nzb)
+        self.server.indexers['limited'] = (0, '<?xml version="1.0" encoding="UTF-8"?>\n<error code="500" description="Request limit reached"/>')
+
+        provider = NewznabProvider('indexer', 'http://127.0.0.1:{}/'.format(self.server.server_port))
+
+        # newznab error documents are downloaded again
+        for name in ['indexer', 'limited']:
+            url = urljoin(provider.urls['base_url'], '{}/getnzb/1.nzb'.format(name))
+            self.assertEqual(provider.get_content(url), provider.get_content(url))
+
+        self.assertEqual(self.server.requests, ['indexer', 'limited', 'limited'])
+
+    def test_limits(self):
+        now = [0]
+        cache = ContentCache(max_size=10, ttl=60, clock=lambda: now[0])
+
+        # payloads are kept once per content hash
+        cache.add('http://provider1.example.com/1.nzb', b'nzb1')
+        cache.add('http://provider2.example.com/1.nzb', b'nzb1')
+        self.assertEqual(cache.size, 4)
+
+        cache.add('http://provider1.example.com/2.nzb', b'nzb2')
+        self.assertEqual(cache.size, 8)
+
+        # the oldest urls are dropped when the payloads take more than max_size bytes, larger payloads are not cached
+        cache.add('http://provider1.example.com/3.nzb', b'nzb3')
+        self.assertIsNone(cache.get('http://provider1.example.com/1.nzb'))
+        self.assertIsNone(cache.get('http://provider2.example.com/1.nzb'))
+        self.assertEqual(cache.get('http://provider1.example.com/2.nzb'), b'nzb2')
+        self.assertEqual(cache.size, 8)
+
+        cache.add('http://provider1.example.com/4.nzb', b'a very large nzb')
+        self.assertIsNone(cache.get('http://provider1.example.com/4.nzb'))
+
+        cache.discard('http://provider1.example.com/2.nzb')
+        self.assertIsNone(cache.get('http://provider1.example.com/2.nzb'))
+        self.assertEqual(cache.size, 4)
+
+        # and expire after ttl seconds
+        now[0] = 61
+        self.assertIsNone(cache.get('http://provider1.example.com/3.nzb'))
+        self.assertEqual(cache.size, 0)
+
+
+NEWZNAB_CAPS = """<?xml version="1.0" encoding="UTF-8"?>
+<caps>
+<limits max="50" default="25"/>
+<searching>
+<search available="yes" supportedParams="q"/>
+<tv-search available="yes" supportedParams="{tv_search_params}"/>
+<movie-search available="no" supportedParams="q,imdbid"/>
+</searching>
+<categories>
+<category id="2000" name="Movies"/>
+<category id="5000" name="TV">
+<subcat id="5030" name="SD"/>
+<subcat id="5040" name="HD"/>
+</category>
+</categories>
+</caps>"""
+
+
+class FakeNewznabHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        params = dict((key, value[0]) for key, value in parse_qs(urlparse(self.path).query).items())
+        self.server.requests.append(params)
+
+        if params['t'] == 'caps':
+            data = NEWZNAB_CAPS.format(tv_search_params=self.server.tv_search_params)
+        else:
+            data = NEWZNAB_FEED.format(name='newznab')
+
+        data = data.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class NewznabCapsTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(NewznabCapsTests, self).setUp()
+
+        self.server = self.start_http_server(FakeNewznabHandler, requests=[], tv_search_params='q,tvdbid,season,ep')
+
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_port)
+
+        with sickrage.app.main_db.session() as session:
+            session.add(MainDB.TVShow(**{
+                'series_id': 1,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'name': 'Show Name',
+                'lang': 'en',
+                'location': '',
+                'quality': Qualities.HDTV,
+                'default_ep_status': EpisodeStatus.WANTED
+            }))
+            session.add(MainDB.TVEpisode(**{
+                'series_id': 1,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'episode_id': 11,
+                'season': 1,
+                'episode': 1,
+                'location': '',
+                'status': EpisodeStatus.WANTED,
+                'airdate': datetime.date.today() - datetime.timedelta(days=10)
+            }))
+            session.commit()
+
+        TVShow(1, SeriesProviderID.THETVDB)
+
+    def tearDown(self):
+        sickrage.app.shows.clear()
+        super(NewznabCapsTests, self).tearDown()
+
+    def _caps_requests(self):
+        return len([x for x in self.server.requests if x['t'] == 'caps'])
+
+    def _search(self):
+        del self.server.requests[:]
+        provider = NewznabProvider('newznab', self.url)
+        provider.search({'Episode': ['Show Name S01E01']}, series_id=1, series_provider_id=SeriesProviderID.THETVDB, season=1, episode=1)
+        return [x for x in self.server.requests if x['t'] != 'caps'][0]
+
+    def test_cached_caps(self):
+        success, categories, error = NewznabProvider('newznab', self.url).get_newznab_categories()
+        self.assertTrue(success)
+        self.assertEqual([x['id'] for x in categories], ['5000', '5030', '5040'])
+
+        # a restarted provider reads the caps from the cache database
+        provider = NewznabProvider('newznab', self.url)
+        caps = provider.get_caps()
+        self.assertEqual(caps['searching'], {'search': ['q'], 'tv-search': ['q', 'tvdbid', 'season', 'ep']})
+        self.assertEqual(caps['limits'], {'max': 50, 'default': 25})
+        self.assertEqual(self._caps_requests(), 1)
+
+        # until they expire or are refreshed
+        provider.get_caps(refresh=True)
+        self.assertEqual(self._caps_requests(), 2)
+
+        session = sickrage.app.cache_db.session()
+        session.query(CacheDB.NewznabCaps).update({'time': int(time.time()) - NewznabProvider.caps_ttl})
+        session.commit()
+        NewznabProvider('newznab', self.url).get_caps()
+        self.assertEqual(self._caps_requests(), 3)
+
+        # caps of another url are not used
+        NewznabProvider('newznab', self.url + 'other/').get_caps()
+        self.assertEqual(self._caps_requests(), 4)
+
+    def test_search_params(self):
+        params = self._search()
+        self.assertEqual(params['t'], 'tvsearch')
+        self.assertEqual((params['tvdbid'], params['season'], params['ep'], params['limit']), ('1', '1', '1', '50'))
+        self.assertNotIn('q', params)
+
+        # unsupported params are skipped
+        self.server.tv_search_params = 'q,tvdbid'
+        NewznabProvider('newznab', self.url).get_caps(refresh=True)
+        params = self._search()
+        self.assertEqual(params['t'], 'tvsearch')
+        self.assertNotIn('season', params)
+        self.assertNotIn('ep', params)
+
+        # without id based tvsearch the search function is used
+        self.server.tv_search_params = 'q,season,ep'
+        NewznabProvider('newznab', self.url).get_caps(refresh=True)
+        params = self._search()
+        self.assertEqual((params['t'], params['q']), ('search', 'Show Name S01E01'))
+        self.assertNotIn('tvdbid', params)
+
+
+class ResultDeduplicatorTests(tests.SiCKRAGETestCase):
+    INFO_HASH = '8A19577FB5F690970CA43A57FF1011AE202244B8'
+
+    def setUp(self):
+        super(ResultDeduplicatorTests, self).setUp()
+        self.providers = [TorrentRssProvider('provider{}'.format(i), 'https://provider{}.example.com/rss'.format(i)) for i in range(3)]
+
+    def _result(self, provider, name, url, size=-1, seeders=-1, content=None):
+        result = self.providers[provider].get_result(1, [1])
+        result.name, result.url, result.size, result.seeders, result.content = name, url, size, seeders, content
+        return result
+
+    def test_merge_by_info_hash(self):
+        hex_magnet = 'magnet:?xt=urn:btih:{}&dn=Show.Name.S01E01'.format(self.INFO_HASH)
+        base32_magnet = 'magnet:?xt=urn:btih:{}&dn=Show.Name.S01E01'.format(b32encode(b16decode(self.INFO_HASH)).decode())
+
+        info = {'name': 'Show.Name.S01E01.720p.HDTV.x264-GRP.mkv', 'length': 1, 'piece length': 1, 'pieces': ''}
+        content = bencode({'announce': 'http://tracker1.example.com/announce', 'info': info})
+        other_content = bencode({'announce': 'http://tracker2.example.com/announce', 'info': info})
+
+        deduplicator = ResultDeduplicator()
+        first = deduplicator.filter([self._result(0, 'Show.Name.S01E01.720p.HDTV.x264-GRP', hex_magnet, seeders=5),
+                                     self._result(0, 'Show.Name.S01E02.720p.HDTV.x264-GRP', 'https://provider0.example.com/2.torrent', content=content)])
+        second = deduplicator.filter([self._result(1, 'Show Name S01E01 720p HDTV x264-GRP [eztv]', base32_magnet, seeders=50),
+                                      self._result(1, 'Show.Name.S01E02.720p.HDTV.x264-GRP', 'https://provider1.example.com/2.torrent', content=other_content)])
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, [])
+        self.assertEqual(deduplicator.duplicate_rate, 0.5)
+
+        # the source with the most seeders is kept for the release
+        self.assertEqual(deduplicator.best_source(first[0]).provider, self.providers[1])
+        self.assertEqual(deduplicator.best_source(first[1]), first[1])
+
+    def test_season_pack_source(self):
+        deduplicator = ResultDeduplicator()
+
+        season_pack = deduplicator.filter([self._result(0, 'Show.Name.S01.720p.HDTV.x264-GRP', 'https://provider0.example.com/s01.torrent', 8589934592, 5)])[0]
+        season_pack.episodes = list(range(1, 11))
+
+        duplicate = self._result(1, 'Show.Name.S01.720p.HDTV.x264-GRP', 'https://provider1.example.com/s01.torrent', 8589934592, 50)
+        self.assertEqual(deduplicator.filter([duplicate]), [])
+
+        # the processed season pack keeps its episodes and takes the source of the better seeded duplicate
+        result = deduplicator.best_source(season_pack)
+        self.assertIs(result, season_pack)
+        self.assertEqual(result.episodes, list(range(1, 11)))
+        self.assertEqual((result.provider, result.url, result.seeders), (self.providers[1], duplicate.url, 50))
+
+    def test_merge_by_name_and_size(self):
+        deduplicator = ResultDeduplicator()
+
+        results = deduplicator.filter([
+            self._result(0, 'Show.Name.S01E01.1080p.WEB-DL.DD5.1.H.264-GRP', 'https://provider0.example.com/1.torrent', 2147483648, 10),
+            self._result(1, 'show name s01e01 1080p web-dl dd5 1 h 264-grp', 'https://provider1.example.com/1.torrent', 2140000000, 20),
+            self._result(2, 'Show.Name.S01E01.1080p.WEB-DL.DD5.1.H.264-GRP', 'https://provider2.example.com/1.torrent', 1073741824, 30),
+            self._result(2, 'Show.Name.S01E01.1080p.WEB-DL.DD5.1.H.264-GRP', 'https://provider2.example.com/2.torrent', -1, 40),
+        ])
+
+        # different sizes or an unknown size are different releases, within one list the better source replaces the first one
+        self.assertEqual([x.provider.name for x in results], ['provider1', 'provider2', 'provider2'])
+        self.assertEqual(deduplicator.duplicates, 1)
+        self.assertEqual(deduplicator.total, 4)
+
+    def test_duplicate_rate(self):
+        deduplicator = ResultDeduplicator()
+
+        for provider in range(3):
+            deduplicator.filter([self._result(provider, 'Show.Name.S01E0{}.720p.HDTV.x264-GRP'.format(i),
+                                              'https://provider{}.example.com/{}.torrent'.format(provider, i), 1000000 * i, provider) for i in range(1, 5)])
+
+        self.assertEqual(len(deduplicator.releases), 4)
+        self.assertEqual(deduplicator.duplicates, 8)
+        self.assertAlmostEqual(deduplicator.duplicate_rate, 8 / 12)
+        self.assertTrue(all(x.provider == self.providers[2] for x in deduplicator.releases.values()))
+
+
+class FakeSearchProvider(TorrentRssProvider):
+    def __init__(self, name, releases):
+        super(FakeSearchProvider, self).__init__(name, 'https://{}.example.com/rss'.format(name))
+        self.releases = releases
+        self.searches = []
+
+    def search(self, search_strings, age=0, series_id=None, series_provider_id=None, season=None, episode=None, **kwargs):
+        items = []
+
+        for mode, strings in search_strings.items():
+            for search_string in strings:
+                self.searches.append(search_string)
+
+                for release in self.releases:
+                    if release.startswith(search_string.replace(' ', '.')):
+                        items.append({'title': release, 'link': 'https://{}.example.com/{}.torrent'.format(self.name, release)})
+
+        return items
+
+
+class SearchPlanTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(SearchPlanTests, self).setUp()
+
+        sickrage.app.config.general.enable_sickrage_api = False
+
+        with sickrage.app.main_db.session() as session:
+            session.add(MainDB.TVShow(**{
+                'series_id': 1,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'name': 'Show Name',
+                'lang': 'en',
+                'location': '',
+                'quality': Qualities.HDTV,
+                'default_ep_status': EpisodeStatus.WANTED
+            }))
+
+            for season in [1, 2]:
+                for episode in range(1, 5):
+                    session.add(MainDB.TVEpisode(**{
+                        'series_id': 1,
+                        'series_provider_id': SeriesProviderID.THETVDB,
+                        'episode_id': season * 10 + episode,
+                        'season': season,
+                        'episode': episode,
+                        'location': '',
+                        'status': EpisodeStatus.WANTED,
+                        'airdate': datetime.date.today() - datetime.timedelta(days=100 - season * 10 - episode)
+                    }))
+
+            session.commit()
+
+        self.show = TVShow(1, SeriesProviderID.THETVDB)
+
+        self.provider = FakeSearchProvider('fake', ['Show.Name.S0{}E0{}.720p.HDTV.x264-GRP'.format(season, episode)
+                                                    for season in [1, 2] for episode in range(1, 5)])
+
+    def tearDown(self):
+        sickrage.app.shows.clear()
+        super(SearchPlanTests, self).tearDown()
+
+    def _search(self, plan, season, episode):
+        plan.add_unplanned(self.provider, season, episode)
+        results = self.provider.find_search_results(1, SeriesProviderID.THETVDB, season, episode, plan.search_mode(season), plan=plan)
+        plan.done(season, episode)
+        return results
+
+    def test_season_search(self):
+        episodes = [(1, 1), (1, 2), (1, 4), (2, 3)]
+
+        plan = SearchPlan(1, SeriesProviderID.THETVDB, episodes)
+        self.assertEqual(plan.search_mode(1), 'sponly')
+        self.assertEqual(plan.search_mode(2), 'eponly')
+
+        # the season query is sent once and returns the results of every wanted episode of the season
+        for season, episode in episodes:
+            results = self._search(plan, season, episode)
+            self.assertEqual({x.name for x in results[episode]}, {'Show.Name.S0{}E0{}.720p.HDTV.x264-GRP'.format(season, episode)})
+
+        self.assertEqual(self.provider.searches, ['Show Name S01', 'Show Name S02E03'])
+        self.assertEqual(plan.requests[self.provider.id], 2)
+        self.assertEqual(plan.unplanned_requests[self.provider.id], 4)
+        self.assertEqual(plan.requests_saved, 2)
+        self.assertEqual(plan.pending, set())
+
+    def test_max_search_strings(self):
+        episodes = [(2, 1), (1, 2), (1, 3), (1, 4)]
+
+        # only one of four episodes wanted in season 2, the last season 1 episode is beyond the cap
+        plan = SearchPlan(1, SeriesProviderID.THETVDB, episodes, season_ratio=1, max_search_strings=3)
+        self.assertEqual(plan.search_mode(1), 'eponly')
+
+        results = [self._search(plan, season, episode) for season, episode in episodes]
+
+        self.assertEqual(self.provider.searches, ['Show Name S02E01', 'Show Name S01E02', 'Show Name S01E03'])
+        self.assertEqual([len(x) for x in results], [1, 1, 1, 0])
+        self.assertEqual(plan.skipped_requests[self.provider.id], 1)
+        self.assertEqual(plan.requests_saved, 1)
+
+        # the capped episode was not searched
+        self.assertEqual([plan.is_deferred(season, episode) for season, episode in episodes], [False, False, False, True])
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - SEARCH TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
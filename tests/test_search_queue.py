@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.queues.search import BacklogSearchTask, DailySearchTask, FailedSearchTask, ManualSearchTask, SearchHistory, SearchQueue
+from sickrage.search_providers import SearchProviders, TorrentRssProvider
+
+
+class SearchQueueTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(SearchQueueTests, self).setUp()
+
+        sickrage.app.config.general.use_torrents = True
+
+        self.search_providers = sickrage.app.search_providers
+        sickrage.app.search_providers = SearchProviders()
+        for provider_type in sickrage.app.search_providers:
+            sickrage.app.search_providers[provider_type] = {}
+
+        provider = TorrentRssProvider('provider1', 'http://localhost/provider1')
+        provider.enabled = True
+        sickrage.app.search_providers[TorrentRssProvider.provider_type.name][provider.id] = provider
+
+        self.search_queue = SearchQueue()
+
+    def tearDown(self):
+        sickrage.app.search_providers = self.search_providers
+        super(SearchQueueTests, self).tearDown()
+
+    def test_duplicates(self):
+        self.search_queue.put(BacklogSearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+        self.search_queue.put(BacklogSearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+        self.search_queue.put(ManualSearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+        self.search_queue.put(FailedSearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+
+        # manual searches of the same episode number of another show are not duplicates
+        self.search_queue.put(ManualSearchTask(2, SeriesProviderID.THETVDB, 1, 1))
+
+        self.assertEqual(len(self.search_queue.tasks), 3)
+        self.assertEqual(self.search_queue.queue_length(), {'backlog': 1, 'daily': 0, 'manual': 2, 'failed': 0})
+
+    def test_indexes(self):
+        self.search_queue.put(DailySearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+        self.search_queue.put(BacklogSearchTask(1, SeriesProviderID.THETVDB, 1, 2))
+        self.search_queue.put(ManualSearchTask(2, SeriesProviderID.THETVDB, 1, 1))
+
+        self.assertTrue(self.search_queue.is_in_queue(1, 1, 2))
+        self.assertFalse(self.search_queue.is_in_queue(1, 1, 1))
+        self.assertTrue(self.search_queue.is_ep_in_queue(2, 1, 1))
+        self.assertFalse(self.search_queue.is_ep_in_queue(1, 1, 1))
+        self.assertTrue(self.search_queue.is_show_in_queue(1))
+        self.assertTrue(self.search_queue.is_show_in_queue(2, SeriesProviderID.THETVDB))
+        self.assertFalse(self.search_queue.is_show_in_queue(3))
+        self.assertEqual(len(self.search_queue.get_all_tasks_from_queue_by_show(1)), 2)
+        self.assertEqual(len(self.search_queue.get_all_tasks_from_queue_by_episode(1, 1, 1)), 1)
+        self.assertTrue(self.search_queue.is_dailysearch_in_progress())
+        self.assertTrue(self.search_queue.is_backlog_in_progress())
+        self.assertTrue(self.search_queue.is_manual_search_in_progress())
+
+        for task in list(self.search_queue.tasks.values()):
+            self.search_queue.remove_task(task.id)
+
+        self.assertFalse(self.search_queue.is_show_in_queue(1))
+        self.assertFalse(self.search_queue.is_in_queue(1, 1, 2))
+        self.assertFalse(self.search_queue.is_backlog_in_progress())
+        self.assertFalse(self.search_queue.is_manual_search_in_progress())
+        self.assertEqual(self.search_queue.queue_length(), {'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0})
+        self.assertFalse(any([self.search_queue.show_tasks, self.search_queue.episode_tasks, self.search_queue.type_tasks]))
+
+    def test_manual_search_history(self):
+        self.search_queue.put(ManualSearchTask(1, SeriesProviderID.THETVDB, 1, 1))
+        self.search_queue.put(BacklogSearchTask(1, SeriesProviderID.THETVDB, 1, 2))
+        self.search_queue.put(FailedSearchTask(2, SeriesProviderID.THETVDB, 1, 1))
+
+        self.assertEqual([(x['series_id'], x['season'], x['episode'], x['status']) for x in self.search_queue.TASK_HISTORY.since()],
+                         [(1, 1, 1, 'Queued'), (2, 1, 1, 'Queued')])
+        self.assertEqual([(x['series_id'], x['status']) for x in self.search_queue.TASK_HISTORY.since(series_id=2)], [(2, 'Queued')])
+
+
+class SearchHistoryTests(tests.SiCKRAGETestCase):
+    def test_size(self):
+        history = SearchHistory(size=3, age=60)
+        for episode in range(1, 6):
+            history.add(1, 1, episode)
+
+        self.assertEqual(len(history), 3)
+        self.assertNotIn((1, 1, 2), history)
+        self.assertIn((1, 1, 5), history)
+
+        # updating an entry moves it to the end, so it is evicted last
+        history.add(1, 1, 3)
+        history.add(1, 1, 6)
+        self.assertIn((1, 1, 3), history)
+        self.assertNotIn((1, 1, 4), history)
+
+        history.remove((1, 1, 3))
+        history.remove((1, 1, 3))
+        self.assertNotIn((1, 1, 3), history)
+
+    def test_age(self):
+        history = SearchHistory(size=10, age=1)
+        history.add(1, 1, 1)
+        history.add(1, 1, 2)
+        history.entries[(1, 1, 1)]['time'] -= 120
+
+        self.assertNotIn((1, 1, 1), history)
+        self.assertIn((1, 1, 2), history)
+        self.assertEqual(len(history), 1)
+
+    def test_since(self):
+        history = SearchHistory(size=10, age=60)
+        history.add(1, 1, 1, status='Queued')
+        history.add(2, 1, 1, status='Queued')
+        cursor = history.cursor
+
+        self.assertEqual([(x['series_id'], x['status']) for x in history.since()], [(1, 'Queued'), (2, 'Queued')])
+        self.assertEqual(history.since(cursor), [])
+
+        history.add(1, 1, 1, status='Searching')
+        history.add(2, 1, 1, status='Finished')
+
+        self.assertEqual([(x['series_id'], x['status']) for x in history.since(cursor)], [(1, 'Searching'), (2, 'Finished')])
+        self.assertEqual([(x['series_id'], x['status']) for x in history.since(cursor, series_id=1)], [(1, 'Searching')])
+        self.assertEqual(history.since(history.cursor), [])
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - SEARCH QUEUE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import datetime
+import time
+import unittest
+from unittest import mock
+
+from sqlalchemy import event
+
+import sickrage
+import tests
+from sickrage.core.common import EpisodeStatus, Qualities, Quality
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.searchers import get_wanted_episodes, get_wanted_statuses, set_new_episode_statuses
+from sickrage.core.searchers.backlog_searcher import BacklogSearcher
+from sickrage.core.searchers.failed_snatch_searcher import FailedSnatchSearcher
+from sickrage.core.searchers.proper_searcher import ProperSearcher
+from sickrage.core.tv.show import TVShow
+from sickrage.search_providers import SearchProviders, TorrentRssProvider
+
+
+class SearcherTestCase(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(SearcherTestCase, self).setUp()
+
+        today = datetime.date.today()
+
+        episodes = {
+            1: [(1, 1, EpisodeStatus.WANTED, today - datetime.timedelta(days=10)),
+                (1, 2, Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.SDTV), today - datetime.timedelta(days=3)),
+                (1, 3, Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV), today - datetime.timedelta(days=2)),
+                (1, 4, EpisodeStatus.SKIPPED, today - datetime.timedelta(days=1)),
+                (1, 5, EpisodeStatus.WANTED, today),
+                (1, 6, EpisodeStatus.UNAIRED, today - datetime.timedelta(days=1)),
+                (1, 7, EpisodeStatus.UNAIRED, today + datetime.timedelta(days=7)),
+                (0, 1, EpisodeStatus.WANTED, today - datetime.timedelta(days=5))],
+            2: [(1, 1, EpisodeStatus.WANTED, today - datetime.timedelta(days=10)),
+                (1, 2, EpisodeStatus.UNAIRED, today - datetime.timedelta(days=1))],
+            3: [(1, 1, EpisodeStatus.WANTED, today - datetime.timedelta(days=10)),
+                (1, 2, Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.SDTV), today - datetime.timedelta(days=2))],
+        }
+
+        with sickrage.app.main_db.session() as session:
+            for series_id, paused, quality in [(1, False, Qualities.HD720P), (2, True, Qualities.HD720P), (3, False, Qualities.SD)]:
+                session.add(MainDB.TVShow(**{
+                    'series_id': series_id,
+                    'series_provider_id': SeriesProviderID.THETVDB,
+                    'name': 'Show {}'.format(series_id),
+                    'lang': 'en',
+                    'location': '',
+                    'paused': paused,
+                    'quality': quality,
+                    'default_ep_status': EpisodeStatus.WANTED
+                }))
+
+                for season, episode, status, airdate in episodes[series_id]:
+                    session.add(MainDB.TVEpisode(**{
+                        'series_id': series_id,
+                        'series_provider_id': SeriesProviderID.THETVDB,
+                        'episode_id': series_id * 100 + season * 10 + episode,
+                        'season': season,
+                        'episode': episode,
+                        'location': '',
+                        'status': status,
+                        'airdate': airdate
+                    }))
+
+            session.commit()
+
+        self.shows = [TVShow(series_id, SeriesProviderID.THETVDB) for series_id in episodes]
+
+    def tearDown(self):
+        sickrage.app.shows.clear()
+        super(SearcherTestCase, self).tearDown()
+
+
+class WantedEpisodesTests(SearcherTestCase):
+    def test_wanted_statuses(self):
+        statuses = get_wanted_statuses(Quality.combine_qualities([Qualities.HDTV], [Qualities.FULLHDBLURAY]), False)
+        self.assertIn(EpisodeStatus.WANTED, statuses)
+        self.assertIn(Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV), statuses)
+        self.assertNotIn(Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.FULLHDBLURAY), statuses)
+        self.assertNotIn(EpisodeStatus.SKIPPED, statuses)
+
+        # downloaded episodes are not upgraded when skipped
+        statuses = get_wanted_statuses(Quality.combine_qualities([Qualities.HDTV], [Qualities.FULLHDBLURAY]), True)
+        self.assertNotIn(Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV), statuses)
+        self.assertIn(Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.HDTV), statuses)
+
+    def test_get_wanted_episodes(self):
+        today = datetime.date.today()
+
+        # backlog, paused shows and specials are skipped, downloaded episodes below the show quality are upgraded
+        wanted = get_wanted_episodes(MainDB.TVEpisode.airdate > datetime.date.min, MainDB.TVEpisode.airdate < today)
+        self.assertEqual(wanted, {(1, SeriesProviderID.THETVDB): [(1, 1), (1, 2)], (3, SeriesProviderID.THETVDB): [(1, 1)]})
+
+        # daily search
+        wanted = get_wanted_episodes(MainDB.TVEpisode.airdate >= today)
+        self.assertEqual(wanted, {(1, SeriesProviderID.THETVDB): [(1, 5)]})
+
+        # a single show
+        wanted = get_wanted_episodes(MainDB.TVEpisode.series_id == 3)
+        self.assertEqual(list(wanted), [(3, SeriesProviderID.THETVDB)])
+
+    def test_set_new_episode_statuses(self):
+        # loaded episode objects are updated along with the database
+        episode_object = self.shows[0].get_episode(1, 6)
+
+        updated = set_new_episode_statuses()
+        self.assertEqual([(show.series_id, season, episode, status) for show, season, episode, status in updated],
+                         [(1, 1, 6, EpisodeStatus.WANTED)])
+        self.assertEqual(episode_object.status, EpisodeStatus.WANTED)
+
+        with sickrage.app.main_db.session() as session:
+            statuses = dict(((x.series_id, x.episode), x.status) for x in session.query(MainDB.TVEpisode).filter_by(season=1))
+
+        self.assertEqual(statuses[(1, 6)], EpisodeStatus.WANTED)
+        self.assertEqual(statuses[(1, 7)], EpisodeStatus.UNAIRED)
+        self.assertEqual(statuses[(2, 2)], EpisodeStatus.UNAIRED)
+
+        self.assertEqual(set_new_episode_statuses(), [])
+
+
+class FakeSearchQueue(object):
+    def __init__(self):
+        self.tasks = []
+        self.refused = set()
+        self.SNATCH_HISTORY = []
+
+    def put(self, task):
+        if (task.series_id, task.season, task.episode) in self.refused:
+            return
+
+        self.tasks.append(task)
+        return len(self.tasks)
+
+    def is_in_queue(self, series_id, season, episode):
+        return any((x.series_id, x.season, x.episode) == (series_id, season, episode) for x in self.tasks)
+
+
+class BacklogSearcherTests(SearcherTestCase):
+    def setUp(self):
+        super(BacklogSearcherTests, self).setUp()
+
+        sickrage.app.search_providers = SearchProviders()
+        for provider_type in sickrage.app.search_providers:
+            sickrage.app.search_providers[provider_type] = {}
+
+        for name in ['provider1', 'provider2']:
+            provider = TorrentRssProvider(name, 'http://localhost/{}'.format(name), enable_backlog=True)
+            provider.enabled = True
+            sickrage.app.search_providers[TorrentRssProvider.provider_type.name][provider.id] = provider
+
+        sickrage.app.config.general.backlog_searcher_freq = 1440
+        sickrage.app.config.general.backlog_search_budget = 0
+
+        self.restart()
+
+    def tearDown(self):
+        sickrage.app.backlog_searcher = None
+        sickrage.app.search_queue = None
+
+        super(BacklogSearcherTests, self).tearDown()
+
+    def restart(self):
+        # a restart only keeps what was written to the cache database
+        sickrage.app.backlog_searcher = BacklogSearcher()
+        sickrage.app.search_queue = FakeSearchQueue()
+
+    @staticmethod
+    def queued():
+        return [(x.series_id, x.season, x.episode) for x in sickrage.app.search_queue.tasks]
+
+    def test_restart_resumes_cycle(self):
+        sickrage.app.backlog_searcher.task()
+        self.assertEqual(self.queued(), [(1, 1, 1), (1, 1, 2), (3, 1, 1)])
+
+        sickrage.app.search_queue.tasks[0].set_searched()
+
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['total'], progress['searched'], progress['queued'], progress['spent']), (3, 1, 2, 2))
+
+        # searched episodes are not queued again, unfinished ones are
+        self.restart()
+        sickrage.app.backlog_searcher.task()
+        self.assertEqual(self.queued(), [(1, 1, 2), (3, 1, 1)])
+
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['total'], progress['searched'], progress['pending'], progress['spent']), (3, 1, 0, 2))
+
+        for task in sickrage.app.search_queue.tasks:
+            task.set_searched()
+
+        self.restart()
+        sickrage.app.backlog_searcher.step()
+        self.assertEqual(self.queued(), [])
+        self.assertEqual(sickrage.app.backlog_searcher.progress()['eta'], 0)
+
+        # a finished cycle starts over with the next backlog search
+        sickrage.app.backlog_searcher.task()
+        self.assertEqual(self.queued(), [(1, 1, 1), (1, 1, 2), (3, 1, 1)])
+
+    def test_budget_is_spread_over_frequency(self):
+        sickrage.app.config.general.backlog_search_budget = 4
+
+        sickrage.app.backlog_searcher.task()
+        self.assertEqual(self.queued(), [])
+        self.assertEqual(sickrage.app.backlog_searcher.progress()['pending'], 3)
+
+        # half the frequency window releases half the budget, one episode costs a request per provider
+        sickrage.app.backlog_searcher.cursor.cycle = int(time.time()) - 720 * 60
+        sickrage.app.backlog_searcher.step()
+        self.assertEqual(self.queued(), [(1, 1, 1)])
+
+        sickrage.app.backlog_searcher.step()
+        self.assertEqual(self.queued(), [(1, 1, 1)])
+
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['budget'], progress['queued'], progress['pending']), (4, 1, 2))
+
+        # six requests at four per frequency window, half of which has passed
+        self.assertAlmostEqual(progress['eta'], (6 / 4 - 0.5) * 1440 * 60, delta=60)
+
+    def test_refused_episode_stays_pending(self):
+        # the search queue does not take an episode it already holds, for example for a manual search
+        sickrage.app.search_queue.refused.add((1, 1, 2))
+
+        sickrage.app.backlog_searcher.task()
+        self.assertEqual(self.queued(), [(1, 1, 1), (3, 1, 1)])
+
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['queued'], progress['pending'], progress['searched']), (2, 1, 0))
+
+        # it is queued by the next step once the queue takes it
+        sickrage.app.search_queue.refused.clear()
+        sickrage.app.backlog_searcher.step()
+        self.assertEqual(self.queued(), [(1, 1, 1), (3, 1, 1), (1, 1, 2)])
+
+    def test_deferred_episode_stays_pending(self):
+        sickrage.app.backlog_searcher.task()
+        task = sickrage.app.search_queue.tasks[1]
+
+        # the search plan cap keeps every search string of the episode from the provider
+        provider = next(iter(sickrage.app.search_providers.enabled().values()))
+        task.plan.max_search_strings = 0
+        self.assertEqual(task.plan.search(provider, {'Episode': ['Show Name S01E02']}, season=task.season, episode=task.episode), [])
+
+        task.set_searched()
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['queued'], progress['pending'], progress['searched']), (2, 1, 0))
+
+        sickrage.app.search_queue.tasks[0].set_searched()
+        self.assertEqual(sickrage.app.backlog_searcher.progress()['searched'], 1)
+
+    def test_removed_task_episode_stays_pending(self):
+        sickrage.app.backlog_searcher.task()
+
+        # a task removed from the search queue before it ran never records its episode as searched
+        sickrage.app.search_queue.tasks.pop(1)
+        self.assertEqual(sickrage.app.backlog_searcher.progress()['queued'], 3)
+
+        sickrage.app.backlog_searcher.step()
+        self.assertEqual(self.queued(), [(1, 1, 1), (3, 1, 1), (1, 1, 2)])
+        self.assertEqual(sickrage.app.backlog_searcher.progress()['queued'], 3)
+
+    def test_failed_task_is_searched(self):
+        sickrage.app.backlog_searcher.task()
+
+        show_object = mock.Mock(**{'get_episode.side_effect': Exception})
+        with mock.patch('sickrage.core.queues.search.find_show', return_value=show_object):
+            sickrage.app.search_queue.tasks[0].run()
+
+        progress = sickrage.app.backlog_searcher.progress()
+        self.assertEqual((progress['queued'], progress['searched']), (2, 1))
+
+
+class ProperSearcherTests(SearcherTestCase):
+    def setUp(self):
+        super(ProperSearcherTests, self).setUp()
+
+        sickrage.app.search_providers = SearchProviders()
+        for provider_type in sickrage.app.search_providers:
+            sickrage.app.search_providers[provider_type] = {}
+
+        self.live_searches = []
+
+        self.providers = []
+        for name in ['rss', 'live']:
+            provider = TorrentRssProvider(name, 'http://localhost/{}'.format(name))
+            provider.enabled = True
+            provider.find_propers = lambda *args, name=name: self.live_searches.append((name,) + args) or []
+            sickrage.app.search_providers[TorrentRssProvider.provider_type.name][provider.id] = provider
+            self.providers.append(provider)
+
+        # only the first provider has a RSS feed
+        self.providers[0].cache.last_update = datetime.datetime.today()
+        self.providers[1].cache.search_strings = None
+
+        sickrage.app.config.general.use_torrents = True
+        sickrage.app.config.general.enable_rss_cache = True
+        sickrage.app.config.general.propers_from_rss_cache = True
+
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+
+        with sickrage.app.main_db.session() as session:
+            session.query(MainDB.TVEpisode).filter_by(series_id=1, season=1, episode=6).update({
+                'status': Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV), 'airdate': yesterday})
+            session.query(MainDB.TVEpisode).filter_by(series_id=3, season=1, episode=2).update({'airdate': yesterday})
+            session.commit()
+
+        now = int(time.time())
+
+        session = sickrage.app.cache_db.session()
+        for name, series_id, season, episodes, age in [('Show.1.S01E06.REPACK.720p.HDTV.x264-GRP', 1, 1, '|6|', 0),
+                                                        ('Show.1.S01E06.720p.HDTV.x264-OTHER', 1, 1, '|6|', 0),
+                                                        ('Show.1.S01E05.PROPER.720p.HDTV.x264-GRP', 1, 1, '|5|', 0),
+                                                        ('Show.3.S01E02.REAL.HDTV.x264-GRP', 3, 1, '|2|', 0),
+                                                        ('The.Real.Show.1.S01E06.720p.HDTV.x264-GRP', 1, 1, '|6|', 0),
+                                                        ('Show.3.S01E02.PROPER.HDTV.x264-GRP', 3, 1, '|2|', 3 * 86400)]:
+            session.add(CacheDB.Provider(**{
+                'provider': self.providers[0].id,
+                'name': name,
+                'season': season,
+                'episodes': episodes,
+                'series_id': series_id,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'url': 'http://localhost/rss/{}.torrent'.format(name),
+                'time': now - age,
+                'quality': Qualities.HDTV,
+                'seeders': 1,
+                'leechers': 0,
+                'size': 1
+            }))
+        session.commit()
+
+    def test_propers_from_rss_cache(self):
+        searcher = ProperSearcher()
+        searcher._get_proper_list()
+
+        # the provider without a RSS feed is still searched, once per wanted episode
+        self.assertEqual([x[:4] for x in self.live_searches], [('live', 1, SeriesProviderID.THETVDB, 1), ('live', 3, SeriesProviderID.THETVDB, 1)])
+        self.assertEqual(searcher.requests_avoided, len(self.providers[0].proper_strings) * 2)
+
+        # propers of episodes that are not downloaded or older than the search window are ignored
+        search_date = datetime.datetime.today() - datetime.timedelta(days=2)
+        propers = searcher._get_cached_propers([self.providers[0]], [(self.shows[0], [(1, 6)]), (self.shows[2], [(1, 2)])], search_date)
+        self.assertEqual(sorted(x.name for x in propers), ['Show.1.S01E06.REPACK.720p.HDTV.x264-GRP', 'Show.3.S01E02.REAL.HDTV.x264-GRP'])
+        self.assertTrue(all(x.provider == self.providers[0] for x in propers))
+
+    def test_live_search_without_rss_cache(self):
+        sickrage.app.config.general.propers_from_rss_cache = False
+
+        searcher = ProperSearcher()
+        searcher._get_proper_list()
+
+        self.assertEqual(sorted(set(x[0] for x in self.live_searches)), ['live', 'rss'])
+        self.assertEqual(searcher.requests_avoided, 0)
+
+
+class FailedSnatchSearcherTests(SearcherTestCase):
+    def setUp(self):
+        super(FailedSnatchSearcherTests, self).setUp()
+
+        sickrage.app.search_queue = FakeSearchQueue()
+        sickrage.app.config.failed_snatches.enable = True
+        sickrage.app.config.failed_snatches.age = 1
+
+        snatched = Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.SDTV)
+
+        with sickrage.app.main_db.session() as session:
+            for series_id, episode in [(1, 2), (2, 1)]:
+                session.query(MainDB.TVEpisode).filter_by(series_id=series_id, season=1, episode=episode).update({'status': snatched})
+            session.commit()
+
+        # still snatched, downloaded, paused show, not snatched anymore and too recent
+        self.add_history([(3, 1, 2, EpisodeStatus.SNATCHED, 3),
+                          (1, 1, 2, EpisodeStatus.SNATCHED, 3),
+                          (1, 1, 2, EpisodeStatus.DOWNLOADED, 2),
+                          (2, 1, 1, EpisodeStatus.SNATCHED, 3),
+                          (1, 1, 1, EpisodeStatus.SNATCHED, 3),
+                          (3, 1, 2, EpisodeStatus.SNATCHED, 0)])
+
+    def tearDown(self):
+        sickrage.app.search_queue = None
+        super(FailedSnatchSearcherTests, self).tearDown()
+
+    @staticmethod
+    def add_history(rows):
+        with sickrage.app.main_db.session() as session:
+            for series_id, season, episode, action, age in rows:
+                session.add(MainDB.History(**{
+                    'series_id': series_id,
+                    'series_provider_id': SeriesProviderID.THETVDB,
+                    'season': season,
+                    'episode': episode,
+                    'resource': 'Show.{}.S{:02d}E{:02d}.HDTV.x264-GRP'.format(series_id, season, episode),
+                    'action': Quality.composite_status(action, Qualities.SDTV),
+                    'provider': 'provider',
+                    'date': datetime.datetime.now() - datetime.timedelta(days=age),
+                    'quality': Qualities.SDTV,
+                    'release_group': 'GRP'
+                }))
+            session.commit()
+
+    def count_queries(self, func):
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            queries.append(statement)
+
+        engine = sickrage.app.main_db.session().get_bind()
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            func()
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+        return len(queries)
+
+    def test_failed_snatches(self):
+        self.assertEqual(FailedSnatchSearcher.failed_snatches(), [(3, SeriesProviderID.THETVDB, 1, 2)])
+
+        searcher = FailedSnatchSearcher()
+        searcher.task()
+        self.assertEqual([(x.series_id, x.season, x.episode) for x in sickrage.app.search_queue.tasks], [(3, 1, 2)])
+
+    def test_constant_query_count(self):
+        searcher = FailedSnatchSearcher()
+        queries = self.count_queries(searcher.task)
+        self.assertGreater(queries, 0)
+
+        # a bigger history does not add queries
+        self.add_history([(1, 1, episode % 7 + 1, (EpisodeStatus.SNATCHED, EpisodeStatus.DOWNLOADED)[episode % 2], 3) for episode in range(500)])
+        sickrage.app.search_queue = FakeSearchQueue()
+
+        self.assertEqual(self.count_queries(searcher.task), queries)
+        self.assertEqual(len(sickrage.app.search_queue.tasks), 1)
+
+    def test_batch_size(self):
+        snatched = Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.SDTV)
+
+        with sickrage.app.main_db.session() as session:
+            session.query(MainDB.TVEpisode).filter_by(series_id=1).update({'status': snatched})
+            session.commit()
+
+        self.add_history([(1, 1, episode, EpisodeStatus.SNATCHED, 10 - episode) for episode in range(3, 8)])
+
+        searcher = FailedSnatchSearcher()
+        searcher.batch_size = 2
+        searcher.task()
+
+        # the oldest snatches are retried first
+        self.assertEqual([(x.series_id, x.season, x.episode) for x in sickrage.app.search_queue.tasks], [(1, 1, 3), (1, 1, 4)])
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - SEARCHER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import datetime
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+import feedparser
+from sqlalchemy import event
+
+import sickrage
+import tests
+from sickrage.core.caches.provider_times import ProviderTimes, provider_times
+from sickrage.core.caches.seen_items import SeenItems
+from sickrage.core.caches.tv_cache import TVCache
+from sickrage.core.common import EpisodeStatus, Qualities, Quality
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.nameparser import InvalidShowException, ParseResult
+from sickrage.core.tv.show import TVShow
+from sickrage.search_providers import TorrentRssProvider
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+<title>Feed</title>
+<item>
+<title>Show.Name.S01E0{episode}.720p.HDTV.x264-GRP</title>
+<link>magnet:?xt=urn:btih:000000000000000000000000000000000000000{episode}</link>
+</item>
+</channel>
+</rss>"""
+
+
+class ConditionalFeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+
+        etag, last_modified, data = self.server.feed
+        if self.headers.get('If-None-Match') == etag or (last_modified and self.headers.get('If-Modified-Since') == last_modified):
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(data)))
+        if etag:
+            self.send_header('ETag', etag)
+        if last_modified:
+            self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeFeedProvider(TorrentRssProvider):
+    def search(self, search_strings, **kwargs):
+        resp = self.session.get(self.urls['base_url'])
+        if not resp or not resp.text:
+            return []
+
+        return feedparser.parse(resp.text)['entries']
+
+
+class TVCacheTests(tests.SiCKRAGETestCacheDBCase):
+    def setUp(self):
+        super(TVCacheTests, self).setUp()
+
+        self.cache = TVCache(TorrentRssProvider('Test', 'https://tracker.example.com/rss'))
+
+    def _parse_result(self, name, episode, quality=Qualities.HDTV):
+        episodes = episode if isinstance(episode, list) else [episode]
+        return ParseResult(name,
+                           series_name='Show Name',
+                           season_number=1,
+                           episode_numbers=episodes,
+                           release_group='GRP',
+                           series_id=1,
+                           series_provider_id=SeriesProviderID.THETVDB,
+                           quality=quality)
+
+    def test_add_cache_entries(self):
+        names = ['Show.Name.S01E0{}.720p.HDTV.x264-GRP'.format(i) for i in range(1, 5)]
+        parse_results = dict((name, self._parse_result(name, i)) for i, name in enumerate(names, 1))
+        parse_results[names[3]] = InvalidShowException()
+
+        # an url that is already cached is skipped
+        self.cache.add_cache_entry(names[0], 'https://tracker.example.com/1', 1, 1, 100, parse_result=parse_results[names[0]])
+
+        self.cache.add_cache_entries([
+            (names[0], 'https://tracker.example.com/1', 1, 1, 100),
+            (names[1], 'https://tracker.example.com/2', 1, 1, 100),
+            (names[1], 'https://tracker.example.com/2', 1, 1, 100),
+            (names[2], 'https://tracker.example.com/3', 10, 5, 200),
+            (names[3], 'https://tracker.example.com/4', 1, 1, 100),
+        ], parse_results)
+
+        session = sickrage.app.cache_db.session()
+        rows = session.query(CacheDB.Provider).order_by(CacheDB.Provider.url).all()
+        self.assertEqual([x.url for x in rows], ['https://tracker.example.com/{}'.format(i) for i in range(1, 4)])
+        self.assertEqual(rows[2].episodes, '|3|')
+        self.assertEqual(rows[2].seeders, 10)
+        self.assertEqual(rows[2].size, 200)
+
+    def test_search_cache(self):
+        with sickrage.app.main_db.session() as session:
+            session.add(MainDB.TVShow(**{
+                'series_id': 1,
+                'series_provider_id': SeriesProviderID.THETVDB,
+                'name': 'Show Name',
+                'lang': 'en',
+                'location': '',
+                'quality': Quality.combine_qualities([Qualities.HDTV], [Qualities.FULLHDBLURAY])
+            }))
+
+            for episode, status in [(1, EpisodeStatus.WANTED), (2, Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV))]:
+                session.add(MainDB.TVEpisode(**{
+                    'series_id': 1,
+                    'series_provider_id': SeriesProviderID.THETVDB,
+                    'episode_id': episode,
+                    'season': 1,
+                    'episode': episode,
+                    'location': '',
+                    'status': status
+                }))
+
+            session.commit()
+
+        show = TVShow(1, SeriesProviderID.THETVDB)
+        sickrage.app.config.general.enable_sickrage_api = False
+
+        entries = [
+            ('Show.Name.S01E01.720p.HDTV.x264-GRP', 1, Qualities.HDTV),
+            ('Show.Name.S01E01.HDTV.x264-GRP', 1, Qualities.SDTV),
+            ('Show.Name.S01E02.720p.HDTV.x264-GRP', 2, Qualities.HDTV),
+            ('Show.Name.S01E02.1080p.BluRay.x264-GRP', 2, Qualities.FULLHDBLURAY),
+            ('Show.Name.S01E01E02.720p.HDTV.x264-GRP', [1, 2], Qualities.HDTV),
+        ]
+
+        self.cache.add_cache_entries([(name, 'https://tracker.example.com/{}'.format(i), 1, 1, 100) for i, (name, episode, quality) in enumerate(entries)],
+                                     dict((name, self._parse_result(name, episode, quality)) for name, episode, quality in entries))
+
+        results = self.cache.search_cache(show.series_id, show.series_provider_id, 1, 1)
+        self.assertEqual(sorted(x.name for x in results[1]), ['Show.Name.S01E01.720p.HDTV.x264-GRP', 'Show.Name.S01E01E02.720p.HDTV.x264-GRP'])
+
+        # the downloaded episode is not wanted, a multi episode result is still kept for its wanted episode
+        results = self.cache.search_cache(show.series_id, show.series_provider_id, 1, 2)
+        self.assertEqual([x.name for x in results[2]], ['Show.Name.S01E01E02.720p.HDTV.x264-GRP'])
+        self.assertFalse(show.want_episode(1, 2, Qualities.FULLHDBLURAY))
+
+    def test_seen_items_are_skipped(self):
+        names = ['Show.Name.S01E0{}.720p.HDTV.x264-GRP'.format(i) for i in range(1, 5)]
+        items = [{'title': name, 'link': 'https://tracker.example.com/{}'.format(i)} for i, name in enumerate(names, 1)]
+
+        parse_results = dict((name, self._parse_result(name, i)) for i, name in enumerate(names, 1))
+        parse_results[names[2]] = InvalidShowException()
+
+        parsed = []
+        add_cache_entries = self.cache.add_cache_entries
+
+        def parse(entries):
+            parsed.extend(name for name, url, seeders, leechers, size in entries)
+            return add_cache_entries(entries, parse_results)
+
+        self.cache.add_cache_entries = parse
+        sickrage.app.config.general.enable_sickrage_api = False
+
+        self.cache._parse_items(items[:3])
+        self.assertEqual((self.cache.updated_items, self.cache.skipped_items), (3, 0))
+
+        # only the new item of the next update is parsed
+        self.cache._parse_items(items)
+        self.assertEqual((self.cache.updated_items, self.cache.skipped_items), (1, 3))
+        self.assertEqual(parsed, names)
+
+        # the seen items are stored in the cache database
+        self.assertEqual(SeenItems().filter(self.cache.providerID, [self.cache._get_item_hash(x) for x in items]), set())
+
+        # clearing the provider cache forgets the cached items, the rejected one stays seen
+        self.cache.last_update = datetime.datetime.today() - datetime.timedelta(minutes=1)
+        self.cache.last_search = datetime.datetime.today()
+        self.cache.clear()
+
+        del parsed[:]
+        self.cache._parse_items(items)
+        self.assertEqual(sorted(parsed), sorted(names[:2] + names[3:]))
+        self.assertEqual(self.cache.skipped_items, 1)
+
+    def test_seen_items_capacity(self):
+        seen = SeenItems(capacity=2)
+        seen.add(self.cache.providerID, {'a': False, 'b': False})
+        seen.add(self.cache.providerID, {'c': False})
+        self.assertEqual(seen.filter(self.cache.providerID, ['a', 'b', 'c']), {'a'})
+
+        # items are forgotten after the ttl
+        seen.ttl = -1
+        self.assertEqual(seen.filter(self.cache.providerID, ['b', 'c']), {'b', 'c'})
+
+    def test_conditional_feed_requests(self):
+        server = self.start_http_server(ConditionalFeedHandler, requests=[],
+                                        feed=('"v1"', 'Mon, 19 Oct 2020 10:00:00 GMT', RSS_FEED.format(episode=1).encode('utf-8')))
+
+        url = 'http://127.0.0.1:{}/rss'.format(server.server_port)
+
+        feed = self.cache.get_rss_feed(url, conditional=True)
+        self.assertEqual(len(feed['entries']), 1)
+        self.assertNotIn('If-None-Match', server.requests[-1])
+
+        # the server answers 304 to the stored validators, nothing is parsed
+        feed = self.cache.get_rss_feed(url, conditional=True)
+        self.assertTrue(feed.get('not_modified'))
+        self.assertEqual(feed['entries'], [])
+        self.assertEqual(server.requests[-1]['If-None-Match'], '"v1"')
+        self.assertEqual(self.cache.feed_metrics['not_modified'], 1)
+        self.assertEqual(self.cache.feed_metrics['bytes_saved'], len(server.feed[2]))
+
+        # new validators but the same body, the content hash skips parsing
+        server.feed = ('"v2"', None, server.feed[2])
+        self.assertTrue(self.cache.get_rss_feed(url, conditional=True).get('not_modified'))
+        self.assertEqual(self.cache.feed_metrics['unchanged'], 1)
+
+        # a changed feed is parsed again
+        server.feed = ('"v3"', None, RSS_FEED.format(episode=2).encode('utf-8'))
+        feed = self.cache.get_rss_feed(url, conditional=True)
+        self.assertEqual(feed['entries'][0]['title'], 'Show.Name.S01E02.720p.HDTV.x264-GRP')
+        self.assertEqual(self.cache.feed_metrics['requests'], 4)
+        self.assertGreater(self.cache.feed_metrics['parse_time_saved'], 0)
+
+        # searches are never conditional
+        self.assertEqual(len(self.cache.get_rss_feed(url)['entries']), 1)
+        self.assertNotIn('If-None-Match', server.requests[-1])
+
+    def test_conditional_provider_polling(self):
+        server = self.start_http_server(ConditionalFeedHandler, requests=[], feed=('"v1"', None, RSS_FEED.format(episode=1).encode('utf-8')))
+
+        cache = TVCache(FakeFeedProvider('Test', 'http://127.0.0.1:{}/rss'.format(server.server_port)))
+
+        parsed, cleared = [], []
+        cache._parse_items = lambda items: parsed.extend(x['title'] for x in items)
+        cache.clear = lambda: cleared.append(True)
+
+        self.assertTrue(cache.update(force=True))
+        self.assertEqual(parsed, ['Show.Name.S01E01.720p.HDTV.x264-GRP'])
+        self.assertNotIn('If-None-Match', server.requests[-1])
+
+        # the provider session sends the stored validators, the cache is neither cleared nor parsed again
+        self.assertTrue(cache.update(force=True))
+        self.assertEqual(server.requests[-1]['If-None-Match'], '"v1"')
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(len(cleared), 1)
+
+        # new validators but the same body, the provider gets an empty body to skip
+        server.feed = ('"v2"', None, server.feed[2])
+        self.assertTrue(cache.update(force=True))
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(cache.feed_metrics['requests'], 3)
+        self.assertEqual(cache.feed_metrics['not_modified'] + cache.feed_metrics['unchanged'], 2)
+
+        # a changed feed is parsed again
+        server.feed = ('"v3"', None, RSS_FEED.format(episode=2).encode('utf-8'))
+        self.assertTrue(cache.update(force=True))
+        self.assertEqual(parsed[-1], 'Show.Name.S01E02.720p.HDTV.x264-GRP')
+        self.assertEqual(len(cleared), 2)
+
+        # searches outside of the update get the unchanged feed
+        self.assertIsNone(cache.provider.session.conditional)
+        self.assertEqual(len(cache.provider.search({'RSS': ['']})), 1)
+
+    def test_rss_cycle_query_count(self):
+        statements = []
+        event.listen(sickrage.app.cache_db.session().get_bind(), 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        self.cache.min_time = 0
+        self.cache._get_rss_data = lambda: {'entries': []}
+
+        # the provider times are loaded with one query per table, a cycle then only clears the provider cache
+        self.cache.update()
+        self.assertEqual(len(statements), 3)
+
+        del statements[:]
+        self.cache.last_search = datetime.datetime.today()
+        self.cache.update()
+        self.assertEqual(len(statements), 1)
+
+        # changes are written back on flush and survive a restart
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(session.query(CacheDB.LastUpdate).count(), 0)
+
+        provider_times.flush()
+        self.assertEqual(session.query(CacheDB.LastUpdate).count(), 1)
+        self.assertEqual(session.query(CacheDB.LastSearch).count(), 1)
+        self.assertEqual(ProviderTimes().get(CacheDB.LastUpdate, self.cache.providerID), int(time.mktime(self.cache.last_update.timetuple())))
+
+    def test_provider_times_flush_interval(self):
+        times = ProviderTimes(interval=0)
+        times.set(CacheDB.LastSearch, self.cache.providerID, 100)
+        times.set(CacheDB.LastSearch, self.cache.providerID, 200)
+
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(session.query(CacheDB.LastSearch).one().time, 200)
+        self.assertFalse(times.dirty)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - TV CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()